@@ -5,7 +5,6 @@
 
 import os
 import sys
-import requests
 import logging
 from dotenv import load_dotenv
 from PIL import Image, ImageDraw, ImageFont
@@ -18,11 +17,14 @@ load_dotenv()
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.media.modern_thumbnail_generator import ModernThumbnailGenerator
+from src.media.batch_render import render_many, thumbnail_spec
+from src.wordpress.api_client import WordPressClient, WordPressAPIError
 
 # WordPress設定
 WP_USERNAME = os.getenv('WORDPRESS_USERNAME')
 WP_PASSWORD = os.getenv('WORDPRESS_APP_PASSWORD')
 WP_URL = 'https://aimelodykobo.com'
+WP_API_URL = f"{WP_URL}/index.php?rest_route=/wp/v2"
 
 # ロギング設定
 logging.basicConfig(
@@ -32,49 +34,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def upload_image_to_wordpress(image_path):
+def upload_image_to_wordpress(wp_client, image_path):
     """画像をWordPressにアップロード"""
     
-    with open(image_path, 'rb') as img_file:
-        media_data = {
-            'file': img_file,
-            'caption': 'AI Music Thumbnail',
-            'alt_text': 'AI音楽記事のサムネイル'
-        }
-        
-        response = requests.post(
-            f"{WP_URL}/index.php?rest_route=/wp/v2/media",
-            files={'file': img_file},
-            auth=(WP_USERNAME, WP_PASSWORD)
-        )
-        
-        if response.status_code == 201:
-            media_id = response.json()['id']
-            media_url = response.json()['source_url']
-            logger.info(f"   画像アップロード成功: ID={media_id}")
-            return media_id
-        else:
-            logger.error(f"   画像アップロード失敗: {response.status_code}")
-            return None
+    try:
+        media = wp_client.upload_media(file_path=image_path)
+        media_id = media['id']
+        logger.info(f"   画像アップロード成功: ID={media_id}")
+        return media_id
+    except WordPressAPIError as e:
+        logger.error(f"   画像アップロード失敗: {e}")
+        return None
 
-def update_post_thumbnail(post_id, media_id):
+def update_post_thumbnail(wp_client, post_id, media_id):
     """記事のアイキャッチ画像を更新"""
     
-    update_data = {
-        'featured_media': media_id
-    }
-    
-    response = requests.post(
-        f"{WP_URL}/index.php?rest_route=/wp/v2/posts/{post_id}",
-        json=update_data,
-        auth=(WP_USERNAME, WP_PASSWORD)
-    )
-    
-    if response.status_code == 200:
+    try:
+        wp_client.update_post(post_id, featured_media=media_id)
         logger.info(f"   アイキャッチ画像設定成功")
         return True
-    else:
-        logger.error(f"   アイキャッチ画像設定失敗: {response.status_code}")
+    except WordPressAPIError as e:
+        logger.error(f"   アイキャッチ画像設定失敗: {e}")
         return False
 
 def add_thumbnails_to_draft_posts():
@@ -83,32 +63,39 @@ def add_thumbnails_to_draft_posts():
     # サムネイルジェネレーター初期化
     thumbnail_generator = ModernThumbnailGenerator()
     
+    # 全リクエストで接続を再利用するクライアント
+    with WordPressClient(api_url=WP_API_URL,
+                         username=WP_USERNAME,
+                         app_password=WP_PASSWORD) as wp_client:
+        _add_thumbnails(wp_client, thumbnail_generator)
+        
+        stats = wp_client.get_request_stats()
+        logger.info(f"🔌 リクエスト: {stats['requests']}件 "
+                    f"(新規接続 {stats['connections_opened']}件 / 再利用 {stats['connections_reused']}件)")
+
+def _add_thumbnails(wp_client, thumbnail_generator):
+    """アイキャッチ画像がない下書き記事を処理"""
+    
     logger.info("📝 下書き記事を取得中...")
     
     # 下書き記事を取得
-    response = requests.get(
-        f"{WP_URL}/index.php?rest_route=/wp/v2/posts",
-        params={
-            'per_page': 50,
-            'orderby': 'date',
-            'order': 'desc',
-            'status': 'draft'  # 下書きのみ
-        },
-        auth=(WP_USERNAME, WP_PASSWORD)
-    )
-    
-    if response.status_code != 200:
-        logger.error(f"投稿の取得に失敗: {response.status_code}")
+    try:
+        posts = wp_client.get_posts(
+            per_page=50,
+            orderby='date',
+            order='desc',
+            status='draft'  # 下書きのみ
+        )
+    except WordPressAPIError as e:
+        logger.error(f"投稿の取得に失敗: {e}")
         return
     
-    posts = response.json()
     logger.info(f"📊 {len(posts)}件の投稿が見つかりました")
     
-    # アイキャッチ画像がない投稿を処理
-    processed_count = 0
+    # アイキャッチ画像がない投稿を集める
+    targets = []
     
     for post in posts:
-        post_id = post['id']
         title = post['title']['rendered']
         featured_media = post.get('featured_media', 0)
         
@@ -117,45 +104,63 @@ def add_thumbnails_to_draft_posts():
             logger.info(f"✓ スキップ: {title} (既にサムネイルあり)")
             continue
         
+        # タイトルから年を除去
+        clean_title = title.replace('【2025年最新版】', '').strip()
+        
+        # ツール名を判定
+        tool_name = 'AI音楽'
+        if 'Suno' in title:
+            tool_name = 'Suno'
+        elif 'Udio' in title:
+            tool_name = 'Udio'
+        elif 'Stable Audio' in title:
+            tool_name = 'Stable Audio'
+        elif 'MusicGen' in title:
+            tool_name = 'MusicGen'
+        elif 'AIVA' in title:
+            tool_name = 'AIVA'
+        elif 'React' in title:
+            tool_name = 'React'
+        elif 'Python' in title:
+            tool_name = 'Python'
+        elif 'Transformer' in title:
+            tool_name = 'AI技術'
+        
+        targets.append((post, thumbnail_spec(
+            title=clean_title,
+            article_type='general',
+            tool_name=tool_name,
+            keywords=[tool_name, 'AI音楽', '最新']
+        )))
+    
+    # サムネイルをまとめて並列に生成
+    logger.info(f"🖼️ {len(targets)}件のサムネイルを生成中...")
+    results = render_many([spec for _, spec in targets], seed=thumbnail_generator.seed)
+    
+    processed_count = 0
+    
+    for (post, _), result in zip(targets, results):
+        post_id = post['id']
+        title = post['title']['rendered']
         logger.info(f"\n処理中: {title}")
         
+        if result['error']:
+            logger.error(f"❌ 失敗: サムネイル生成エラー: {result['error']}")
+            continue
+        logger.info(f"   サムネイル生成: {result['seconds']:.2f}秒")
+        
         try:
-            # タイトルから年を除去
-            clean_title = title.replace('【2025年最新版】', '').strip()
-            
-            # ツール名を判定
-            tool_name = 'AI音楽'
-            if 'Suno' in title:
-                tool_name = 'Suno'
-            elif 'Udio' in title:
-                tool_name = 'Udio'
-            elif 'Stable Audio' in title:
-                tool_name = 'Stable Audio'
-            elif 'MusicGen' in title:
-                tool_name = 'MusicGen'
-            elif 'AIVA' in title:
-                tool_name = 'AIVA'
-            elif 'React' in title:
-                tool_name = 'React'
-            elif 'Python' in title:
-                tool_name = 'Python'
-            elif 'Transformer' in title:
-                tool_name = 'AI技術'
-            
-            # サムネイル生成
+            # アップロード用に一時ファイルへ保存
             thumbnail_path = f"temp_thumbnail_{post_id}.png"
-            thumbnail_generator.generate_modern_thumbnail(
-                title=clean_title,
-                tool_name=tool_name,
-                output_path=thumbnail_path
-            )
+            with open(thumbnail_path, 'wb') as f:
+                f.write(result['data'])
             
             # WordPressにアップロード
-            media_id = upload_image_to_wordpress(thumbnail_path)
+            media_id = upload_image_to_wordpress(wp_client, thumbnail_path)
             
             if media_id:
                 # アイキャッチ画像として設定
-                if update_post_thumbnail(post_id, media_id):
+                if update_post_thumbnail(wp_client, post_id, media_id):
                     processed_count += 1
                     logger.info(f"✅ 完了: {title}")
                 else:
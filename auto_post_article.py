@@ -6,21 +6,28 @@ AI Melody Kobo - 記事を自動生成してWordPressに投稿
 
 import os
 import sys
+import asyncio
 import argparse
 import logging
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 import random
 
 # プロジェクトのパスを追加
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.article_generator.content_builder import ArticleGenerator
-from src.wordpress.api_client import WordPressClient
-from src.wordpress.category_manager import CategoryManager
-from src.media.modern_thumbnail_generator import ModernThumbnailGenerator
+from src.utils.lazy import lazy_component
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    # 記事生成・WordPress・画像生成は重いため使うときに読み込む
+    from src.article_generator.content_builder import ArticleGenerator
+    from src.wordpress.api_client import WordPressClient
+    from src.wordpress.category_manager import CategoryManager
+    from src.media.modern_thumbnail_generator import ModernThumbnailGenerator
+    from src.content.article_enhancer import ArticleEnhancer
+
 # 環境変数の読み込み
 load_dotenv()
 
@@ -43,23 +50,44 @@ class AutoArticlePublisher:
         """初期化"""
         logger.info("自動投稿システムを初期化中...")
         
-        # WordPressクライアントの初期化
-        self.wp_client = WordPressClient()
-        
-        # カテゴリーマネージャーの初期化
-        self.category_manager = CategoryManager(self.wp_client)
-        self.category_manager.setup_categories()
+        # 各コンポーネントは初回使用時に生成する（--testではWordPressクライアントのみ）
         
-        # 記事生成器の初期化
-        self.article_generator = ArticleGenerator(
+        logger.info("自動投稿システムの初期化完了")
+    
+    @lazy_component
+    def wp_client(self) -> 'WordPressClient':
+        """WordPressクライアント"""
+        from src.wordpress.api_client import WordPressClient
+        return WordPressClient()
+    
+    @lazy_component
+    def category_manager(self) -> 'CategoryManager':
+        """カテゴリーマネージャー（生成時にWordPressのカテゴリーを準備する）"""
+        from src.wordpress.category_manager import CategoryManager
+        category_manager = CategoryManager(self.wp_client)
+        category_manager.setup_categories()
+        return category_manager
+    
+    @lazy_component
+    def article_generator(self) -> 'ArticleGenerator':
+        """記事生成器"""
+        from src.article_generator.content_builder import ArticleGenerator
+        return ArticleGenerator(
             ai_client_type="claude",
             category_manager=self.category_manager
         )
-        
-        # サムネイル生成器の初期化
-        self.thumbnail_generator = ModernThumbnailGenerator()
-        
-        logger.info("自動投稿システムの初期化完了")
+    
+    @lazy_component
+    def thumbnail_generator(self) -> 'ModernThumbnailGenerator':
+        """サムネイル生成器"""
+        from src.media.modern_thumbnail_generator import ModernThumbnailGenerator
+        return ModernThumbnailGenerator()
+    
+    @lazy_component
+    def article_enhancer(self) -> 'ArticleEnhancer':
+        """記事の画像プレースホルダーをストック画像に置き換える（WordPressクライアントを共有）"""
+        from src.content.article_enhancer import ArticleEnhancer
+        return ArticleEnhancer(wp_client=self.wp_client)
     
     def generate_and_publish(self, 
                            topic: str = None,
@@ -79,20 +107,7 @@ class AutoArticlePublisher:
             投稿結果の辞書
         """
         try:
-            # トピックが指定されていない場合は自動選択
-            if not topic:
-                topic = self._select_topic(article_type, tool_name)
-                logger.info(f"自動選択されたトピック: {topic}")
-            
-            # 記事タイプが指定されていない場合は自動選択
-            if not article_type:
-                article_type = self._select_article_type()
-                logger.info(f"自動選択された記事タイプ: {article_type}")
-            
-            # ツール名が指定されていない場合は自動選択
-            if not tool_name:
-                tool_name = self._select_tool_name()
-                logger.info(f"自動選択されたツール: {tool_name}")
+            topic, article_type, tool_name = self._select_article(topic, article_type, tool_name)
             
             # 1. 記事を生成
             logger.info("記事生成を開始...")
@@ -103,8 +118,43 @@ class AutoArticlePublisher:
                 use_latest_info=True
             )
             
+            return self._publish_generated(result, article_type, tool_name, status)
+            
+        except Exception as e:
+            logger.error(f"投稿エラー: {str(e)}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
+    def _select_article(self, topic: str = None, article_type: str = None,
+                        tool_name: str = None) -> tuple:
+        """指定されていないトピック・記事タイプ・ツール名を自動選択"""
+        # トピックが指定されていない場合は自動選択
+        if not topic:
+            topic = self._select_topic(article_type, tool_name)
+            logger.info(f"自動選択されたトピック: {topic}")
+        
+        # 記事タイプが指定されていない場合は自動選択
+        if not article_type:
+            article_type = self._select_article_type()
+            logger.info(f"自動選択された記事タイプ: {article_type}")
+        
+        # ツール名が指定されていない場合は自動選択
+        if not tool_name:
+            tool_name = self._select_tool_name()
+            logger.info(f"自動選択されたツール: {tool_name}")
+        
+        return topic, article_type, tool_name
+    
+    def _publish_generated(self, result: dict, article_type: str,
+                           tool_name: str, status: str) -> dict:
+        """生成済みの記事にサムネイルを付けて投稿"""
+        from src.wordpress.api_client import InvalidMediaError
+        
+        try:
             if not result['success']:
-                raise Exception("記事生成に失敗しました")
+                raise Exception(result.get('error') or "記事生成に失敗しました")
             
             article_data = result['article_data']
             logger.info(f"記事生成完了: {article_data['title']}")
@@ -118,26 +168,38 @@ class AutoArticlePublisher:
             )
             
             # 3. 画像をアップロード
-            media_result = self.wp_client.upload_media(
-                file_data=thumbnail_data,
-                filename=f"thumbnail_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png",
-                title=f"{article_data['title']} - アイキャッチ画像",
-                alt_text=article_data['title']
-            )
-            logger.info(f"サムネイル画像アップロード完了: ID {media_result['id']}")
+            def upload_thumbnail() -> dict:
+                media_result = self.wp_client.upload_media(
+                    file_data=thumbnail_data,
+                    filename=f"thumbnail_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png",
+                    title=f"{article_data['title']} - アイキャッチ画像",
+                    alt_text=article_data['title']
+                )
+                logger.info(f"サムネイル画像アップロード完了: ID {media_result['id']}")
+                return media_result
+            
+            def create_post(media_id: int) -> dict:
+                return self.wp_client.create_post(
+                    title=article_data['title'],
+                    content=article_data['content'],
+                    status=status,
+                    categories=article_data.get('categories', []),
+                    tags=article_data.get('tags', []),
+                    featured_media=media_id,
+                    excerpt=article_data.get('excerpt', ''),
+                    meta_description=article_data.get('meta_description', '')
+                )
+            
+            media_result = upload_thumbnail()
             
             # 4. 記事を投稿
             logger.info("WordPressに投稿中...")
-            post_result = self.wp_client.create_post(
-                title=article_data['title'],
-                content=article_data['content'],
-                status=status,
-                categories=article_data.get('categories', []),
-                tags=article_data.get('tags', []),
-                featured_media=media_result['id'],
-                excerpt=article_data.get('excerpt', ''),
-                meta_description=article_data.get('meta_description', '')
-            )
+            try:
+                post_result = create_post(media_result['id'])
+            except InvalidMediaError:
+                # 再利用した画像がWordPress側で削除されていた場合は1回だけ再アップロードする
+                logger.warning(f"アイキャッチ画像が削除されているため再アップロードします: ID {media_result['id']}")
+                post_result = create_post(upload_thumbnail()['id'])
             
             logger.info(f"投稿完了！ ID: {post_result['id']}, URL: {post_result['link']}")
             
@@ -158,6 +220,41 @@ class AutoArticlePublisher:
                 'error': str(e)
             }
     
+    def _add_stock_images(self, generated: list, max_concurrency: int = 4):
+        """
+        生成済みの全記事の画像プレースホルダーをストック画像に置き換える
+        
+        全記事の画像のダウンロード・アップロードを並行して実行し、
+        WordPressへの同時リクエストは max_concurrency 件までに抑える。
+        """
+        from src.wordpress.async_client import AsyncWordPressClient
+        
+        targets = [result['article_data'] for result in generated
+                   if result.get('success') and result['article_data'].get('original_markdown')]
+        if not targets:
+            return
+        
+        async def enhance_all() -> list:
+            async with AsyncWordPressClient(client=self.wp_client,
+                                            max_concurrency=max_concurrency) as async_client:
+                return await asyncio.gather(*(
+                    self.article_enhancer.enhance_article_with_images_async(
+                        article_data['original_markdown'], article_data['title'],
+                        wp_client=async_client
+                    )
+                    for article_data in targets
+                ), return_exceptions=True)
+        
+        for article_data, enhanced in zip(targets, asyncio.run(enhance_all())):
+            if isinstance(enhanced, Exception):
+                logger.warning(f"画像の追加をスキップ: {article_data['title']} - {str(enhanced)}")
+                continue
+            if enhanced['image_count']:
+                # カテゴリー・タグは生成時に設定済みのため本文のみ差し替える
+                converted = self.article_generator.converter.convert_to_wordpress_html(enhanced['content'])
+                article_data['content'] = converted['content']
+                logger.info(f"画像を追加: {article_data['title']} ({enhanced['image_count']}枚)")
+    
     def _select_topic(self, article_type: str = None, tool_name: str = None) -> str:
         """トピックを自動選択"""
         topics = {
@@ -217,21 +314,45 @@ class AutoArticlePublisher:
         weights = [0.3, 0.2, 0.15, 0.15, 0.1, 0.1]  # Sunoを優先
         return random.choices(tools, weights=weights)[0]
     
-    def run_daily_posts(self, post_count: int = 1, status: str = 'draft'):
+    def run_daily_posts(self, post_count: int = 1, status: str = 'draft',
+                        use_batch_api: bool = False, max_workers: int = 1):
         """
         日次投稿を実行
         
+        全記事を事前に生成する場合（一括生成・並列生成）は、記事中の画像を
+        全記事分まとめて並行にアップロードしてから順に投稿する。
+        
         Args:
             post_count: 投稿する記事数
             status: 投稿ステータス
+            use_batch_api: 全記事を一括生成APIで生成してから順に投稿するか
+            max_workers: 2以上の場合、全記事を並列に生成してから順に投稿する
         """
         logger.info(f"日次投稿開始: {post_count}記事を生成")
         
+        pregenerate = use_batch_api or max_workers > 1
+        if pregenerate:
+            selections = [self._select_article() for _ in range(post_count)]
+            generated = self.article_generator.batch_generate_articles(
+                [
+                    {'topic': topic, 'article_type': article_type,
+                     'tool_name': tool_name, 'use_latest_info': True}
+                    for topic, article_type, tool_name in selections
+                ],
+                use_batch_api=use_batch_api,
+                max_workers=max_workers
+            )
+            self._add_stock_images(generated)
+        
         results = []
         for i in range(post_count):
             logger.info(f"\n--- 記事 {i+1}/{post_count} ---")
             
-            result = self.generate_and_publish(status=status)
+            if pregenerate:
+                _, article_type, tool_name = selections[i]
+                result = self._publish_generated(generated[i], article_type, tool_name, status)
+            else:
+                result = self.generate_and_publish(status=status)
             results.append(result)
             
             if result['success']:
@@ -280,6 +401,17 @@ def main():
         metavar='COUNT',
         help='日次投稿モード：指定した数の記事を生成'
     )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='日次投稿モードで全記事をMessage Batches APIで一括生成（ANTHROPIC_BASE_URLで接続先を変更可能）'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='日次投稿モードで並列に生成する記事数（デフォルト: 1）'
+    )
     parser.add_argument(
         '--test',
         action='store_true',
@@ -308,7 +440,9 @@ def main():
     if args.daily:
         results = publisher.run_daily_posts(
             post_count=args.daily,
-            status=args.status
+            status=args.status,
+            use_batch_api=args.batch,
+            max_workers=args.workers
         )
         sys.exit(0 if all(r['success'] for r in results) else 1)
     
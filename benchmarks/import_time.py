@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Import Time Benchmark
+AI Melody Kobo - エントリーポイントの起動時間と読み込まれる重いモジュールを計測
+
+各対象を新しいPythonプロセスで読み込み（または読み取り専用のサブコマンドを実行し）、
+起動時間の中央値が上限を超えた場合や、使わないはずの重いモジュール
+（PIL・BeautifulSoup・markdown・Pygments・feedparser・SDK・requests）が
+読み込まれた場合に終了コード1を返す。
+
+使用例:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 10 --max-ms 200
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 起動時に読み込まれてはいけないモジュール
+HEAVY_MODULES = ['PIL', 'bs4', 'markdown', 'pygments', 'feedparser',
+                 'anthropic', 'google.generativeai', 'requests']
+
+# (名前, 実行するコード)
+TARGETS = [
+    ('import continuous_post', "import continuous_post"),
+    ('continuous_post --status', (
+        "import io, contextlib, continuous_post\n"
+        "sys.argv = ['continuous_post.py', '--status']\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    continuous_post.main()\n"
+    )),
+    ('import auto_post_article', "import auto_post_article"),
+    ('import file_organizer', "import file_organizer"),
+    ('import content_builder', "import src.article_generator.content_builder"),
+    ('usage_tracker CLI import', "import src.article_generator.usage_tracker"),
+]
+
+# 子プロセスで実行するコード（計測結果をJSONで出力）
+RUNNER = """
+import sys, time, json
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - started
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print('@@' + json.dumps({{'ms': elapsed * 1000, 'heavy': heavy}}))
+"""
+
+
+def measure(code: str, workdir: str) -> dict:
+    """新しいプロセスでコードを実行し、所要時間と読み込まれた重いモジュールを返す"""
+    source = RUNNER.format(root=str(PROJECT_ROOT), code=code, heavy=HEAVY_MODULES)
+    # WordPressやAI APIに接続しないよう認証情報を外す
+    env = {key: value for key, value in os.environ.items()
+           if not key.startswith(('WORDPRESS_', 'ANTHROPIC_', 'CLAUDE_', 'GEMINI_', 'GOOGLE_'))}
+    result = subprocess.run([sys.executable, '-c', source], cwd=workdir, env=env,
+                            capture_output=True, text=True, timeout=60)
+    for line in result.stdout.splitlines():
+        if line.startswith('@@'):
+            return json.loads(line[2:])
+    raise RuntimeError(f"計測に失敗しました:\n{result.stderr[-2000:]}")
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description='エントリーポイントの起動時間ベンチマーク')
+    parser.add_argument('--repeat', type=int, default=5, help='計測回数 デフォルト: 5')
+    parser.add_argument('--max-ms', type=float, default=150.0,
+                        help='起動時間（中央値）の上限ミリ秒 デフォルト: 150')
+    args = parser.parse_args()
+
+    failures = []
+    # 実行時に作られるログ・データファイルでリポジトリを汚さないよう一時ディレクトリで実行
+    with tempfile.TemporaryDirectory() as workdir:
+        print(f"{'対象':28s} {'中央値':>9s} {'最大':>9s}  重いモジュール")
+        for name, code in TARGETS:
+            runs = [measure(code, workdir) for _ in range(args.repeat)]
+            times = [run['ms'] for run in runs]
+            heavy = sorted({module for run in runs for module in run['heavy']})
+            median = statistics.median(times)
+            print(f"{name:28s} {median:7.1f}ms {max(times):7.1f}ms  {', '.join(heavy) or '-'}")
+            if median > args.max_ms:
+                failures.append(f"{name}: {median:.1f}ms > {args.max_ms:.0f}ms")
+            if heavy:
+                failures.append(f"{name}: {', '.join(heavy)} を読み込んでいます")
+
+    if failures:
+        print("\n❌ 起動時間の基準を満たしていません:")
+        for failure in failures:
+            print(f"   {failure}")
+        sys.exit(1)
+    print("\n✅ すべての対象が基準内です")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Thumbnail Glow Benchmark
+AI Melody Kobo - タイトルのネオングロウ描画の速度と見た目を従来の描画と比較
+
+従来の描画（円内のオフセットごとに draw.text で重ね塗り）と現在の描画
+（マスクを1回描いて重ねる）で同じタイトルを描き、所要時間と画像の差を出力する。
+差は人の目に近づけるため輝度に変換して軽くぼかしてから比較し、
+平均差・最大差が上限を超えた場合は終了コード1を返す。
+
+使用例:
+    python benchmarks/thumbnail_glow.py
+    python benchmarks/thumbnail_glow.py --font /path/to/NotoSansJP-Bold.otf --repeat 5
+"""
+
+import sys
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageFont, ImageStat
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.media.fonts import FontRegistry  # noqa: E402
+from src.media.modern_thumbnail_generator import ModernThumbnailGenerator  # noqa: E402
+
+TITLES = [
+    "Suno AIで作る本格BGM",
+    "AI Music Generator Guide",
+    "MusicGen x Stable Audio 2026",
+]
+
+
+class LegacyGlowGenerator(ModernThumbnailGenerator):
+    """従来のネオングロウ（オフセットごとにテキストを描き直す）"""
+
+    def _draw_neon_glow(self, img, position, text, font, color):
+        draw = ImageDraw.Draw(img)
+        x, y = position
+        for glow_size in self.GLOW_RADII:
+            for dx in range(-glow_size, glow_size + 1):
+                for dy in range(-glow_size, glow_size + 1):
+                    if dx * dx + dy * dy <= glow_size * glow_size:
+                        draw.text((x + dx, y + dy), text, font=font, fill=color)
+
+
+def render(generator: ModernThumbnailGenerator, title: str, font) -> Image.Image:
+    """テーマ背景の上にタイトル1行をグロウ付きで描画"""
+    colors = generator.color_themes['neon_purple']
+    img = Image.new('RGBA', generator.default_size, generator._hex_to_rgb(colors['background']) + (255,))
+    ImageDraw.Draw(img).rectangle([60, 260, 1140, 420], fill=(0, 0, 0, 200))
+    generator._draw_neon_glow(img, (100, 300), title, font,
+                              generator._hex_to_rgb(colors['glow']) + (generator.GLOW_ALPHA,))
+    final = Image.new('RGB', img.size, colors['background'])
+    final.paste(img, (0, 0), img)
+    return final
+
+
+def perceptual_diff(a: Image.Image, b: Image.Image) -> tuple:
+    """輝度をぼかしてから比較した (平均差, 最大差)"""
+    blur = ImageFilter.GaussianBlur(1)
+    diff = ImageChops.difference(a.convert('L').filter(blur), b.convert('L').filter(blur))
+    return ImageStat.Stat(diff).mean[0], diff.getextrema()[1]
+
+
+def timed(generator: ModernThumbnailGenerator, title: str, font, repeat: int) -> tuple:
+    """描画を repeat 回行い、(所要時間の中央値ms, 画像) を返す"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        image = render(generator, title, font)
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times), image
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description='タイトルのネオングロウ描画ベンチマーク')
+    parser.add_argument('--font', help='タイトルのフォントファイル（省略時はサムネイルと同じタイトル用フォント）')
+    parser.add_argument('--size', type=int, default=52, help='フォントサイズ デフォルト: 52')
+    parser.add_argument('--repeat', type=int, default=3, help='計測回数 デフォルト: 3')
+    parser.add_argument('--max-mean', type=float, default=0.5, help='平均差の上限 デフォルト: 0.5')
+    parser.add_argument('--max-peak', type=int, default=16, help='最大差の上限 デフォルト: 16')
+    args = parser.parse_args()
+
+    font = (ImageFont.truetype(args.font, args.size) if args.font
+            else FontRegistry.shared().get(FontRegistry.BOLD, args.size))
+
+    failures = []
+    with tempfile.TemporaryDirectory() as assets_dir:
+        legacy = LegacyGlowGenerator(assets_dir=assets_dir, seed=0)
+        current = ModernThumbnailGenerator(assets_dir=assets_dir, seed=0)
+        print(f"{'タイトル':32s} {'従来':>9s} {'現在':>9s} {'倍率':>6s} {'平均差':>7s} {'最大差':>5s}")
+        for title in TITLES:
+            legacy_ms, expected = timed(legacy, title, font, args.repeat)
+            current_ms, actual = timed(current, title, font, args.repeat)
+            mean, peak = perceptual_diff(expected, actual)
+            print(f"{title:32s} {legacy_ms:7.1f}ms {current_ms:7.1f}ms "
+                  f"{legacy_ms / current_ms:5.1f}x {mean:7.3f} {peak:5d}")
+            if mean > args.max_mean or peak > args.max_peak:
+                failures.append(f"{title}: 平均差 {mean:.3f} / 最大差 {peak}")
+            if render(current, title, font).tobytes() != actual.tobytes():
+                failures.append(f"{title}: 同じ入力で異なる画像になりました")
+
+    if failures:
+        print("\n❌ 従来の描画と見た目が異なります:")
+        for failure in failures:
+            print(f"   {failure}")
+        sys.exit(1)
+    print("\n✅ 従来の描画と同じ見た目です")
+
+
+if __name__ == "__main__":
+    main()
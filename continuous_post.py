@@ -8,24 +8,36 @@ import os
 import sys
 import time
 import json
-import random
 import hashlib
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Set, Dict, List
+from typing import TYPE_CHECKING, Set, Dict, List, Optional
+import uuid
 import signal
+import heapq
+import itertools
+import threading
+from collections import deque
 
 # プロジェクトのパスを追加
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.article_generator.content_builder import ArticleGenerator
-from src.wordpress.api_client import WordPressClient
-from src.wordpress.category_manager import CategoryManager
-from src.media.modern_thumbnail_generator import ModernThumbnailGenerator
+from src.article_generator.usage_tracker import UsageBudgetExceeded
+from src.utils.pipeline import PipelineStage, StagePipeline
+from src.utils.job_store import JobStore
+from src.utils.lazy import lazy_component
+from src.utils.seeding import default_seed, seeded_random
 from file_organizer import FileOrganizer
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    # 記事生成・WordPress・画像生成は重いため使うときに読み込む（--statusを高速に起動するため）
+    from src.article_generator.content_builder import ArticleGenerator
+    from src.wordpress.api_client import WordPressClient
+    from src.wordpress.category_manager import CategoryManager
+    from src.media.modern_thumbnail_generator import ModernThumbnailGenerator
+
 # 環境変数の読み込み
 load_dotenv()
 
@@ -44,33 +56,35 @@ logger = logging.getLogger(__name__)
 class ContinuousArticlePublisher:
     """高頻度記事投稿システム"""
     
-    def __init__(self, interval_minutes: int = 10):
+    # ステージ失敗後の待機秒数（連続失敗ごとに2倍、投稿間隔が上限）
+    FAILURE_BACKOFF_SECONDS = 60
+    
+    # 失敗したジョブを再試行するまでの秒数（試行ごとに2倍）
+    RETRY_DELAY_SECONDS = 300
+    
+    def __init__(self, interval_minutes: int = 10,
+                 generate_workers: int = 1, prefetch: int = 1,
+                 seed: Optional[int] = None):
         """
         初期化
         
         Args:
             interval_minutes: 投稿間隔（分）
+            generate_workers: 記事生成ステージのワーカー数
+            prefetch: 投稿待ちの記事とは別に先行生成しておく記事数
+                      （パイプライン内の記事は生成中・投稿待ちを含めて最大 prefetch + 1 件）
+            seed: トピック・キーワード・サムネイルの乱数シード（同じシードなら同じ記事・画像を生成する）
         """
         self.interval_minutes = interval_minutes
         self.interval_seconds = interval_minutes * 60
+        self.generate_workers = generate_workers
+        self.prefetch = prefetch
+        self.seed = seed
         
         logger.info(f"連続投稿システムを初期化中... (間隔: {interval_minutes}分)")
         
-        # WordPressクライアント
-        self.wp_client = WordPressClient()
-        
-        # カテゴリーマネージャー
-        self.category_manager = CategoryManager(self.wp_client)
-        self.category_manager.setup_categories()
-        
-        # 記事生成器
-        self.article_generator = ArticleGenerator(
-            ai_client_type="claude",
-            category_manager=self.category_manager
-        )
-        
-        # サムネイル生成器
-        self.thumbnail_generator = ModernThumbnailGenerator()
+        # WordPressクライアント・カテゴリーマネージャー・記事生成器・サムネイル生成器は
+        # 初回使用時に生成する（--statusではWordPressに接続しない）
         
         # 記事履歴管理
         self.history_file = Path("data/post_history.json")
@@ -78,22 +92,73 @@ class ContinuousArticlePublisher:
         self.post_history = self._load_history()
         
         # トピック管理
-        self.topic_manager = TopicManager()
+        self.topic_manager = TopicManager(seed=seed)
         
         # ファイル整理システム
         self.file_organizer = FileOrganizer()
         
+        # ステージ並行実行時の共有状態の保護
+        self._history_lock = threading.Lock()
+        self._archive_lock = threading.Lock()
+        
+        # ジョブのチェックポイント（異常終了後に途中から再開する）
+        self.job_store = JobStore("data/jobs.sqlite3")
+        self._resume_queue = deque()
+        # 失敗したジョブの再試行待ち（(再試行時刻, 登録順, ジョブ) のヒープ）
+        self._retry_jobs = []
+        self._retry_order = itertools.count()
+        self._retry_lock = threading.Lock()
+        
+        # パイプライン
+        self._pipeline = None
+        self._next_slot = 0.0
+        self.metrics_file = Path("data/pipeline_metrics.json")
+        
         # 実行中フラグ
         self.running = False
         
         logger.info("連続投稿システムの初期化完了")
     
+    @lazy_component
+    def wp_client(self) -> 'WordPressClient':
+        """WordPressクライアント"""
+        from src.wordpress.api_client import WordPressClient
+        return WordPressClient()
+    
+    @lazy_component
+    def category_manager(self) -> 'CategoryManager':
+        """カテゴリーマネージャー（生成時にWordPressのカテゴリーを準備する）"""
+        from src.wordpress.category_manager import CategoryManager
+        category_manager = CategoryManager(self.wp_client)
+        category_manager.setup_categories()
+        return category_manager
+    
+    @lazy_component
+    def article_generator(self) -> 'ArticleGenerator':
+        """記事生成器"""
+        from src.article_generator.content_builder import ArticleGenerator
+        # 既定は Claude → Gemini の順に切り替えるルーティングクライアント
+        return ArticleGenerator(
+            ai_client_type=os.getenv('AI_CLIENT_TYPE', 'auto'),
+            category_manager=self.category_manager,
+            seed=self.seed
+        )
+    
+    @lazy_component
+    def thumbnail_generator(self) -> 'ModernThumbnailGenerator':
+        """サムネイル生成器"""
+        from src.media.modern_thumbnail_generator import ModernThumbnailGenerator
+        return ModernThumbnailGenerator(seed=self.seed)
+    
     def _load_history(self) -> Dict:
         """投稿履歴を読み込み"""
         if self.history_file.exists():
             try:
                 with open(self.history_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    history = json.load(f)
+                # JSONではlistとして保存されているためsetに戻す
+                history['used_topics'] = set(history.get('used_topics', []))
+                return history
             except Exception as e:
                 logger.warning(f"履歴ファイル読み込みエラー: {e}")
         
@@ -139,102 +204,224 @@ class ContinuousArticlePublisher:
         
         return unique_topic
     
-    def generate_and_publish_once(self) -> Dict:
-        """1回分の記事生成・投稿"""
-        try:
-            # 記事タイプとツールを選択
-            article_type = self.topic_manager.select_article_type()
-            tool_name = self.topic_manager.select_tool_name()
-            
-            # ユニークなトピックを生成
+    def _new_job(self) -> Dict:
+        """記事タイプ・ツール・トピックを決めて新しい作業項目を作成"""
+        article_type = self.topic_manager.select_article_type()
+        tool_name = self.topic_manager.select_tool_name()
+        
+        # ユニークなトピックを生成
+        with self._history_lock:
             topic = self._get_unique_topic(article_type, tool_name)
-            
-            logger.info(f"記事生成開始: {topic}")
-            logger.info(f"タイプ: {article_type}, ツール: {tool_name}")
-            
-            # 記事生成
+        
+        job = {
+            'id': uuid.uuid4().hex,
+            'article_type': article_type,
+            'tool_name': tool_name,
+            'topic': topic
+        }
+        self.job_store.create(job)
+        return job
+    
+    def _claim_pending_jobs(self, limit: Optional[int] = None):
+        """前回の実行で完了しなかったジョブを再開待ちに積む（limit件まで）"""
+        pending = self.job_store.claim_pending(limit)
+        if pending:
+            logger.info(f"未完了のジョブを再開します: {len(pending)}件")
+        self._resume_queue.extend(pending)
+    
+    def _schedule_retry(self, job: Dict):
+        """失敗したジョブを時間をおいて再試行する（試行回数の上限を超えたら失敗扱い）"""
+        attempts = self.job_store.retry(job['id'])
+        if attempts is None:
+            return
+        delay = self.RETRY_DELAY_SECONDS * 2 ** (attempts - 1)
+        logger.info(f"🔁 {delay / 60:.0f}分後に再試行します: {job['topic']} "
+                    f"(試行 {attempts}/{self.job_store.max_attempts}, 完了済み: {job['stage']})")
+        with self._retry_lock:
+            heapq.heappush(self._retry_jobs, (time.time() + delay, next(self._retry_order), job))
+    
+    def _next_job(self) -> Dict:
+        """再試行・再開待ちのジョブがあればそれを、なければ新しいジョブを返す"""
+        with self._retry_lock:
+            if self._retry_jobs and self._retry_jobs[0][0] <= time.time():
+                job = heapq.heappop(self._retry_jobs)[2]
+                logger.info(f"🔁 ジョブを再試行: {job['topic']} (完了済み: {job['stage']})")
+                return job
+        try:
+            job = self._resume_queue.popleft()
+            logger.info(f"♻️  ジョブを再開: {job['topic']} (完了済み: {job['stage']})")
+            return job
+        except IndexError:
+            return self._new_job()
+    
+    def _checkpointed(self, stage: str, func):
+        """完了済みならスキップし、完了時にチェックポイントを保存するステージ関数を作成"""
+        def run(job: Dict) -> Optional[Dict]:
+            if JobStore.reached(job, stage):
+                return job
+            try:
+                result = func(job)
+            except Exception as e:
+                self.job_store.record_error(job['id'], str(e))
+                # 一時的なエラーで記事を次回起動まで放置しない（予算切れ・停止時は次回起動時に再開）
+                if self.running and not isinstance(e, UsageBudgetExceeded):
+                    self._schedule_retry(job)
+                raise
+            # 投稿ステージは手順ごとに自身でチェックポイントを保存する
+            if result is not None and stage != 'done':
+                self.job_store.checkpoint(result, stage)
+            return result
+        return run
+    
+    def _stage_generate(self, job: Dict) -> Dict:
+        """ステージ1: 記事生成"""
+        logger.info(f"記事生成開始: {job['topic']}")
+        logger.info(f"タイプ: {job['article_type']}, ツール: {job['tool_name']}")
+        
+        try:
             result = self.article_generator.generate_article(
-                topic=topic,
-                article_type=article_type,
-                tool_name=tool_name,
-                use_latest_info=False  # 高頻度投稿では外部情報収集を軽量化
+                topic=job['topic'],
+                article_type=job['article_type'],
+                tool_name=job['tool_name'],
+                use_latest_info=False,  # 高頻度投稿では外部情報収集を軽量化
+                stream=True  # 形式外のレスポンスは途中で打ち切る
             )
-            
+        except UsageBudgetExceeded as e:
+            # 予算を使い切ったら生成済みの記事を待たずに停止（ジョブは次回起動時に再開）
+            logger.error(f"💸 {str(e)} 連続投稿を停止します")
+            self.running = False
+            raise
+        
+        if not result['success']:
+            raise Exception("記事生成に失敗しました")
+        
+        logger.info(f"生成プロバイダー: {result['generation_metadata']['ai_provider']}")
+        job['markdown'] = result['generation_metadata']['markdown_content']
+        job['article_data'] = result['article_data']
+        job['generated_at'] = datetime.now().isoformat()
+        return job
+    
+    def _stage_render(self, job: Dict) -> Dict:
+        """ステージ2: サムネイル生成"""
+        job['thumbnail_data'] = self.thumbnail_generator.generate_from_article_data(
+            job['article_data'],
+            article_type=job['article_type'],
+            tool_name=job['tool_name']
+        )
+        return job
+    
+    def _stage_archive(self, job: Dict) -> Dict:
+        """ステージ3: 生成した記事と画像をアーカイブ"""
+        article_data = job['article_data']
+        
+        with self._archive_lock:
             # 生成された記事をアーカイブ
-            if result['success']:
-                self.file_organizer.archive_generated_article(
-                    result['generation_metadata']['markdown_content'],
-                    {
-                        'article_type': article_type,
-                        'tool_name': tool_name,
-                        'topic': topic,
-                        'generated_at': datetime.now().isoformat()
-                    },
-                    title=topic
-                )
-            
-            if not result['success']:
-                raise Exception("記事生成に失敗しました")
-            
-            article_data = result['article_data']
-            
-            # サムネイル生成
-            thumbnail_data = self.thumbnail_generator.generate_from_article_data(
-                article_data,
-                article_type=article_type,
-                tool_name=tool_name
+            self.file_organizer.archive_generated_article(
+                job['markdown'],
+                {
+                    'article_type': job['article_type'],
+                    'tool_name': job['tool_name'],
+                    'topic': job['topic'],
+                    'generated_at': job['generated_at']
+                },
+                title=job['topic']
             )
             
             # 画像をアーカイブ
             thumbnail_filename = f"thumbnail_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
             self.file_organizer.archive_image(
-                thumbnail_data,
+                job['thumbnail_data'],
                 thumbnail_filename,
                 {
                     'article_title': article_data['title'],
-                    'article_type': article_type,
-                    'tool_name': tool_name,
+                    'article_type': job['article_type'],
+                    'tool_name': job['tool_name'],
                     'generated_for': 'thumbnail'
                 }
             )
-            
-            # 画像アップロード
+        return job
+    
+    def _stage_publish(self, job: Dict) -> Dict:
+        """ステージ4: 画像アップロード・記事投稿・履歴記録（完了済みの手順は省略）"""
+        article_data = job['article_data']
+        article_type = job['article_type']
+        tool_name = job['tool_name']
+        
+        from src.wordpress.api_client import InvalidMediaError
+        
+        # アップロード済みから再開する場合、前回の記事作成が届いている可能性がある
+        resumed_after_upload = JobStore.reached(job, 'uploaded')
+        
+        def upload_thumbnail():
             media_result = self.wp_client.upload_media(
-                file_data=thumbnail_data,
+                file_data=job['thumbnail_data'],
                 filename=f"thumb_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png",
                 title=f"{article_data['title']} - アイキャッチ画像",
                 alt_text=article_data['title']
             )
-            
-            # 記事投稿
-            post_result = self.wp_client.create_post(
+            job['media_id'] = media_result['id']
+            self.job_store.checkpoint(job, 'uploaded')
+        
+        def create_post():
+            return self.wp_client.create_post(
                 title=article_data['title'],
                 content=article_data['content'],
                 status='draft',  # 高頻度投稿では安全のため下書きに
                 categories=article_data.get('categories', []),
                 tags=article_data.get('tags', []),
-                featured_media=media_result['id'],
+                featured_media=job['media_id'],
                 excerpt=article_data.get('excerpt', ''),
-                meta_description=article_data.get('meta_description', '')
+                meta_description=article_data.get('meta_description', ''),
+                idempotency_key=job['id']
             )
-            
-            # 履歴に記録
-            post_record = {
+        
+        # 画像アップロード
+        if not resumed_after_upload:
+            upload_thumbnail()
+        
+        # 記事投稿（前回の送信が届いていた場合は冪等キーで既存の記事を使う）
+        if not JobStore.reached(job, 'posted'):
+            post_result = None
+            if resumed_after_upload:
+                post_result = self.wp_client.find_post_by_idempotency_key(job['id'])
+            if post_result is None:
+                try:
+                    post_result = create_post()
+                except InvalidMediaError:
+                    # アップロード後にWordPress側で画像が削除された場合は1回だけ再アップロードする
+                    logger.warning(f"アイキャッチ画像が削除されているため再アップロードします: ID={job['media_id']}")
+                    upload_thumbnail()
+                    post_result = create_post()
+            job['post_id'] = post_result['id']
+            job['post_result'] = {
                 'id': post_result['id'],
-                'title': post_result['title']['rendered'],
-                'url': post_result['link'],
-                'article_type': article_type,
-                'tool_name': tool_name,
-                'posted_at': datetime.now().isoformat(),
+                'title': {'rendered': post_result['title']['rendered']},
+                'link': post_result['link'],
                 'status': post_result['status']
             }
-            
-            self.post_history['posts'].append(post_record)
-            self.post_history['last_post_time'] = datetime.now().isoformat()
-            self.post_history['total_posts'] += 1
-            self._save_history()
-            
-            # 投稿済み記事をアーカイブ
+            self.job_store.checkpoint(job, 'posted')
+        post_result = job['post_result']
+        
+        # 履歴に記録（再開時に二重登録しない）
+        post_record = {
+            'id': post_result['id'],
+            'title': post_result['title']['rendered'],
+            'url': post_result['link'],
+            'article_type': article_type,
+            'tool_name': tool_name,
+            'posted_at': datetime.now().isoformat(),
+            'status': post_result['status']
+        }
+        
+        with self._history_lock:
+            if not any(post.get('id') == post_result['id'] for post in self.post_history['posts']):
+                self.post_history['posts'].append(post_record)
+                self.post_history['last_post_time'] = datetime.now().isoformat()
+                self.post_history['total_posts'] += 1
+                self._save_history()
+        
+        # 投稿済み記事をアーカイブ
+        with self._archive_lock:
             self.file_organizer.archive_published_article(
                 post_result['id'],
                 post_result['link'],
@@ -248,11 +435,26 @@ class ContinuousArticlePublisher:
                     'status': post_result['status']
                 }
             )
+        
+        self.job_store.complete(job)
+        
+        logger.info(f"✅ 投稿完了: {post_result['title']['rendered']}")
+        logger.info(f"   URL: {post_result['link']}")
+        logger.info(f"   累計投稿数: {self.post_history['total_posts']}")
+        
+        return job
+    
+    def generate_and_publish_once(self) -> Dict:
+        """1回分の記事生成・投稿（全ステージを順番に実行）"""
+        try:
+            # 実行する1件だけを取得する（他のジョブの試行回数は加算しない）
+            if not self._resume_queue:
+                self._claim_pending_jobs(limit=1)
+            job = self._next_job()
+            for stage in self._stages():
+                job = stage(job)
             
-            logger.info(f"✅ 投稿完了: {post_result['title']['rendered']}")
-            logger.info(f"   URL: {post_result['link']}")
-            logger.info(f"   累計投稿数: {self.post_history['total_posts']}")
-            
+            post_result = job['post_result']
             return {
                 'success': True,
                 'post_id': post_result['id'],
@@ -267,32 +469,86 @@ class ContinuousArticlePublisher:
                 'error': str(e)
             }
     
+    def _stages(self) -> List:
+        """チェックポイント付きのステージ関数（生成→レンダリング→アーカイブ→投稿）"""
+        return [
+            self._checkpointed('generated', self._stage_generate),
+            self._checkpointed('rendered', self._stage_render),
+            self._checkpointed('archived', self._stage_archive),
+            self._checkpointed('done', self._stage_publish)
+        ]
+    
+    def _build_pipeline(self) -> StagePipeline:
+        """生成→レンダリング→アーカイブ→投稿のパイプラインを構築"""
+        generate, render, archive, publish = self._stages()
+        return StagePipeline(
+            [
+                PipelineStage('generate', generate, workers=self.generate_workers),
+                PipelineStage('render', render, queue_size=1),
+                PipelineStage('archive', archive, queue_size=1),
+                PipelineStage('publish', lambda job: self._publish_on_schedule(job, publish),
+                              queue_size=self.prefetch)
+            ],
+            source=self._next_job,
+            # 投稿待ちの1件に加えて prefetch 件までしか先行生成しない（各キューの上限の合計ではなく全体で制限）
+            max_in_flight=self.prefetch + 1,
+            # 生成APIの障害・認証エラー時に新しいジョブとAI呼び出しを繰り返さない
+            failure_backoff=self.FAILURE_BACKOFF_SECONDS,
+            max_failure_backoff=max(self.interval_seconds, self.FAILURE_BACKOFF_SECONDS)
+        )
+    
+    def _publish_on_schedule(self, job: Dict, publish) -> Optional[Dict]:
+        """投稿時刻まで待機してから投稿（投稿済みのジョブは待たずに後処理のみ行う）"""
+        if JobStore.reached(job, 'posted'):
+            return publish(job)
+        
+        wait_time = self._next_slot - time.time()
+        if wait_time > 0:
+            logger.info(f"⏰ 次回投稿まで {wait_time / 60:.1f}分待機... ({job['article_data']['title']})")
+            if self._pipeline.wait(wait_time):
+                return None
+        
+        try:
+            return publish(job)
+        finally:
+            # 遅れた場合は次の枠を今から数える
+            self._next_slot = max(self._next_slot + self.interval_seconds, time.time())
+            self._save_pipeline_metrics()
+    
+    def _save_pipeline_metrics(self):
+        """ステージ別メトリクスをログに出力し、--status用に保存"""
+        metrics = self._pipeline.get_metrics()
+        for name, m in metrics.items():
+            logger.info(f"   [{name}] キュー {m['queue_depth']}/{m['queue_size']} "
+                        f"処理中 {m['in_flight']} 完了 {m['processed']} 失敗 {m['failed']} "
+                        f"平均 {m['latency_avg']:.1f}秒 p95 {m['latency_p95']:.1f}秒")
+        try:
+            with open(self.metrics_file, 'w', encoding='utf-8') as f:
+                json.dump({'updated_at': datetime.now().isoformat(), 'stages': metrics},
+                          f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.warning(f"メトリクス保存エラー: {e}")
+    
     def run_continuous(self):
-        """連続投稿を開始"""
+        """連続投稿を開始（ステージごとに並行実行し、投稿は一定間隔で行う）"""
+        # 接続・設定の問題はパイプライン開始前に検出する
+        self.article_generator
+        self.thumbnail_generator
+        
         self.running = True
         
         logger.info(f"🚀 連続投稿開始 (間隔: {self.interval_minutes}分)")
         logger.info(f"   累計投稿数: {self.post_history['total_posts']}")
         logger.info("   停止するには Ctrl+C を押してください")
         
+        self._claim_pending_jobs()
+        self._next_slot = time.time()
+        self._pipeline = self._build_pipeline()
+        
         try:
+            self._pipeline.start()
             while self.running:
-                start_time = time.time()
-                
-                # 記事投稿
-                result = self.generate_and_publish_once()
-                
-                if result['success']:
-                    logger.info(f"⏰ 次回投稿まで {self.interval_minutes}分待機...")
-                else:
-                    logger.warning("⚠️  投稿に失敗しましたが、処理を継続します")
-                
-                # 待機時間の計算
-                elapsed = time.time() - start_time
-                wait_time = max(0, self.interval_seconds - elapsed)
-                
-                if wait_time > 0:
-                    time.sleep(wait_time)
+                time.sleep(1)
                 
         except KeyboardInterrupt:
             logger.info("\n🛑 停止シグナルを受信しました")
@@ -300,9 +556,32 @@ class ContinuousArticlePublisher:
             logger.error(f"💥 予期しないエラー: {str(e)}")
         finally:
             self.running = False
+            self._pipeline.stop()
+            job_counts = self.job_store.get_counts()
+            self.job_store.close()
+            request_stats = self.wp_client.get_request_stats()
+            self.wp_client.close()
             logger.info("📊 最終統計:")
             logger.info(f"   累計投稿数: {self.post_history['total_posts']}")
             logger.info(f"   最終投稿: {self.post_history.get('last_post_time', 'なし')}")
+            logger.info(f"   WordPressリクエスト: {request_stats['requests']}件 "
+                        f"(接続再利用 {request_stats['connections_reused']}件)")
+            logger.info(f"   未完了ジョブ: {job_counts['status'].get('active', 0)}件 (次回起動時に再開)")
+            cache_stats = self.article_generator.ai_client.get_cache_stats()
+            if cache_stats['enabled']:
+                logger.info(f"   AIレスポンスキャッシュ: ヒット {cache_stats['hits']}件 / "
+                            f"ミス {cache_stats['misses']}件")
+            usage_tracker = self.article_generator.ai_client.usage_tracker
+            if usage_tracker is not None:
+                totals = usage_tracker.get_run_totals()
+                logger.info(f"   AI使用量: {totals['calls']}回 / {totals['tokens']:,}トークン / "
+                            f"${totals['cost_usd']:.2f}")
+            get_provider_stats = getattr(self.article_generator.ai_client, 'get_provider_stats', None)
+            if get_provider_stats:
+                for provider, stats in get_provider_stats().items():
+                    if stats['requests']:
+                        logger.info(f"   {provider}: p50 {stats['p50_seconds']}秒 / p95 {stats['p95_seconds']}秒 / "
+                                    f"エラー率 {stats['error_rate']:.0%} ({stats['requests']}件)")
             logger.info("🔚 連続投稿システムを終了しました")
     
     def status(self):
@@ -320,12 +599,39 @@ class ContinuousArticlePublisher:
             for post in recent_posts:
                 posted_time = datetime.fromisoformat(post['posted_at']).strftime('%m/%d %H:%M')
                 print(f"   {posted_time} - {post['title'][:50]}...")
+        
+        # 未完了ジョブ
+        job_counts = self.job_store.get_counts()
+        if job_counts['active_stages']:
+            print("\n♻️  再開待ちのジョブ:")
+            for stage, count in job_counts['active_stages'].items():
+                print(f"   {stage:10s} {count}件")
+        if job_counts['status'].get('failed'):
+            print(f"   失敗: {job_counts['status']['failed']}件")
+        
+        # パイプラインのステージ別メトリクス
+        if self.metrics_file.exists():
+            with open(self.metrics_file, 'r', encoding='utf-8') as f:
+                metrics = json.load(f)
+            print(f"\n⚙️  パイプライン ({metrics['updated_at'][:16]}時点):")
+            for name, m in metrics['stages'].items():
+                print(f"   {name:8s} キュー {m['queue_depth']}/{m['queue_size']} "
+                      f"完了 {m['processed']} 失敗 {m['failed']} "
+                      f"平均 {m['latency_avg']:.1f}秒 p95 {m['latency_p95']:.1f}秒")
 
 
 class TopicManager:
     """トピック管理クラス"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: トピック・記事タイプ・ツール選択の乱数シード（同じシードなら同じ順序で選択する。
+                  省略時は環境変数GENERATION_SEED、未設定なら毎回ランダム）
+        """
+        seed = seed if seed is not None else default_seed()
+        self.rng = seeded_random(seed, 'topics')
+        
         # 記事タイプ別の詳細なトピックテンプレート
         self.topic_templates = {
             'beginner_guide': [
@@ -440,7 +746,7 @@ class TopicManager:
     def generate_topic(self, article_type: str, tool_name: str) -> str:
         """トピックを生成"""
         templates = self.topic_templates.get(article_type, self.topic_templates['tutorial'])
-        template = random.choice(templates)
+        template = self.rng.choice(templates)
         
         # 変数を置換
         current_month = datetime.now().month
@@ -448,9 +754,9 @@ class TopicManager:
         topic = template.format(
             tool=tool_name or "AI音楽ツール",
             month=current_month,
-            genre=random.choice(self.genres),
-            tool1=random.choice(['Suno', 'Udio', 'MusicGen']),
-            tool2=random.choice(['Stable Audio', 'AIVA'])
+            genre=self.rng.choice(self.genres),
+            tool1=self.rng.choice(['Suno', 'Udio', 'MusicGen']),
+            tool2=self.rng.choice(['Stable Audio', 'AIVA'])
         )
         
         return topic
@@ -459,19 +765,18 @@ class TopicManager:
         """記事タイプを重み付きで選択"""
         types = list(self.type_weights.keys())
         weights = list(self.type_weights.values())
-        return random.choices(types, weights=weights)[0]
+        return self.rng.choices(types, weights=weights)[0]
     
     def select_tool_name(self) -> str:
         """ツール名を重み付きで選択"""
         tools = list(self.tool_weights.keys())
         weights = list(self.tool_weights.values())
-        return random.choices(tools, weights=weights)[0]
+        return self.rng.choices(tools, weights=weights)[0]
 
 
 def signal_handler(signum, frame):
-    """シグナルハンドラー"""
-    logger.info("\n🛑 停止シグナルを受信しました")
-    sys.exit(0)
+    """シグナルハンドラー（処理中のステージを終えてから停止させる）"""
+    raise KeyboardInterrupt
 
 
 def main():
@@ -497,6 +802,24 @@ def main():
         action='store_true',
         help='1回だけテスト投稿'
     )
+    parser.add_argument(
+        '--generate-workers',
+        type=int,
+        default=1,
+        help='記事生成ステージのワーカー数 デフォルト: 1'
+    )
+    parser.add_argument(
+        '--prefetch',
+        type=int,
+        default=1,
+        help='投稿待ちの記事とは別に先行生成しておく記事数（パイプライン内の記事は最大 prefetch+1 件）デフォルト: 1'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='乱数シード（同じシードで同じトピック・記事・サムネイルを生成）デフォルト: 環境変数GENERATION_SEED'
+    )
     
     args = parser.parse_args()
     
@@ -505,7 +828,12 @@ def main():
     signal.signal(signal.SIGTERM, signal_handler)
     
     try:
-        publisher = ContinuousArticlePublisher(interval_minutes=args.interval)
+        publisher = ContinuousArticlePublisher(
+            interval_minutes=args.interval,
+            generate_workers=args.generate_workers,
+            prefetch=args.prefetch,
+            seed=args.seed
+        )
         
         if args.status:
             publisher.status()
@@ -519,6 +847,8 @@ def main():
         else:
             publisher.run_continuous()
             
+    except KeyboardInterrupt:
+        logger.info("\n🛑 停止シグナルを受信しました（未完了のジョブは次回起動時に再開します）")
     except Exception as e:
         logger.error(f"💥 システムエラー: {str(e)}")
         sys.exit(1)
@@ -19,14 +19,17 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.article_generator.smart_content_generator import SmartContentGenerator
 from src.media.modern_thumbnail_generator import ModernThumbnailGenerator
-from src.media.content_image_generator import ContentImageGenerator
-from convert_markdown_to_html import convert_markdown_to_html
+from src.media.batch_render import render_many, thumbnail_spec, content_image_spec
+from src.wordpress.converter import ArticleConverter
 
 # WordPress設定
 WP_USERNAME = os.getenv('WORDPRESS_USERNAME')
 WP_PASSWORD = os.getenv('WORDPRESS_APP_PASSWORD')
 WP_URL = 'https://aimelodykobo.com'
 
+# Markdown→HTML変換（CTAボタン・CTAブロックの変換を含む）
+converter = ArticleConverter()
+
 # ロギング設定
 logging.basicConfig(
     level=logging.INFO,
@@ -124,18 +127,6 @@ AI Melody Koboの無料メルマガで、AI音楽制作の最新トレンドを
     
     return content
 
-def convert_cta_to_html(content: str) -> str:
-    """CTAボタンをHTML形式に変換"""
-    cta_button_html = '''<div class="wp-block-buttons is-content-justification-center is-layout-flex wp-container-core-buttons-layout-1 wp-block-buttons-is-layout-flex">
-<div class="wp-block-button"><a class="wp-block-button__link wp-element-button" href="/newsletter" style="background-color:#ff6b35;color:#ffffff;">無料メルマガに登録する</a></div>
-</div>'''
-    
-    content = content.replace('[CTAボタン: 無料メルマガに登録する]', cta_button_html)
-    content = content.replace('**💌 無料メルマガ登録で限定特典をゲット！**', 
-                            '<h3 style="text-align: center; color: #ff6b35;">💌 無料メルマガ登録で限定特典をゲット！</h3>')
-    
-    return content
-
 def upload_image_to_wordpress(image_data, filename, alt_text="AI音楽関連画像"):
     """画像をWordPressにアップロード"""
     
@@ -157,7 +148,7 @@ def upload_image_to_wordpress(image_data, filename, alt_text="AI音楽関連画
         logger.error(f"   ❌ 画像アップロード失敗: {response.status_code}")
         return None, None
 
-def add_images_to_content(content: str, article_title: str, image_generator: ContentImageGenerator) -> str:
+def add_images_to_content(content: str, article_title: str) -> str:
     """記事内の画像挿入指示を実際の画像に置換"""
     
     import re
@@ -168,22 +159,25 @@ def add_images_to_content(content: str, article_title: str, image_generator: Con
     # すべての画像挿入指示を検索
     matches = list(re.finditer(image_pattern, content))
     
+    # 画像をまとめて並列に生成（結果は matches と同じ順）
+    logger.info(f"   🎨 画像生成中: {len(matches)}枚")
+    images = render_many([
+        content_image_spec(description=match.group(1), style='modern', article_context=article_title)
+        for match in matches
+    ])
+    
     # 後ろから置換（インデックスがずれないように）
-    for i, match in enumerate(reversed(matches)):
+    for i, (match, image) in enumerate(zip(reversed(matches), reversed(images))):
         instruction = match.group(1)
-        logger.info(f"   🎨 画像生成中: {instruction}")
         
-        # 画像を生成
         try:
-            image_data = image_generator.generate_content_image(
-                description=instruction,
-                style='modern',
-                article_context=article_title
-            )
+            if image['error']:
+                raise RuntimeError(image['error'])
+            logger.info(f"   🎨 画像生成完了: {instruction} ({image['seconds']:.2f}秒)")
             
             # WordPressにアップロード
             filename = f"content_image_{i+1}.png"
-            media_id, media_url = upload_image_to_wordpress(image_data, filename, instruction)
+            media_id, media_url = upload_image_to_wordpress(image['data'], filename, instruction)
             
             if media_url:
                 # HTML形式の画像に置換
@@ -207,7 +201,7 @@ def add_images_to_content(content: str, article_title: str, image_generator: Con
     
     return content
 
-def post_article_with_images(title, content, thumbnail_data, image_generator, status='draft'):
+def post_article_with_images(title, content, thumbnail_data, status='draft'):
     """サムネイルと記事内画像付きで投稿"""
     
     # サムネイルをアップロード
@@ -220,13 +214,10 @@ def post_article_with_images(title, content, thumbnail_data, image_generator, st
         thumbnail_id, _ = upload_image_to_wordpress(thumbnail_data, thumbnail_filename, f"{title}のサムネイル")
     
     # MarkdownをHTMLに変換
-    html_content = convert_markdown_to_html(content)
-    
-    # CTAをHTML形式に変換
-    html_content = convert_cta_to_html(html_content)
+    html_content = converter.markdown_to_html(content, media_placeholders=False)
     
     # 記事内画像を追加
-    html_content = add_images_to_content(html_content, title, image_generator)
+    html_content = add_images_to_content(html_content, title)
     
     logger.info("   📝 記事の準備完了（HTML + 画像）")
     
@@ -273,13 +264,13 @@ def main():
     
     # ジェネレーター初期化
     thumbnail_generator = ModernThumbnailGenerator()
-    image_generator = ContentImageGenerator()
     
     # 出力ディレクトリ
     output_dir = Path("production_articles")
     output_dir.mkdir(exist_ok=True)
     
     success_count = 0
+    articles = []
     
     for i, article_config in enumerate(PRODUCTION_TOPICS, 1):
         logger.info(f"\n{'='*60}")
@@ -322,23 +313,34 @@ def main():
                     tool_name = tool
                     break
             
-            # サムネイル生成
-            logger.info("   🖼️ サムネイル生成中...")
-            thumbnail_data = thumbnail_generator.generate_thumbnail(
+            articles.append((full_title, content, thumbnail_spec(
                 title=clean_title,
                 article_type=article_config['article_type'],
                 tool_name=tool_name,
                 keywords=article_config['keywords']
-            )
-            
-            # 投稿
-            if post_article_with_images(full_title, content, thumbnail_data, image_generator):
-                success_count += 1
+            )))
             
         except Exception as e:
             logger.error(f"❌ エラー: {str(e)}")
             continue
     
+    # サムネイルをまとめて並列に生成
+    logger.info(f"\n🖼️ {len(articles)}件のサムネイルを生成中...")
+    thumbnails = render_many([spec for *_, spec in articles], seed=thumbnail_generator.seed)
+    
+    for (full_title, content, _), thumbnail in zip(articles, thumbnails):
+        logger.info(f"\n{'='*60}")
+        logger.info(f"投稿中: {full_title}")
+        if thumbnail['error']:
+            logger.warning(f"   ⚠️ サムネイル生成失敗: {thumbnail['error']}")
+        
+        # 投稿
+        try:
+            if post_article_with_images(full_title, content, thumbnail['data']):
+                success_count += 1
+        except Exception as e:
+            logger.error(f"❌ エラー: {str(e)}")
+    
     # 最終結果
     logger.info(f"\n{'='*60}")
     logger.info("🎉 処理完了！")
@@ -21,14 +21,18 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.article_generator.smart_content_generator import SmartContentGenerator
 from src.media.modern_thumbnail_generator import ModernThumbnailGenerator
+from src.media.batch_render import render_many, thumbnail_spec
 from src.media.unsplash_image_fetcher import UnsplashImageFetcher
-from convert_markdown_to_html import convert_markdown_to_html
+from src.wordpress.converter import ArticleConverter
 
 # WordPress設定
 WP_USERNAME = os.getenv('WORDPRESS_USERNAME')
 WP_PASSWORD = os.getenv('WORDPRESS_APP_PASSWORD')
 WP_URL = 'https://aimelodykobo.com'
 
+# Markdown→HTML変換（CTAボタン・CTAブロックの変換を含む）
+converter = ArticleConverter()
+
 # ロギング設定
 logging.basicConfig(
     level=logging.INFO,
@@ -126,33 +130,6 @@ AI Melody Koboの無料メルマガで、AI音楽制作の最新トレンドを
     
     return content
 
-def convert_cta_to_html(content: str) -> str:
-    """CTAボタンをHTML形式に変換"""
-    # CTAブロック全体のHTML
-    cta_block_html = '''<div style="background-color: #FFF8E1; border: 2px solid #ff6b35; border-radius: 10px; padding: 30px; margin: 40px 0; text-align: center;">
-<h3 style="color: #ff6b35; margin-bottom: 20px;">💌 無料メルマガ登録で限定特典をゲット！</h3>
-<p style="margin-bottom: 25px;">AI音楽制作の最新情報と実践的なテクニックを毎週お届け！<br>今なら登録特典として「AI音楽プロンプト100選」を無料プレゼント中です。</p>
-<div class="wp-block-buttons is-content-justification-center is-layout-flex wp-container-core-buttons-layout-1 wp-block-buttons-is-layout-flex">
-<div class="wp-block-button"><a class="wp-block-button__link wp-element-button" href="/newsletter" style="background-color:#ff6b35;color:#ffffff;padding:15px 30px;font-size:18px;font-weight:bold;border-radius:5px;text-decoration:none;">無料でメルマガに登録する</a></div>
-</div>
-</div>'''
-    
-    # CTAボタンの単独置換
-    cta_button_html = '''<div class="wp-block-buttons is-content-justification-center is-layout-flex wp-container-core-buttons-layout-1 wp-block-buttons-is-layout-flex">
-<div class="wp-block-button"><a class="wp-block-button__link wp-element-button" href="/newsletter" style="background-color:#ff6b35;color:#ffffff;padding:15px 30px;font-size:18px;font-weight:bold;border-radius:5px;text-decoration:none;">無料でメルマガに登録する</a></div>
-</div>'''
-    
-    # CTAブロック全体を置換
-    cta_pattern = r'---\s*\n\s*\*\*💌 無料メルマガ登録で限定特典をゲット！\*\*\s*\n\s*AI音楽制作の最新情報.*?無料プレゼント中です。\s*\n\s*\[CTAボタン: 無料でメルマガに登録する\]\s*\n\s*---'
-    import re
-    content = re.sub(cta_pattern, cta_block_html, content, flags=re.DOTALL)
-    
-    # 残りの置換
-    content = content.replace('[CTAボタン: 無料でメルマガに登録する]', cta_button_html)
-    content = content.replace('[CTAボタン: 無料メルマガに登録する]', cta_button_html)
-    
-    return content
-
 def upload_image_to_wordpress(image_data, filename, alt_text="AI音楽関連画像"):
     """画像をWordPressにアップロード"""
     
@@ -259,10 +236,7 @@ def post_article_with_images(title, content, thumbnail_data, image_fetcher, stat
         thumbnail_id, _ = upload_image_to_wordpress(thumbnail_data, thumbnail_filename, f"{title}のサムネイル")
     
     # MarkdownをHTMLに変換
-    html_content = convert_markdown_to_html(content)
-    
-    # CTAをHTML形式に変換
-    html_content = convert_cta_to_html(html_content)
+    html_content = converter.markdown_to_html(content, media_placeholders=False)
     
     # Unsplash画像を追加
     html_content = add_stock_images_to_content(html_content, title, image_fetcher)
@@ -323,6 +297,7 @@ def main():
     output_dir.mkdir(exist_ok=True)
     
     success_count = 0
+    articles = []
     
     for i, article_config in enumerate(PRODUCTION_TOPICS, 1):
         logger.info(f"\n{'='*60}")
@@ -365,23 +340,34 @@ def main():
                     tool_name = tool
                     break
             
-            # サムネイル生成
-            logger.info("   🖼️ サムネイル生成中...")
-            thumbnail_data = thumbnail_generator.generate_thumbnail(
+            articles.append((full_title, content, thumbnail_spec(
                 title=clean_title,
                 article_type=article_config['article_type'],
                 tool_name=tool_name,
                 keywords=article_config['keywords']
-            )
-            
-            # 投稿
-            if post_article_with_images(full_title, content, thumbnail_data, image_fetcher):
-                success_count += 1
+            )))
             
         except Exception as e:
             logger.error(f"❌ エラー: {str(e)}")
             continue
     
+    # サムネイルをまとめて並列に生成
+    logger.info(f"\n🖼️ {len(articles)}件のサムネイルを生成中...")
+    thumbnails = render_many([spec for *_, spec in articles], seed=thumbnail_generator.seed)
+    
+    for (full_title, content, _), thumbnail in zip(articles, thumbnails):
+        logger.info(f"\n{'='*60}")
+        logger.info(f"投稿中: {full_title}")
+        if thumbnail['error']:
+            logger.warning(f"   ⚠️ サムネイル生成失敗: {thumbnail['error']}")
+        
+        # 投稿
+        try:
+            if post_article_with_images(full_title, content, thumbnail['data'], image_fetcher):
+                success_count += 1
+        except Exception as e:
+            logger.error(f"❌ エラー: {str(e)}")
+    
     # 最終結果
     logger.info(f"\n{'='*60}")
     logger.info("🎉 処理完了！")
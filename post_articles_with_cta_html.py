@@ -6,7 +6,6 @@ CTA付き記事をHTML形式でサムネイル付きでWordPressに投稿する
 import os
 import sys
 import glob
-import requests
 import logging
 from datetime import datetime
 from dotenv import load_dotenv
@@ -18,12 +17,17 @@ load_dotenv()
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.media.modern_thumbnail_generator import ModernThumbnailGenerator
-from convert_markdown_to_html import convert_markdown_to_html
+from src.wordpress.api_client import WordPressClient, WordPressAPIError
+from src.wordpress.converter import ArticleConverter
 
 # WordPress設定
 WP_USERNAME = os.getenv('WORDPRESS_USERNAME')
 WP_PASSWORD = os.getenv('WORDPRESS_APP_PASSWORD')
 WP_URL = 'https://aimelodykobo.com'
+WP_API_URL = f"{WP_URL}/index.php?rest_route=/wp/v2"
+
+# Markdown→HTML変換（CTAボタン・CTAブロックの変換を含む）
+converter = ArticleConverter()
 
 # ロギング設定
 logging.basicConfig(
@@ -33,101 +37,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def upload_thumbnail_to_wordpress(image_path, title):
+def upload_thumbnail_to_wordpress(wp_client, image_path, title):
     """サムネイルをWordPressにアップロード"""
     
-    with open(image_path, 'rb') as img_file:
-        files = {'file': (os.path.basename(image_path), img_file, 'image/png')}
-        
-        response = requests.post(
-            f"{WP_URL}/index.php?rest_route=/wp/v2/media",
-            files=files,
-            auth=(WP_USERNAME, WP_PASSWORD),
-            headers={'Content-Disposition': f'attachment; filename="{os.path.basename(image_path)}"'}
-        )
-        
-        if response.status_code == 201:
-            media_id = response.json()['id']
-            media_url = response.json()['source_url']
-            logger.info(f"   ✅ サムネイルアップロード成功: ID={media_id}")
-            return media_id
-        else:
-            logger.error(f"   ❌ サムネイルアップロード失敗: {response.status_code}")
-            logger.error(f"   エラー: {response.text}")
-            return None
-
-def convert_cta_to_html(content: str) -> str:
-    """CTAボタンをHTML形式に変換"""
-    # CTAボタンをWordPressのボタンブロックに変換
-    cta_button_html = '''<div class="wp-block-buttons is-content-justification-center is-layout-flex wp-container-core-buttons-layout-1 wp-block-buttons-is-layout-flex">
-<div class="wp-block-button"><a class="wp-block-button__link wp-element-button" href="/newsletter" style="background-color:#ff6b35;color:#ffffff;">無料メルマガに登録する</a></div>
-</div>'''
-    
-    # CTAボタンを置換
-    content = content.replace('[CTAボタン: 無料メルマガに登録する]', cta_button_html)
-    
-    # CTA見出しを強調
-    content = content.replace('**💌 無料メルマガ登録で限定特典をゲット！**', 
-                            '<h3 style="text-align: center; color: #ff6b35;">💌 無料メルマガ登録で限定特典をゲット！</h3>')
-    
-    return content
+    try:
+        media = wp_client.upload_media(file_path=image_path, title=title)
+        media_id = media['id']
+        logger.info(f"   ✅ サムネイルアップロード成功: ID={media_id}")
+        return media_id
+    except WordPressAPIError as e:
+        logger.error("   ❌ サムネイルアップロード失敗")
+        logger.error(f"   エラー: {e}")
+        return None
 
-def post_article_with_thumbnail(title, content, thumbnail_path, status='draft'):
+def post_article_with_thumbnail(wp_client, title, content, thumbnail_path, status='draft'):
     """サムネイル付きで記事をWordPressに投稿（HTML形式、CTA対応）"""
     
     # まずサムネイルをアップロード
     media_id = None
     if thumbnail_path and os.path.exists(thumbnail_path):
-        media_id = upload_thumbnail_to_wordpress(thumbnail_path, title)
+        media_id = upload_thumbnail_to_wordpress(wp_client, thumbnail_path, title)
     
     # MarkdownをHTMLに変換
-    html_content = convert_markdown_to_html(content)
-    
-    # CTAをHTML形式に変換
-    html_content = convert_cta_to_html(html_content)
+    html_content = converter.markdown_to_html(content, media_placeholders=False)
     
     logger.info("   📝 MarkdownをHTMLに変換しました（CTA対応）")
     
-    # WordPressの投稿データ
-    post_data = {
-        'title': title,
-        'content': html_content,  # HTML形式のコンテンツ
-        'status': status,
-        'categories': [27, 29, 31],  # AI音楽ツール、使い方・始め方、最新情報
-        'tags': [],  # タグは後で追加
-    }
-    
-    # サムネイルがある場合は追加
-    if media_id:
-        post_data['featured_media'] = media_id
-    
-    # 投稿API URL
-    api_url = f"{WP_URL}/index.php?rest_route=/wp/v2/posts"
-    
     try:
-        response = requests.post(
-            api_url,
-            json=post_data,
-            auth=(WP_USERNAME, WP_PASSWORD)
+        post = wp_client.create_post(
+            title=title,
+            content=html_content,  # HTML形式のコンテンツ
+            status=status,
+            categories=[27, 29, 31],  # AI音楽ツール、使い方・始め方、最新情報
+            tags=[],  # タグは後で追加
+            featured_media=media_id  # サムネイルがある場合のみ設定される
         )
         
-        if response.status_code == 201:
-            post_id = response.json()['id']
-            post_link = response.json()['link']
-            logger.info(f"✅ 投稿成功: {title}")
-            logger.info(f"   ID: {post_id}")
-            logger.info(f"   URL: {post_link}")
-            logger.info(f"   サムネイル: {'あり' if media_id else 'なし'}")
-            logger.info(f"   形式: HTML (CTA付き)")
-            return True
-        else:
-            logger.error(f"❌ 投稿失敗: {title}")
-            logger.error(f"   ステータス: {response.status_code}")
-            logger.error(f"   エラー: {response.text}")
-            return False
+        logger.info(f"✅ 投稿成功: {title}")
+        logger.info(f"   ID: {post['id']}")
+        logger.info(f"   URL: {post['link']}")
+        logger.info(f"   サムネイル: {'あり' if media_id else 'なし'}")
+        logger.info(f"   形式: HTML (CTA付き)")
+        return True
             
-    except Exception as e:
-        logger.error(f"❌ 投稿エラー: {str(e)}")
+    except WordPressAPIError as e:
+        logger.error(f"❌ 投稿失敗: {title}")
+        logger.error(f"   エラー: {e}")
         return False
 
 def main():
@@ -147,6 +102,11 @@ def main():
     
     logger.info(f"📊 {len(article_files)}件の記事が見つかりました")
     
+    # 全記事で接続を再利用するクライアント
+    wp_client = WordPressClient(api_url=WP_API_URL,
+                                username=WP_USERNAME,
+                                app_password=WP_PASSWORD)
+    
     success_count = 0
     failed_count = 0
     
@@ -201,7 +161,7 @@ def main():
             logger.info(f"   🖼️ サムネイル生成完了")
             
             # 投稿
-            if post_article_with_thumbnail(title, content, thumbnail_path):
+            if post_article_with_thumbnail(wp_client, title, content, thumbnail_path):
                 success_count += 1
             else:
                 failed_count += 1
@@ -215,12 +175,17 @@ def main():
             failed_count += 1
             continue
     
+    stats = wp_client.get_request_stats()
+    wp_client.close()
+    
     # 最終結果
     logger.info(f"\n{'='*60}")
     logger.info("🎉 投稿処理完了！")
     logger.info(f"✅ 成功: {success_count}件")
     logger.info(f"❌ 失敗: {failed_count}件")
     logger.info(f"📊 成功率: {success_count/len(article_files)*100:.1f}%")
+    logger.info(f"🔌 リクエスト: {stats['requests']}件 "
+                f"(新規接続 {stats['connections_opened']}件 / 再利用 {stats['connections_reused']}件)")
 
 if __name__ == "__main__":
     try:
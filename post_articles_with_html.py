@@ -18,13 +18,16 @@ load_dotenv()
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.media.modern_thumbnail_generator import ModernThumbnailGenerator
-from convert_markdown_to_html import convert_markdown_to_html
+from src.wordpress.converter import ArticleConverter
 
 # WordPress設定
 WP_USERNAME = os.getenv('WORDPRESS_USERNAME')
 WP_PASSWORD = os.getenv('WORDPRESS_APP_PASSWORD')
 WP_URL = 'https://aimelodykobo.com'
 
+# Markdown→HTML変換（CTAボタン・CTAブロックの変換を含む）
+converter = ArticleConverter()
+
 # ロギング設定
 logging.basicConfig(
     level=logging.INFO,
@@ -65,7 +68,7 @@ def post_article_with_thumbnail(title, content, thumbnail_path, status='draft'):
         media_id = upload_thumbnail_to_wordpress(thumbnail_path, title)
     
     # MarkdownをHTMLに変換
-    html_content = convert_markdown_to_html(content)
+    html_content = converter.markdown_to_html(content, media_placeholders=False)
     logger.info("   📝 MarkdownをHTMLに変換しました")
     
     # WordPressの投稿データ
@@ -18,6 +18,7 @@ load_dotenv()
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.media.modern_thumbnail_generator import ModernThumbnailGenerator
+from src.media.batch_render import render_many, thumbnail_spec
 
 # WordPress設定
 WP_USERNAME = os.getenv('WORDPRESS_USERNAME')
@@ -121,58 +122,66 @@ def main():
     
     logger.info(f"📊 {len(article_files)}件の記事が見つかりました")
     
+    # 記事を読み込んでサムネイルの描画指定を作成
+    articles = []
+    for filepath in article_files:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        # タイトルを抽出（最初の行）
+        lines = content.split('\n')
+        title = lines[0].replace('# ', '').strip()
+        
+        # タイトルから年を除去してサムネイル用に
+        clean_title = title.replace('【2025年最新版】', '').strip()
+        
+        # ツール名を判定
+        tool_name = 'AI音楽'
+        if 'Suno' in title:
+            tool_name = 'Suno'
+        elif 'Udio' in title:
+            tool_name = 'Udio'
+        elif 'Stable Audio' in title:
+            tool_name = 'Stable Audio'
+        elif 'MusicGen' in title:
+            tool_name = 'MusicGen'
+        elif 'AIVA' in title:
+            tool_name = 'AIVA'
+        elif 'React' in title:
+            tool_name = 'React'
+        elif 'Python' in title:
+            tool_name = 'Python'
+        elif 'Transformer' in title:
+            tool_name = 'AI技術'
+        
+        articles.append((filepath, title, content, thumbnail_spec(
+            title=clean_title,
+            article_type='general',
+            tool_name=tool_name,
+            keywords=[tool_name, 'AI音楽', '最新']
+        )))
+    
+    # サムネイルをまとめて並列に生成
+    logger.info(f"🖼️ {len(articles)}件のサムネイルを生成中...")
+    thumbnails = render_many([spec for *_, spec in articles], seed=thumbnail_generator.seed)
+    
     success_count = 0
     failed_count = 0
     
-    for i, filepath in enumerate(article_files, 1):
+    for i, ((filepath, title, content, _), thumbnail) in enumerate(zip(articles, thumbnails), 1):
         logger.info(f"\n{'='*60}")
         logger.info(f"処理中 {i}/{len(article_files)}: {os.path.basename(filepath)}")
         
         try:
-            # ファイルを読み込み
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # タイトルを抽出（最初の行）
-            lines = content.split('\n')
-            title = lines[0].replace('# ', '').strip()
-            
-            # タイトルから年を除去してサムネイル用に
-            clean_title = title.replace('【2025年最新版】', '').strip()
-            
-            # ツール名を判定
-            tool_name = 'AI音楽'
-            if 'Suno' in title:
-                tool_name = 'Suno'
-            elif 'Udio' in title:
-                tool_name = 'Udio'
-            elif 'Stable Audio' in title:
-                tool_name = 'Stable Audio'
-            elif 'MusicGen' in title:
-                tool_name = 'MusicGen'
-            elif 'AIVA' in title:
-                tool_name = 'AIVA'
-            elif 'React' in title:
-                tool_name = 'React'
-            elif 'Python' in title:
-                tool_name = 'Python'
-            elif 'Transformer' in title:
-                tool_name = 'AI技術'
-            
-            # サムネイル生成
-            thumbnail_path = f"temp_thumbnail_{i}.png"
-            thumbnail_data = thumbnail_generator.generate_thumbnail(
-                title=clean_title,
-                article_type='general',
-                tool_name=tool_name,
-                keywords=[tool_name, 'AI音楽', '最新']
-            )
-            
-            # バイトデータをファイルに保存
-            with open(thumbnail_path, 'wb') as f:
-                f.write(thumbnail_data)
-            
-            logger.info(f"   🖼️ サムネイル生成完了")
+            thumbnail_path = None
+            if thumbnail['data']:
+                # バイトデータをファイルに保存
+                thumbnail_path = f"temp_thumbnail_{i}.png"
+                with open(thumbnail_path, 'wb') as f:
+                    f.write(thumbnail['data'])
+                logger.info(f"   🖼️ サムネイル生成完了 ({thumbnail['seconds']:.2f}秒)")
+            else:
+                logger.warning(f"   ⚠️ サムネイル生成失敗: {thumbnail['error']}")
             
             # 投稿
             if post_article_with_thumbnail(title, content, thumbnail_path):
@@ -181,7 +190,7 @@ def main():
                 failed_count += 1
             
             # 一時ファイルを削除
-            if os.path.exists(thumbnail_path):
+            if thumbnail_path and os.path.exists(thumbnail_path):
                 os.remove(thumbnail_path)
                 
         except Exception as e:
@@ -5,11 +5,17 @@ AI Melody Kobo - AI モデル（Claude/Gemini）との統合インターフェ
 
 import os
 import json
+import time
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple
 import logging
 from dotenv import load_dotenv
 
+from .response_cache import ResponseCache
+from .streaming import ArticleStream, SectionSplitter
+from .usage_tracker import UsageTracker, usage_context
+
 # 環境変数の読み込み
 load_dotenv()
 
@@ -19,27 +25,274 @@ logger = logging.getLogger(__name__)
 class AIClientInterface(ABC):
     """AIクライアントの抽象基底クラス"""
     
+    # プロバイダー名（同時実行数の上限を環境変数 {PROVIDER}_MAX_CONCURRENCY で指定する）
+    PROVIDER = "mock"
+    DEFAULT_MAX_CONCURRENCY = 4
+    
+    # レスポンスキャッシュ（Noneの場合は毎回APIを呼び出す）
+    response_cache: Optional[ResponseCache] = None
+    
+    # 呼び出しごとのトークン使用量・コストの記録先（Noneの場合は記録しない）
+    usage_tracker: Optional[UsageTracker] = None
+    
+    # プロバイダーごとの同時実行数を制限するセマフォ（インスタンス間で共有）
+    _provider_slots: Dict[str, threading.BoundedSemaphore] = {}
+    _provider_slots_lock = threading.Lock()
+    
     @abstractmethod
     def generate_article(self, 
                         topic: str,
                         keywords: List[str],
                         article_type: str,
-                        additional_context: Optional[str] = None) -> Dict[str, Any]:
-        """記事を生成する抽象メソッド"""
+                        additional_context: Optional[str] = None,
+                        static_context: Optional[str] = None,
+                        sample_context: Optional[str] = None) -> Dict[str, Any]:
+        """
+        記事を生成する抽象メソッド
+        
+        static_contextは記事ごとに変わらない指示（ペルソナ・品質チェックリスト等）で、
+        プロンプトキャッシュに対応したクライアントではキャッシュ対象の先頭部分に置く。
+        sample_contextは過去の執筆例で、記事を生成するたびに変わるためプロンプトには
+        含めるがレスポンスキャッシュのキーには含めない（再実行時にキャッシュを使えるように）。
+        """
         pass
     
     @abstractmethod
     def refine_content(self, content: str, instructions: str) -> str:
         """コンテンツを改善する抽象メソッド"""
         pass
+    
+    def stream_article(self,
+                       topic: str,
+                       keywords: List[str],
+                       article_type: str,
+                       additional_context: Optional[str] = None,
+                       static_context: Optional[str] = None,
+                       sample_context: Optional[str] = None) -> ArticleStream:
+        """
+        記事をストリーミング生成し、見出し単位のセクションを届いた順に返す
+        
+        ストリーミングに対応していないクライアントでは生成完了後に分割して返す。
+        """
+        response = self.generate_article(topic, keywords, article_type,
+                                         additional_context, static_context, sample_context)
+        article_stream = ArticleStream(
+            SectionSplitter.split(response.get('markdown_content', '')),
+            model=response.get('model', 'unknown'),
+            status=response.get('status', 'generated')
+        )
+        article_stream.usage = response.get('usage', {})
+        return article_stream
+    
+    @staticmethod
+    def _merge_context(static_context: Optional[str],
+                       additional_context: Optional[str]) -> Optional[str]:
+        """静的・動的コンテキストを1つにまとめる（プロンプトキャッシュ非対応のクライアント用）"""
+        parts = [part for part in (static_context, additional_context) if part]
+        return "\n\n".join(parts) if parts else None
+    
+    @staticmethod
+    def _with_samples(prompt: str, sample_context: Optional[str]) -> str:
+        """プロンプトの末尾に執筆例を付ける（キャッシュキーには付ける前のプロンプトを使う）"""
+        return f"{prompt}\n{sample_context}\n" if sample_context else prompt
+    
+    def generate_articles_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        複数の記事をまとめて生成
+        
+        一括生成APIに対応していないクライアントでは1件ずつ生成する。
+        
+        Args:
+            requests: generate_articleの引数（topic, keywords, article_type,
+                      additional_context, static_context, sample_context）のリスト
+            
+        Returns:
+            入力順のレスポンス（失敗した項目は status='failed' と error を含む）
+        """
+        responses = []
+        for request in requests:
+            request = dict(request)
+            tool_name = request.pop('tool_name', None)
+            try:
+                with usage_context(tool_name=tool_name):
+                    responses.append(self.generate_article(**request))
+            except Exception as e:
+                responses.append({'markdown_content': '', 'status': 'failed', 'error': str(e)})
+        return responses
+    
+    def _stream_sections(self,
+                         key: Optional[str],
+                         chunks: Iterable[str],
+                         metadata: Dict[str, Any]) -> Iterator[str]:
+        """
+        テキスト片をセクションに区切って返し、最後まで届いた場合のみキャッシュに保存
+        
+        Args:
+            key: キャッシュキー（Noneの場合は保存しない）
+            chunks: APIから届くテキスト片
+            metadata: キャッシュに保存するメタデータ
+        """
+        splitter = SectionSplitter()
+        received = []
+        # ストリームを読み終える（または中断する）までスロットを保持する
+        with self.provider_slot():
+            for chunk in chunks:
+                received.append(chunk)
+                yield from splitter.feed(chunk)
+        yield from splitter.flush()
+        
+        if key and self.response_cache is not None:
+            self.response_cache.put(key, ''.join(received), metadata)
+    
+    @property
+    def available(self) -> bool:
+        """APIを呼び出せる状態か（Falseの場合はモックレスポンスを返す）"""
+        return True
+    
+    @classmethod
+    def max_concurrency(cls) -> int:
+        """このプロバイダーに同時に送るリクエスト数の上限"""
+        value = os.getenv(f"{cls.PROVIDER.upper()}_MAX_CONCURRENCY")
+        return max(1, int(value)) if value else cls.DEFAULT_MAX_CONCURRENCY
+    
+    def provider_slot(self) -> threading.BoundedSemaphore:
+        """
+        API呼び出し中に保持するセマフォ（with文で使う）
+        
+        複数スレッドから記事を生成しても、プロバイダーへの同時リクエストが
+        max_concurrency() を超えないようにする。
+        """
+        with AIClientInterface._provider_slots_lock:
+            slot = AIClientInterface._provider_slots.get(self.PROVIDER)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_concurrency())
+                AIClientInterface._provider_slots[self.PROVIDER] = slot
+            return slot
+    
+    def _check_budget(self):
+        """実行ごとのトークン・コスト予算を超えている場合はUsageBudgetExceededを送出"""
+        if self.usage_tracker is not None:
+            self.usage_tracker.check_budget()
+    
+    def _record_usage(self,
+                      operation: str,
+                      model: str,
+                      usage: Optional[Dict[str, Any]],
+                      started: float,
+                      article_type: Optional[str] = None,
+                      error: Optional[str] = None,
+                      **kwargs):
+        """呼び出し1回分の使用量を記録（startedはtime.monotonic()の値）"""
+        if self.usage_tracker is not None:
+            self.usage_tracker.record(operation, self.PROVIDER, model, usage,
+                                      time.monotonic() - started, article_type, error, **kwargs)
+    
+    def _cached_completion(self,
+                           model: str,
+                           system: Optional[str],
+                           prompt: str,
+                           temperature: Optional[float],
+                           max_tokens: Optional[int],
+                           call: Callable[[], Tuple[str, Dict[str, Any]]],
+                           operation: str = 'generate_article',
+                           article_type: Optional[str] = None,
+                           key_prompt: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        """
+        同じリクエストのレスポンスがキャッシュにあればそれを返し、なければcall()でAPIを呼び出す
+        
+        Args:
+            model: モデル名
+            system: システムプロンプト
+            prompt: ユーザープロンプト
+            temperature: 温度
+            max_tokens: 最大出力トークン数
+            call: APIを呼び出して(レスポンス本文, トークン使用量)を返す関数
+            operation: 使用量レコードに記録する処理名
+            article_type: 使用量レコードに記録する記事タイプ
+            key_prompt: キャッシュキーに使うプロンプト（省略時はprompt。執筆例を除く場合に指定）
+            
+        Returns:
+            (レスポンス本文, トークン使用量)
+        """
+        key = None
+        if self.response_cache is not None:
+            key = ResponseCache.make_key(model, system, key_prompt if key_prompt is not None else prompt,
+                                         temperature, max_tokens)
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                logger.info(f"レスポンスキャッシュを使用: {model} ({key[:12]})")
+                usage = {'response_cache_hit': True}
+                self._record_usage(operation, model, usage, time.monotonic(), article_type)
+                return cached, usage
+        
+        self._check_budget()
+        with self.provider_slot():
+            started = time.monotonic()
+            try:
+                text, usage = call()
+            except Exception as e:
+                self._record_usage(operation, model, None, started, article_type, error=str(e))
+                raise
+        self._record_usage(operation, model, usage, started, article_type)
+        
+        if key is not None:
+            self.response_cache.put(key, text, {'model': model, 'temperature': temperature})
+        return text, usage
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """レスポンスキャッシュのヒット・ミス統計を取得"""
+        if self.response_cache is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.response_cache.get_stats()}
 
 
 class ClaudeClient(AIClientInterface):
     """Claude APIクライアント"""
     
-    def __init__(self, api_key: Optional[str] = None):
-        """Claude APIクライアントの初期化"""
+    PROVIDER = "claude"
+    MODEL = "claude-3-opus-20240229"
+    
+    # SDKが正式対応する前のバージョンでもプロンプトキャッシュを有効にするためのヘッダー
+    PROMPT_CACHE_BETA = "prompt-caching-2024-07-31"
+    
+    # 記事ごとに変わらない出力要件（システムプロンプトと合わせてキャッシュされる）
+    ARTICLE_REQUIREMENTS = """記事の要件:
+1. タイトル案を3つ提案し、最も適切なものを選択
+2. 魅力的な導入文（トピックに応じた内容）
+3. 目次（H2、H3の階層構造）
+4. 本文（キーワードを自然に含める）
+5. CTA（無料メルマガ登録）を記事中と最後に挿入
+6. まとめセクション
+7. WordPressタグ（5-10個、#付き）
+8. メタディスクリプション（120文字以内）
+
+重要：トピックに応じて適切な内容を生成してください。
+- Sunoがトピックの場合：Sunoに関する内容
+- Udioがトピックの場合：Udioに関する内容
+- AI音声合成がトピックの場合：音声合成技術に関する内容
+- アプリ開発がトピックの場合：音楽アプリ開発に関する内容
+など、トピックに応じて柔軟に対応してください。
+
+Markdown形式で出力してください。
+"""
+    
+    def __init__(self, api_key: Optional[str] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 use_cache: bool = True,
+                 usage_tracker: Optional[UsageTracker] = None):
+        """
+        Claude APIクライアントの初期化
+        
+        Args:
+            api_key: APIキー（省略時は環境変数ANTHROPIC_API_KEY）
+            response_cache: レスポンスキャッシュ（省略時はプロセス共有のキャッシュ）
+            use_cache: レスポンスキャッシュを使うか
+            usage_tracker: 使用量の記録先（省略時はプロセス共有のトラッカー）
+        """
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
+        if use_cache:
+            self.response_cache = response_cache or ResponseCache.shared()
+        self.usage_tracker = usage_tracker or UsageTracker.shared()
         if not self.api_key:
             logger.warning("Claude API キーが設定されていません")
         
@@ -51,32 +304,36 @@ class ClaudeClient(AIClientInterface):
             logger.warning("Anthropic SDKがインストールされていません")
             self.client = None
     
-    def generate_article(self, 
+    @property
+    def available(self) -> bool:
+        return self.client is not None and bool(self.api_key)
+    
+    def generate_article(self,
                         topic: str,
                         keywords: List[str],
                         article_type: str,
-                        additional_context: Optional[str] = None) -> Dict[str, Any]:
+                        additional_context: Optional[str] = None,
+                        static_context: Optional[str] = None,
+                        sample_context: Optional[str] = None) -> Dict[str, Any]:
         """Claude APIを使用して記事を生成"""
         
-        # プロンプトの構築
-        prompt = self._build_prompt(topic, keywords, article_type, additional_context)
-        
         if self.client:
             try:
-                message = self.client.messages.create(
-                    model="claude-3-opus-20240229",
-                    max_tokens=4000,
-                    temperature=0.7,
-                    system=self._get_system_prompt(),
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ]
+                # 静的部分（システムプロンプト・ペルソナ・要件）をキャッシュ対象にし、
+                # 記事ごとに変わる部分だけをユーザープロンプトに置く
+                system = self._system_blocks(static_context)
+                key_prompt = self._build_request_prompt(topic, keywords, article_type, additional_context)
+                prompt = self._with_samples(key_prompt, sample_context)
+                content_text, usage = self._cached_completion(
+                    self.MODEL, self._system_text(system), prompt, 0.7, 4000,
+                    lambda: self._create_message(prompt, 0.7, system=system),
+                    article_type=article_type,
+                    key_prompt=key_prompt
                 )
-                
-                # レスポンスをパース - message.content はリストなので適切にアクセス
-                content_text = message.content[0].text if hasattr(message.content[0], 'text') else str(message.content[0])
-                return self._parse_claude_response(content_text)
-                
+                response = self._parse_claude_response(content_text)
+                response['usage'] = usage
+                return response
+            
             except Exception as e:
                 logger.error(f"Claude API エラー: {str(e)}")
                 raise
@@ -84,24 +341,216 @@ class ClaudeClient(AIClientInterface):
             # モックレスポンス（開発用）
             return self._generate_mock_article(topic, keywords, article_type)
     
+    def stream_article(self,
+                       topic: str,
+                       keywords: List[str],
+                       article_type: str,
+                       additional_context: Optional[str] = None,
+                       static_context: Optional[str] = None,
+                       sample_context: Optional[str] = None) -> ArticleStream:
+        """Claude APIのストリーミングで記事を生成（セクション単位で返す）"""
+        if not self.client:
+            return super().stream_article(topic, keywords, article_type,
+                                          additional_context, static_context, sample_context)
+        
+        system = self._system_blocks(static_context)
+        key_prompt = self._build_request_prompt(topic, keywords, article_type, additional_context)
+        prompt = self._with_samples(key_prompt, sample_context)
+        key = None
+        if self.response_cache is not None:
+            key = ResponseCache.make_key(self.MODEL, self._system_text(system), key_prompt, 0.7, 4000)
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                logger.info(f"レスポンスキャッシュを使用: {self.MODEL} ({key[:12]})")
+                article_stream = ArticleStream(SectionSplitter.split(cached), model='claude-3-opus')
+                article_stream.usage = {'response_cache_hit': True}
+                self._record_usage('stream_article', self.MODEL, article_stream.usage,
+                                   time.monotonic(), article_type)
+                return article_stream
+        
+        self._check_budget()
+        
+        def text_stream() -> Iterator[str]:
+            started = time.monotonic()
+            try:
+                # ジェネレータが閉じられるとwithを抜けてHTTP接続も閉じる
+                with self.client.messages.stream(
+                    model=self.MODEL,
+                    max_tokens=4000,
+                    temperature=0.7,
+                    system=system,
+                    messages=[{"role": "user", "content": prompt}],
+                    extra_headers={'anthropic-beta': self.PROMPT_CACHE_BETA}
+                ) as stream:
+                    yield from stream.text_stream
+                    article_stream.usage = self._usage_dict(stream.get_final_message().usage)
+            except GeneratorExit:
+                self._record_usage('stream_article', self.MODEL, None, started, article_type,
+                                   error='ストリームを中断しました')
+                raise
+            except Exception as e:
+                self._record_usage('stream_article', self.MODEL, None, started, article_type, error=str(e))
+                raise
+            self._record_usage('stream_article', self.MODEL, article_stream.usage, started, article_type)
+        
+        article_stream = ArticleStream(
+            self._stream_sections(key, text_stream(), {'model': self.MODEL, 'temperature': 0.7}),
+            model='claude-3-opus'
+        )
+        return article_stream
+    
+    def generate_articles_batch(self, requests: List[Dict[str, Any]],
+                                poll_interval: float = 30.0) -> List[Dict[str, Any]]:
+        """
+        Message Batches APIで複数の記事を1つのバッチとして生成
+        
+        キャッシュ済みのリクエストは送信しない。APIキーがない場合はモック記事を返す。
+        
+        Args:
+            requests: generate_articleの引数のリスト
+            poll_interval: 処理状況を確認する間隔（秒）
+        
+        Returns:
+            入力順のレスポンス（失敗した項目は status='failed' と error を含む）
+        """
+        if not self.api_key:
+            return super().generate_articles_batch(requests)
+        
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        pending = {}
+        
+        for index, request in enumerate(requests):
+            system = self._system_blocks(request.get('static_context'))
+            key_prompt = self._build_request_prompt(request['topic'], request['keywords'],
+                                                    request['article_type'],
+                                                    request.get('additional_context'))
+            prompt = self._with_samples(key_prompt, request.get('sample_context'))
+            key = ResponseCache.make_key(self.MODEL, self._system_text(system), key_prompt, 0.7, 4000)
+            cached = self.response_cache.get(key) if self.response_cache is not None else None
+            if cached is not None:
+                responses[index] = self._parse_claude_response(cached)
+                responses[index]['usage'] = {'response_cache_hit': True}
+                self._record_usage('generate_articles_batch', self.MODEL, responses[index]['usage'],
+                                   time.monotonic(), request['article_type'],
+                                   tool_name=request.get('tool_name'))
+            else:
+                pending[f"article-{index}"] = (index, key, system, prompt)
+        
+        if pending:
+            # requestsを使うため一括生成時にのみ読み込む
+            from .message_batches import MessageBatchClient, MessageBatchError
+            
+            self._check_budget()
+            started = time.monotonic()
+            batch_client = MessageBatchClient(api_key=self.api_key, poll_interval=poll_interval)
+            try:
+                results = batch_client.run([
+                    {
+                        'custom_id': custom_id,
+                        'params': {
+                            'model': self.MODEL,
+                            'max_tokens': 4000,
+                            'temperature': 0.7,
+                            'system': system,
+                            'messages': [{"role": "user", "content": prompt}]
+                        }
+                    }
+                    for custom_id, (_, _, system, prompt) in pending.items()
+                ])
+            except MessageBatchError as e:
+                logger.error(f"一括生成エラー: {str(e)}")
+                raise
+            
+            for custom_id, (index, key, _, _) in pending.items():
+                result = results.get(custom_id, {'type': 'missing'})
+                request = requests[index]
+                try:
+                    text = MessageBatchClient.message_text(result)
+                except MessageBatchError as e:
+                    logger.warning(f"一括生成の項目が失敗: {request['topic']} - {str(e)}")
+                    responses[index] = {'markdown_content': '', 'status': 'failed', 'error': str(e)}
+                    self._record_usage('generate_articles_batch', self.MODEL, None, started,
+                                       request['article_type'], error=str(e),
+                                       batch=True, tool_name=request.get('tool_name'))
+                    continue
+                if self.response_cache is not None:
+                    self.response_cache.put(key, text, {'model': self.MODEL, 'temperature': 0.7})
+                responses[index] = self._parse_claude_response(text)
+                responses[index]['usage'] = self._usage_dict(result['message'].get('usage'))
+                # 遅延はバッチ全体の所要時間
+                self._record_usage('generate_articles_batch', self.MODEL, responses[index]['usage'],
+                                   started, request['article_type'],
+                                   batch=True, tool_name=request.get('tool_name'))
+        
+        logger.info(f"一括生成完了: {len(requests)}件 (キャッシュ {len(requests) - len(pending)}件)")
+        return responses
+    
     def refine_content(self, content: str, instructions: str) -> str:
         """コンテンツを改善"""
         if self.client:
             try:
-                message = self.client.messages.create(
-                    model="claude-3-opus-20240229",
-                    max_tokens=4000,
-                    temperature=0.3,
-                    messages=[
-                        {"role": "user", "content": f"以下のコンテンツを次の指示に従って改善してください。\n\n指示: {instructions}\n\nコンテンツ:\n{content}"}
-                    ]
+                prompt = f"以下のコンテンツを次の指示に従って改善してください。\n\n指示: {instructions}\n\nコンテンツ:\n{content}"
+                text, _ = self._cached_completion(
+                    self.MODEL, None, prompt, 0.3, 4000,
+                    lambda: self._create_message(prompt, 0.3),
+                    operation='refine_content'
                 )
-                return message.content[0].text if hasattr(message.content[0], 'text') else str(message.content[0])
+                return text
             except Exception as e:
                 logger.error(f"Claude API エラー: {str(e)}")
                 return content
         return content
     
+    def _create_message(self, prompt: str, temperature: float,
+                        system: Optional[List[Dict[str, Any]]] = None) -> Tuple[str, Dict[str, int]]:
+        """Messages APIを呼び出して(本文, トークン使用量)を返す"""
+        params = {
+            'model': self.MODEL,
+            'max_tokens': 4000,
+            'temperature': temperature,
+            'messages': [{"role": "user", "content": prompt}]
+        }
+        if system:
+            params['system'] = system
+            params['extra_headers'] = {'anthropic-beta': self.PROMPT_CACHE_BETA}
+        message = self.client.messages.create(**params)
+        
+        # message.content はリストなので適切にアクセス
+        text = message.content[0].text if hasattr(message.content[0], 'text') else str(message.content[0])
+        return text, self._usage_dict(getattr(message, 'usage', None))
+    
+    @staticmethod
+    def _usage_dict(usage: Any) -> Dict[str, int]:
+        """SDKのUsage（またはバッチ結果のdict）をトークン数の辞書に変換"""
+        fields = ('input_tokens', 'output_tokens',
+                  'cache_creation_input_tokens', 'cache_read_input_tokens')
+        if usage is None:
+            return {}
+        if isinstance(usage, dict):
+            return {field: usage.get(field) or 0 for field in fields}
+        return {field: getattr(usage, field, None) or 0 for field in fields}
+    
+    def _system_blocks(self, static_context: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        システムプロンプト・静的コンテキスト・出力要件をまとめたキャッシュ対象のブロック
+        
+        記事ごとに同じ内容になるため、2回目以降はプロバイダー側のキャッシュから読み込まれる。
+        """
+        parts = [self._get_system_prompt()]
+        if static_context:
+            parts.append(static_context)
+        parts.append(self.ARTICLE_REQUIREMENTS)
+        return [{
+            'type': 'text',
+            'text': "\n\n".join(parts),
+            'cache_control': {'type': 'ephemeral'}
+        }]
+    
+    @staticmethod
+    def _system_text(system: List[Dict[str, Any]]) -> str:
+        """レスポンスキャッシュのキー用にシステムブロックを連結"""
+        return "\n\n".join(block['text'] for block in system)
+    
     def _get_system_prompt(self) -> str:
         """システムプロンプトを取得"""
         from datetime import datetime
@@ -120,12 +569,12 @@ class ClaudeClient(AIClientInterface):
 - 具体的な操作手順、各ツールの利用事例、活用アイデアを豊富に盛り込む
 - 複数のツールを扱う場合は、公平で客観的な比較を心がける"""
     
-    def _build_prompt(self, topic: str, keywords: List[str], 
-                     article_type: str, additional_context: Optional[str]) -> str:
-        """記事生成用のプロンプトを構築"""
+    def _build_request_prompt(self, topic: str, keywords: List[str],
+                              article_type: str, additional_context: Optional[str]) -> str:
+        """記事ごとに変わる部分（トピック・キーワード・追加コンテキスト）のプロンプト"""
         keyword_str = ", ".join(keywords)
         
-        base_prompt = f"""以下の条件で記事を生成してください。
+        prompt = f"""以下の条件で記事を生成してください。
 
 トピック: {topic}
 記事タイプ: {article_type}
@@ -133,30 +582,16 @@ class ClaudeClient(AIClientInterface):
 """
         
         if additional_context:
-            base_prompt += f"\n追加コンテキスト:\n{additional_context}\n"
+            prompt += f"\n追加コンテキスト:\n{additional_context}\n"
         
-        base_prompt += """
-記事の要件:
-1. タイトル案を3つ提案し、最も適切なものを選択
-2. 魅力的な導入文（トピックに応じた内容）
-3. 目次（H2、H3の階層構造）
-4. 本文（キーワードを自然に含める）
-5. CTA（無料メルマガ登録）を記事中と最後に挿入
-6. まとめセクション
-7. WordPressタグ（5-10個、#付き）
-8. メタディスクリプション（120文字以内）
-
-重要：トピックに応じて適切な内容を生成してください。
-- Sunoがトピックの場合：Sunoに関する内容
-- Udioがトピックの場合：Udioに関する内容
-- AI音声合成がトピックの場合：音声合成技術に関する内容
-- アプリ開発がトピックの場合：音楽アプリ開発に関する内容
-など、トピックに応じて柔軟に対応してください。
-
-Markdown形式で出力してください。
-"""
-        return base_prompt
+        return prompt
     
+    def _build_prompt(self, topic: str, keywords: List[str],
+                     article_type: str, additional_context: Optional[str]) -> str:
+        """記事生成用のプロンプトを構築（出力要件まで含めた1つのプロンプト）"""
+        return (ClaudeClient._build_request_prompt(self, topic, keywords, article_type, additional_context)
+                + "\n" + ClaudeClient.ARTICLE_REQUIREMENTS)
+
     def _parse_claude_response(self, response_text: str) -> Dict[str, Any]:
         """Claudeのレスポンスをパース"""
         # 簡易的なパーサー（実際にはより複雑な処理が必要）
@@ -184,9 +619,26 @@ Markdown形式で出力してください。
 class GeminiClient(AIClientInterface):
     """Google Gemini APIクライアント"""
     
-    def __init__(self, api_key: Optional[str] = None):
-        """Gemini APIクライアントの初期化"""
+    PROVIDER = "gemini"
+    MODEL = "gemini-pro"
+    
+    def __init__(self, api_key: Optional[str] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 use_cache: bool = True,
+                 usage_tracker: Optional[UsageTracker] = None):
+        """
+        Gemini APIクライアントの初期化
+        
+        Args:
+            api_key: APIキー（省略時は環境変数GEMINI_API_KEY）
+            response_cache: レスポンスキャッシュ（省略時はプロセス共有のキャッシュ）
+            use_cache: レスポンスキャッシュを使うか
+            usage_tracker: 使用量の記録先（省略時はプロセス共有のトラッカー）
+        """
         self.api_key = api_key or os.getenv('GEMINI_API_KEY')
+        if use_cache:
+            self.response_cache = response_cache or ResponseCache.shared()
+        self.usage_tracker = usage_tracker or UsageTracker.shared()
         if not self.api_key:
             logger.warning("Gemini API キーが設定されていません")
         
@@ -194,27 +646,41 @@ class GeminiClient(AIClientInterface):
         try:
             import google.generativeai as genai
             genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel('gemini-pro')
+            self.model = genai.GenerativeModel(self.MODEL)
         except ImportError:
             logger.warning("Google Generative AI SDKがインストールされていません")
             self.model = None
     
+    @property
+    def available(self) -> bool:
+        return self.model is not None and bool(self.api_key)
+    
     def generate_article(self, 
                         topic: str,
                         keywords: List[str],
                         article_type: str,
-                        additional_context: Optional[str] = None) -> Dict[str, Any]:
-        """Gemini APIを使用して記事を生成"""
+                        additional_context: Optional[str] = None,
+                        static_context: Optional[str] = None,
+                        sample_context: Optional[str] = None) -> Dict[str, Any]:
+        """Gemini APIを使用して記事を生成（プロンプトキャッシュ非対応のため静的部分も毎回送信）"""
         
-        prompt = self._build_prompt(topic, keywords, article_type, additional_context)
+        key_prompt = self._build_prompt(topic, keywords, article_type,
+                                        self._merge_context(static_context, additional_context))
+        prompt = self._with_samples(key_prompt, sample_context)
         
         if self.model:
             try:
-                response = self.model.generate_content(prompt)
+                text, usage = self._cached_completion(
+                    self.MODEL, None, prompt, None, None,
+                    lambda: self._generate_content(prompt),
+                    article_type=article_type,
+                    key_prompt=key_prompt
+                )
                 return {
-                    'markdown_content': response.text,
+                    'markdown_content': text,
                     'status': 'generated',
-                    'model': 'gemini-pro'
+                    'model': 'gemini-pro',
+                    'usage': usage
                 }
             except Exception as e:
                 logger.error(f"Gemini API エラー: {str(e)}")
@@ -223,18 +689,90 @@ class GeminiClient(AIClientInterface):
             # モックレスポンス
             return self._generate_mock_article(topic, keywords, article_type)
     
+    def stream_article(self,
+                       topic: str,
+                       keywords: List[str],
+                       article_type: str,
+                       additional_context: Optional[str] = None,
+                       static_context: Optional[str] = None,
+                       sample_context: Optional[str] = None) -> ArticleStream:
+        """Gemini APIのストリーミングで記事を生成（セクション単位で返す）"""
+        if not self.model:
+            return super().stream_article(topic, keywords, article_type,
+                                          additional_context, static_context, sample_context)
+        
+        key_prompt = self._build_prompt(topic, keywords, article_type,
+                                        self._merge_context(static_context, additional_context))
+        prompt = self._with_samples(key_prompt, sample_context)
+        key = None
+        if self.response_cache is not None:
+            key = ResponseCache.make_key(self.MODEL, None, key_prompt, None, None)
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                logger.info(f"レスポンスキャッシュを使用: {self.MODEL} ({key[:12]})")
+                article_stream = ArticleStream(SectionSplitter.split(cached), model=self.MODEL)
+                article_stream.usage = {'response_cache_hit': True}
+                self._record_usage('stream_article', self.MODEL, article_stream.usage,
+                                   time.monotonic(), article_type)
+                return article_stream
+        
+        self._check_budget()
+        
+        def chunks() -> Iterator[str]:
+            # 読み出し開始時（スロット取得後）にリクエストを送る
+            started = time.monotonic()
+            chunk = None
+            try:
+                for chunk in self.model.generate_content(prompt, stream=True):
+                    yield chunk.text
+            except GeneratorExit:
+                self._record_usage('stream_article', self.MODEL, None, started, article_type,
+                                   error='ストリームを中断しました')
+                raise
+            except Exception as e:
+                self._record_usage('stream_article', self.MODEL, None, started, article_type, error=str(e))
+                raise
+            # 使用量は最後のチャンクに含まれる
+            article_stream.usage = self._usage_from_metadata(getattr(chunk, 'usage_metadata', None))
+            self._record_usage('stream_article', self.MODEL, article_stream.usage, started, article_type)
+        
+        article_stream = ArticleStream(
+            self._stream_sections(key, chunks(), {'model': self.MODEL, 'temperature': None}),
+            model=self.MODEL
+        )
+        return article_stream
+    
     def refine_content(self, content: str, instructions: str) -> str:
         """コンテンツを改善"""
         if self.model:
             try:
                 prompt = f"以下のコンテンツを次の指示に従って改善してください。\n\n指示: {instructions}\n\nコンテンツ:\n{content}"
-                response = self.model.generate_content(prompt)
-                return response.text
+                text, _ = self._cached_completion(
+                    self.MODEL, None, prompt, None, None,
+                    lambda: self._generate_content(prompt),
+                    operation='refine_content'
+                )
+                return text
             except Exception as e:
                 logger.error(f"Gemini API エラー: {str(e)}")
                 return content
         return content
     
+    def _generate_content(self, prompt: str) -> Tuple[str, Dict[str, int]]:
+        """Gemini APIを呼び出して(本文, トークン使用量)を返す"""
+        response = self.model.generate_content(prompt)
+        return response.text, self._usage_from_metadata(getattr(response, 'usage_metadata', None))
+    
+    @staticmethod
+    def _usage_from_metadata(metadata: Any) -> Dict[str, int]:
+        """Geminiのusage_metadataをトークン数の辞書に変換"""
+        if metadata is None:
+            return {}
+        return {
+            'input_tokens': getattr(metadata, 'prompt_token_count', 0) or 0,
+            'output_tokens': getattr(metadata, 'candidates_token_count', 0) or 0
+        }
+    
     def _build_prompt(self, topic: str, keywords: List[str], 
                      article_type: str, additional_context: Optional[str]) -> str:
         """Gemini用のプロンプトを構築"""
@@ -258,10 +796,16 @@ class AIClientFactory:
             return ClaudeClient()
         elif client_type.lower() == "gemini":
             return GeminiClient()
+        elif client_type.lower() == "auto":
+            # 優先順（環境変数AI_PROVIDER_ORDER、既定はclaude,gemini）に並べたクライアントを切り替えて使う
+            from .routing_client import RoutingClient
+            order = [name.strip() for name in os.getenv('AI_PROVIDER_ORDER', 'claude,gemini').split(',')
+                     if name.strip() and name.strip().lower() != 'auto']
+            return RoutingClient([AIClientFactory.create_client(name) for name in order])
         else:
             raise ValueError(f"サポートされていないクライアントタイプ: {client_type}")
     
     @staticmethod
     def get_available_clients() -> List[str]:
         """利用可能なクライアントタイプのリストを返す"""
-        return ["claude", "gemini"]
\ No newline at end of file
+        return ["claude", "gemini", "auto"]
\ No newline at end of file
@@ -3,9 +3,10 @@
 各トピックに対して1500文字以上の充実した記事を生成
 """
 
-from typing import Dict, List, Any
-import random
-from datetime import datetime
+from typing import List
+
+from .mock_templates import MockTemplateStore
+
 
 class CompleteMockGenerator:
     """トピックに応じた完全版モック記事生成"""
@@ -13,1613 +14,29 @@ class CompleteMockGenerator:
     @staticmethod
     def generate_complete_article(topic: str, keywords: List[str], article_type: str) -> str:
         """トピックに基づいて完全な記事を生成(1500文字以上)"""
-        
-        # トピックに基づいて適切な記事を生成
+        tool = CompleteMockGenerator._select_template(topic)
+        return MockTemplateStore.shared().render('complete', tool, article_type, topic, keywords)
+    
+    @staticmethod
+    def _select_template(topic: str) -> str:
+        """トピックに基づいて使用するテンプレート（ツール・分野名）を決定"""
         if "Udio" in topic:
-            return CompleteMockGenerator._generate_complete_udio_article(topic, keywords)
+            return 'udio'
         elif "MusicGen" in topic:
-            return CompleteMockGenerator._generate_complete_musicgen_article(topic, keywords)
+            return 'musicgen'
         elif "Stable Audio" in topic:
-            return CompleteMockGenerator._generate_complete_stable_audio_article(topic, keywords)
+            return 'stable_audio'
         elif "AIVA" in topic:
-            return CompleteMockGenerator._generate_complete_aiva_article(topic, keywords)
+            return 'aiva'
         elif "音声合成" in topic or "音声技術" in topic:
-            return CompleteMockGenerator._generate_complete_voice_synthesis_article(topic, keywords)
+            return 'voice_synthesis'
         elif "アプリ開発" in topic:
-            return CompleteMockGenerator._generate_complete_app_development_article(topic, keywords)
+            return 'app_development'
         elif "音楽分析" in topic or "楽曲分析" in topic:
-            return CompleteMockGenerator._generate_complete_music_analysis_article(topic, keywords)
+            return 'music_analysis'
         elif "業界" in topic or "市場" in topic:
-            return CompleteMockGenerator._generate_complete_industry_article(topic, keywords)
+            return 'industry'
         elif "技術" in topic or "アルゴリズム" in topic:
-            return CompleteMockGenerator._generate_complete_technical_article(topic, keywords)
+            return 'technical'
         else:
-            return CompleteMockGenerator._generate_complete_suno_article(topic, keywords)
-    
-    @staticmethod
-    def _generate_complete_stable_audio_article(topic: str, keywords: List[str]) -> str:
-        """Stable Audio関連の完全記事を生成"""
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです🎵**
-
-「Stable Audioでプロ級の音楽を作りたい」「最新機能を使いこなしたい」「商用利用できる音楽を効率的に生成したい」
-
-そんなあなたに朗報です！Stable Audioの最新アップデートで、驚くほど高品質な音楽制作が可能になりました✨
-
-この記事では、2025年最新のStable Audio機能を、初心者から上級者まで活用できるよう徹底解説していきます！
-
-## 目次
-
-1. [Stable Audioとは？2025年最新版の実力](#stable-audioとは)
-2. [新機能①：マルチトラック生成機能](#マルチトラック)
-3. [新機能②：リアルタイム編集モード](#リアルタイム編集)
-4. [新機能③：AIコラボレーション機能](#aiコラボ)
-5. [プロ級の楽曲を作る実践テクニック](#実践テクニック)
-6. [商用利用とライセンスガイド](#ライセンス)
-7. [他のAI音楽ツールとの比較](#比較)
-8. [よくある質問と解決方法](#faq)
-
-## Stable Audioとは？2025年最新版の実力 {#stable-audioとは}
-
-**Stable Audio**は、Stability AI社が開発した最先端のAI音楽生成プラットフォームです。画像生成AI「Stable Diffusion」の技術を音楽分野に応用し、驚異的な品質の楽曲生成を実現しています。
-
-### 🚀 2025年版の革新的な特徴
-
-**1. 超高音質生成(48kHz/24bit対応)**
-- スタジオ品質の音源を直接生成
-- マスタリング済みの完成度
-- 各楽器の分離が明瞭
-
-**2. 日本語プロンプト完全対応**
-- 「エモいロック」「チルいローファイ」など日本語での指示が可能
-- 感情や雰囲気を細かく指定
-- 音楽用語を知らなくてもOK
-
-**3. 商用利用ライセンス込み**
-- 生成した楽曲は即商用利用可能
-- YouTube、Spotify等での配信もOK
-- ロイヤリティフリー
-
-### 📊 ユーザー数と利用実績
-
-2025年6月現在、Stable Audioのユーザー数は**全世界で500万人**を突破！日本国内でも**15万人以上**のクリエイターが活用しています。
-
-**主な利用者層：**
-- YouTuber・動画クリエイター(45%)
-- ゲーム開発者(25%)
-- 音楽プロデューサー(20%)
-- その他クリエイター(10%)
-
-[画像挿入指示: Stable Audioのダッシュボード画面のスクリーンショット]
-
-## 新機能①：マルチトラック生成機能 {#マルチトラック}
-
-2025年最大のアップデートである**マルチトラック生成機能**について詳しく解説します！
-
-### 🎛️ マルチトラック生成とは？
-
-従来は1つの完成した楽曲として生成されていましたが、新機能では以下のように**個別トラックに分離**して生成可能になりました：
-
-- **ドラムトラック**
-- **ベーストラック**
-- **メロディトラック**
-- **コード/パッドトラック**
-- **ボーカルトラック**(実験的機能)
-
-### 💡 実践的な使い方
-
-**STEP1：基本トラックの生成**
-```
-プロンプト例：
-「明るいポップス、BPM120、キー：C major、ドラムとベースのみ」
-```
-
-**STEP2：メロディの追加**
-```
-プロンプト例：
-「キャッチーなシンセリード、8小節のメロディライン」
-```
-
-**STEP3：ハーモニーの構築**
-```
-プロンプト例：
-「温かいピアノコード、コード進行：C-Am-F-G」
-```
-
-### 🎯 プロのワークフロー
-
-1. **リズムセクションから構築**
-   - まずドラムとベースで土台を作る
-   - グルーヴ感を重視した生成
-
-2. **レイヤーを重ねる**
-   - 各トラックを個別に調整
-   - 不要な部分はミュート可能
-
-3. **最終ミックス**
-   - 内蔵ミキサーで音量バランス調整
-   - エフェクトの追加も可能
-
-[動画挿入指示: マルチトラック生成の実演動画]
-
-<div style="background: linear-gradient(45deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 10px; text-align: center; margin: 40px 0;">
-<h3 style="color: white; margin-bottom: 10px;">🎁 AI音楽制作の極意を無料プレゼント！</h3>
-<p style="color: white; margin-bottom: 20px;">プロが使うAI音楽プロンプト100選を今だけ無料配布中！<br>YouTube収益化できるBGMも作れるようになります✨</p>
-<a href="#" style="display: inline-block; background: white; color: #667eea; padding: 15px 40px; border-radius: 50px; text-decoration: none; font-weight: bold; font-size: 18px;">📧 無料でメルマガ登録する</a>
-<p style="color: white; font-size: 14px; margin-top: 15px;">※ワンクリックでいつでも解除可能です</p>
-</div>
-
-## 新機能②：リアルタイム編集モード {#リアルタイム編集}
-
-生成した楽曲をその場で編集できる**リアルタイム編集モード**が実装されました！
-
-### ✏️ 編集可能な要素
-
-**1. テンポ変更**
-- BPM60〜200の範囲で自由に調整
-- 楽曲の雰囲気を保ったまま変更可能
-- グラデーション変化にも対応
-
-**2. キー/スケール変更**
-- 12キーすべてに対応
-- メジャー/マイナーの切り替え
-- モーダルスケールにも対応
-
-**3. 楽器の差し替え**
-- 100種類以上の音色から選択
-- AIが自動で最適化
-- 雰囲気に合った提案機能付き
-
-### 🔧 高度な編集テクニック
-
-**セクション単位の編集**
-```
-- イントロ：8小節
-- Aメロ：16小節
-- サビ：16小節
-- アウトロ：8小節
-```
-
-各セクションで異なる編集を適用可能！
-
-**オートメーション機能**
-- 音量の自動変化
-- フィルターの動的制御
-- パンニングの自動化
-
-[画像挿入指示: リアルタイム編集画面のUI]
-
-## 新機能③：AIコラボレーション機能 {#aiコラボ}
-
-複数のAIモデルが協力して楽曲を生成する画期的な機能です！
-
-### 🤝 コラボレーションの仕組み
-
-**1. スタイル融合**
-- 異なるジャンルのAIモデルを組み合わせ
-- 「ジャズ×EDM」「クラシック×ヒップホップ」など
-- 新しい音楽スタイルの創造
-
-**2. アレンジャーAI**
-- 基本的な楽曲をプロレベルにアレンジ
-- オーケストレーション対応
-- ジャンル別の最適化
-
-**3. マスタリングAI**
-- 音圧の最適化
-- 周波数バランスの調整
-- 配信プラットフォーム別の最適化
-
-### 🎪 実践例：映画音楽の制作
-
-```
-基本プロンプト：
-「壮大な冒険のテーマ、オーケストラ、3分」
-
-コラボレーション設定：
-- メインAI：シネマティックモデル
-- サポートAI1：オーケストラモデル
-- サポートAI2：エモーショナルモデル
-```
-
-結果：ハリウッド映画級のサウンドトラックが完成！
-
-## プロ級の楽曲を作る実践テクニック {#実践テクニック}
-
-### 🎯 プロンプトエンジニアリングの極意
-
-**1. 具体的な指示を心がける**
-```
-❌ 悪い例：「いい感じの曲」
-✅ 良い例：「夏の夕暮れをイメージした、BPM95のチルアウト、アコースティックギターとローズピアノ」
-```
-
-**2. 参照アーティストの活用**
-```
-「Nujabesスタイルのローファイヒップホップ」
-「久石譲風の感動的なピアノバラード」
-「Aviciiインスパイアのプログレッシブハウス」
-```
-
-**3. 感情と色彩の表現**
-```
-「温かみのあるオレンジ色のサウンド」
-「冷たく透明感のあるブルーの音色」
-「情熱的で赤く燃えるようなリズム」
-```
-
-### 🎨 ジャンル別攻略法
-
-**ローファイヒップホップ**
-- ビンテージ感の演出
-- ビニールノイズの追加
-- サイドチェインコンプレッション
-
-**EDM/ダンスミュージック**
-- ビルドアップの構築
-- ドロップのインパクト
-- サイドチェインの活用
-
-**アンビエント/環境音楽**
-- 空間的な広がり
-- テクスチャーの重視
-- 長いリバーブテイル
-
-[動画挿入指示: 各ジャンルの制作過程を解説する動画]
-
-## 商用利用とライセンスガイド {#ライセンス}
-
-### 📜 ライセンスの種類
-
-**1. Free Plan(無料プラン)**
-- 月20曲まで生成可能
-- 個人利用のみ
-- クレジット表記必須
-
-**2. Pro Plan($19.99/月)**
-- 月500曲まで生成可能
-- 商用利用OK
-- クレジット表記不要
-
-**3. Studio Plan($49.99/月)**
-- 無制限生成
-- 完全な商用利用権
-- APIアクセス付き
-
-### 💰 収益化の具体例
-
-**YouTube収益化**
-- 広告収入：完全OK
-- スーパーチャット：OK
-- メンバーシップ：OK
-
-**音楽配信**
-- Spotify：配信可能
-- Apple Music：配信可能
-- Bandcamp：販売可能
-
-**その他の商用利用**
-- ゲームBGM：OK
-- 動画BGM：OK
-- ポッドキャスト：OK
-- 店舗BGM：OK
-
-### ⚠️ 注意事項
-
-- 生成楽曲の著作権は利用者に帰属
-- 既存楽曲の模倣は避ける
-- プラットフォームの規約を遵守
-
-## 他のAI音楽ツールとの比較 {#比較}
-
-### 📊 主要AI音楽ツール比較表
-
-| 項目 | Stable Audio | Suno | Udio | MusicGen |
-|------|-------------|------|------|----------|
-| **音質** | ★★★★★ | ★★★★☆ | ★★★★★ | ★★★☆☆ |
-| **生成速度** | 30秒 | 45秒 | 60秒 | 15秒 |
-| **日本語対応** | ◎ | ○ | △ | × |
-| **商用利用** | ◎ | ○ | ○ | ◎ |
-| **価格** | $19.99〜 | $8〜 | $10〜 | 無料 |
-| **特徴** | 高音質・編集機能充実 | ボーカル生成可能 | プロ向け機能 | オープンソース |
-
-### 🎯 用途別おすすめ
-
-**動画BGM制作** → Stable Audio
-- 高音質で編集も簡単
-- 商用利用がスムーズ
-
-**歌モノ制作** → Suno
-- ボーカル生成が得意
-- 歌詞も自動生成
-
-**実験的制作** → MusicGen
-- 無料で使える
-- カスタマイズ自由度高
-
-## よくある質問と解決方法 {#faq}
-
-### ❓ Q1: 生成がうまくいかない時は？
-
-**A:** 以下のチェックリストを確認してください：
-- プロンプトは具体的か？
-- ジャンルは明確か？
-- BPMは指定したか？
-- 楽器は適切か？
-
-### ❓ Q2: 特定の雰囲気を出すには？
-
-**A:** 感情や色彩を使った表現が効果的です：
-```
-「nostalgic(懐かしい)」
-「ethereal(幻想的)」
-「uplifting(高揚感のある)」
-「melancholic(物悲しい)」
-```
-
-### ❓ Q3: 生成した楽曲の編集は？
-
-**A:** Stable Audio内蔵エディタの他、以下のDAWでも編集可能：
-- Logic Pro
-- Ableton Live
-- FL Studio
-- Cubase
-
-<div style="background: linear-gradient(45deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 10px; text-align: center; margin: 40px 0;">
-<h3 style="color: white; margin-bottom: 10px;">🎁 AI音楽制作の極意を無料プレゼント！</h3>
-<p style="color: white; margin-bottom: 20px;">プロが使うAI音楽プロンプト100選を今だけ無料配布中！<br>YouTube収益化できるBGMも作れるようになります✨</p>
-<a href="#" style="display: inline-block; background: white; color: #667eea; padding: 15px 40px; border-radius: 50px; text-decoration: none; font-weight: bold; font-size: 18px;">📧 無料でメルマガ登録する</a>
-<p style="color: white; font-size: 14px; margin-top: 15px;">※ワンクリックでいつでも解除可能です</p>
-</div>
-
-## まとめ
-
-Stable Audioの最新機能により、AI音楽制作は新たなステージに突入しました。マルチトラック生成、リアルタイム編集、AIコラボレーションなど、プロレベルの機能が誰でも使えるようになっています。
-
-**今すぐ始めるべき3つの理由：**
-1. 技術の進化スピードが速い今が学習のチャンス
-2. 商用利用可能で収益化の道が開かれている
-3. クリエイターコミュニティが活発で情報交換しやすい
-
-ぜひStable Audioを使って、あなただけの素晴らしい音楽を生み出してください！
-
-質問や感想はぜひコメント欄でお聞かせください。次回は「Stable AudioとSunoの使い分け術」について解説予定です。お楽しみに！
-
-**アリサ** 🎵
-
----
-
-**関連記事：**
-[内部リンク: AI音楽制作入門ガイド]
-[内部リンク: Suno vs Udio徹底比較]
-[外部リンク: Stable Audio公式サイト]
-
-**WordPressタグ:** #StableAudio #AI音楽 #音楽制作 #AI作曲 #{' #'.join(keywords[:5])}
-**メタディスクリプション:** {topic}を徹底解説。マルチトラック生成やリアルタイム編集など最新機能の使い方を初心者にも分かりやすく紹介。"""
-
-    @staticmethod
-    def _generate_complete_voice_synthesis_article(topic: str, keywords: List[str]) -> str:
-        """音声合成関連の完全記事を生成"""
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです🎤**
-
-「自分の声でAIに喋らせたい」「もっと自然な音声を作りたい」「感情豊かな音声表現を実現したい」
-
-そんなあなたに朗報です！最新のAI音声合成技術を使えば、驚くほどリアルな音声を簡単に生成できるようになりました✨
-
-この記事では、Pythonを使った音声合成プログラミングについて、初心者の方でも実装できるよう、基礎から応用まで徹底解説していきます！
-
-## 目次
-
-1. [AI音声合成の基礎知識](#基礎知識)
-2. [Pythonで音声合成を始める準備](#準備)
-3. [基本的な音声合成の実装](#基本実装)
-4. [高度な音声合成テクニック](#高度なテクニック)
-5. [実践プロジェクト：音声アシスタント開発](#プロジェクト)
-6. [音声クローンの実装方法](#音声クローン)
-7. [商用利用とライセンス](#ライセンス)
-8. [トラブルシューティング](#トラブル)
-
-## AI音声合成の基礎知識 {#基礎知識}
-
-### 🎯 音声合成技術の種類
-
-**1. テキスト音声合成(TTS: Text-to-Speech)**
-- 文字情報から音声を生成
-- 最も一般的な音声合成技術
-- リアルタイム処理が可能
-
-**2. 音声変換(Voice Conversion)**
-- ある人の声を別の人の声に変換
-- 感情や話し方の特徴を保持
-- リアルタイム変換も可能
-
-**3. 音声クローン(Voice Cloning)**
-- 少量の音声サンプルから声を再現
-- 高い再現性を実現
-- 倫理的配慮が必要
-
-### 📊 主要な音声合成ライブラリ比較
-
-| ライブラリ | 特徴 | 難易度 | 音質 | ライセンス |
-|-----------|------|--------|------|-----------|
-| **gTTS** | シンプル、Google翻訳API使用 | ★☆☆ | ★★☆ | MIT |
-| **pyttsx3** | オフライン動作、クロスプラットフォーム | ★☆☆ | ★★☆ | MPL-2.0 |
-| **Azure TTS** | 高品質、多言語対応 | ★★☆ | ★★★★★ | 商用 |
-| **Coqui TTS** | オープンソース、高品質 | ★★★ | ★★★★☆ | MPL-2.0 |
-| **Tacotron2** | 研究向け、カスタマイズ性高 | ★★★★ | ★★★★☆ | BSD |
-
-## Pythonで音声合成を始める準備 {#準備}
-
-### 🔧 環境構築
-
-**STEP1：Pythonのインストール**
-```bash
-# Python 3.8以上を推奨
-python --version
-```
-
-**STEP2：仮想環境の作成**
-```bash
-# 仮想環境を作成
-python -m venv voice_synthesis_env
-
-# 仮想環境を有効化(Windows)
-voice_synthesis_env\\Scripts\\activate
-
-# 仮想環境を有効化(Mac/Linux)
-source voice_synthesis_env/bin/activate
-```
-
-**STEP3：必要なライブラリのインストール**
-```bash
-# 基本的なライブラリ
-pip install numpy scipy matplotlib
-pip install torch torchaudio
-
-# 音声合成ライブラリ
-pip install gTTS pyttsx3
-pip install TTS  # Coqui TTS
-```
-
-### 📁 プロジェクト構造
-
-```
-voice_synthesis_project/
-│
-├── src/
-│   ├── __init__.py
-│   ├── basic_tts.py      # 基本的なTTS実装
-│   ├── advanced_tts.py   # 高度なTTS実装
-│   └── voice_clone.py    # 音声クローン実装
-│
-├── models/              # 学習済みモデル
-├── audio/              # 音声ファイル
-├── config/             # 設定ファイル
-└── requirements.txt    # 依存関係
-```
-
-## 基本的な音声合成の実装 {#基本実装}
-
-### 🎤 シンプルなTTS実装(gTTS)
-
-```python
-from gtts import gTTS
-import pygame
-import io
-
-def simple_tts(text, lang='ja'):
-    """
-    シンプルな音声合成関数
-    
-    Args:
-        text (str): 変換するテキスト
-        lang (str): 言語コード (ja=日本語)
-    """
-    # gTTSオブジェクトを作成
-    tts = gTTS(text=text, lang=lang, slow=False)
-    
-    # メモリ上に音声データを保存
-    audio_data = io.BytesIO()
-    tts.write_to_fp(audio_data)
-    audio_data.seek(0)
-    
-    # Pygameで再生
-    pygame.mixer.init()
-    pygame.mixer.music.load(audio_data)
-    pygame.mixer.music.play()
-    
-    # 再生終了まで待機
-    while pygame.mixer.music.get_busy():
-        pygame.time.Clock().tick(10)
-
-# 使用例
-if __name__ == "__main__":
-    text = "こんにちは！AI音声合成の世界へようこそ。"
-    simple_tts(text)
-```
-
-### 🎵 オフライン音声合成(pyttsx3)
-
-```python
-import pyttsx3
-
-class OfflineTTS:
-    """オフライン音声合成クラス"""
-    
-    def __init__(self):
-        self.engine = pyttsx3.init()
-        self._setup_voice()
-    
-    def _setup_voice(self):
-        """音声の設定"""
-        # 利用可能な音声を取得
-        voices = self.engine.getProperty('voices')
-        
-        # 日本語音声を設定(利用可能な場合)
-        for voice in voices:
-            if 'japanese' in voice.name.lower():
-                self.engine.setProperty('voice', voice.id)
-                break
-        
-        # 話速を設定(デフォルト: 200)
-        self.engine.setProperty('rate', 150)
-        
-        # 音量を設定(0.0〜1.0)
-        self.engine.setProperty('volume', 0.9)
-    
-    def speak(self, text):
-        """テキストを音声に変換して再生"""
-        self.engine.say(text)
-        self.engine.runAndWait()
-    
-    def save_to_file(self, text, filename):
-        """音声をファイルに保存"""
-        self.engine.save_to_file(text, filename)
-        self.engine.runAndWait()
-        print(f"音声を保存しました: {filename}")
-
-# 使用例
-if __name__ == "__main__":
-    tts = OfflineTTS()
-    
-    # 音声再生
-    tts.speak("Pythonで音声合成プログラミングを始めましょう！")
-    
-    # ファイルに保存
-    tts.save_to_file(
-        "この音声はPythonで生成されました。",
-        "output.mp3"
-    )
-```
-
-[画像挿入指示: コード実行結果のスクリーンショット]
-
-## 高度な音声合成テクニック {#高度なテクニック}
-
-### 🚀 Coqui TTSを使った高品質音声合成
-
-```python
-from TTS.api import TTS
-import torch
-import soundfile as sf
-
-class AdvancedTTS:
-    """高度な音声合成クラス"""
-    
-    def __init__(self, model_name="tts_models/ja/kokoro/tacotron2-DDC"):
-        """
-        初期化
-        
-        Args:
-            model_name: 使用するモデル名
-        """
-        # GPUが利用可能か確認
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        print(f"使用デバイス: {self.device}")
-        
-        # TTSモデルを読み込み
-        self.tts = TTS(model_name).to(self.device)
-    
-    def synthesize(self, text, output_path="output.wav", speed=1.0):
-        """
-        高品質な音声合成
-        
-        Args:
-            text: 変換するテキスト
-            output_path: 出力ファイルパス
-            speed: 話速(1.0が標準)
-        """
-        # 音声を生成
-        self.tts.tts_to_file(
-            text=text,
-            file_path=output_path,
-            speed=speed
-        )
-        
-        return output_path
-    
-    def synthesize_with_emotion(self, text, emotion="neutral"):
-        """
-        感情を込めた音声合成
-        
-        Args:
-            text: 変換するテキスト
-            emotion: 感情(neutral, happy, sad, angry)
-        """
-        # 感情パラメータの設定
-        emotion_params = {
-            "neutral": {"pitch": 1.0, "energy": 1.0},
-            "happy": {"pitch": 1.2, "energy": 1.3},
-            "sad": {"pitch": 0.8, "energy": 0.7},
-            "angry": {"pitch": 1.1, "energy": 1.5}
-        }
-        
-        params = emotion_params.get(emotion, emotion_params["neutral"])
-        
-        # 感情を反映した音声生成(実装例)
-        # 実際の実装はモデルによって異なります
-        output_path = f"output_{emotion}.wav"
-        self.synthesize(text, output_path)
-        
-        return output_path
-
-# 使用例
-if __name__ == "__main__":
-    # 高度なTTSインスタンスを作成
-    tts = AdvancedTTS()
-    
-    # 基本的な音声合成
-    text = "最新のAI技術で、より自然な音声を生成できます。"
-    tts.synthesize(text)
-    
-    # 感情を込めた音声合成
-    emotions = ["neutral", "happy", "sad", "angry"]
-    for emotion in emotions:
-        tts.synthesize_with_emotion(
-            "今日はとてもいい天気ですね。",
-            emotion=emotion
-        )
-```
-
-### 🎨 音声の後処理とエフェクト
-
-```python
-import numpy as np
-import scipy.signal as signal
-from scipy.io import wavfile
-import librosa
-import soundfile as sf
-
-class AudioEffects:
-    """音声エフェクト処理クラス"""
-    
-    @staticmethod
-    def add_reverb(audio_path, output_path, reverb_amount=0.3):
-        """
-        リバーブ効果を追加
-        
-        Args:
-            audio_path: 入力音声ファイル
-            output_path: 出力音声ファイル
-            reverb_amount: リバーブの強さ (0.0〜1.0)
-        """
-        # 音声を読み込み
-        audio, sr = librosa.load(audio_path, sr=None)
-        
-        # インパルス応答を生成(簡易版)
-        reverb_time = int(0.5 * sr)  # 0.5秒のリバーブ
-        impulse = np.zeros(reverb_time)
-        impulse[0] = 1.0
-        
-        # エクスポネンシャル減衰
-        for i in range(1, reverb_time):
-            impulse[i] = impulse[i-1] * 0.95
-        
-        # リバーブを適用
-        reverbed = signal.convolve(audio, impulse, mode='same')
-        
-        # ドライ/ウェットミックス
-        output = (1 - reverb_amount) * audio + reverb_amount * reverbed
-        
-        # 正規化
-        output = output / np.max(np.abs(output))
-        
-        # 保存
-        sf.write(output_path, output, sr)
-        print(f"リバーブを適用しました: {output_path}")
-    
-    @staticmethod
-    def change_pitch(audio_path, output_path, semitones=0):
-        """
-        ピッチ変更
-        
-        Args:
-            audio_path: 入力音声ファイル
-            output_path: 出力音声ファイル
-            semitones: 半音単位の変更量
-        """
-        # 音声を読み込み
-        audio, sr = librosa.load(audio_path, sr=None)
-        
-        # ピッチシフト
-        pitched = librosa.effects.pitch_shift(
-            audio, sr=sr, n_steps=semitones
-        )
-        
-        # 保存
-        sf.write(output_path, pitched, sr)
-        print(f"ピッチを{semitones}半音変更しました: {output_path}")
-    
-    @staticmethod
-    def add_background_music(voice_path, music_path, output_path, 
-                           voice_volume=0.8, music_volume=0.2):
-        """
-        BGMを追加
-        
-        Args:
-            voice_path: 音声ファイル
-            music_path: BGMファイル
-            output_path: 出力ファイル
-            voice_volume: 音声の音量
-            music_volume: BGMの音量
-        """
-        # ファイルを読み込み
-        voice, sr1 = librosa.load(voice_path, sr=None)
-        music, sr2 = librosa.load(music_path, sr=sr1)
-        
-        # 長さを合わせる
-        if len(music) > len(voice):
-            music = music[:len(voice)]
-        else:
-            music = np.pad(music, (0, len(voice) - len(music)))
-        
-        # ミックス
-        mixed = voice * voice_volume + music * music_volume
-        
-        # 正規化
-        mixed = mixed / np.max(np.abs(mixed))
-        
-        # 保存
-        sf.write(output_path, mixed, sr1)
-        print(f"BGMを追加しました: {output_path}")
-
-# 使用例
-if __name__ == "__main__":
-    effects = AudioEffects()
-    
-    # リバーブを追加
-    effects.add_reverb("output.wav", "output_reverb.wav", 0.3)
-    
-    # ピッチを変更
-    effects.change_pitch("output.wav", "output_high.wav", 3)
-    effects.change_pitch("output.wav", "output_low.wav", -3)
-    
-    # BGMを追加
-    effects.add_background_music(
-        "output.wav", 
-        "bgm.mp3", 
-        "output_with_bgm.wav"
-    )
-```
-
-<div style="background: linear-gradient(45deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 10px; text-align: center; margin: 40px 0;">
-<h3 style="color: white; margin-bottom: 10px;">🎁 AI音楽制作の極意を無料プレゼント！</h3>
-<p style="color: white; margin-bottom: 20px;">プロが使うAI音楽プロンプト100選を今だけ無料配布中！<br>YouTube収益化できるBGMも作れるようになります✨</p>
-<a href="#" style="display: inline-block; background: white; color: #667eea; padding: 15px 40px; border-radius: 50px; text-decoration: none; font-weight: bold; font-size: 18px;">📧 無料でメルマガ登録する</a>
-<p style="color: white; font-size: 14px; margin-top: 15px;">※ワンクリックでいつでも解除可能です</p>
-</div>
-
-## 実践プロジェクト：音声アシスタント開発 {#プロジェクト}
-
-### 🤖 シンプルな音声アシスタントの実装
-
-```python
-import speech_recognition as sr
-import pyttsx3
-import datetime
-import requests
-import json
-
-class VoiceAssistant:
-    """音声アシスタントクラス"""
-    
-    def __init__(self, name="アリサ"):
-        self.name = name
-        self.engine = pyttsx3.init()
-        self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
-        
-        # 音声設定
-        self._setup_voice()
-        
-        # 初回挨拶
-        self.speak(f"こんにちは！{self.name}です。何かお手伝いできることはありますか？")
-    
-    def _setup_voice(self):
-        """音声エンジンの設定"""
-        self.engine.setProperty('rate', 150)
-        self.engine.setProperty('volume', 0.9)
-    
-    def speak(self, text):
-        """テキストを音声で出力"""
-        print(f"{self.name}: {text}")
-        self.engine.say(text)
-        self.engine.runAndWait()
-    
-    def listen(self):
-        """音声入力を受け取る"""
-        with self.microphone as source:
-            print("聞いています...")
-            self.recognizer.adjust_for_ambient_noise(source)
-            
-            try:
-                audio = self.recognizer.listen(source, timeout=5)
-                text = self.recognizer.recognize_google(audio, language='ja-JP')
-                print(f"あなた: {text}")
-                return text
-            except sr.UnknownValueError:
-                self.speak("すみません、聞き取れませんでした。")
-                return None
-            except sr.RequestError:
-                self.speak("音声認識サービスに接続できません。")
-                return None
-    
-    def process_command(self, command):
-        """コマンドを処理"""
-        if command is None:
-            return
-        
-        command = command.lower()
-        
-        # 時刻を教える
-        if "時間" in command or "時刻" in command:
-            now = datetime.datetime.now()
-            time_str = now.strftime("%H時%M分")
-            self.speak(f"現在の時刻は{time_str}です。")
-        
-        # 天気を教える(OpenWeatherMap APIを使用)
-        elif "天気" in command:
-            self.get_weather()
-        
-        # 終了
-        elif "終了" in command or "さようなら" in command:
-            self.speak("またお会いしましょう！さようなら！")
-            return False
-        
-        # その他
-        else:
-            self.speak("そのコマンドはまだ実装されていません。")
-        
-        return True
-    
-    def get_weather(self):
-        """天気情報を取得(実装例)"""
-        # 実際にはAPIキーが必要です
-        self.speak("東京の天気は晴れ、気温は25度です。")
-    
-    def run(self):
-        """メインループ"""
-        running = True
-        
-        while running:
-            command = self.listen()
-            if command:
-                running = self.process_command(command)
-            
-            if running:
-                self.speak("他に何かありますか？")
-
-# 使用例
-if __name__ == "__main__":
-    assistant = VoiceAssistant()
-    assistant.run()
-```
-
-## 音声クローンの実装方法 {#音声クローン}
-
-### 🎭 音声クローンの基本実装
-
-```python
-import torch
-from TTS.api import TTS
-import numpy as np
-import soundfile as sf
-
-class VoiceCloner:
-    """音声クローンクラス"""
-    
-    def __init__(self):
-        # 音声クローンモデルを初期化
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.tts = TTS("tts_models/multilingual/multi-dataset/your_tts").to(self.device)
-    
-    def clone_voice(self, reference_audio, text, output_path):
-        """
-        音声をクローンして新しいテキストを読み上げる
-        
-        Args:
-            reference_audio: 参照音声ファイル(3秒以上推奨)
-            text: 読み上げるテキスト
-            output_path: 出力ファイルパス
-        """
-        try:
-            # 音声クローンを実行
-            self.tts.tts_to_file(
-                text=text,
-                speaker_wav=reference_audio,
-                language="ja",
-                file_path=output_path
-            )
-            
-            print(f"音声クローンが完了しました: {output_path}")
-            return True
-            
-        except Exception as e:
-            print(f"エラーが発生しました: {e}")
-            return False
-    
-    def batch_clone(self, reference_audio, texts, output_dir):
-        """
-        複数のテキストを一括でクローン音声化
-        
-        Args:
-            reference_audio: 参照音声ファイル
-            texts: テキストのリスト
-            output_dir: 出力ディレクトリ
-        """
-        import os
-        os.makedirs(output_dir, exist_ok=True)
-        
-        for i, text in enumerate(texts):
-            output_path = os.path.join(output_dir, f"cloned_{i+1}.wav")
-            self.clone_voice(reference_audio, text, output_path)
-            print(f"進捗: {i+1}/{len(texts)}")
-
-# 使用例
-if __name__ == "__main__":
-    cloner = VoiceCloner()
-    
-    # 単一のテキストをクローン
-    cloner.clone_voice(
-        reference_audio="my_voice.wav",
-        text="こんにちは、私の声でAIが話しています。",
-        output_path="cloned_voice.wav"
-    )
-    
-    # 複数のテキストを一括処理
-    texts = [
-        "おはようございます。",
-        "今日もいい天気ですね。",
-        "AIの進化は素晴らしいです。"
-    ]
-    cloner.batch_clone("my_voice.wav", texts, "cloned_voices/")
-```
-
-### ⚠️ 音声クローンの倫理的配慮
-
-**必ず守るべきルール：**
-1. **本人の同意を得る**
-2. **悪用しない(なりすまし等)**
-3. **商用利用時は権利関係を確認**
-4. **生成物には「AI生成」と明記**
-
-## 商用利用とライセンス {#ライセンス}
-
-### 📜 ライブラリのライセンス比較
-
-| ライブラリ | ライセンス | 商用利用 | 注意点 |
-|-----------|----------|---------|--------|
-| gTTS | MIT | ○ | Google規約に準拠 |
-| pyttsx3 | MPL-2.0 | ○ | ソース公開義務なし |
-| Coqui TTS | MPL-2.0 | ○ | モデルにより異なる |
-| Azure TTS | 商用 | ○ | 従量課金 |
-| ElevenLabs | 商用 | ○ | プランによる |
-
-### 💰 料金プラン例(Azure Cognitive Services)
-
-```python
-# Azure TTSの料金計算例
-def calculate_azure_cost(characters, tier="standard"):
-    """
-    Azure TTSの料金を計算
-    
-    Args:
-        characters: 文字数
-        tier: 料金プラン(standard/neural)
-    
-    Returns:
-        float: 推定料金(USD)
-    """
-    rates = {
-        "standard": 4.00,  # $4 per 1M characters
-        "neural": 16.00    # $16 per 1M characters
-    }
-    
-    rate = rates.get(tier, rates["standard"])
-    cost = (characters / 1_000_000) * rate
-    
-    return round(cost, 4)
-
-# 使用例
-text = "これは商用利用のテストです。" * 1000
-char_count = len(text)
-cost = calculate_azure_cost(char_count, "neural")
-print(f"文字数: {char_count:,}")
-print(f"推定料金: ${cost}")
-```
-
-## トラブルシューティング {#トラブル}
-
-### ❓ よくある問題と解決方法
-
-**Q1: 日本語が文字化けする**
-```python
-# 解決方法：エンコーディングを指定
-with open('text.txt', 'r', encoding='utf-8') as f:
-    text = f.read()
-```
-
-**Q2: 音声が途切れる**
-```python
-# 解決方法：バッファサイズを調整
-import pyaudio
-
-p = pyaudio.PyAudio()
-stream = p.open(
-    format=pyaudio.paInt16,
-    channels=1,
-    rate=16000,
-    output=True,
-    frames_per_buffer=4096  # バッファサイズを増やす
-)
-```
-
-**Q3: GPUが使用されない**
-```python
-# 解決方法：CUDAの確認
-import torch
-print(f"CUDA available: {torch.cuda.is_available()}")
-print(f"CUDA version: {torch.version.cuda}")
-print(f"GPU: {torch.cuda.get_device_name(0)}")
-```
-
-<div style="background: linear-gradient(45deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 10px; text-align: center; margin: 40px 0;">
-<h3 style="color: white; margin-bottom: 10px;">🎁 AI音楽制作の極意を無料プレゼント！</h3>
-<p style="color: white; margin-bottom: 20px;">プロが使うAI音楽プロンプト100選を今だけ無料配布中！<br>YouTube収益化できるBGMも作れるようになります✨</p>
-<a href="#" style="display: inline-block; background: white; color: #667eea; padding: 15px 40px; border-radius: 50px; text-decoration: none; font-weight: bold; font-size: 18px;">📧 無料でメルマガ登録する</a>
-<p style="color: white; font-size: 14px; margin-top: 15px;">※ワンクリックでいつでも解除可能です</p>
-</div>
-
-## まとめ
-
-Pythonを使った音声合成プログラミングについて、基礎から応用まで解説してきました。
-
-**学んだこと：**
-- 基本的なTTSライブラリの使い方
-- 高度な音声合成テクニック
-- 音声エフェクトの追加方法
-- 音声アシスタントの実装
-- 音声クローン技術
-
-**次のステップ：**
-1. まずは簡単なgTTSから始めてみる
-2. 徐々に高度なライブラリに挑戦
-3. 自分のプロジェクトに音声機能を追加
-
-音声合成技術は日々進化しています。この記事で紹介した技術を活用して、ぜひあなただけの音声アプリケーションを作ってみてください！
-
-質問やご意見がありましたら、ぜひコメント欄でお聞かせください。次回は「リアルタイム音声変換の実装」について解説予定です。
-
-**アリサ** 🎤
-
----
-
-**関連記事：**
-[内部リンク: AI音楽制作入門ガイド]
-[内部リンク: 音声認識プログラミング入門]
-[外部リンク: Coqui TTS公式ドキュメント]
-
-**WordPressタグ:** #Python #音声合成 #AI音声 #プログラミング #{' #'.join(keywords[:5])}
-**メタディスクリプション:** {topic}を徹底解説。基礎から音声クローンまで、実践的なコード例と共に分かりやすく紹介。"""
-
-    @staticmethod
-    def _generate_complete_suno_article(topic: str, keywords: List[str]) -> str:
-        """Suno関連の完全記事を生成"""
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです🎵**
-
-「Sunoでもっとクオリティの高い曲を作りたい」「プロンプトの書き方がわからない」「商用利用の方法を知りたい」
-
-そんなあなたの悩み、すべて解決します！
-
-この記事では、Sunoを使った音楽制作について、初心者から上級者まで役立つ情報を徹底的にお伝えしていきます。
-
-## 目次
-
-1. [Sunoとは？2025年最新アップデート情報](#sunoとは)
-2. [Sunoの基本的な使い方完全ガイド](#基本的な使い方)
-3. [プロ級のプロンプトテクニック15選](#プロンプトテクニック)
-4. [ジャンル別攻略法と実例](#ジャンル別攻略法)
-5. [商用利用の完全ガイド](#商用利用)
-6. [収益化成功事例と戦略](#収益化事例)
-7. [よくある質問と解決方法](#faq)
-8. [Sunoコミュニティと学習リソース](#コミュニティ)
-
-## Sunoとは？2025年最新アップデート情報 {#sunoとは}
-
-**Suno**は、テキストプロンプトから高品質な音楽を生成できる革命的なAI音楽生成プラットフォームです。2023年のリリース以来、急速に進化を続け、2025年現在では世界中のクリエイターに愛用されています。
-
-### 🚀 2025年の最新アップデート
-
-**1. V4.0の新機能**
-- **超高音質生成**：48kHz/24bitのスタジオクオリティ
-- **日本語歌詞の精度向上**：自然な発音と抑揚
-- **リアルタイム編集**：生成後の微調整が可能に
-- **マルチトラック出力**：各楽器を個別に書き出し可能
-
-**2. 料金プランの拡充**
-- **Free Plan**：月5曲まで無料
-- **Pro Plan**：月500曲($8/月)
-- **Premier Plan**：無制限生成($24/月)
-
-**3. 新しいジャンル対応**
-- J-POP、アニソン対応強化
-- ローファイヒップホップ
-- アンビエント・瞑想音楽
-- ゲームBGM特化モード
-
-### 📊 Sunoの実績と評価
-
-**ユーザー数**：全世界1,000万人以上
-**生成楽曲数**：1日あたり100万曲以上
-**商用利用率**：35%のユーザーが収益化に成功
-
-[画像挿入指示: Sunoのダッシュボード画面]
-
-## Sunoの基本的な使い方完全ガイド {#基本的な使い方}
-
-### 🎯 STEP1：アカウント作成と初期設定
-
-1. **Suno公式サイトにアクセス**
-   - [https://suno.ai](https://suno.ai)
-   - Googleアカウントで簡単ログイン
-
-2. **初期設定のポイント**
-   - 言語設定を「日本語」に
-   - 音質設定は「High Quality」推奨
-   - 自動保存をONに
-
-### 🎯 STEP2：最初の曲を作ってみよう
-
-**基本的なプロンプトの構造**
-```
-[ジャンル] + [ムード] + [楽器] + [テンポ] + [その他の特徴]
-```
-
-**実例：**
-```
-"Uplifting J-pop, female vocal, piano and strings, 120 BPM, emotional chorus"
-```
-
-### 🎯 STEP3：Custom Modeの活用
-
-**Custom Modeの利点：**
-- 歌詞を自分で書ける
-- 曲の構成を細かく指定
-- スタイルをより詳細に設定
-
-**歌詞の書き方のコツ：**
-```
-[Verse 1]
-朝日が昇る街で
-新しい一日が始まる
-希望を胸に抱いて
-一歩ずつ前へ進もう
-
-[Chorus]
-輝く未来へ向かって
-夢を追いかけていこう
-どんな困難も乗り越えて
-笑顔で明日を迎えよう
-```
-
-### 🎯 STEP4：生成オプションの最適化
-
-**重要な設定項目：**
-- **Duration**：30秒〜4分まで選択可能
-- **Instrumental**：歌なしバージョン
-- **Continuation**：続きを生成
-- **Remix**：既存曲のリミックス
-
-[動画挿入指示: Sunoの基本操作チュートリアル動画]
-
-## プロ級のプロンプトテクニック15選 {#プロンプトテクニック}
-
-### 🎨 基本テクニック(初級)
-
-**1. ジャンルの明確化**
-```
-❌ 悪い例：「いい感じの曲」
-✅ 良い例：「Emotional ballad with orchestral arrangement」
-```
-
-**2. BPMの指定**
-```
-Slow (60-90 BPM): バラード、アンビエント
-Medium (90-120 BPM): ポップス、R&B
-Fast (120-180 BPM): ダンス、EDM
-```
-
-**3. 楽器の具体的指定**
-```
-"Acoustic guitar, warm bass, soft drums, vintage rhodes piano"
-```
-
-### 🎨 中級テクニック
-
-**4. 感情表現の追加**
-```
-"Melancholic but hopeful, building to an uplifting climax"
-```
-
-**5. 参照アーティストの活用**
-```
-"In the style of Nujabes meets J Dilla, jazzy hip-hop"
-```
-
-**6. 音響空間の指定**
-```
-"Intimate bedroom recording" vs "Grand concert hall sound"
-```
-
-### 🎨 上級テクニック
-
-**7. コード進行の指定**
-```
-"Following a I-V-vi-IV progression in C major"
-```
-
-**8. ダイナミクスの制御**
-```
-"Start quietly with solo piano, gradually add strings, explosive finale"
-```
-
-**9. 音色の詳細指定**
-```
-"Warm analog synths, tape saturation, vintage drum machines"
-```
-
-### 🎨 プロフェッショナルテクニック
-
-**10. レイヤリングの指示**
-```
-"Layer 1: Foundation - drums and bass
-Layer 2: Harmony - piano and pads  
-Layer 3: Melody - lead synth
-Layer 4: Texture - ambient sounds"
-```
-
-**11. ミックス指示**
-```
-"Wide stereo image, punchy drums, warm bass, crisp highs"
-```
-
-**12. マスタリング風の指示**
-```
-"Radio-ready production, competitive loudness, clear separation"
-```
-
-### 🎨 創造的テクニック
-
-**13. ストーリーテリング**
-```
-"Musical journey from darkness to light, representing personal growth"
-```
-
-**14. 文化的要素の融合**
-```
-"Traditional Japanese instruments meets modern trap production"
-```
-
-**15. 実験的アプローチ**
-```
-"Glitch elements, unexpected tempo changes, experimental sound design"
-```
-
-<div style="background: linear-gradient(45deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 10px; text-align: center; margin: 40px 0;">
-<h3 style="color: white; margin-bottom: 10px;">🎁 AI音楽制作の極意を無料プレゼント！</h3>
-<p style="color: white; margin-bottom: 20px;">プロが使うAI音楽プロンプト100選を今だけ無料配布中！<br>YouTube収益化できるBGMも作れるようになります✨</p>
-<a href="#" style="display: inline-block; background: white; color: #667eea; padding: 15px 40px; border-radius: 50px; text-decoration: none; font-weight: bold; font-size: 18px;">📧 無料でメルマガ登録する</a>
-<p style="color: white; font-size: 14px; margin-top: 15px;">※ワンクリックでいつでも解除可能です</p>
-</div>
-
-## ジャンル別攻略法と実例 {#ジャンル別攻略法}
-
-### 🎵 J-POP / アニソン
-
-**効果的なプロンプト例：**
-```
-"Energetic anime opening, female vocalist, catchy melody, 
-rock band with strings, 170 BPM, powerful chorus with key change"
-```
-
-**ポイント：**
-- キャッチーなメロディラインを強調
-- サビでの転調を指定
-- エネルギッシュな展開
-
-### 🎵 ローファイヒップホップ
-
-**効果的なプロンプト例：**
-```
-"Lo-fi hip hop, vinyl crackle, jazz piano samples, 
-mellow drums, rainy day mood, 85 BPM, study music vibe"
-```
-
-**ポイント：**
-- ビンテージ感の演出
-- リラックスした雰囲気
-- 環境音の追加
-
-### 🎵 EDM / ダンスミュージック
-
-**効果的なプロンプト例：**
-```
-"Progressive house, building energy, side-chain compression,
-128 BPM, festival ready, huge drop at 1:00, hands-up moment"
-```
-
-**ポイント：**
-- ビルドアップとドロップの明確化
-- エネルギーレベルの指定
-- ダンスフロア向けの構成
-
-### 🎵 アンビエント / 瞑想音楽
-
-**効果的なプロンプト例：**
-```
-"Peaceful ambient, nature sounds, tibetan bowls,
-slow evolution, no drums, meditation and sleep, 60 BPM"
-```
-
-**ポイント：**
-- ゆったりとした展開
-- 自然音の活用
-- リラックス効果の重視
-
-## 商用利用の完全ガイド {#商用利用}
-
-### 📜 Sunoのライセンス体系
-
-**Free Plan：**
-- 個人利用のみ
-- クレジット表記必須
-- 収益化不可
-
-**Pro Plan以上：**
-- 完全な商用利用権
-- クレジット表記不要
-- 収益化OK
-
-### 💰 収益化可能なプラットフォーム
-
-**1. 音楽配信サービス**
-- Spotify：○
-- Apple Music：○
-- YouTube Music：○
-- Amazon Music：○
-
-**2. 動画プラットフォーム**
-- YouTube(広告収入)：○
-- TikTok(クリエイターファンド)：○
-- Instagram(リール再生報酬)：○
-
-**3. 音楽販売**
-- Bandcamp：○
-- iTunes Store：○
-- Beatport：○
-
-**4. その他の収益化**
-- NFT化：○
-- ライセンス販売：○
-- カスタムBGM制作：○
-
-### 📋 商用利用時の注意点
-
-1. **著作権の帰属**
-   - 生成した楽曲の著作権は利用者に帰属
-   - Sunoは一切の権利を主張しない
-
-2. **既存楽曲との類似性**
-   - 偶然の一致でも問題になる可能性
-   - 必ず独自性をチェック
-
-3. **プラットフォームの規約**
-   - 各配信サービスの規約を確認
-   - AI生成音楽の扱いは変更される可能性
-
-## 収益化成功事例と戦略 {#収益化事例}
-
-### 🏆 成功事例1：YouTubeチャンネル運営
-
-**事例：瞑想音楽チャンネル**
-- 月間再生数：500万回
-- 推定月収：$3,000〜5,000
-- 戦略：毎日投稿、SEO最適化
-
-### 🏆 成功事例2：BGM素材販売
-
-**事例：ゲーム向けBGMパック**
-- 販売価格：$29/パック
-- 月間販売数：100〜200パック
-- 戦略：ニッチジャンル特化
-
-### 🏆 成功事例3：カスタムBGM制作
-
-**事例：企業向けBGM制作**
-- 単価：$500〜2,000/曲
-- 月間受注：5〜10件
-- 戦略：高品質ポートフォリオ
-
-### 💡 収益化のための戦略
-
-**1. ニッチを見つける**
-- 競合の少ない分野を狙う
-- 特定の用途に特化
-
-**2. 品質の追求**
-- プロンプトの最適化
-- 後処理での品質向上
-
-**3. マーケティング**
-- SNSでの発信
-- コミュニティへの参加
-- SEO対策
-
-## よくある質問と解決方法 {#faq}
-
-### ❓ Q1: 日本語の歌詞がうまく生成されない
-
-**A:** 以下の方法を試してください：
-1. ローマ字表記を併用
-2. シンプルな表現を使用
-3. 英語版で生成後、日本語に差し替え
-
-### ❓ Q2: 特定の楽器の音が出ない
-
-**A:** プロンプトの書き方を工夫：
-```
-"Prominent acoustic guitar" > "Acoustic guitar"
-"Lead electric guitar solo at 1:30" > 具体的な指示
-```
-
-### ❓ Q3: 生成される曲の長さが短い
-
-**A:** Pro Plan以上で4分まで生成可能。Continuationを使って延長も可能。
-
-### ❓ Q4: 商用利用で問題が起きた
-
-**A:** 
-1. プランを確認(Pro以上か)
-2. 生成日時の記録を保存
-3. Sunoサポートに連絡
-
-## Sunoコミュニティと学習リソース {#コミュニティ}
-
-### 🌐 公式コミュニティ
-
-**Discord Server**
-- メンバー数：50万人以上
-- 日本語チャンネルあり
-- プロンプト共有が活発
-
-**Reddit (r/SunoAI)**
-- 作品共有
-- テクニック討論
-- 最新情報
-
-### 📚 おすすめ学習リソース
-
-**1. 公式ドキュメント**
-- 基本的な使い方
-- APIリファレンス
-- ベストプラクティス
-
-**2. YouTube チャンネル**
-- Suno公式チャンネル
-- クリエイター解説動画
-- 実践チュートリアル
-
-**3. オンラインコース**
-- Udemy: Suno Mastery
-- Skillshare: AI Music Production
-
-### 🤝 日本のSunoコミュニティ
-
-**Twitter #Suno音楽**
-- 日本人クリエイターが集結
-- 作品共有が活発
-- 情報交換
-
-**Facebook Sunoユーザーグループ**
-- 初心者向けサポート
-- イベント情報
-- コラボ募集
-
-<div style="background: linear-gradient(45deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 10px; text-align: center; margin: 40px 0;">
-<h3 style="color: white; margin-bottom: 10px;">🎁 AI音楽制作の極意を無料プレゼント！</h3>
-<p style="color: white; margin-bottom: 20px;">プロが使うAI音楽プロンプト100選を今だけ無料配布中！<br>YouTube収益化できるBGMも作れるようになります✨</p>
-<a href="#" style="display: inline-block; background: white; color: #667eea; padding: 15px 40px; border-radius: 50px; text-decoration: none; font-weight: bold; font-size: 18px;">📧 無料でメルマガ登録する</a>
-<p style="color: white; font-size: 14px; margin-top: 15px;">※ワンクリックでいつでも解除可能です</p>
-</div>
-
-## まとめ
-
-Sunoを使った音楽制作について、基礎から応用、そして収益化まで幅広く解説してきました。
-
-**重要なポイント：**
-- プロンプトの書き方が品質を左右する
-- 商用利用にはPro Plan以上が必要
-- コミュニティでの学習が成長を加速
-
-**次のアクション：**
-1. まずは無料プランで練習
-2. 自分の得意ジャンルを見つける
-3. 収益化を視野に入れた制作
-
-Sunoは日々進化しています。この記事で紹介したテクニックを活用して、ぜひ素晴らしい音楽を生み出してください！
-
-質問や作品の共有は、ぜひコメント欄でお待ちしています。次回は「Sunoで作った曲のマスタリング術」について解説予定です。
-
-**アリサ** 🎵
-
----
-
-**関連記事：**
-[内部リンク: AI音楽制作完全ガイド]
-[内部リンク: Udio vs Suno徹底比較]
-[外部リンク: Suno公式サイト]
-
-**WordPressタグ:** #Suno #AI音楽 #音楽制作 #AI作曲 #{' #'.join(keywords[:5])}
-**メタディスクリプション:** {topic}を完全解説。プロンプトテクニックから収益化まで、実践的なノウハウを初心者にも分かりやすく紹介。"""
-
-    # 他の記事生成メソッドも同様に実装...
-    
-    @staticmethod
-    def _generate_complete_udio_article(topic: str, keywords: List[str]) -> str:
-        """Udio関連の完全記事を生成"""
-        return CompleteMockGenerator._generate_complete_suno_article(topic, keywords).replace("Suno", "Udio")
-    
-    @staticmethod
-    def _generate_complete_musicgen_article(topic: str, keywords: List[str]) -> str:
-        """MusicGen関連の完全記事を生成"""
-        return CompleteMockGenerator._generate_complete_stable_audio_article(topic, keywords).replace("Stable Audio", "MusicGen")
-    
-    @staticmethod
-    def _generate_complete_aiva_article(topic: str, keywords: List[str]) -> str:
-        """AIVA関連の完全記事を生成"""
-        return CompleteMockGenerator._generate_complete_suno_article(topic, keywords).replace("Suno", "AIVA")
-    
-    @staticmethod
-    def _generate_complete_app_development_article(topic: str, keywords: List[str]) -> str:
-        """アプリ開発関連の完全記事を生成"""
-        return CompleteMockGenerator._generate_complete_voice_synthesis_article(topic, keywords)
-    
-    @staticmethod
-    def _generate_complete_music_analysis_article(topic: str, keywords: List[str]) -> str:
-        """音楽分析関連の完全記事を生成"""
-        return CompleteMockGenerator._generate_complete_stable_audio_article(topic, keywords)
-    
-    @staticmethod
-    def _generate_complete_industry_article(topic: str, keywords: List[str]) -> str:
-        """業界分析関連の完全記事を生成"""
-        return CompleteMockGenerator._generate_complete_voice_synthesis_article(topic, keywords)
-    
-    @staticmethod
-    def _generate_complete_technical_article(topic: str, keywords: List[str]) -> str:
-        """技術記事の完全版を生成"""
-        return CompleteMockGenerator._generate_complete_voice_synthesis_article(topic, keywords)
\ No newline at end of file
+            return 'suno'
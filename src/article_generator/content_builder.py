@@ -5,19 +5,28 @@ AI Melody Kobo - 記事コンテンツの構築と生成を管理
 
 import os
 import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
 import logging
 from pathlib import Path
 
 from .ai_client import AIClientFactory, AIClientInterface
 from .persona import AlisaPersona
-from ..wordpress.converter import ArticleConverter
-from ..wordpress.category_manager import CategoryManager
-from ..data_sources.suno_scraper import SunoInfoCollector
-from ..data_sources.ai_music_collector import AIMusicInfoCollector
+from .streaming import SectionFormatGuard, StreamFormatError
+from .usage_tracker import UsageBudgetExceeded, usage_context
 from ..seo.keyword_strategy import SEOKeywordStrategy
 from ..seo.content_optimizer import SEOContentOptimizer
+from ..utils.lazy import lazy_component
+
+if TYPE_CHECKING:
+    # HTML変換（markdown・BeautifulSoup）と情報収集（feedparser）は使うときに読み込む
+    from ..wordpress.converter import ArticleConverter
+    from ..wordpress.category_manager import CategoryManager
+    from ..data_sources.suno_scraper import SunoInfoCollector
+    from ..data_sources.ai_music_collector import AIMusicInfoCollector
 
 logger = logging.getLogger(__name__)
 
@@ -25,11 +34,15 @@ logger = logging.getLogger(__name__)
 class ArticleGenerator:
     """記事生成パイプライン全体を管理するクラス"""
     
+    # 最新情報の収集結果を使い回す秒数（一括生成で記事ごとに取得しないため）
+    LATEST_INFO_TTL = 600
+    
     def __init__(self, 
                  ai_client_type: str = "claude",
                  persona_data_path: Optional[str] = None,
-                 category_manager: Optional[CategoryManager] = None,
-                 enable_seo_optimization: bool = True):
+                 category_manager: Optional['CategoryManager'] = None,
+                 enable_seo_optimization: bool = True,
+                 seed: Optional[int] = None):
         """
         記事生成器の初期化
         
@@ -38,23 +51,46 @@ class ArticleGenerator:
             persona_data_path: ペルソナデータのパス
             category_manager: カテゴリーマネージャーインスタンス
             enable_seo_optimization: SEO最適化を有効にするか
+            seed: キーワード・タイトル・見出し選択の乱数シード
+                  （省略時は環境変数GENERATION_SEED、未設定なら毎回ランダム）
         """
         self.ai_client = AIClientFactory.create_client(ai_client_type)
         self.persona = AlisaPersona(persona_data_path)
-        self.converter = ArticleConverter()
         self.category_manager = category_manager
-        self.suno_collector = SunoInfoCollector()
-        self.ai_music_collector = AIMusicInfoCollector()
         
         # SEO最適化システム
         self.enable_seo = enable_seo_optimization
         if self.enable_seo:
-            self.seo_keyword_strategy = SEOKeywordStrategy()
-            self.seo_content_optimizer = SEOContentOptimizer()
+            self.seo_keyword_strategy = SEOKeywordStrategy(seed=seed)
+            self.seo_content_optimizer = SEOContentOptimizer(seed=seed)
         
         # 生成履歴の保存先
         self.history_dir = Path("data/generation_history")
         self.history_dir.mkdir(parents=True, exist_ok=True)
+        
+        # 並列生成時の共有状態の保護
+        # 後処理（ペルソナ・履歴・HTML変換・タグ作成）は1記事ずつ実行する
+        self._finish_lock = threading.Lock()
+        self._latest_info_lock = threading.Lock()
+        self._latest_info: Optional[Tuple[float, str]] = None
+    
+    @lazy_component
+    def converter(self) -> 'ArticleConverter':
+        """Markdown→WordPress HTML変換"""
+        from ..wordpress.converter import ArticleConverter
+        return ArticleConverter()
+    
+    @lazy_component
+    def suno_collector(self) -> 'SunoInfoCollector':
+        """Suno最新情報の収集"""
+        from ..data_sources.suno_scraper import SunoInfoCollector
+        return SunoInfoCollector()
+    
+    @lazy_component
+    def ai_music_collector(self) -> 'AIMusicInfoCollector':
+        """AI音楽ツール全般の情報収集"""
+        from ..data_sources.ai_music_collector import AIMusicInfoCollector
+        return AIMusicInfoCollector()
     
     def generate_article(self,
                         topic: str,
@@ -62,7 +98,8 @@ class ArticleGenerator:
                         keywords: Optional[List[str]] = None,
                         use_latest_info: bool = True,
                         custom_context: Optional[str] = None,
-                        tool_name: Optional[str] = None) -> Dict[str, Any]:
+                        tool_name: Optional[str] = None,
+                        stream: bool = False) -> Dict[str, Any]:
         """
         記事を生成するメインメソッド
         
@@ -72,14 +109,63 @@ class ArticleGenerator:
             keywords: SEOキーワードのリスト
             use_latest_info: 最新のSuno情報を収集するか
             custom_context: カスタムコンテキスト
+            stream: ストリーミング生成し、届いたセクションから順に処理するか
             
         Returns:
             生成された記事データ
         """
         logger.info(f"記事生成開始: {topic}")
         
+        request = self._prepare_request(
+            topic, article_type, keywords, use_latest_info, custom_context, tool_name
+        )
+        
+        # 3. AI記事生成（ストリーミング時は4.のペルソナスタイルもセクションごとに適用）
+        styled_content = None
+        try:
+            # 使用量レコードに記事タイプ・ツール名を付ける
+            with usage_context(article_type=request['article_type'], tool_name=request['tool_name']):
+                if stream:
+                    ai_response, styled_content = self._generate_streaming(request)
+                else:
+                    ai_response = self.ai_client.generate_article(
+                        topic=request['topic'],
+                        keywords=request['keywords'],
+                        article_type=request['article_type'],
+                        additional_context=request['additional_context'],
+                        static_context=request['static_context'],
+                        sample_context=request['sample_context']
+                    )
+            logger.info("AI記事生成完了")
+            
+        except Exception as e:
+            logger.error(f"AI記事生成エラー: {str(e)}")
+            raise
+        
+        with self._finish_lock:
+            return self._finish_article(request, ai_response, styled_content)
+    
+    def _prepare_request(self,
+                         topic: str,
+                         article_type: str,
+                         keywords: Optional[List[str]],
+                         use_latest_info: bool,
+                         custom_context: Optional[str],
+                         tool_name: Optional[str]) -> Dict[str, Any]:
+        """
+        AIに渡すトピック・キーワード・コンテキストを準備（SEOキーワード・最新情報・ペルソナ）
+        
+        Returns:
+            AIクライアントへの入力と後処理に必要な情報をまとめた辞書
+        """
         # 現在の年を動的に取得
         current_year = datetime.now().year
+        seo_keywords = None
+        # 呼び出し元のリストを書き換えない（同じリストを複数の記事で共有している場合がある）
+        keywords = list(keywords) if keywords else None
+        
+        # 記事ごとに変わらない指示（プロンプトキャッシュの対象）
+        static_parts = [self.persona.get_style_prompt(include_samples=False)]
         
         # SEO最適化キーワードの生成
         if self.enable_seo:
@@ -113,11 +199,11 @@ class ArticleGenerator:
                 article_structure, seo_keywords, article_type
             )
             
-            # カスタムコンテキストにSEOガイダンスを追加
+            # カスタムコンテキストにSEOガイダンスを追加（チェックリストは記事によらず同じ）
             if not custom_context:
                 custom_context = ""
             custom_context += f"\n\n{seo_prompts['keyword_guidance']}"
-            custom_context += f"\n\n{seo_prompts['quality_checklist']}"
+            static_parts.append(seo_prompts['quality_checklist'])
             
         else:
             # 従来のキーワード設定
@@ -131,38 +217,71 @@ class ArticleGenerator:
         additional_context = custom_context or ""
         if use_latest_info:
             try:
-                latest_info = self.suno_collector.collect_latest_info()
+                latest_info = self._collect_latest_info()
                 if latest_info:
                     additional_context += f"\n\n最新のSuno情報:\n{latest_info}"
                     logger.info("最新のSuno情報を収集しました")
             except Exception as e:
                 logger.warning(f"Suno情報収集エラー: {str(e)}")
         
-        # 2. ペルソナスタイルプロンプトの追加
-        persona_prompt = self.persona.get_style_prompt()
-        full_context = f"{persona_prompt}\n\n{additional_context}" if additional_context else persona_prompt
+        # 2. ペルソナの執筆例（生成のたびに変わるためレスポンスキャッシュのキーから除く）
+        additional_context = additional_context.strip()
+        sample_context = self.persona.get_sample_prompt()
         
-        # 3. AI記事生成
-        try:
-            ai_response = self.ai_client.generate_article(
-                topic=topic,
-                keywords=keywords,
-                article_type=article_type,
-                additional_context=full_context
-            )
-            
-            markdown_content = ai_response.get('markdown_content', '')
-            logger.info("AI記事生成完了")
-            
-        except Exception as e:
-            logger.error(f"AI記事生成エラー: {str(e)}")
-            raise
+        return {
+            'topic': topic,
+            'article_type': article_type,
+            'keywords': keywords,
+            'tool_name': tool_name,
+            'static_context': "\n\n".join(static_parts),
+            'additional_context': additional_context or None,
+            'sample_context': sample_context or None,
+            'seo_keywords': seo_keywords
+        }
+    
+    def _collect_latest_info(self) -> str:
+        """最新のSuno情報を取得（LATEST_INFO_TTL秒以内の取得結果はスレッド間で使い回す）"""
+        with self._latest_info_lock:
+            if self._latest_info and time.time() - self._latest_info[0] < self.LATEST_INFO_TTL:
+                return self._latest_info[1]
+            latest_info = self.suno_collector.collect_latest_info()
+            self._latest_info = (time.time(), latest_info)
+            return latest_info
+    
+    def _finish_article(self,
+                        request: Dict[str, Any],
+                        ai_response: Dict[str, Any],
+                        styled_content: Optional[str] = None) -> Dict[str, Any]:
+        """
+        AIの出力を後処理して記事データにする（ペルソナ・SEO・CTA・HTML変換・カテゴリー・履歴）
+        
+        共有状態を更新するため、呼び出し側で _finish_lock を保持すること。
+        
+        Args:
+            request: _prepare_requestで準備した入力
+            ai_response: AIクライアントのレスポンス
+            styled_content: ペルソナスタイル適用済みのMarkdown（ストリーミング時）
+        """
+        topic = request['topic']
+        article_type = request['article_type']
+        tool_name = request['tool_name']
+        seo_keywords = request['seo_keywords']
+        seo_analysis = None
+        
+        usage = ai_response.get('usage') or {}
+        if usage.get('cache_read_input_tokens') or usage.get('cache_creation_input_tokens'):
+            logger.info(f"プロンプトキャッシュ: 読み込み {usage.get('cache_read_input_tokens', 0)}トークン, "
+                        f"書き込み {usage.get('cache_creation_input_tokens', 0)}トークン, "
+                        f"その他入力 {usage.get('input_tokens', 0)}トークン")
         
         # 4. ペルソナスタイルの適用
-        styled_content = self.persona.apply_persona_style(markdown_content)
+        if styled_content is None:
+            styled_content = self.persona.apply_persona_style(
+                ai_response.get('markdown_content', '')
+            )
         
         # 4.5. SEO最適化
-        if self.enable_seo and 'seo_keywords' in locals():
+        if self.enable_seo and seo_keywords is not None:
             styled_content = self.seo_keyword_strategy.optimize_content_structure(
                 styled_content, seo_keywords
             )
@@ -223,9 +342,11 @@ class ArticleGenerator:
         generation_data = {
             'topic': topic,
             'article_type': article_type,
-            'keywords': keywords,
+            'keywords': request['keywords'],
             'generated_at': datetime.now().isoformat(),
             'ai_model': ai_response.get('model', 'unknown'),
+            'ai_provider': ai_response.get('provider', self.ai_client.PROVIDER),
+            'usage': ai_response.get('usage', {}),
             'title': article_data.get('title', ''),
             'markdown_content': styled_content,
             'html_content': article_data.get('content', ''),
@@ -236,8 +357,8 @@ class ArticleGenerator:
             'detected_article_type': final_article_type if self.category_manager else article_type,
             'seo_optimization': {
                 'enabled': self.enable_seo,
-                'keywords': seo_keywords if self.enable_seo and 'seo_keywords' in locals() else None,
-                'analysis': seo_analysis if self.enable_seo and 'seo_analysis' in locals() else None
+                'keywords': seo_keywords if self.enable_seo else None,
+                'analysis': seo_analysis if self.enable_seo else None
             }
         }
         
@@ -259,6 +380,41 @@ class ArticleGenerator:
             'generation_metadata': generation_data
         }
     
+    def _generate_streaming(self, request: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+        """
+        記事をストリーミング生成し、届いたセクションから形式チェックとペルソナスタイルを適用
+        
+        CTA配置・SEO最適化・HTML変換は記事全体（H2の数や導入・まとめの位置）を
+        必要とするため、全セクションが揃ってから実行する。
+        
+        Returns:
+            (AIレスポンス, ペルソナスタイル適用済みのMarkdown)
+        """
+        article_stream = self.ai_client.stream_article(
+            topic=request['topic'],
+            keywords=request['keywords'],
+            article_type=request['article_type'],
+            additional_context=request['additional_context'],
+            static_context=request['static_context'],
+            sample_context=request['sample_context']
+        )
+        guard = SectionFormatGuard()
+        styled_sections = []
+        
+        try:
+            for section in article_stream:
+                guard.check(section)
+                # 置換は行単位のため、セクションごとに適用しても全体に適用した結果と同じになる
+                styled_sections.append(self.persona.apply_persona_style(section))
+        except StreamFormatError as e:
+            article_stream.close()
+            logger.warning(f"形式外のレスポンスのため生成を中断しました "
+                           f"({guard.sections}セクション受信後): {str(e)}")
+            raise
+        
+        logger.info(f"ストリーミング生成完了: {guard.sections}セクション (H2 {guard.h2_count}個)")
+        return article_stream.to_response(), ''.join(styled_sections)
+    
     def _process_cta_blocks(self, content: str) -> str:
         """CTAブロックを適切に処理（しつこすぎる場合は調整）"""
         cta_template = self.persona.get_cta_template()
@@ -313,7 +469,8 @@ class ArticleGenerator:
     
     def _save_generation_history(self, generation_data: Dict[str, Any]):
         """生成履歴を保存"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 並列生成で同じ秒に保存しても上書きしないようマイクロ秒まで含める
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         filename = f"article_{timestamp}.json"
         filepath = self.history_dir / filename
         
@@ -371,21 +528,115 @@ class ArticleGenerator:
         )
     
     def batch_generate_articles(self,
-                              article_specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """複数の記事を一括生成"""
-        results = []
+                              article_specs: List[Dict[str, Any]],
+                              use_batch_api: bool = False,
+                              max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        複数の記事を一括生成
+        
+        記事はスレッドプールで並列に生成する。AIプロバイダーへの同時リクエスト数は
+        AIクライアントの max_concurrency() で制限され、後処理は1記事ずつ実行される。
         
-        for spec in article_specs:
+        Args:
+            article_specs: generate_articleの引数のリスト
+            use_batch_api: 全記事のプロンプトを1つのバッチとして送信するか
+                           （送信後は処理完了までポーリングし、結果を順に後処理する）
+            max_workers: 並列に生成する記事数（省略時は環境変数ARTICLE_GENERATION_WORKERS、既定4）
+            
+        Returns:
+            入力順の結果（失敗した記事は success=False と error, spec を含む）
+        """
+        if use_batch_api:
+            return self._batch_generate_with_api(article_specs)
+        
+        if max_workers is None:
+            max_workers = int(os.getenv('ARTICLE_GENERATION_WORKERS', '4'))
+        max_workers = max(1, min(max_workers, len(article_specs) or 1))
+        
+        budget_exceeded = threading.Event()
+        
+        def generate(spec: Dict[str, Any]) -> Dict[str, Any]:
+            if budget_exceeded.is_set():
+                return {'success': False, 'error': "使用量の予算を超えたため生成しませんでした", 'spec': spec}
             try:
                 result = self.generate_article(**spec)
-                results.append(result)
                 logger.info(f"記事生成成功: {spec.get('topic', 'Unknown')}")
+                return result
+            except UsageBudgetExceeded as e:
+                if not budget_exceeded.is_set():
+                    budget_exceeded.set()
+                    logger.error(f"{str(e)} 残りの記事の生成を中止します")
+                return {'success': False, 'error': str(e), 'spec': spec}
             except Exception as e:
                 logger.error(f"記事生成失敗: {spec.get('topic', 'Unknown')} - {str(e)}")
-                results.append({
+                return {
                     'success': False,
                     'error': str(e),
                     'spec': spec
-                })
+                }
+        
+        started = time.time()
+        logger.info(f"並列生成開始: {len(article_specs)}記事 (ワーカー {max_workers})")
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='article') as executor:
+            # mapは入力順に結果を返す
+            results = list(executor.map(generate, article_specs))
+        
+        failed = [r['spec'].get('topic', 'Unknown') for r in results if not r.get('success')]
+        logger.info(f"並列生成完了: 成功 {len(results) - len(failed)}件 / 失敗 {len(failed)}件 "
+                    f"({time.time() - started:.1f}秒)")
+        if failed:
+            logger.warning(f"生成に失敗した記事: {', '.join(failed)}")
+        if self.ai_client.usage_tracker is not None:
+            totals = self.ai_client.usage_tracker.get_run_totals()
+            logger.info(f"AI使用量（この実行の累計）: {totals['calls']}回 / "
+                        f"{totals['tokens']:,}トークン / ${totals['cost_usd']:.2f}")
+        
+        return results
+    
+    def _batch_generate_with_api(self, article_specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """一括生成APIで本文を生成し、各記事を後処理"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(article_specs)
+        prepared = []
+        
+        for index, spec in enumerate(article_specs):
+            try:
+                request = self._prepare_request(
+                    spec['topic'],
+                    spec.get('article_type', 'news'),
+                    spec.get('keywords'),
+                    spec.get('use_latest_info', True),
+                    spec.get('custom_context'),
+                    spec.get('tool_name')
+                )
+                prepared.append((index, request))
+            except Exception as e:
+                logger.error(f"記事生成失敗: {spec.get('topic', 'Unknown')} - {str(e)}")
+                results[index] = {'success': False, 'error': str(e), 'spec': spec}
+        
+        logger.info(f"一括生成開始: {len(prepared)}記事")
+        responses = self.ai_client.generate_articles_batch([
+            {
+                'topic': request['topic'],
+                'keywords': request['keywords'],
+                'article_type': request['article_type'],
+                'additional_context': request['additional_context'],
+                'static_context': request['static_context'],
+                'sample_context': request['sample_context'],
+                'tool_name': request['tool_name']
+            }
+            for _, request in prepared
+        ])
+        
+        for (index, request), ai_response in zip(prepared, responses):
+            spec = article_specs[index]
+            try:
+                if ai_response.get('status') == 'failed':
+                    raise Exception(ai_response.get('error', '生成に失敗しました'))
+                with self._finish_lock:
+                    results[index] = self._finish_article(request, ai_response)
+                logger.info(f"記事生成成功: {spec.get('topic', 'Unknown')}")
+            except Exception as e:
+                logger.error(f"記事生成失敗: {spec.get('topic', 'Unknown')} - {str(e)}")
+                results[index] = {'success': False, 'error': str(e), 'spec': spec}
         
-        return results
\ No newline at end of file
+        return results
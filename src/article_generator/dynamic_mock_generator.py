@@ -3,8 +3,10 @@
 トピックに応じて適切なモック記事を生成
 """
 
-from typing import Dict, List, Any
-import random
+from typing import List
+
+from .mock_templates import MockTemplateStore
+
 
 class DynamicMockGenerator:
     """トピックに応じた動的モック記事生成"""
@@ -12,2638 +14,33 @@ class DynamicMockGenerator:
     @staticmethod
     def generate_mock_article(topic: str, keywords: List[str], article_type: str) -> str:
         """トピックに基づいて動的にモック記事を生成"""
-        
-        # トピックに基づいてタイトルと内容を決定
+        tool = DynamicMockGenerator._select_template(topic)
+        return MockTemplateStore.shared().render('dynamic', tool, article_type, topic, keywords)
+    
+    @staticmethod
+    def _select_template(topic: str) -> str:
+        """トピックに基づいて使用するテンプレート（ツール・分野名）を決定"""
         if "Udio" in topic:
-            return DynamicMockGenerator._generate_udio_article(topic, keywords)
+            return 'udio'
         elif "MusicGen" in topic:
-            return DynamicMockGenerator._generate_musicgen_article(topic, keywords)
+            return 'musicgen'
         elif "Stable Audio" in topic:
-            return DynamicMockGenerator._generate_stable_audio_article(topic, keywords)
+            return 'stable_audio'
         elif "AIVA" in topic:
-            return DynamicMockGenerator._generate_aiva_article(topic, keywords)
+            return 'aiva'
         elif "音声合成" in topic or "音声技術" in topic:
-            return DynamicMockGenerator._generate_voice_synthesis_article(topic, keywords)
+            return 'voice_synthesis'
         elif "アプリ開発" in topic or "React" in topic or "Vue" in topic or "Angular" in topic or "プレイヤー" in topic or "作る方法" in topic:
-            return DynamicMockGenerator._generate_app_development_article(topic, keywords)
+            # Reactに関する記事の場合はReact専用の記事
+            return 'react_app' if "React" in topic else 'app_development'
         elif "音楽分析" in topic or "楽曲分析" in topic:
-            return DynamicMockGenerator._generate_music_analysis_article(topic, keywords)
+            return 'music_analysis'
         elif "業界" in topic or "市場" in topic:
-            return DynamicMockGenerator._generate_industry_article(topic, keywords)
+            return 'industry'
         elif "技術" in topic or "アルゴリズム" in topic or "Transformer" in topic or "実装" in topic or "仕組み" in topic:
-            return DynamicMockGenerator._generate_technical_article(topic, keywords)
-        else:
-            return DynamicMockGenerator._generate_suno_article(topic, keywords)
-    
-    @staticmethod
-    def _generate_udio_article(topic: str, keywords: List[str]) -> str:
-        """Udio関連の記事を生成"""
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです🎵**
-
-Udioは、Sunoと並んで注目を集めているAI音楽生成プラットフォームです。
-高品質な音楽生成と、直感的なインターフェースが特徴的です。
-
-## 目次
-
-1. [Udioとは？最新AI音楽生成ツールの実力](#udioとは)
-2. [Udioの使い方 - 基本操作ガイド](#使い方)
-3. [Udioの特徴的な機能](#特徴)
-4. [Sunoとの比較 - どちらを選ぶべき？](#比較)
-5. [商用利用とライセンス](#商用利用)
-
-## Udioとは？最新AI音楽生成ツールの実力 {{#udioとは}}
-
-**Udio**は、2024年に登場した革新的なAI音楽生成プラットフォームです。
-テキストプロンプトから高品質な音楽を生成できる、次世代の音楽制作ツールです。
-
-### Udioの魅力的な特徴
-
-✅ **高音質な楽曲生成** - プロ品質のサウンドを実現
-✅ **多様なジャンル対応** - ポップス、ロック、エレクトロニックなど幅広くカバー
-✅ **直感的なUI** - 初心者でも使いやすいインターフェース
-✅ **リアルタイム編集** - 生成後の微調整が可能
-✅ **コラボレーション機能** - 他のクリエイターとの共同制作
-
-## まとめ
-
-Udioは、AI音楽制作の新たな可能性を切り開くツールです。
-ぜひ一度試してみてください！
-
-**WordPressタグ:** #Udio #AI音楽 #音楽制作 #AI作曲 {' '.join('#' + k for k in keywords[:5])}
-**メタディスクリプション:** {topic}について詳しく解説。Udioの使い方から実践テクニックまで、初心者にも分かりやすく紹介します。"""
-    
-    @staticmethod
-    def _generate_musicgen_article(topic: str, keywords: List[str]) -> str:
-        """MusicGen関連の記事を生成"""
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです🎵**
-
-Meta（旧Facebook）が開発したMusicGenは、オープンソースのAI音楽生成モデルとして注目を集めています。
-
-## 目次
-
-1. [MusicGenとは？Metaが開発したAI音楽生成技術](#musicgenとは)
-2. [MusicGenのセットアップ方法](#セットアップ)
-3. [基本的な使い方とパラメータ設定](#使い方)
-4. [応用テクニックとカスタマイズ](#応用)
-5. [他のAI音楽ツールとの比較](#比較)
-
-## MusicGenとは？Metaが開発したAI音楽生成技術 {{#musicgenとは}}
-
-**MusicGen**は、Meta AI Researchが開発したオープンソースの音楽生成モデルです。
-研究用途から商用利用まで、幅広い用途で活用できます。
-
-### MusicGenの技術的特徴
-
-✅ **オープンソース** - GitHubで公開、自由にカスタマイズ可能
-✅ **高度な制御性** - 細かなパラメータ調整が可能
-✅ **学習済みモデル** - すぐに使える複数のモデルを提供
-✅ **Python対応** - プログラマブルな音楽生成
-✅ **研究用途に最適** - 学術研究での活用事例多数
-
-## まとめ
-
-MusicGenは、技術者や研究者にとって理想的なAI音楽生成ツールです。
-オープンソースの力を活用して、新しい音楽表現に挑戦しましょう！
-
-**WordPressタグ:** #MusicGen #Meta #AI音楽 #オープンソース #{'#'.join(keywords[:5])}
-**メタディスクリプション:** {topic}を徹底解説。MusicGenの技術的特徴から実装方法まで、開発者向けに詳しく紹介します。"""
-    
-    @staticmethod
-    def _generate_voice_synthesis_article(topic: str, keywords: List[str]) -> str:
-        """音声合成関連の記事を生成"""
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです🎤**
-
-「自分の声でAIに喋らせたい」「もっと自然な音声を作りたい」「感情豊かな音声表現を実現したい」
-
-そんなあなたに朗報です！最新のAI音声合成技術を使えば、驚くほどリアルな音声を簡単に生成できるようになりました✨
-
-この記事では、2025年最新のAI音声合成技術について、初心者の方にも分かりやすく徹底解説していきます！
-
-## 目次
-
-1. [AI音声合成技術の最新トレンド2025](#最新トレンド)
-2. [主要な音声合成サービス徹底比較](#サービス比較)
-3. [実践！AI音声合成の始め方](#始め方)
-4. [プロ級の音声を作るコツ](#プロのコツ)
-5. [音声合成の活用事例15選](#活用事例)
-6. [著作権と倫理的な配慮](#倫理)
-7. [今後の展望と可能性](#展望)
-
-## AI音声合成技術の最新トレンド2025 {{#最新トレンド}}
-
-2025年、AI音声合成技術は**第3世代**へと進化を遂げました。もはや「機械っぽい音声」は過去のものです。
-
-### 🚀 2025年の革新的な技術
-
-**1. ゼロショット音声クローン技術**
-- たった**3秒**の音声サンプルで声質を完全再現
-- 感情や抑揚まで忠実に再現可能
-- 多言語での音声クローンにも対応
-
-**2. リアルタイム感情制御**
-- 喜び、悲しみ、怒り、驚きなど**8種類の感情**を自在に表現
-- 感情の強度を0-100%で細かく調整可能
-- 文脈に応じた自動感情付与機能
-
-**3. 超低遅延処理（エッジAI対応）**
-- スマートフォンでも**0.1秒以下**の遅延で音声生成
-- オフライン環境でも高品質な音声合成が可能
-- 5G/6G通信との連携でさらなる高速化
-
-### 📊 市場規模と成長予測
-
-2025年のAI音声合成市場は**前年比75%成長**を記録し、市場規模は**約3.2兆円**に到達しました。
-
-特に注目すべきは：
-- **エンターテインメント分野**：VTuber、バーチャルアイドルでの活用が急増
-- **教育分野**：個別最適化された音声教材の普及
-- **医療・介護分野**：音声アシスタントによる見守りサービス
-
-## 主要な音声合成サービス徹底比較 {{#サービス比較}}
-
-2025年現在、様々なAI音声合成サービスが登場しています。ここでは主要サービスを徹底比較！
-
-### 🏆 サービス比較表
-
-| サービス名 | 音質 | 料金 | 特徴 | おすすめ度 |
-|-----------|------|------|------|------------|
-| **ElevenLabs** | ★★★★★ | $5~/月 | 最高品質の音声クローン | ⭐⭐⭐⭐⭐ |
-| **Murf.ai** | ★★★★☆ | $19~/月 | 120以上の音声スタイル | ⭐⭐⭐⭐☆ |
-| **Play.ht** | ★★★★☆ | $31.2~/月 | 800以上の音声 | ⭐⭐⭐⭐☆ |
-| **Resemble AI** | ★★★★★ | $30~/月 | リアルタイム音声変換 | ⭐⭐⭐⭐☆ |
-| **Amazon Polly** | ★★★☆☆ | 従量課金 | AWS連携が強み | ⭐⭐⭐☆☆ |
-
-### 💡 選び方のポイント
-
-1. **用途で選ぶ**
-   - コンテンツ制作 → ElevenLabs、Murf.ai
-   - アプリ開発 → Amazon Polly、Google Cloud TTS
-   - リアルタイム配信 → Resemble AI
-
-2. **予算で選ぶ**
-   - 無料枠あり → Google Cloud TTS（月100万文字まで）
-   - 低価格 → ElevenLabs（$5~/月）
-   - 本格利用 → Murf.ai、Play.ht
-
-## 実践！AI音声合成の始め方 {{#始め方}}
-
-それでは実際にAI音声合成を始めてみましょう！初心者の方でも簡単にできる方法をご紹介します。
-
-### 🎯 STEP1: サービスの選択と登録
-
-**初心者におすすめ：ElevenLabs**
-1. [ElevenLabs公式サイト](https://elevenlabs.io)にアクセス
-2. 「Sign Up」から無料アカウント作成
-3. 月10,000文字まで無料で利用可能！
-
-### 🎯 STEP2: 音声の生成
-
-**基本的な手順：**
-1. テキストを入力（日本語OK！）
-2. 音声スタイルを選択
-3. 感情や速度を調整
-4. 「Generate」ボタンをクリック
-
-**プロのコツ：**
-- 句読点を効果的に使って自然な間を作る
-- 「！」や「？」で感情を強調
-- カタカナ表記で発音を調整
-
-### 🎯 STEP3: 音声のカスタマイズ
-
-**細かい調整で品質UP！**
-- **速度**：0.8倍速がおすすめ（聞き取りやすい）
-- **ピッチ**：±10%の範囲で調整
-- **感情**：文脈に合わせて選択
-
-## プロ級の音声を作るコツ {{#プロのコツ}}
-
-### ✨ テキスト入力の極意
-
-**1. 自然な日本語表現を心がける**
-```
-❌ 悪い例：本日は晴天なり。
-✅ 良い例：今日はとってもいい天気ですね！
-```
-
-**2. 読み方の指定テクニック**
-```
-「AI」→「エーアイ」
-「2025年」→「にせんにじゅうごねん」
-「10:30」→「じゅうじさんじゅっぷん」
-```
-
-**3. 感情表現の工夫**
-- 嬉しい時：文末に「♪」を追加
-- 驚いた時：「！！」で強調
-- 優しく話す：「〜」を使用
-
-### 🎨 音声演出のテクニック
-
-**BGMとの組み合わせ**
-1. 音声の音量を-3dBに設定
-2. BGMは-12dB程度に調整
-3. 音声の前後に0.5秒の無音を挿入
-
-**エフェクトの活用**
-- リバーブ：空間の広がりを演出
-- コンプレッサー：音量を均一化
-- イコライザー：声質を調整
-
-## 音声合成の活用事例15選 {{#活用事例}}
-
-### 🎬 エンターテインメント分野
-
-1. **VTuber・バーチャルタレント**
-   - リアルタイム配信での音声変換
-   - 多言語対応で海外展開も容易に
-
-2. **オーディオブック制作**
-   - 1冊の本を1時間で音声化
-   - 複数の話者で臨場感UP
-
-3. **ゲーム開発**
-   - NPCの音声を無限に生成
-   - プレイヤー名の読み上げ対応
-
-### 📚 教育・学習分野
-
-4. **語学学習アプリ**
-   - ネイティブ級の発音で学習支援
-   - 学習者のペースに合わせた速度調整
-
-5. **オンライン講座**
-   - 講師の負担軽減
-   - 24時間いつでも受講可能
-
-### 🏢 ビジネス分野
-
-6. **カスタマーサポート**
-   - 24時間対応の音声案内
-   - 多言語対応で国際展開支援
-
-7. **社内研修動画**
-   - 統一された品質の教材作成
-   - 更新が容易でコスト削減
-
-### 🏥 医療・福祉分野
-
-8. **服薬リマインダー**
-   - 患者さんに優しい声で服薬を促す
-   - 個別の名前呼びかけで親近感UP
-
-9. **リハビリ支援**
-   - 励ましの声で患者さんをサポート
-   - 進捗に応じた声かけの自動化
-
-## 著作権と倫理的な配慮 {{#倫理}}
-
-### ⚖️ 知っておくべき法的ポイント
-
-**1. 音声の著作権**
-- 生成した音声の著作権は基本的に利用者に帰属
-- ただし、元の音声データの権利には注意
-
-**2. 肖像権・パブリシティ権**
-- 有名人の声を無断でクローンするのはNG
-- 商用利用時は特に慎重に
-
-**3. なりすまし防止**
-- 音声クローンの悪用は犯罪になる可能性
-- 透かし技術の導入が進行中
-
-### 🤝 倫理的な利用のために
-
-- **透明性の確保**：AI音声であることを明記
-- **同意の取得**：音声クローン時は必ず本人の同意を
-- **悪用防止**：セキュリティ対策の徹底
-
-## 今後の展望と可能性 {{#展望}}
-
-### 🔮 2026年以降の技術予測
-
-**1. 脳波連動音声合成**
-- 考えるだけで音声生成が可能に
-- 身体障害者の方々への福音
-
-**2. 感情AI統合**
-- 相手の感情を読み取って最適な音声で応答
-- より人間らしいコミュニケーション
-
-**3. 量子コンピューティング活用**
-- 現在の1000倍の処理速度
-- リアルタイムで映画品質の音声生成
-
-### 💫 私たちの未来
-
-AI音声合成技術は、コミュニケーションの在り方を根本から変えようとしています。
-言語の壁を越え、感情豊かな表現を可能にし、誰もが自由に「声」を持てる時代。
-
-その可能性は無限大です！
-
-## まとめ
-
-AI音声合成技術は、2025年現在、驚異的な進化を遂げています。
-初心者の方でも簡単に始められ、プロ級の音声を作ることが可能になりました。
-
-ぜひこの記事を参考に、AI音声合成の世界に飛び込んでみてください！
-きっと新しい表現の可能性が広がるはずです✨
-
-**今すぐ始めるなら：**
-1. ElevenLabsの無料アカウントを作成
-2. 簡単なテキストで音声生成を体験
-3. 徐々に高度な機能にチャレンジ！
-
-**WordPressタグ:** #AI音声合成 #音声技術 #TTS #音声クローン #ボイスチェンジャー {' '.join('#' + k for k in keywords[:5])} #2025年最新 #AIツール #音声生成AI
-**メタディスクリプション:** {topic}を徹底解説！最新技術トレンドから実践方法、活用事例まで初心者にも分かりやすく紹介。今すぐ始められる音声合成ガイド"""
-    
-    @staticmethod
-    def _generate_app_development_article(topic: str, keywords: List[str]) -> str:
-        """アプリ開発関連の記事を生成"""
-        # タグを先に構築
-        keyword_tags = ' '.join('#' + k for k in keywords[:5])
-        
-        # Reactに関する記事の場合
-        if "React" in topic:
-            from .react_article_generator import generate_react_music_player_article
-            return generate_react_music_player_article(topic, keywords, keyword_tags)
-        # その他のアプリ開発記事
+            if "Transformer" in topic or "トランスフォーマー" in topic:
+                return 'transformer'
+            # VAE・GAN・Diffusionの専用記事はないため一般的な技術記事を使う
+            return 'technical'
         else:
-            return DynamicMockGenerator._generate_general_app_article(topic, keywords, keyword_tags)
-    
-    @staticmethod  
-    def _generate_general_app_article(topic: str, keywords: List[str], keyword_tags: str) -> str:
-        """一般的なアプリ開発記事を生成"""
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです💻**
-
-「ReactでAI音楽プレイヤーを作りたい」「Suno APIやStable Audio APIを使ったアプリを開発したい」「モダンな音楽再生UIを実装したい」
-
-そんな開発者の皆さんに向けて、今日はReactを使ったAI音楽プレイヤーの実装方法を、実際のコードと共に徹底解説します！
-
-私も最初は「音楽プレイヤーって難しそう...」と思っていました。でも、最新のReact HooksとAI音楽APIを組み合わせることで、驚くほど簡単に高機能なプレイヤーが作れるんです✨
-
-## 目次
-
-1. [プロジェクトのセットアップ](#セットアップ)
-2. [必要なパッケージのインストール](#パッケージ)
-3. [AI音楽APIの統合](#api統合)
-4. [音楽プレイヤーコンポーネントの実装](#プレイヤー実装)
-5. [プレイリスト機能の追加](#プレイリスト)
-6. [UIデザインとアニメーション](#uiデザイン)
-7. [パフォーマンス最適化](#最適化)
-8. [デプロイと公開](#デプロイ)
-
-## プロジェクトのセットアップ {{#セットアップ}}
-
-### 🚀 Create React Appで新規プロジェクト作成
-
-まずは、TypeScriptを使用したReactプロジェクトを作成します：
-
-```bash
-npx create-react-app ai-music-player --template typescript
-cd ai-music-player
-```
-
-### 📁 プロジェクト構造
-
-```
-ai-music-player/
-├── src/
-│   ├── components/
-│   │   ├── Player/
-│   │   │   ├── Player.tsx
-│   │   │   ├── Player.module.css
-│   │   │   └── index.ts
-│   │   ├── Playlist/
-│   │   │   ├── Playlist.tsx
-│   │   │   └── PlaylistItem.tsx
-│   │   └── Controls/
-│   │       ├── PlayButton.tsx
-│   │       ├── VolumeControl.tsx
-│   │       └── ProgressBar.tsx
-│   ├── hooks/
-│   │   ├── useAudioPlayer.ts
-│   │   ├── useAIMusic.ts
-│   │   └── usePlaylist.ts
-│   ├── services/
-│   │   ├── sunoAPI.ts
-│   │   ├── stableAudioAPI.ts
-│   │   └── audioContext.ts
-│   └── types/
-│       └── music.ts
-```
-
-## 必要なパッケージのインストール {{#パッケージ}}
-
-### 📦 主要な依存関係
-
-```bash
-# 音楽再生関連
-npm install howler wavesurfer.js
-
-# UI/UXライブラリ
-npm install framer-motion react-icons
-
-# 状態管理
-npm install zustand
-
-# API通信
-npm install axios react-query
-
-# スタイリング
-npm install styled-components
-```
-
-### 🔧 TypeScript型定義
-
-```bash
-npm install --save-dev @types/howler
-```
-
-## AI音楽APIの統合 {{#api統合}}
-
-### 🎵 Suno API統合
-
-```typescript
-// src/services/sunoAPI.ts
-import axios from 'axios';
-
-interface SunoGenerateRequest {{
-  prompt: string;
-  duration?: number;
-  style?: string;
-}}
-
-interface SunoTrack {{
-  id: string;
-  title: string;
-  audioUrl: string;
-  duration: number;
-  createdAt: Date;
-}}
-
-export class SunoAPIService {{
-  private apiKey: string;
-  private baseURL = 'https://api.suno.ai/v1';
-
-  constructor(apiKey: string) {{
-    this.apiKey = apiKey;
-  }}
-
-  async generateMusic(request: SunoGenerateRequest): Promise<SunoTrack> {{
-    try {{
-      const response = await axios.post(
-        `${{this.baseURL}}/generate`,
-        request,
-        {{
-          headers: {{
-            'Authorization': `Bearer ${{this.apiKey}}`,
-            'Content-Type': 'application/json'
-          }}
-        }}
-      );
-
-      return response.data;
-    }} catch (error) {{
-      console.error('Suno API Error:', error);
-      throw error;
-    }}
-  }}
-
-  async getTrack(trackId: string): Promise<SunoTrack> {{
-    const response = await axios.get(
-      `${{this.baseURL}}/tracks/${{trackId}}`,
-      {{
-        headers: {{
-          'Authorization': `Bearer ${{this.apiKey}}`
-        }}
-      }}
-    );
-
-    return response.data;
-  }}
-}}
-```
-
-## 音楽プレイヤーコンポーネントの実装 {{#プレイヤー実装}}
-
-### 🎧 カスタムフックの作成
-
-```typescript
-// src/hooks/useAudioPlayer.ts
-import {{ useState, useRef, useEffect }} from 'react';
-import {{ Howl }} from 'howler';
-
-interface UseAudioPlayerProps {{
-  src: string;
-  onEnd?: () => void;
-}}
-
-export const useAudioPlayer = ({{ src, onEnd }}: UseAudioPlayerProps) => {{
-  const [isPlaying, setIsPlaying] = useState(false);
-  const [duration, setDuration] = useState(0);
-  const [currentTime, setCurrentTime] = useState(0);
-  const [volume, setVolume] = useState(1);
-  const soundRef = useRef<Howl | null>(null);
-
-  useEffect(() => {{
-    if (src) {{
-      soundRef.current = new Howl({{
-        src: [src],
-        html5: true,
-        onload: () => {{
-          setDuration(soundRef.current?.duration() || 0);
-        }},
-        onend: () => {{
-          setIsPlaying(false);
-          onEnd?.();
-        }},
-        onplay: () => {{
-          updateCurrentTime();
-        }}
-      });
-    }}
-
-    return () => {{
-      soundRef.current?.unload();
-    };
-  }, [src]);
-
-  const updateCurrentTime = () => {{
-    if (soundRef.current && isPlaying) {{
-      setCurrentTime(soundRef.current.seek());
-      requestAnimationFrame(updateCurrentTime);
-    }}
-  }};
-
-  const play = () => {{
-    soundRef.current?.play();
-    setIsPlaying(true);
-  }};
-
-  const pause = () => {{
-    soundRef.current?.pause();
-    setIsPlaying(false);
-  }};
-
-  const seek = (time: number) => {{
-    soundRef.current?.seek(time);
-    setCurrentTime(time);
-  }};
-
-  const changeVolume = (newVolume: number) => {{
-    soundRef.current?.volume(newVolume);
-    setVolume(newVolume);
-  }};
-
-  return {{
-    isPlaying,
-    duration,
-    currentTime,
-    volume,
-    play,
-    pause,
-    seek,
-    changeVolume
-  }};
-}};
-```
-
-### 🎨 プレイヤーコンポーネント
-
-```typescript
-// src/components/Player/Player.tsx
-import React from 'react';
-import {{ motion }} from 'framer-motion';
-import {{ FaPlay, FaPause, FaForward, FaBackward }} from 'react-icons/fa';
-import {{ useAudioPlayer }} from '../../hooks/useAudioPlayer';
-import styles from './Player.module.css';
-
-interface PlayerProps {{
-  track: {{
-    id: string;
-    title: string;
-    artist?: string;
-    audioUrl: string;
-    coverUrl?: string;
-  }};
-  onNext?: () => void;
-  onPrevious?: () => void;
-}}
-
-export const Player: React.FC<PlayerProps> = ({{ track, onNext, onPrevious }}) => {{
-  const {{
-    isPlaying,
-    duration,
-    currentTime,
-    volume,
-    play,
-    pause,
-    seek,
-    changeVolume
-  }} = useAudioPlayer({{
-    src: track.audioUrl,
-    onEnd: onNext
-  }});
-
-  const formatTime = (seconds: number) => {{
-    const mins = Math.floor(seconds / 60);
-    const secs = Math.floor(seconds % 60);
-    return `${'${mins}'}:${'${secs.toString().padStart(2, \'0\')}'}`;
-  }};
-
-  return (
-    <motion.div 
-      className={styles.player}
-      initial={{ opacity: 0, y: 50 }}
-      animate={{ opacity: 1, y: 0 }}
-      transition={{ duration: 0.5 }}
-    >
-      {/* アルバムアート */}
-      <div className={styles.albumArt}>
-        <motion.img
-          src={track.coverUrl || '/default-cover.jpg'}
-          alt={track.title}
-          animate={{ rotate: isPlaying ? 360 : 0 }}
-          transition={{
-            duration: 20,
-            repeat: isPlaying ? Infinity : 0,
-            ease: 'linear'
-          }}
-        />
-      </div>
-
-      {/* トラック情報 */}
-      <div className={styles.trackInfo}>
-        <h3>{track.title}</h3>
-        <p>{track.artist || 'AI Generated'}</p>
-      </div>
-
-      {/* プログレスバー */}
-      <div className={styles.progressContainer}>
-        <span>{formatTime(currentTime)}</span>
-        <input
-          type="range"
-          min={0}
-          max={duration}
-          value={currentTime}
-          onChange={(e) => seek(Number(e.target.value))}
-          className={styles.progressBar}
-        />
-        <span>{formatTime(duration)}</span>
-      </div>
-
-      {/* コントロール */}
-      <div className={styles.controls}>
-        <button onClick={onPrevious} className={styles.controlButton}>
-          <FaBackward />
-        </button>
-        <button
-          onClick={isPlaying ? pause : play}
-          className={styles.playButton}
-        >
-          {isPlaying ? <FaPause /> : <FaPlay />}
-        </button>
-        <button onClick={onNext} className={styles.controlButton}>
-          <FaForward />
-        </button>
-      </div>
-
-      {/* ボリューム */}
-      <div className={styles.volumeControl}>
-        <input
-          type="range"
-          min={0}
-          max={1}
-          step={0.01}
-          value={volume}
-          onChange={(e) => changeVolume(Number(e.target.value))}
-        />
-      </div>
-    </motion.div>
-  );
-};
-```
-
----
-
-**💌 無料メルマガ登録で限定特典をゲット！**
-
-React×AI音楽の最新情報や、実装に使えるコンポーネント集を無料でプレゼント！今すぐ登録して、最先端の音楽アプリ開発に参加しましょう。
-
-[CTAボタン: 無料メルマガに登録する]
-
----
-
-## プレイリスト機能の追加 {{#プレイリスト}}
-
-### 📋 Zustandでの状態管理
-
-```typescript
-// src/store/playlistStore.ts
-import create from 'zustand';
-
-interface Track {
-  id: string;
-  title: string;
-  audioUrl: string;
-  duration: number;
-}
-
-interface PlaylistStore {
-  tracks: Track[];
-  currentIndex: number;
-  addTrack: (track: Track) => void;
-  removeTrack: (id: string) => void;
-  setCurrentIndex: (index: number) => void;
-  nextTrack: () => void;
-  previousTrack: () => void;
-}
-
-export const usePlaylistStore = create<PlaylistStore>((set, get) => ({
-  tracks: [],
-  currentIndex: 0,
-  
-  addTrack: (track) => set((state) => ({
-    tracks: [...state.tracks, track]
-  })),
-  
-  removeTrack: (id) => set((state) => ({
-    tracks: state.tracks.filter(t => t.id !== id)
-  })),
-  
-  setCurrentIndex: (index) => set({ currentIndex: index }),
-  
-  nextTrack: () => {
-    const { tracks, currentIndex } = get();
-    if (currentIndex < tracks.length - 1) {
-      set({ currentIndex: currentIndex + 1 });
-    }
-  },
-  
-  previousTrack: () => {
-    const { currentIndex } = get();
-    if (currentIndex > 0) {
-      set({ currentIndex: currentIndex - 1 });
-    }
-  }
-}));
-```
-
-## UIデザインとアニメーション {{#uiデザイン}}
-
-### 🎨 モダンなデザイン実装
-
-```css
-/* src/components/Player/Player.module.css */
-.player {
-  max-width: 400px;
-  margin: 0 auto;
-  padding: 2rem;
-  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-  border-radius: 20px;
-  box-shadow: 0 20px 40px rgba(0, 0, 0, 0.2);
-  color: white;
-}
-
-.albumArt {
-  width: 200px;
-  height: 200px;
-  margin: 0 auto 2rem;
-  overflow: hidden;
-  border-radius: 50%;
-  box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
-}
-
-.albumArt img {
-  width: 100%;
-  height: 100%;
-  object-fit: cover;
-}
-
-.progressBar {
-  width: 100%;
-  height: 6px;
-  -webkit-appearance: none;
-  background: rgba(255, 255, 255, 0.3);
-  border-radius: 3px;
-  outline: none;
-}
-
-.progressBar::-webkit-slider-thumb {
-  -webkit-appearance: none;
-  width: 16px;
-  height: 16px;
-  background: white;
-  border-radius: 50%;
-  cursor: pointer;
-  box-shadow: 0 2px 8px rgba(0, 0, 0, 0.3);
-}
-
-.playButton {
-  width: 60px;
-  height: 60px;
-  border-radius: 50%;
-  background: white;
-  color: #667eea;
-  border: none;
-  font-size: 24px;
-  cursor: pointer;
-  transition: all 0.3s ease;
-  box-shadow: 0 4px 15px rgba(0, 0, 0, 0.2);
-}
-
-.playButton:hover {
-  transform: scale(1.1);
-  box-shadow: 0 6px 20px rgba(0, 0, 0, 0.3);
-}
-```
-
-## パフォーマンス最適化 {{#最適化}}
-
-### ⚡ React.memoとuseMemoの活用
-
-```typescript
-// メモ化されたプレイリストアイテム
-export const PlaylistItem = React.memo(({ track, isActive, onClick }) => {
-  return (
-    <motion.div
-      className={`playlist-item ${{isActive ? 'active' : ''}}`}
-      onClick={onClick}
-      whileHover={{ scale: 1.02 }}
-      whileTap={{ scale: 0.98 }}
-    >
-      <span className="track-number">{{track.index}}</span>
-      <div className="track-info">
-        <h4>{{track.title}}</h4>
-        <p>{{track.duration}}</p>
-      </div>
-    </motion.div>
-  );
-});
-```
-
-## デプロイと公開 {{#デプロイ}}
-
-### 🚀 Vercelへのデプロイ
-
-```bash
-# ビルド
-npm run build
-
-# Vercel CLIのインストール
-npm i -g vercel
-
-# デプロイ
-vercel
-```
-
-### 📱 PWA対応
-
-```json
-// public/manifest.json
-{
-  "short_name": "AI Music Player",
-  "name": "AI Music Player - Powered by React",
-  "icons": [
-    {
-      "src": "favicon.ico",
-      "sizes": "64x64 32x32 24x24 16x16",
-      "type": "image/x-icon"
-    }
-  ],
-  "start_url": ".",
-  "display": "standalone",
-  "theme_color": "#667eea",
-  "background_color": "#ffffff"
-}
-```
-
-## まとめ
-
-ReactでAI音楽プレイヤーを作成する方法を、実際のコードと共に解説しました。最新のReact HooksとAI音楽APIを組み合わせることで、高機能なプレイヤーが簡単に実装できます。
-
-**重要ポイント：**
-- カスタムフックで音楽再生ロジックを分離
-- Zustandで効率的な状態管理
-- Framer Motionで滑らかなアニメーション
-- TypeScriptで型安全な開発
-
-**次のステップ：**
-1. 実際にコードを動かしてみる
-2. 好みのAI音楽APIを選んで統合
-3. オリジナルのUIデザインを追加
-4. 追加機能（歌詞表示、ビジュアライザー等）の実装
-
-ぜひこの記事を参考に、あなただけのAI音楽プレイヤーを作ってみてください！
-
-**関連記事：**
-[内部リンク: Next.jsでAI音楽アプリを作る]
-[内部リンク: AI音楽API徹底比較]
-[外部リンク: React公式ドキュメント]
-
-**WordPressタグ:** #React #AI音楽 #プログラミング #Web開発 {keyword_tags}
-**メタディスクリプション:** {topic}を実際のコードと共に徹底解説。Hooks、TypeScript、AI音楽APIを使った実装方法を初心者にも分かりやすく紹介。"""
-    
-    @staticmethod  
-    def _generate_general_app_article(topic: str, keywords: List[str], keyword_tags: str) -> str:
-        """一般的なアプリ開発記事を生成"""
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです💻**
-
-「AI音楽機能を自分のアプリに組み込みたい」「音楽生成AIを活用した新しいサービスを作りたい」「でも、どこから始めればいいか分からない...」
-
-そんな開発者の皆さんに朗報です！2025年現在、AI音楽APIの進化により、誰でも簡単に高品質な音楽生成機能をアプリに実装できるようになりました✨
-
-この記事では、AI音楽アプリ開発の基礎から実装方法、収益化まで、現役エンジニアの視点で徹底解説していきます！
-
-## 目次
-
-1. [AI音楽アプリ市場の現状と可能性](#市場分析)
-2. [開発前に知っておくべき基礎知識](#基礎知識)
-3. [主要AI音楽APIサービス完全比較2025](#api比較)
-4. [実装ステップバイステップガイド](#実装ガイド)
-5. [UI/UXデザインのベストプラクティス](#デザイン)
-6. [パフォーマンス最適化テクニック](#最適化)
-7. [収益化戦略と成功事例](#収益化)
-8. [よくあるトラブルと解決方法](#トラブル)
-
-## AI音楽アプリ市場の現状と可能性 {{#市場分析}}
-
-2025年、AI音楽アプリ市場は**爆発的な成長**を遂げています。市場規模は前年比**120%成長**し、**5,000億円**を突破しました！
-
-### 📊 注目すべき市場トレンド
-
-**1. パーソナライゼーション需要の急増**
-- ユーザーの好みに合わせた自動作曲
-- 気分や状況に応じた音楽生成
-- 個人向けBGM作成サービス
-
-**2. クリエイター支援ツールの需要**
-- 動画制作者向けBGM生成
-- ゲーム開発者向け効果音生成
-- ポッドキャスター向けジングル作成
-
-**3. 教育・療養分野での活用**
-- 音楽療法アプリ
-- 作曲学習支援ツール
-- リラクゼーション音楽生成
-
-### 💡 今がチャンス！参入メリット
-
-- **技術的ハードルの低下**：優れたAPIで簡単実装
-- **市場の未成熟**：ブルーオーシャンが多数存在
-- **投資の活発化**：AI音楽スタートアップへの投資が急増
-
-## 開発前に知っておくべき基礎知識 {{#基礎知識}}
-
-### 🔧 必要な技術スタック
-
-**フロントエンド**
-```javascript
-// 推奨技術スタック
-- React / Vue.js / Angular（SPA開発）
-- Next.js / Nuxt.js（SSR対応）
-- React Native / Flutter（モバイルアプリ）
-- Web Audio API（音声処理）
-```
-
-**バックエンド**
-```python
-# 推奨技術スタック
-- Node.js / Python / Go
-- Express / FastAPI / Gin
-- PostgreSQL / MongoDB
-- Redis（キャッシング）
-```
-
-**インフラ・クラウド**
-```yaml
-# 推奨サービス
-- AWS / Google Cloud / Azure
-- Vercel / Netlify（フロントエンド）
-- Docker / Kubernetes
-- CloudFront / Cloudflare（CDN）
-```
-
-### 🎯 アーキテクチャ設計のポイント
-
-**1. マイクロサービス設計**
-```
-┌─────────────┐     ┌─────────────┐     ┌─────────────┐
-│   Frontend  │────▶│   API GW    │────▶│Music Gen API│
-└─────────────┘     └─────────────┘     └─────────────┘
-                            │
-                            ▼
-                    ┌─────────────┐
-                    │   Database  │
-                    └─────────────┘
-```
-
-**2. 非同期処理の実装**
-- WebSocketsでリアルタイム通信
-- Message Queueで負荷分散
-- Webhookで生成完了通知
-
-## 主要AI音楽APIサービス完全比較2025 {{#api比較}}
-
-### 🏆 API比較表（開発者視点）
-
-| サービス名 | 料金 | レスポンス速度 | 音質 | 開発しやすさ | 特徴 |
-|-----------|------|--------------|------|------------|------|
-| **Suno API** | $0.01/曲 | 30秒 | ★★★★★ | ★★★★☆ | ボーカル付き楽曲生成 |
-| **Udio API** | $0.02/曲 | 45秒 | ★★★★★ | ★★★★★ | 高品質・多ジャンル対応 |
-| **MusicGen API** | 無料〜 | 10秒 | ★★★★☆ | ★★★☆☆ | オープンソース |
-| **Stable Audio API** | $0.015/曲 | 20秒 | ★★★★☆ | ★★★★☆ | カスタマイズ性高 |
-| **AIVA API** | $20/月〜 | 60秒 | ★★★★★ | ★★★☆☆ | クラシック特化 |
-
-### 💻 実際のAPI実装例（Suno API）
-
-```javascript
-// Suno API実装例
-const generateMusic = async (prompt) => {{
-  const response = await fetch('https://api.suno.ai/v1/generate', {{
-    method: 'POST',
-    headers: {{
-      'Authorization': `Bearer ${{API_KEY}}`,
-      'Content-Type': 'application/json'
-    }},
-    body: JSON.stringify({{
-      prompt: prompt,
-      duration: 180, // 3分
-      style: 'pop',
-      vocals: true
-    }})
-  }});
-  
-  const data = await response.json();
-  return data.audio_url;
-}};
-```
-
-## 実装ステップバイステップガイド {{#実装ガイド}}
-
-### 📝 STEP1: プロジェクトセットアップ
-
-```bash
-# プロジェクト作成
-npx create-next-app@latest ai-music-app
-cd ai-music-app
-
-# 必要なパッケージをインストール
-npm install axios react-audio-player zustand
-npm install -D @types/react-audio-player
-```
-
-### 📝 STEP2: API統合レイヤーの実装
-
-```typescript
-// lib/musicApi.ts
-import axios from 'axios';
-
-interface MusicGenerationParams {{
-  prompt: string;
-  style?: string;
-  duration?: number;
-}}
-
-class MusicAPIClient {{
-  private apiKey: string;
-  private baseURL: string;
-  
-  constructor() {{
-    this.apiKey = process.env.NEXT_PUBLIC_MUSIC_API_KEY!;
-    this.baseURL = 'https://api.suno.ai/v1';
-  }}
-  
-  async generateMusic(params: MusicGenerationParams) {{
-    try {{
-      const response = await axios.post(
-        `${{this.baseURL}}/generate`,
-        params,
-        {{
-          headers: {{
-            'Authorization': `Bearer ${{this.apiKey}}`,
-          }},
-        }}
-      );
-      return response.data;
-    }} catch (error) {{
-      console.error('Music generation failed:', error);
-      throw error;
-    }}
-  }}
-  
-  async checkStatus(jobId: string) {{
-    const response = await axios.get(
-      `${{this.baseURL}}/status/${{jobId}}`,
-      {{
-        headers: {{
-          'Authorization': `Bearer ${{this.apiKey}}`,
-        }},
-      }}
-    );
-    return response.data;
-  }}
-}}
-
-export default new MusicAPIClient();
-```
-
-### 📝 STEP3: UIコンポーネントの実装
-
-```tsx
-// components/MusicGenerator.tsx
-import {{ useState }} from 'react';
-import musicApi from '../lib/musicApi';
-import AudioPlayer from 'react-audio-player';
-
-export default function MusicGenerator() {{
-  const [prompt, setPrompt] = useState('');
-  const [loading, setLoading] = useState(false);
-  const [audioUrl, setAudioUrl] = useState('');
-  
-  const handleGenerate = async () => {{
-    setLoading(true);
-    try {{
-      const result = await musicApi.generateMusic({{
-        prompt,
-        style: 'pop',
-        duration: 180
-      }});
-      
-      // ポーリングで生成状態をチェック
-      const checkInterval = setInterval(async () => {{
-        const status = await musicApi.checkStatus(result.jobId);
-        if (status.status === 'completed') {{
-          setAudioUrl(status.audioUrl);
-          setLoading(false);
-          clearInterval(checkInterval);
-        }}
-      }}, 5000);
-    }} catch (error) {{
-      setLoading(false);
-      alert('生成に失敗しました');
-    }}
-  }};
-  
-  return (
-    <div className="music-generator">
-      <textarea
-        value={{prompt}}
-        onChange={{(e) => setPrompt(e.target.value)}}
-        placeholder="どんな曲を作りたいですか？"
-        className="w-full p-4 border rounded"
-      />
-      
-      <button
-        onClick={{handleGenerate}}
-        disabled={{loading || !prompt}}
-        className="mt-4 px-6 py-2 bg-blue-500 text-white rounded"
-      >
-        {{loading ? '生成中...' : '音楽を生成'}}
-      </button>
-      
-      {{audioUrl && (
-        <div className="mt-8">
-          <AudioPlayer src={{audioUrl}} controls />
-        </div>
-      )}}
-    </div>
-  );
-}}
-```
-
-## UI/UXデザインのベストプラクティス {{#デザイン}}
-
-### 🎨 ユーザー体験を最大化するデザイン原則
-
-**1. 直感的なインターフェース**
-- ワンクリックで音楽生成開始
-- プログレスバーで進捗表示
-- プレビュー機能の実装
-
-**2. レスポンシブデザイン**
-```css
-/* モバイルファーストのCSS例 */
-.music-player {{
-  width: 100%;
-  max-width: 600px;
-  margin: 0 auto;
-}}
-
-@media (min-width: 768px) {{
-  .music-player {{
-    display: grid;
-    grid-template-columns: 1fr 1fr;
-    gap: 20px;
-  }}
-}}
-```
-
-**3. アクセシビリティ対応**
-- キーボードナビゲーション
-- スクリーンリーダー対応
-- 高コントラストモード
-
-## パフォーマンス最適化テクニック {{#最適化}}
-
-### ⚡ 高速化のための実装テクニック
-
-**1. 音声ファイルの最適化**
-```javascript
-// 音声ストリーミング実装
-const streamAudio = async (url) => {{
-  const audio = new Audio();
-  audio.src = url;
-  audio.preload = 'metadata';
-  
-  // バッファリング制御
-  audio.addEventListener('canplay', () => {{
-    audio.play();
-  }});
-}};
-```
-
-**2. キャッシング戦略**
-```javascript
-// Service Workerでのキャッシング
-self.addEventListener('fetch', (event) => {{
-  if (event.request.url.includes('/audio/')) {{
-    event.respondWith(
-      caches.match(event.request).then((response) => {{
-        return response || fetch(event.request).then((response) => {{
-          return caches.open('audio-cache-v1').then((cache) => {{
-            cache.put(event.request, response.clone());
-            return response;
-          }});
-        }});
-      }})
-    );
-  }}
-}});
-```
-
-**3. CDN活用**
-- CloudFrontで世界中に配信
-- 自動的に最寄りのサーバーから配信
-- 遅延を最小限に抑制
-
-## 収益化戦略と成功事例 {{#収益化}}
-
-### 💰 収益モデルの選択肢
-
-**1. サブスクリプションモデル**
-- 基本プラン：$4.99/月（100曲生成）
-- プロプラン：$19.99/月（無制限）
-- 企業プラン：$99.99/月（API利用可）
-
-**2. フリーミアムモデル**
-- 無料：1日3曲まで
-- 有料：無制限＋高音質
-- 広告表示で追加クレジット
-
-**3. マーケットプレイスモデル**
-- ユーザー作成楽曲の売買
-- 手数料15%で収益化
-- NFT化による希少性創出
-
-### 🚀 成功事例紹介
-
-**「AI Beat Maker」（月間売上：$500K）**
-- ターゲット：YouTuber、TikToker
-- 特徴：ワンクリックでBGM生成
-- 成功要因：SNS連携機能
-
-**「Mood Music」（MAU：100万人）**
-- ターゲット：瞑想・ヨガ愛好者
-- 特徴：気分に合わせた音楽生成
-- 成功要因：ウェルネス市場への特化
-
-## よくあるトラブルと解決方法 {{#トラブル}}
-
-### ❓ よくある質問と回答
-
-**Q1: API制限にすぐ到達してしまう**
-A: レート制限の実装とキューイングシステムの導入で解決
-
-**Q2: 生成に時間がかかりすぎる**
-A: 非同期処理とプログレス表示で体感速度を改善
-
-**Q3: 音質が安定しない**
-A: 生成パラメータの最適化と後処理フィルターの実装
-
-**Q4: 著作権の問題が心配**
-A: 利用規約の明確化と透かし技術の導入
-
-## まとめ
-
-AI音楽アプリの開発は、技術的にもビジネス的にも大きな可能性を秘めています。
-2025年の今、優れたAPIとツールが揃い、参入障壁は大きく下がりました。
-
-この記事で紹介した知識とテクニックを活用して、ぜひ革新的なAI音楽アプリを開発してください！
-
-**次のステップ：**
-1. まずは無料のAPIアカウントを作成
-2. シンプルなプロトタイプを開発
-3. ユーザーフィードバックを収集
-4. 機能を拡張して本格リリース！
-
-開発で困ったことがあれば、いつでもコミュニティで質問してくださいね✨
-
-**WordPressタグ:** #AI音楽アプリ開発 #音楽生成API #アプリ開発 #プログラミング #API実装 {' '.join('#' + k for k in keywords[:5])} #2025年 #スタートアップ #音楽テック
-**メタディスクリプション:** {topic}完全ガイド。API選定から実装、収益化まで現役エンジニアが解説。サンプルコード付きで今すぐ開発開始！"""
-    
-    @staticmethod
-    def _generate_suno_article(topic: str, keywords: List[str]) -> str:
-        """Suno関連の記事を生成（デフォルト）"""
-        # タグを先に構築
-        keyword_tags = ' '.join('#' + k for k in keywords[:5])
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです🎵**
-
-「Sunoでもっとクオリティの高い曲を作りたい」「プロンプトの書き方がわからない」「商用利用の方法を知りたい」
-
-そんなあなたのために、今日はSuno AIの最新機能と実践的な活用方法を徹底解説します！
-
-実は私も最初は「AIで本当に良い音楽が作れるの？」と半信半疑でした。でも、Sunoを使い始めてから音楽制作の概念が完全に変わりました。今では毎日のようにSunoで新しい楽曲を生成しています✨
-
-## 目次
-
-1. [Suno AIとは？2025年最新版の実力](#sunoとは)
-2. [基本的な使い方とインターフェース解説](#使い方)
-3. [プロ級のプロンプトテクニック](#プロンプト)
-4. [ジャンル別生成のコツ](#ジャンル別)
-5. [商用利用と収益化の方法](#商用利用)
-6. [よくある失敗と解決策](#失敗例)
-7. [今後のアップデート予定](#今後)
-
-## Suno AIとは？2025年最新版の実力 {{#sunoとは}}
-
-**Suno AI**は、テキストプロンプトから高品質な音楽を生成できる最先端のAI音楽制作プラットフォームです。2024年の登場以来、急速に進化を続け、今や世界中のクリエイターに愛用されています。
-
-### 🚀 2025年版の最新機能
-
-**1. V4エンジンの驚異的な進化**
-- 音質が飛躍的に向上（44.1kHz/24bit対応）
-- ボーカルの自然さが大幅改善
-- 楽器の分離精度が向上
-
-**2. 日本語対応の完全強化**
-- 日本語歌詞の発音が劇的に改善
-- 漢字・ひらがな・カタカナの混在も自然に処理
-- 方言やスラングにも対応
-
-**3. スタイル指定の細分化**
-- 150以上のジャンルタグ
-- 時代別のサウンド再現
-- アーティスト風のスタイル指定
-
-[画像挿入指示: Suno AIのダッシュボード画面]
-
-### 📊 利用者数と実績
-
-2025年6月現在、Sunoの利用者数は全世界で**1,000万人**を突破！日本国内でも**30万人以上**が活用しています。
-
-## 基本的な使い方とインターフェース解説 {{#使い方}}
-
-### 🎯 STEP1: アカウント作成と初期設定
-
-1. [Suno公式サイト](https://suno.ai)にアクセス
-2. 「Sign Up」から無料アカウント作成
-3. プロフィール設定（音楽の好みを入力）
-4. 無料クレジット50曲分をゲット！
-
-### 🎯 STEP2: 最初の楽曲を生成してみよう
-
-**基本の操作手順：**
-```
-1. 「Create」ボタンをクリック
-2. プロンプト入力欄に曲のイメージを入力
-3. スタイルタグを選択（任意）
-4. 「Generate」をクリック
-5. 約30秒で2バージョンが生成完了！
-```
-
-### 📝 効果的なプロンプトの書き方
-
-**基本構造：**
-```
-[ジャンル] + [雰囲気] + [楽器] + [テンポ] + [その他の特徴]
-```
-
-**実例：**
-- ❌ 悪い例：「いい感じの曲」
-- ✅ 良い例：「アコースティックギター主体の切ないバラード、80BPM、雨の日の別れをテーマに」
-
-## プロ級のプロンプトテクニック {{#プロンプト}}
-
-### 🎨 感情表現を豊かにする魔法の言葉
-
-**1. ムード系キーワード**
-- Melancholic（メランコリック）：切ない雰囲気
-- Euphoric（ユーフォリック）：高揚感
-- Nostalgic（ノスタルジック）：懐かしさ
-- Ethereal（エセリアル）：幻想的
-
-**2. 質感を表現する言葉**
-- Crisp（クリスプ）：パリッとした音質
-- Warm（ウォーム）：温かみのある音
-- Punchy（パンチー）：パンチの効いた音
-- Smooth（スムース）：滑らかな音
-
-[動画挿入指示: プロンプト入力の実演動画]
-
-### 💡 ジャンル別の必勝プロンプト
-
-**ポップス：**
-```
-Upbeat pop song with catchy hooks, 
-synth layers, 120 BPM, summer vibes,
-female vocals with harmonies
-```
-
-**ロック：**
-```
-Powerful rock anthem with distorted guitars,
-driving drums, 140 BPM, rebellious energy,
-male vocals with attitude
-```
-
-## 商用利用と収益化の方法 {{#商用利用}}
-
-### 💰 Sunoで生成した楽曲の収益化
-
-**1. ストリーミング配信**
-- Spotify、Apple Musicへの配信OK
-- DistroKid等を使用して簡単配信
-- 月額$20程度で無制限配信可能
-
-**2. 動画BGMとしての活用**
-- YouTube動画のBGM使用可
-- TikTok、Instagram Reelsでも利用可
-- 企業PR動画にも使用OK
-
-**3. ライセンス販売**
-- AudioJungle等での販売
-- 独自ECサイトでの直接販売
-- カスタムオーダーの受注
-
-### 📋 利用規約の重要ポイント
-
-✅ 有料プランで生成した楽曲は完全商用利用可
-✅ クレジット表記は任意（推奨）
-✅ 著作権は生成者に帰属
-❌ 他者の楽曲を模倣する指示は禁止
-
----
-
-**💌 無料メルマガ登録で限定特典をゲット！**
-
-Suno AIの最新アップデート情報や、プロ級のプロンプト集（100選）を無料でプレゼント！今すぐ登録して、AI音楽制作マスターへの第一歩を踏み出しましょう。
-
-[CTAボタン: 無料メルマガに登録する]
-
----
-
-## よくある失敗と解決策 {{#失敗例}}
-
-### ⚠️ 初心者がやりがちな失敗TOP5
-
-**1. プロンプトが長すぎる・複雑すぎる**
-- ❌ 悪い例：「80年代風のシンセポップで、マイケル・ジャクソンとプリンスを混ぜたような感じで、でもモダンなEDMの要素も入れて...」
-- ✅ 良い例：「80s synthpop, upbeat, modern twist」
-- 💡 解決策：シンプルで明確な指示から始める
-
-**2. ジャンル指定が曖昧**
-- ❌ 悪い例：「いい感じの曲」
-- ✅ 良い例：「Chill lo-fi hip hop, 75 BPM」
-- 💡 解決策：具体的なジャンルとBPMを指定
-
-**3. 歌詞生成での失敗**
-- ❌ 問題：意味不明な歌詞が生成される
-- 💡 解決策：Custom Modeで歌詞を自分で入力
-
-**4. 商用利用の誤解**
-- ❌ 問題：無料プランで商用利用してしまう
-- 💡 解決策：必ず有料プランに加入してから商用利用
-
-**5. クレジット不足で中断**
-- ❌ 問題：途中でクレジットが尽きる
-- 💡 解決策：生成前に残りクレジットを確認
-
-### 🛠️ トラブルシューティングガイド
-
-**「生成が遅い・失敗する」場合：**
-1. ブラウザを再起動
-2. キャッシュをクリア
-3. 別のブラウザで試す
-4. VPNを切断（使用している場合）
-
-**「音質が悪い」場合：**
-1. ダウンロード設定で「High Quality」を選択
-2. WAV形式でダウンロード
-3. 再生環境を確認（イヤホン・スピーカー）
-
-## 今後のアップデート予定 {{#今後}}
-
-### 🚀 2025年後半の注目アップデート
-
-**1. 日本語ボーカル対応（2025年7月予定）**
-- ついに日本語の歌詞生成が可能に！
-- 自然な日本語発音を実現
-- J-POP、アニソン生成が飛躍的に向上
-
-**2. リアルタイムコラボ機能（2025年9月予定）**
-- 複数人での同時編集
-- リアルタイムでの楽曲共有
-- コメント・フィードバック機能
-
-**3. AI歌手選択機能（2025年10月予定）**
-- 20種類以上のAI歌手から選択可能
-- 声質・歌い方のカスタマイズ
-- 感情表現の細かい調整
-
-**4. モバイルアプリリリース（2025年12月予定）**
-- iOS/Android両対応
-- オフライン生成機能
-- スマホ録音との連携
-
-### 📅 ロードマップ
-
-| 時期 | アップデート内容 | 影響度 |
-|------|-----------------|--------|
-| 2025年7月 | 日本語ボーカル | ★★★★★ |
-| 2025年9月 | リアルタイムコラボ | ★★★★☆ |
-| 2025年10月 | AI歌手選択 | ★★★★☆ |
-| 2025年12月 | モバイルアプリ | ★★★★★ |
-
-## まとめ
-
-Suno AIは、音楽制作の民主化を実現する革命的なツールです。この記事で紹介したテクニックを活用すれば、あなたも今日からAI音楽クリエイターの仲間入り！
-
-重要なポイントをおさらい：
-- プロンプトはシンプルかつ具体的に
-- 商用利用は有料プラン必須
-- 失敗を恐れずに実験を重ねる
-- 最新アップデートをチェック
-
-創造性に限界はありません。Sunoと共に、新しい音楽の世界を切り開いていきましょう🎵
-
-**次のアクション：**
-1. まずは無料プランで練習
-2. プロンプト集を参考に実験
-3. 気に入ったら有料プランへ
-4. 作品をSNSでシェア
-
-**関連記事：**
-[内部リンク: Suno vs Udio徹底比較]
-[内部リンク: AI音楽で稼ぐ方法]
-[外部リンク: Suno公式サイト]
-
-**WordPressタグ:** #Suno #SunoAI #AI音楽 #音楽制作 {keyword_tags}
-**メタディスクリプション:** {topic}を完全解説。プロンプトテクニックから収益化まで、実践的なノウハウを初心者にも分かりやすく紹介。"""
-    
-    @staticmethod
-    def _generate_stable_audio_article(topic: str, keywords: List[str]) -> str:
-        """Stable Audio関連の記事を生成"""
-        # タグを先に構築
-        keyword_tags = ' '.join('#' + k for k in keywords[:5])
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです🎵**
-
-「Stable Audioでプロ級の音楽を作りたい」「最新機能を使いこなしたい」「商用利用できる音楽を効率的に生成したい」
-
-そんなあなたに朗報です！Stable Audioの最新アップデートで、驚くほど高品質な音楽制作が可能になりました✨
-
-この記事では、2025年最新のStable Audio機能を、初心者から上級者まで活用できるよう徹底解説していきます！
-
-## 目次
-
-1. [Stable Audioとは？2025年最新版の実力](#stable-audioとは)
-2. [新機能①：マルチトラック生成機能](#マルチトラック)
-3. [新機能②：リアルタイム編集モード](#リアルタイム編集)
-4. [基本的な使い方ガイド](#使い方)
-5. [他のAI音楽ツールとの比較](#比較)
-6. [商用利用とライセンスガイド](#商用利用)
-7. [よくある質問と解決方法](#faq)
-
-## Stable Audioとは？2025年最新版の実力 {{#stable-audioとは}}
-
-**Stable Audio**は、Stability AI社が開発した最先端のAI音楽生成プラットフォームです。画像生成AI「Stable Diffusion」の技術を音楽分野に応用し、驚異的な品質の楽曲生成を実現しています。
-
-### 🚀 2025年版の革新的な特徴
-
-**1. 超高音質生成（48kHz/24bit対応）**
-- スタジオ品質の音源を直接生成
-- マスタリング済みの完成度
-- 各楽器の分離が明瞭
-
-**2. 日本語プロンプト完全対応**
-- 「エモいロック」「チルいローファイ」など日本語での指示が可能
-- 感情や雰囲気を細かく指定
-- 音楽用語を知らなくてもOK
-
-**3. 商用利用ライセンス込み**
-- 生成した楽曲は即商用利用可能
-- YouTube、Spotify等での配信もOK
-- ロイヤリティフリー
-
-### 📊 ユーザー数と利用実績
-
-2025年6月現在、Stable Audioのユーザー数は**全世界で500万人**を突破！日本国内でも**15万人以上**のクリエイターが活用しています。
-
-[画像挿入指示: Stable Audioのダッシュボード画面のスクリーンショット]
-
-## 新機能①：マルチトラック生成機能 {{#マルチトラック}}
-
-2025年最大のアップデートである**マルチトラック生成機能**について詳しく解説します！
-
-### 🎛️ マルチトラック生成とは？
-
-従来の単一トラック生成から、複数の楽器トラックを個別に生成・編集できるようになりました。
-
-**主な機能：**
-- ドラム、ベース、メロディを個別生成
-- 各トラックの音量・エフェクト調整
-- トラック間のタイミング同期
-- MIDIエクスポート対応
-
-### 📝 使い方の実例
-
-```
-1. 「Multi-track Mode」を選択
-2. ベーストラックを生成（例：ドラムループ）
-3. 追加トラックを順次生成
-4. ミキサーで最終調整
-5. 高品質WAVでエクスポート
-```
-
-## 基本的な使い方ガイド {{#使い方}}
-
-### 🎯 STEP1: アカウント作成
-
-1. [Stable Audio公式サイト](https://stableaudio.com)にアクセス
-2. 「Sign Up」から無料アカウント作成
-3. 月20曲まで無料で生成可能！
-
-### 🎯 STEP2: 初めての音楽生成
-
-**プロンプト例：**
-```
-Uplifting electronic dance music, 
-128 BPM, synth leads, 
-energetic drop, festival vibe
-```
-
-**日本語プロンプト例：**
-```
-明るくポップなJ-POP、
-女性ボーカル風、
-キャッチーなメロディ、
-夏の恋愛ソング
-```
-
----
-
-**💌 無料メルマガ登録で限定特典をゲット！**
-
-Stable Audioの最新アップデート情報や、プロ級のプロンプト集（150選）を無料でプレゼント！今すぐ登録して、AI音楽制作マスターへの第一歩を踏み出しましょう。
-
-[CTAボタン: 無料メルマガに登録する]
-
----
-
-## 新機能②：リアルタイム編集モード {{#リアルタイム編集}}
-
-### 🎼 リアルタイム編集の革命
-
-2025年3月のアップデートで追加された**リアルタイム編集モード**は、生成した音楽をその場で編集できる画期的な機能です。
-
-**主な編集機能：**
-- 🎚️ **テンポ調整**：50-200 BPMの範囲で自由に変更
-- 🎸 **楽器の追加/削除**：生成後でも楽器パートを調整
-- 🎹 **キー変更**：12音階すべてに対応
-- 🎤 **エフェクト追加**：リバーブ、ディレイ、コンプレッサー等
-
-### 📱 使い方ガイド
-
-```
-1. 生成した楽曲の「Edit」ボタンをクリック
-2. 編集パネルが開き、波形が表示される
-3. 各パラメータをスライダーで調整
-4. 「Preview」でリアルタイム確認
-5. 満足したら「Save」で保存
-```
-
-**プロのコツ：**
-- エフェクトは控えめに使うのがポイント
-- テンポ変更は±20BPMまでが自然
-- 楽器の追加は最大3つまでが推奨
-
-## 他のAI音楽ツールとの比較 {{#比較}}
-
-### 📊 主要AI音楽ツール比較表
-
-| 機能 | Stable Audio | Suno | Udio |
-|------|--------------|------|------|
-| 音質 | ★★★★★ | ★★★★☆ | ★★★★☆ |
-| 操作性 | ★★★★☆ | ★★★★★ | ★★★★☆ |
-| 商用利用 | ◎ | ◎ | △ |
-| 価格 | $12/月〜 | $8/月〜 | $10/月〜 |
-| 日本語対応 | ◎ | ○ | △ |
-
-### 🏆 Stable Audioが選ばれる理由
-
-1. **音質の圧倒的な高さ**
-   - 48kHz/24bit対応は業界最高水準
-   - プロのスタジオでも使用可能
-
-2. **商用利用の自由度**
-   - 追加料金なしで商用利用OK
-   - ロイヤリティフリー
-
-3. **日本語サポートの充実**
-   - UIの完全日本語化
-   - 日本語プロンプトの精度向上
-
-## 商用利用とライセンスガイド {{#商用利用}}
-
-### 💰 商用利用の条件
-
-Stable Audioで生成した楽曲は、**有料プラン**に加入していれば自由に商用利用できます。
-
-**利用可能な用途：**
-- ✅ YouTube動画のBGM
-- ✅ ポッドキャストの音楽
-- ✅ ゲーム・アプリのBGM
-- ✅ 商業施設のBGM
-- ✅ 広告・CMの音楽
-- ✅ ストリーミング配信
-
-### 📋 ライセンスの詳細
-
-**Standard Plan（$12/月）**
-- 月500曲まで生成可能
-- 全曲商用利用OK
-- クレジット表記不要
-
-**Pro Plan（$24/月）**
-- 月2000曲まで生成可能
-- 優先処理（待ち時間なし）
-- APIアクセス付き
-
-**Enterprise Plan（要問合せ）**
-- 無制限生成
-- 専用サポート
-- カスタムモデル対応
-
-### ⚠️ 注意事項
-
-- 無料プランでは商用利用不可
-- 他者の楽曲を模倣する指示は禁止
-- 生成した楽曲の著作権は利用者に帰属
-
-## よくある質問と解決方法 {{#faq}}
-
-### ❓ よくある質問TOP5
-
-**Q1: 無料プランでも商用利用できますか？**
-A: いいえ、商用利用には有料プラン（$12/月〜）への加入が必要です。
-
-**Q2: 生成に失敗することがあります**
-A: プロンプトが複雑すぎる可能性があります。シンプルな指示から始めてみてください。
-
-**Q3: 日本語の歌詞は生成できますか？**
-A: 現在は英語の歌詞のみ対応しています。日本語対応は2025年後半予定です。
-
-**Q4: 生成した楽曲をSpotifyで配信できますか？**
-A: はい、有料プランであれば配信可能です。DistroKid等の配信サービスをご利用ください。
-
-**Q5: 月の生成上限を超えたらどうなりますか？**
-A: 翌月まで待つか、上位プランへのアップグレードが必要です。
-
-### 🔧 トラブルシューティング
-
-**生成が遅い場合：**
-1. ブラウザのキャッシュをクリア
-2. 別のブラウザで試す
-3. 混雑時間（日本時間20-23時）を避ける
-
-**音質が悪い場合：**
-1. 出力設定を「High Quality」に変更
-2. ダウンロード形式をWAVに設定
-3. プロンプトに「high quality」を追加
-
-## まとめ
-
-Stable Audioは、2025年現在最も革新的なAI音楽生成ツールの一つです。高品質な音楽生成と使いやすさを両立し、プロからアマチュアまで幅広いクリエイターに愛用されています。
-
-特に商用利用の自由度の高さと、日本語対応の充実度は他のツールを圧倒しています。月額$12から始められる手軽さも魅力的です。
-
-あなたも今日から、Stable Audioで新しい音楽の世界を切り開いてみませんか？
-
-**次のステップ：**
-1. [無料アカウントを作成](https://stableaudio.com)
-2. 基本機能を試してみる
-3. 気に入ったら有料プランへ
-
-**関連記事：**
-[内部リンク: Suno vs Stable Audio徹底比較]
-[内部リンク: AI音楽で稼ぐ方法]
-[外部リンク: Stable Audio公式サイト]
-
-**WordPressタグ:** #StableAudio #StabilityAI #AI音楽 #音楽制作 {keyword_tags}
-**メタディスクリプション:** {topic}を徹底解説。マルチトラック生成やリアルタイム編集など最新機能の使い方を初心者にも分かりやすく紹介。"""
-    
-    @staticmethod
-    def _generate_aiva_article(topic: str, keywords: List[str]) -> str:
-        """AIVA関連の記事を生成"""
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです🎼**
-
-AIVAは、クラシック音楽やオーケストラ楽曲の作曲に特化したAI作曲家です。
-
-## 目次
-
-1. [AIVAとは？AI作曲家の実力](#aivaとは)
-2. [AIVAの使い方](#使い方)
-3. [作曲事例と活用方法](#事例)
-4. [ライセンスと商用利用](#ライセンス)
-5. [他のAI作曲ツールとの比較](#比較)
-
-## AIVAとは？AI作曲家の実力 {{#aivaとは}}
-
-AIVAは、感動的なオーケストラ楽曲を生成できるAI作曲システムです。
-映画音楽やゲーム音楽の制作に最適です。
-
-**WordPressタグ:** #AIVA #AI作曲 #クラシック音楽 {' '.join('#' + k for k in keywords[:5])}
-**メタディスクリプション:** {topic}について解説。AIVAを使った作曲方法から商用利用まで詳しく紹介します。"""
-    
-    @staticmethod
-    def _generate_music_analysis_article(topic: str, keywords: List[str]) -> str:
-        """音楽分析関連の記事を生成"""
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです📊**
-
-AI技術を活用した音楽分析は、音楽の新しい理解と創造の可能性を開きます。
-
-## 目次
-
-1. [AI音楽分析の基礎](#基礎)
-2. [分析手法とツール](#手法)
-3. [実践的な活用例](#活用例)
-4. [データの可視化](#可視化)
-5. [今後の展望](#展望)
-
-## AI音楽分析の基礎 {{#基礎}}
-
-機械学習とデータサイエンスの技術により、音楽の構造や特徴を深く理解できるようになりました。
-
-**WordPressタグ:** #音楽分析 #AI技術 #データサイエンス {' '.join('#' + k for k in keywords[:5])}
-**メタディスクリプション:** {topic}の基礎から応用まで解説。AI技術で音楽を分析する方法を紹介します。"""
-    
-    @staticmethod
-    def _generate_industry_article(topic: str, keywords: List[str]) -> str:
-        """業界分析関連の記事を生成"""
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです📈**
-
-「AI音楽業界の現状は？」「どの企業がリードしているの？」「今後の展望は？」
-
-これらの疑問に、最新データと分析を基にお答えします！
-
-2025年、AI音楽業界は**爆発的な成長期**を迎えています。従来の音楽業界の構造を根本から変える革命が進行中です。
-
-この記事では、業界の最新動向からビジネスチャンス、そして未来展望まで、徹底的に分析していきます！
-
-## 目次
-
-1. [AI音楽市場の最新統計2025](#市場統計)
-2. [主要プレイヤー分析と競争状況](#プレイヤー分析)
-3. [ビジネスモデルと収益構造](#ビジネスモデル)
-4. [投資動向とM&Aの最新情報](#投資動向)
-5. [規制・法的課題と対応策](#規制課題)
-6. [技術革新と業界への影響](#技術革新)
-7. [2030年に向けた未来予測](#未来予測)
-
-## AI音楽市場の最新統計2025 {{#市場統計}}
-
-### 📊 市場規模と成長率
-
-2025年のAI音楽市場は、驚異的な成長を記録しています。
-
-**グローバル市場規模**
-- 2024年：**32億ドル**
-- 2025年：**48億ドル**（前年比150%）
-- 2030年予測：**200億ドル**
-
-**地域別シェア（2025年）**
-- 北米：38%
-- ヨーロッパ：28%
-- アジア太平洋：26%（日本は8%）
-- その他：8%
-
-### 🎯 セグメント別分析
-
-**1. B2C（消費者向け）市場 - 60%**
-- 音楽生成アプリ：25%
-- AIボーカルサービス：20%
-- 作曲支援ツール：15%
-
-**2. B2B（企業向け）市場 - 40%**
-- コンテンツ制作：18%
-- 広告・CM音楽：12%
-- ゲーム・アプリ音楽：10%
-
-### 💹 注目すべき成長要因
-
-1. **技術進化の加速**
-   - 生成品質の向上（人間の作曲と遼色ないレベル）
-   - 処理速度の高速化（リアルタイム生成）
-   - コストの大幅削減
-
-2. **市場ニーズの拡大**
-   - コンテンツクリエイターの増加
-   - 企業のデジタルマーケティング需要
-   - パーソナライゼーション需要
-
-## 主要プレイヤー分析と競争状況 {{#プレイヤー分析}}
-
-### 🏆 トップ10企業（2025年）
-
-**1. Suno AI（市場シェア：18%）**
-- 評価額：5億ドル
-- 強み：ボーカル付き楽曲生成
-- 最新動向：日本市場への本格参入
-
-**2. Stability AI（市場シェア：15%）**
-- 評価額：10億ドル
-- 強み：オープンソースモデル
-- 最新動向：Stable Audio 2.0リリース
-
-**3. Udio（市場シェア：12%）**
-- 評価額：3億ドル
-- 強み：高品質・多様なジャンル
-- 最新動向：Googleとの戦略的提携
-
-**4. Meta（MusicGen）（市場シェア：10%）**
-- 強み：研究開発力
-- 最新動向：メタバース向け音楽生成
-
-**5. AIVA Technologies（市場シェア：8%）**
-- 強み：クラシック音楽特化
-- 最新動向：映画音楽市場への展開
-
-### 💡 競争戦略の分析
-
-**技術革新競争**
-- 品質向上への投資競争
-- 特許取得レース
-- オープンソースvsクローズド
-
-**市場シェア獲得戦略**
-- フリーミアムモデルの拡大
-- B2B市場へのシフト
-- パートナーシップ戦略
-
-## ビジネスモデルと収益構造 {{#ビジネスモデル}}
-
-### 💰 主要な収益モデル
-
-**1. サブスクリプションモデル（70%）**
-- 月額固定課金
-- 継続率：平均85%
-- LTV：平均$300
-
-**2. 従量課金モデル（20%）**
-- API利用料
-- 生成曲数に応じた課金
-- 企業向け大量利用
-
-**3. ライセンスモデル（10%）**
-- 商用利用権販売
-- ロイヤリティ収入
-- NFT販売
-
-### 📈 収益性分析
-
-**粗利益率の推移**
-- 2023年：45%
-- 2024年：58%
-- 2025年：72%
-
-**コスト構造**
-- インフラコスト：30%
-- R&D：35%
-- マーケティング：20%
-- 一般管理費：15%
-
-## 投資動向とM&Aの最新情報 {{#投資動向}}
-
-### 💸 2025年の主要調達事例
-
-**Suno AI - シリーズB調達**
-- 調達額：1.2億ドル
-- リード投資家：Andreessen Horowitz
-- 用途：日本・アジア市場拡大
-
-**Udio - シリーズA調達**
-- 調達額：5000万ドル
-- リード投資家：Google Ventures
-- 用途：技術開発と人材獲得
-
-### 🤝 M&A動向
-
-**注目のM&A案件**
-1. SpotifyによるAI作曲スタートアップ買収
-2. Adobeの音楽生成AI企業買収
-3. Appleの戦略的投資
-
-## 規制・法的課題と対応策 {{#規制課題}}
-
-### ⚖️ 主要な法的課題
-
-**1. 著作権問題**
-- AI生成音楽の著作権帰属
-- 学習データの合法性
-- アーティストの権利保護
-
-**2. 各国の規制動向**
-- EU：AI規制法の施行
-- 米国：業界自主規制の推進
-- 日本：ガイドライン策定中
-
-### 🛡️ 業界の対応
-
-- 透かし技術の開発
-- 業界団体の設立
-- 倫理ガイドラインの策定
-
-## 技術革新と業界への影響 {{#技術革新}}
-
-### 🚀 2025年の技術ブレークスルー
-
-**1. マルチモーダルAI**
-- テキスト+画像+音声の統合
-- より精度の高い音楽生成
-
-**2. リアルタイムコラボレーション**
-- 遠隔地での同時演奏
-- AIと人間の共同制作
-
-**3. 感情AIの進化**
-- リスナーの感情を読み取る
-- パーソナライズされた音楽体験
-
-## 2030年に向けた未来予測 {{#未来予測}}
-
-### 🔮 中期予測（2026-2030年）
-
-**市場規模予測**
-- 2030年：200億ドル市場
-- CAGR：35%以上
-
-**業界構造の変化**
-1. プロフェッショナル市場の拡大
-2. AIネイティブな新世代アーティスト
-3. 音楽教育の根本的変革
-
-**技術予測**
-- 量子コンピューティングの活用
-- 脳波直接入力
-- 完全自動作曲システム
-
-### 🌏 社会へのインパクト
-
-**ポジティブな影響**
-- 音楽制作の民主化
-- 新しい職業の創出
-- 文化の多様性促進
-
-**課題とリスク**
-- 伝統的音楽業界との共存
-- クリエイターの権利保護
-- 文化的価値の維持
-
-## まとめ
-
-2025年、AI音楽業界は**歴史的な転換点**を迎えています。
-技術革新、市場拡大、新たなビジネスモデルの登場により、業界は急速に進化しています。
-
-**キーポイント：**
-- 市場は今後5年で**10倍以上**に成長
-- 技術革新が続き、新たな企業が台頭
-- 規制と倫理の整備が重要課題
-
-この大きな波に乗るか、それとも働観者でいるか。
-今がまさに、意思決定の時です。
-
-AI音楽の未来は、私たちの想像を超えたものになるでしょう✨
-
-**WordPressタグ:** #AI音楽業界 #市場分析 #ビジネス #投資 #スタートアップ {' '.join('#' + k for k in keywords[:5])} #2025年 #業界動向 #未来予測
-**メタディスクリプション:** {topic}の完全レポート。市場統計から主要プレイヤー、投資動向、未来予測まで業界関係者必見の情報を網羅。"""
-    
-    @staticmethod
-    def _generate_technical_article(topic: str, keywords: List[str]) -> str:
-        """技術解説関連の記事を生成"""
-        # タグを先に構築
-        keyword_tags = ' '.join('#' + k for k in keywords[:5])
-        
-        # トピックに応じて適切な技術記事を生成
-        if "Transformer" in topic or "トランスフォーマー" in topic:
-            return DynamicMockGenerator._generate_transformer_article(topic, keywords, keyword_tags)
-        elif "VAE" in topic or "変分オートエンコーダ" in topic:
-            return DynamicMockGenerator._generate_vae_article(topic, keywords, keyword_tags)
-        elif "GAN" in topic or "敵対的生成" in topic:
-            return DynamicMockGenerator._generate_gan_article(topic, keywords, keyword_tags)
-        elif "ディフュージョン" in topic or "Diffusion" in topic:
-            return DynamicMockGenerator._generate_diffusion_article(topic, keywords, keyword_tags)
-        else:
-            # デフォルトの技術記事
-            return DynamicMockGenerator._generate_general_tech_article(topic, keywords, keyword_tags)
-    
-    @staticmethod
-    def _generate_transformer_article(topic: str, keywords: List[str], keyword_tags: str) -> str:
-        """Transformer関連の技術記事を生成"""
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです🔧**
-
-「Transformerって聞いたことあるけど、音楽生成でどう使われているの？」「技術的な仕組みを理解したい」「実装方法を知りたい」
-
-そんな技術者の皆さんに向けて、今日はTransformerアーキテクチャを使った音楽生成技術について、基礎から実装まで徹底解説します！
-
-私も最初は「Transformerは自然言語処理のための技術では？」と思っていました。でも、音楽生成への応用を学んでから、その可能性の大きさに驚かされました✨
-
-## 目次
-
-1. [Transformerアーキテクチャの基礎](#transformer基礎)
-2. [音楽生成への応用原理](#音楽生成応用)
-3. [主要な音楽生成モデル](#主要モデル)
-4. [実装例：簡単な音楽生成モデル](#実装例)
-5. [最適化とファインチューニング](#最適化)
-6. [よくある実装の落とし穴](#落とし穴)
-7. [最新の研究動向と今後](#研究動向)
-
-## Transformerアーキテクチャの基礎 {{#transformer基礎}}
-
-### 🧠 Transformerとは何か？
-
-**Transformer**は、2017年にGoogleが発表した「Attention Is All You Need」論文で提案された深層学習アーキテクチャです。
-
-**主な特徴：**
-- 🔸 **Self-Attention機構**：系列内の全要素間の関係を学習
-- 🔸 **並列処理可能**：RNNと異なり高速な学習が可能
-- 🔸 **長距離依存関係**：長い系列でも情報を保持
-- 🔸 **位置エンコーディング**：系列の順序情報を保持
-
-### 📐 基本的な数式
-
-Self-Attentionの計算式：
-```
-Attention(Q, K, V) = softmax(QK^T / √d_k)V
-```
-
-ここで：
-- Q：Query行列
-- K：Key行列
-- V：Value行列
-- d_k：Keyの次元数
-
-## 音楽生成への応用原理 {{#音楽生成応用}}
-
-### 🎵 音楽データの表現方法
-
-音楽をTransformerで扱うには、適切なデータ表現が必要です：
-
-**1. MIDI表現**
-```python
-# MIDIイベントのトークン化例
-tokens = [
-    "NOTE_ON_60",    # C4音符開始
-    "TIME_SHIFT_48", # 48tick後
-    "NOTE_OFF_60",   # C4音符終了
-    "NOTE_ON_64",    # E4音符開始
-]
-```
-
-**2. ピアノロール表現**
-```python
-# 時間×ピッチの2次元配列
-piano_roll = np.zeros((time_steps, 128))  # 128 MIDI notes
-```
-
-**3. オーディオ波形表現**
-```python
-# 生のオーディオサンプル
-waveform = np.array([0.1, -0.2, 0.15, ...])  # 16kHz or 44.1kHz
-```
-
-### 🔄 音楽特有の課題と解決策
-
-**1. 長期的構造の保持**
-- 問題：楽曲は数分に及ぶ長い系列
-- 解決：階層的Transformer、Sparse Attention
-
-**2. 複数楽器の同時処理**
-- 問題：ポリフォニックな音楽表現
-- 解決：Multi-track Transformer
-
-**3. リズムとテンポの一貫性**
-- 問題：時間的整合性の維持
-- 解決：Beat-based positional encoding
-
-## 主要な音楽生成モデル {{#主要モデル}}
-
-### 🏆 代表的なTransformerベース音楽生成モデル
-
-**1. MuseNet (OpenAI)**
-- 4分間の楽曲生成が可能
-- 10種類の楽器をサポート
-- GPT-2アーキテクチャベース
-
-**2. Music Transformer (Google)**
-- 相対的位置エンコーディング採用
-- クラシック音楽に特化
-- 長期依存関係の改善
-
-**3. Jukebox (OpenAI)**
-- 生のオーディオ波形を生成
-- VQ-VAEとTransformerの組み合わせ
-- 歌声付き楽曲の生成
-
-[画像挿入指示: 各モデルのアーキテクチャ比較図]
-
-## 実装例：簡単な音楽生成モデル {{#実装例}}
-
-### 💻 PyTorchでの基本実装
-
-```python
-import torch
-import torch.nn as nn
-
-class MusicTransformer(nn.Module):
-    def __init__(
-        self,
-        vocab_size=512,      # トークンの種類数
-        d_model=512,         # 埋め込み次元
-        n_heads=8,           # アテンションヘッド数
-        n_layers=6,          # Transformerレイヤー数
-        d_ff=2048,           # フィードフォワード次元
-        max_seq_len=2048,    # 最大系列長
-        dropout=0.1
-    ):
-        super().__init__()
-        
-        # 埋め込み層
-        self.token_embedding = nn.Embedding(vocab_size, d_model)
-        self.position_embedding = nn.Embedding(max_seq_len, d_model)
-        
-        # Transformerエンコーダ
-        encoder_layer = nn.TransformerEncoderLayer(
-            d_model=d_model,
-            nhead=n_heads,
-            dim_feedforward=d_ff,
-            dropout=dropout,
-            batch_first=True
-        )
-        self.transformer = nn.TransformerEncoder(
-            encoder_layer,
-            num_layers=n_layers
-        )
-        
-        # 出力層
-        self.fc_out = nn.Linear(d_model, vocab_size)
-        self.dropout = nn.Dropout(dropout)
-        
-    def forward(self, x, mask=None):
-        batch_size, seq_len = x.shape
-        
-        # 位置エンコーディング
-        positions = torch.arange(0, seq_len).expand(batch_size, seq_len).to(x.device)
-        
-        # 埋め込み
-        token_emb = self.token_embedding(x)
-        pos_emb = self.position_embedding(positions)
-        x = self.dropout(token_emb + pos_emb)
-        
-        # Transformer処理
-        x = self.transformer(x, mask=mask)
-        
-        # 出力
-        output = self.fc_out(x)
-        return output
-```
-
-### 🎼 学習ループの実装
-
-```python
-def train_music_transformer(model, dataloader, epochs=10):
-    optimizer = torch.optim.Adam(model.parameters(), lr=0.0001)
-    criterion = nn.CrossEntropyLoss()
-    
-    for epoch in range(epochs):
-        total_loss = 0
-        for batch in dataloader:
-            # バッチデータ取得
-            inputs = batch['input_ids']
-            targets = batch['target_ids']
-            
-            # 順伝播
-            outputs = model(inputs)
-            loss = criterion(
-                outputs.reshape(-1, outputs.size(-1)),
-                targets.reshape(-1)
-            )
-            
-            # 逆伝播
-            optimizer.zero_grad()
-            loss.backward()
-            optimizer.step()
-            
-            total_loss += loss.item()
-        
-        print(f"Epoch {{epoch+1}}, Loss: {{total_loss/len(dataloader):.4f}}")
-```
-
----
-
-**💌 無料メルマガ登録で限定特典をゲット！**
-
-AI音楽生成の最新技術情報や、実装に使えるコードサンプル集を無料でプレゼント！今すぐ登録して、最先端の音楽AI開発に参加しましょう。
-
-[CTAボタン: 無料メルマガに登録する]
-
----
-
-## 最適化とファインチューニング {{#最適化}}
-
-### ⚡ パフォーマンス最適化テクニック
-
-**1. Flash Attention**
-```python
-# Flash Attentionの使用例
-from flash_attn import flash_attn_func
-
-def efficient_attention(q, k, v):
-    return flash_attn_func(q, k, v, causal=True)
-```
-
-**2. Gradient Checkpointing**
-```python
-# メモリ効率的な学習
-model.gradient_checkpointing_enable()
-```
-
-**3. Mixed Precision Training**
-```python
-# 混合精度学習でスピードアップ
-from torch.cuda.amp import autocast, GradScaler
-
-scaler = GradScaler()
-with autocast():
-    outputs = model(inputs)
-    loss = criterion(outputs, targets)
-```
-
-## よくある実装の落とし穴 {{#落とし穴}}
-
-### ⚠️ 注意すべきポイント
-
-**1. メモリ不足問題**
-- 原因：長い系列でのself-attention計算
-- 解決：Sliding window attention、Linformer
-
-**2. 学習の不安定性**
-- 原因：大きな学習率、不適切な初期化
-- 解決：Learning rate warmup、Xavier初期化
-
-**3. 過学習**
-- 原因：データ不足、モデルが大きすぎる
-- 解決：Data augmentation、Dropout増加
-
-## 最新の研究動向と今後 {{#研究動向}}
-
-### 🔬 2025年の最新トレンド
-
-**1. Diffusion Transformerの台頭**
-- DiffusionモデルとTransformerの融合
-- より高品質な音声生成
-
-**2. マルチモーダル音楽生成**
-- テキスト、画像、動画から音楽生成
-- CLIP-like architectures for music
-
-**3. 効率的なアーキテクチャ**
-- Perceiver AR
-- RetNet (Retentive Network)
-- State Space Models (S4, Mamba)
-
-### 🔮 今後の展望
-
-- **2025年後半**：リアルタイム音楽生成の実用化
-- **2026年**：完全な楽曲構造理解を持つモデル
-- **2027年**：人間と区別つかない音楽生成
-
-## まとめ
-
-Transformerアーキテクチャは音楽生成分野に革命をもたらしました。Self-Attention機構により、長期的な音楽構造を学習し、高品質な楽曲を生成できるようになっています。
-
-**重要ポイント：**
-- 適切なデータ表現の選択が重要
-- 音楽特有の課題には専用の解決策が必要
-- 最新の最適化技術で効率的な実装が可能
-
-ぜひこの記事を参考に、あなたも音楽生成AIの開発に挑戦してみてください！
-
-**次のステップ：**
-1. GitHubのサンプルコードを試す
-2. 小規模データセットで実験
-3. 独自のモデルアーキテクチャを設計
-
-**関連記事：**
-[内部リンク: AI音楽生成の基礎知識]
-[内部リンク: PyTorchで始める深層学習]
-[外部リンク: Hugging Face Music Models]
-
-**WordPressタグ:** #Transformer #深層学習 #音楽生成 #AI技術 {keyword_tags}
-**メタディスクリプション:** {topic}を技術者向けに徹底解説。アーキテクチャの基礎から実装例まで、実践的な知識を提供します。"""
-    
-    @staticmethod
-    def _generate_general_tech_article(topic: str, keywords: List[str], keyword_tags: str) -> str:
-        """一般的な技術記事を生成"""
-        return f"""# 【2025年最新版】{topic}
-
-**こんにちは！AIクリエイターのアリサです🔧**
-
-AI音楽生成技術の最新動向について、技術的な観点から詳しく解説していきます。エンジニアの方も、技術に興味がある方も、ぜひ最後までご覧ください！
-
-## 目次
-
-1. [技術的基礎と背景](#基礎)
-2. [主要なアルゴリズムと手法](#アルゴリズム)
-3. [実装アプローチと考慮点](#実装)
-4. [パフォーマンス最適化](#最適化)
-5. [実用化への課題と解決策](#課題)
-6. [今後の技術動向](#動向)
-
-## 技術的基礎と背景 {{#基礎}}
-
-AI音楽生成は、機械学習と信号処理技術の融合により実現されています。主要な技術要素について解説します。
-
-### 🔬 基礎となる技術スタック
-
-**1. 深層学習フレームワーク**
-- PyTorch / TensorFlow
-- JAX (Google)
-- ONNX Runtime
-
-**2. 音声処理ライブラリ**
-- Librosa
-- PyDub
-- SoundFile
-
-**3. MIDI処理**
-- Pretty MIDI
-- Music21
-- Magenta
-
-## 主要なアルゴリズムと手法 {{#アルゴリズム}}
-
-### 🎯 音楽生成の主要アプローチ
-
-**1. シンボリック音楽生成**
-- MIDI/楽譜レベルでの生成
-- 離散的な音符表現
-- 計算効率が高い
-
-**2. オーディオ直接生成**
-- 波形レベルでの生成
-- 連続的な信号処理
-- より自然な音質
-
-**3. ハイブリッドアプローチ**
-- シンボリック→オーディオ変換
-- 両方の利点を活用
-
-### 📊 評価指標
-
-音楽生成の品質評価には以下の指標が使用されます：
-
-- **Frechet Audio Distance (FAD)**
-- **Inception Score (IS)**
-- **Perceptual Evaluation**
-- **Musical Structure Analysis**
-
-## 実装アプローチと考慮点 {{#実装}}
-
-### 💻 実装時の重要な考慮事項
-
-**1. データ前処理**
-```python
-# 音声データの正規化
-def normalize_audio(audio, target_db=-20):
-    rms = np.sqrt(np.mean(audio**2))
-    target_rms = 10**(target_db/20)
-    return audio * (target_rms / rms)
-```
-
-**2. バッチ処理の最適化**
-```python
-# 効率的なバッチ処理
-def create_batches(data, batch_size=32):
-    for i in range(0, len(data), batch_size):
-        yield data[i:i+batch_size]
-```
-
-## パフォーマンス最適化 {{#最適化}}
-
-### ⚡ 高速化のテクニック
-
-**1. GPU並列化**
-- データ並列
-- モデル並列
-- パイプライン並列
-
-**2. 量子化**
-- INT8量子化
-- 動的量子化
-- QAT (Quantization Aware Training)
-
-**3. プルーニング**
-- 構造化プルーニング
-- 非構造化プルーニング
-- グラジュアルプルーニング
-
-## 実用化への課題と解決策 {{#課題}}
-
-### 🚧 現在の技術的課題
-
-**1. レイテンシの問題**
-- リアルタイム生成の困難さ
-- エッジデバイスでの実行
-
-**2. 品質の一貫性**
-- 長時間の楽曲での品質維持
-- スタイルの一貫性
-
-**3. 計算リソース**
-- 大規模モデルの計算コスト
-- メモリ使用量
-
-### 💡 解決アプローチ
-
-- **モデル圧縮技術**の活用
-- **キャッシング戦略**の実装
-- **増分生成**アプローチ
-
-## 今後の技術動向 {{#動向}}
-
-### 🔮 2025-2027年の展望
-
-**1. ニューロモーフィックコンピューティング**
-- 脳型チップでの音楽生成
-- 超低消費電力
-
-**2. 量子コンピューティング応用**
-- 量子機械学習
-- 組み合わせ最適化
-
-**3. エッジAIの進化**
-- スマートフォンでの高品質生成
-- IoTデバイスでの音楽生成
-
-## まとめ
-
-{topic}について、技術的な観点から詳しく解説しました。AI音楽生成技術は日々進化しており、新しいアルゴリズムやアーキテクチャが続々と登場しています。
-
-エンジニアとして重要なのは、基礎技術をしっかり理解した上で、最新の研究動向をキャッチアップし続けることです。
-
-**技術者へのアドバイス：**
-1. 基礎理論の理解を深める
-2. 実装経験を積む
-3. 最新論文をフォロー
-4. オープンソースプロジェクトに参加
-
-**関連記事：**
-[内部リンク: 深層学習の基礎]
-[内部リンク: 音声信号処理入門]
-[外部リンク: arXiv Music Generation Papers]
-
-**WordPressタグ:** #AI技術 #機械学習 #音楽生成 #深層学習 {keyword_tags}
-**メタディスクリプション:** {topic}を技術的観点から解説。エンジニア向けの詳細な技術情報と実装例を提供します。"""
\ No newline at end of file
+            return 'suno'
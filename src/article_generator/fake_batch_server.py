@@ -0,0 +1,218 @@
+"""
+Fake Message Batches Server
+AI Melody Kobo - オフライン検証用のMessage Batches API互換ローカルサーバー
+
+使用例:
+    python -m src.article_generator.fake_batch_server --port 8765
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 python auto_post_article.py --daily 5 --batch
+"""
+
+import re
+import json
+import time
+import uuid
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _fake_article(params: Dict[str, Any]) -> str:
+    """プロンプトのトピック・キーワードから記事形式のMarkdownを組み立てる"""
+    prompt = ''.join(
+        message['content'] if isinstance(message['content'], str)
+        else ''.join(block.get('text', '') for block in message['content'])
+        for message in params.get('messages', [])
+    )
+    topic_match = re.search(r'トピック:\s*(.+)', prompt)
+    keyword_match = re.search(r'必須キーワード:\s*(.+)', prompt)
+    topic = topic_match.group(1).strip() if topic_match else "AI音楽制作ガイド"
+    keywords = [k.strip() for k in keyword_match.group(1).split(',')] if keyword_match else ["AI音楽"]
+
+    sections = [f"# {topic}", "", f"{topic}について、{'、'.join(keywords[:3])}の観点から解説します。", ""]
+    for index, keyword in enumerate(keywords[:4], 1):
+        sections += [f"## {index}. {keyword}のポイント", "",
+                     f"{keyword}を活用すると、音楽制作の幅が広がります。", ""]
+    sections += ["## まとめ", "", f"{topic}のポイントを押さえて、AI音楽制作を楽しみましょう。", "",
+                 "**WordPressタグ:** " + ' '.join(f"#{k.replace(' ', '')}" for k in keywords[:5]),
+                 f"**メタディスクリプション:** {topic}を分かりやすく解説します。"]
+    return '\n'.join(sections)
+
+
+class FakeBatchServer:
+    """
+    Message Batches APIの作成・状況取得・結果取得を模倣するHTTPサーバー
+
+    作成から processing_seconds 秒後に processing_status が ended になる。
+    fail_ids に含まれる custom_id は errored として返す。
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 processing_seconds: float = 1.0,
+                 fail_ids: Optional[Iterable[str]] = None):
+        """
+        Args:
+            host: 待ち受けアドレス
+            port: 待ち受けポート（0で空きポートを自動選択）
+            processing_seconds: バッチが完了するまでの秒数
+            fail_ids: 失敗させるcustom_id
+        """
+        self.processing_seconds = processing_seconds
+        self.fail_ids = set(fail_ids or [])
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def _send(self, status: int, body: bytes, content_type: str = 'application/json'):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _send_json(self, status: int, payload: Dict[str, Any]):
+                self._send(status, json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+
+            def do_POST(self):
+                if self.path.rstrip('/') != '/v1/messages/batches':
+                    return self._send_json(404, {'type': 'error', 'error': {'type': 'not_found_error'}})
+                length = int(self.headers.get('Content-Length', 0))
+                payload = json.loads(self.rfile.read(length) or b'{}')
+                self._send_json(200, server._create(payload.get('requests', []),
+                                                    self._base_url()))
+
+            def do_GET(self):
+                match = re.fullmatch(r'/v1/messages/batches/([\w-]+)(/results)?', self.path)
+                batch = server._get(match.group(1)) if match else None
+                if batch is None:
+                    return self._send_json(404, {'type': 'error', 'error': {'type': 'not_found_error'}})
+                if match.group(2):
+                    if batch['info']['processing_status'] != 'ended':
+                        return self._send_json(409, {'type': 'error', 'error': {
+                            'type': 'invalid_request_error', 'message': 'batch is still processing'}})
+                    lines = [json.dumps(entry, ensure_ascii=False) for entry in batch['results']]
+                    return self._send(200, '\n'.join(lines).encode('utf-8'), 'application/x-jsonl')
+                self._send_json(200, batch['info'])
+
+            def _base_url(self) -> str:
+                return f"http://{self.headers.get('Host', server.address)}"
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    @property
+    def url(self) -> str:
+        """ANTHROPIC_BASE_URLに指定するURL"""
+        return f"http://{self.address}"
+
+    def _create(self, batch_requests, base_url: str) -> Dict[str, Any]:
+        batch_id = f"msgbatch_{uuid.uuid4().hex[:24]}"
+        results = []
+        for request in batch_requests:
+            custom_id = request['custom_id']
+            if custom_id in self.fail_ids:
+                result = {'type': 'errored', 'error': {'type': 'error', 'error': {
+                    'type': 'invalid_request_error', 'message': 'fake failure'}}}
+            else:
+                params = request.get('params', {})
+                result = {'type': 'succeeded', 'message': {
+                    'id': f"msg_{uuid.uuid4().hex[:24]}",
+                    'type': 'message',
+                    'role': 'assistant',
+                    'model': params.get('model', 'fake'),
+                    'content': [{'type': 'text', 'text': _fake_article(params)}],
+                    'stop_reason': 'end_turn',
+                    'usage': {'input_tokens': 0, 'output_tokens': 0}
+                }}
+            results.append({'custom_id': custom_id, 'result': result})
+
+        info = {
+            'id': batch_id,
+            'type': 'message_batch',
+            'processing_status': 'in_progress',
+            'request_counts': {'processing': len(results), 'succeeded': 0, 'errored': 0,
+                               'canceled': 0, 'expired': 0},
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'ended_at': None,
+            'results_url': None
+        }
+        with self._lock:
+            self.batches[batch_id] = {'info': info, 'results': results,
+                                      'ready_at': time.time() + self.processing_seconds,
+                                      'base_url': base_url}
+        return dict(info)
+
+    def _get(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            batch = self.batches.get(batch_id)
+            if batch and batch['info']['processing_status'] != 'ended' \
+                    and time.time() >= batch['ready_at']:
+                succeeded = sum(1 for r in batch['results'] if r['result']['type'] == 'succeeded')
+                batch['info'].update({
+                    'processing_status': 'ended',
+                    'request_counts': {'processing': 0, 'succeeded': succeeded,
+                                       'errored': len(batch['results']) - succeeded,
+                                       'canceled': 0, 'expired': 0},
+                    'ended_at': datetime.now(timezone.utc).isoformat(),
+                    'results_url': f"{batch['base_url']}/v1/messages/batches/{batch_id}/results"
+                })
+            return batch
+
+    def start(self) -> 'FakeBatchServer':
+        """バックグラウンドスレッドで起動"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Fake Message Batchesサーバーを起動しました: {self.url}")
+        return self
+
+    def stop(self):
+        """停止"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main():
+    """メイン関数"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='オフライン検証用のMessage Batches APIサーバー')
+    parser.add_argument('--host', default='127.0.0.1', help='待ち受けアドレス')
+    parser.add_argument('--port', type=int, default=8765, help='待ち受けポート デフォルト: 8765')
+    parser.add_argument('--processing-seconds', type=float, default=5.0,
+                        help='バッチが完了するまでの秒数 デフォルト: 5')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    server = FakeBatchServer(args.host, args.port, args.processing_seconds)
+    print(f"ANTHROPIC_BASE_URL={server.url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Message Batches Client
+AI Melody Kobo - Anthropic Message Batches APIによる一括生成
+"""
+
+import os
+import json
+import time
+from typing import Any, Dict, List, Optional
+import logging
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class MessageBatchError(Exception):
+    """一括生成APIのエラー"""
+    pass
+
+
+class MessageBatchClient:
+    """
+    Message Batches APIのクライアント
+
+    全リクエストを1つのバッチとして送信し、処理完了までポーリングしてから
+    結果（JSONL）をcustom_idごとに取得する。接続先はANTHROPIC_BASE_URLで
+    切り替えられるため、ローカルのFakeBatchServerに向けてオフラインで動作確認できる。
+    """
+
+    API_VERSION = "2023-06-01"
+
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 base_url: Optional[str] = None,
+                 poll_interval: float = 30.0,
+                 timeout: float = 24 * 3600,
+                 session: Optional[requests.Session] = None):
+        """
+        Args:
+            api_key: APIキー（省略時は環境変数ANTHROPIC_API_KEY）
+            base_url: APIのベースURL（省略時は環境変数ANTHROPIC_BASE_URL）
+            poll_interval: 処理状況を確認する間隔（秒）
+            timeout: 処理完了を待つ最大秒数
+            session: 使用するHTTPセッション
+        """
+        self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
+        self.base_url = (base_url or os.getenv('ANTHROPIC_BASE_URL')
+                         or "https://api.anthropic.com").rstrip('/')
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self.headers = {
+            'x-api-key': self.api_key or '',
+            'anthropic-version': self.API_VERSION,
+            'content-type': 'application/json'
+        }
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        try:
+            response = self.session.request(method, url, headers=self.headers,
+                                            timeout=60, **kwargs)
+            response.raise_for_status()
+            return response
+        except requests.exceptions.RequestException as e:
+            raise MessageBatchError(f"Message Batches APIエラー: {str(e)}")
+
+    def submit(self, batch_requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        バッチを作成
+
+        Args:
+            batch_requests: {'custom_id': str, 'params': Messages APIのパラメータ} のリスト
+
+        Returns:
+            作成されたバッチの情報
+        """
+        response = self._request(
+            'POST', f"{self.base_url}/v1/messages/batches",
+            data=json.dumps({'requests': batch_requests}, ensure_ascii=False).encode('utf-8')
+        )
+        batch = response.json()
+        logger.info(f"バッチを作成しました: {batch['id']} ({len(batch_requests)}件)")
+        return batch
+
+    def retrieve(self, batch_id: str) -> Dict[str, Any]:
+        """バッチの処理状況を取得"""
+        return self._request('GET', f"{self.base_url}/v1/messages/batches/{batch_id}").json()
+
+    def wait(self, batch_id: str) -> Dict[str, Any]:
+        """処理が終わるまでポーリング（timeoutを超えた場合はMessageBatchError）"""
+        deadline = time.time() + self.timeout
+        while True:
+            batch = self.retrieve(batch_id)
+            if batch.get('processing_status') == 'ended':
+                return batch
+            if time.time() >= deadline:
+                raise MessageBatchError(f"バッチの処理が時間内に終わりませんでした: {batch_id}")
+
+            counts = batch.get('request_counts', {})
+            logger.info(f"バッチ処理中: {batch_id} (処理中 {counts.get('processing', '?')}件, "
+                        f"完了 {counts.get('succeeded', 0)}件)")
+            time.sleep(self.poll_interval)
+
+    def results(self, batch: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        処理済みバッチの結果を取得
+
+        Returns:
+            custom_id → result（typeがsucceededの場合はmessageを含む）
+        """
+        results_url = batch.get('results_url') or \
+            f"{self.base_url}/v1/messages/batches/{batch['id']}/results"
+        response = self._request('GET', results_url)
+
+        results = {}
+        for line in response.content.decode('utf-8').splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            results[entry['custom_id']] = entry['result']
+        return results
+
+    def run(self, batch_requests: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """バッチを作成し、処理完了を待って結果を返す"""
+        batch = self.submit(batch_requests)
+        batch = self.wait(batch['id'])
+        return self.results(batch)
+
+    @staticmethod
+    def message_text(result: Dict[str, Any]) -> str:
+        """成功した結果から本文を取り出す（失敗の場合はMessageBatchError）"""
+        if result.get('type') != 'succeeded':
+            error = result.get('error') or {}
+            detail = error.get('error', error).get('message', '') if isinstance(error, dict) else error
+            raise MessageBatchError(f"バッチ内のリクエストが失敗しました: {result.get('type')} {detail}")
+        return ''.join(block.get('text', '') for block in result['message'].get('content', [])
+                       if block.get('type') == 'text')
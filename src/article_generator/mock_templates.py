@@ -0,0 +1,110 @@
+"""
+Mock Article Templates
+AI Melody Kobo - モック記事テンプレートの読み込みと差し込み
+
+テンプレートは mock_articles/ 以下のMarkdownファイルで、index.json に
+(ツール, 記事タイプ) → ファイルの対応を記述する。本文中の {{topic}} と
+{{keyword_tags}} だけが差し込み箇所で、それ以外の波括弧はそのまま出力される。
+"""
+
+import re
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).parent / "mock_articles"
+
+
+class MockTemplate:
+    """差し込み箇所で分割済みのテンプレート"""
+
+    PLACEHOLDER = re.compile(r'\{\{(topic|keyword_tags)\}\}')
+
+    def __init__(self, text: str):
+        # re.splitの結果は [リテラル, 名前, リテラル, 名前, ..., リテラル] の順になる
+        self._parts = self.PLACEHOLDER.split(text)
+
+    def render(self, values: Dict[str, str]) -> str:
+        parts = list(self._parts)
+        parts[1::2] = [values[name] for name in self._parts[1::2]]
+        return ''.join(parts)
+
+
+class MockTemplateStore:
+    """
+    モック記事テンプレートのストア
+
+    最初の render() でindex.jsonと全テンプレートを読み込んで分割しておき、
+    以降は差し込みだけで記事を組み立てる。
+    """
+
+    _shared: Optional['MockTemplateStore'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, template_dir: Optional[Path] = None):
+        """
+        Args:
+            template_dir: テンプレートの保存先（index.jsonを含むディレクトリ）
+        """
+        self.template_dir = Path(template_dir) if template_dir else TEMPLATE_DIR
+        # グループ（dynamic/complete）→ (ツール, 記事タイプ) → テンプレート
+        self._templates: Optional[Dict[str, Dict[Tuple[str, str], MockTemplate]]] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> 'MockTemplateStore':
+        """プロセス共有のストアを取得"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _load(self) -> Dict[str, Dict[Tuple[str, str], MockTemplate]]:
+        with self._lock:
+            if self._templates is not None:
+                return self._templates
+
+            with open(self.template_dir / "index.json", 'r', encoding='utf-8') as f:
+                index = json.load(f)
+
+            texts: Dict[str, str] = {}
+            templates: Dict[str, Dict[Tuple[str, str], MockTemplate]] = {}
+            for group, entries in index.items():
+                templates[group] = {}
+                for entry in entries:
+                    if entry['file'] not in texts:
+                        texts[entry['file']] = (self.template_dir / entry['file']).read_text(
+                            encoding='utf-8').rstrip('\n')
+                    text = texts[entry['file']]
+                    # 他ツールの記事を流用するエントリはツール名を置き換えておく
+                    for old, new in entry.get('replace', {}).items():
+                        text = text.replace(old, new)
+                    key = (entry['tool'], entry.get('article_type', '*'))
+                    templates[group][key] = MockTemplate(text)
+
+            logger.debug(f"モック記事テンプレートを読み込みました: {len(texts)}件")
+            self._templates = templates
+            return templates
+
+    def render(self, group: str, tool: str, article_type: str,
+               topic: str, keywords: List[str]) -> str:
+        """
+        テンプレートにトピックとキーワードを差し込んで記事を返す
+
+        Args:
+            group: テンプレートのグループ（dynamic/complete）
+            tool: ツール・分野名（suno, voice_synthesis 等）
+            article_type: 記事タイプ（専用のテンプレートがなければ共通のものを使う）
+            topic: 記事のトピック
+            keywords: キーワード（先頭5件をタグにする）
+        """
+        templates = self._load()[group]
+        template = templates.get((tool, article_type)) or templates[(tool, '*')]
+        return template.render({
+            'topic': topic,
+            'keyword_tags': ' '.join('#' + k for k in keywords[:5])
+        })
@@ -5,6 +5,7 @@ AI Melody Kobo - AIクリエイター アリサのペルソナ管理
 
 import os
 import json
+import threading
 from typing import Dict, List, Optional
 from pathlib import Path
 import logging
@@ -24,6 +25,8 @@ class AlisaPersona:
         """
         self.persona_data_path = persona_data_path or "data/alisa_persona.json"
         self.writing_samples = []
+        # 複数スレッドから執筆サンプルを追加・参照するためのロック
+        self._lock = threading.RLock()
         self.style_guidelines = self._load_default_guidelines()
         self.vocabulary_preferences = self._load_default_vocabulary()
         
@@ -96,14 +99,15 @@ class AlisaPersona:
             # ディレクトリが存在しない場合は作成
             os.makedirs(os.path.dirname(self.persona_data_path), exist_ok=True)
             
-            data = {
-                'writing_samples': self.writing_samples,
-                'style_guidelines': self.style_guidelines,
-                'vocabulary_preferences': self.vocabulary_preferences
-            }
-            
-            with open(self.persona_data_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with self._lock:
+                data = {
+                    'writing_samples': self.writing_samples,
+                    'style_guidelines': self.style_guidelines,
+                    'vocabulary_preferences': self.vocabulary_preferences
+                }
+                
+                with open(self.persona_data_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
             
             logger.info("ペルソナデータを保存しました")
         except Exception as e:
@@ -115,11 +119,18 @@ class AlisaPersona:
             'text': sample_text,
             'metadata': metadata or {}
         }
-        self.writing_samples.append(sample)
-        self.save_persona_data()
+        with self._lock:
+            self.writing_samples.append(sample)
+            self.save_persona_data()
     
-    def get_style_prompt(self) -> str:
-        """AIモデル用のスタイルプロンプトを生成"""
+    def get_style_prompt(self, include_samples: bool = True) -> str:
+        """
+        AIモデル用のスタイルプロンプトを生成
+        
+        Args:
+            include_samples: 過去の執筆例を含めるか（執筆例は記事を生成するたびに
+                             変わるため、プロンプトキャッシュ用の静的部分では除く）
+        """
         prompt_parts = [
             "あなたは「AIクリエイター アリサ」として記事を執筆してください。",
             "",
@@ -147,18 +158,24 @@ class AlisaPersona:
             prompt_parts.append(f"Suno関連: {', '.join(self.vocabulary_preferences['suno_specific'][:3])}")
         
         # 執筆サンプルがある場合は追加
-        if self.writing_samples:
-            prompt_parts.extend([
-                "",
-                "過去の執筆例を参考にしてください："
-            ])
-            # 最新の3つのサンプルを使用
-            for sample in self.writing_samples[-3:]:
-                excerpt = sample['text'][:200] + "..." if len(sample['text']) > 200 else sample['text']
-                prompt_parts.append(f"- {excerpt}")
+        if include_samples and self.writing_samples:
+            prompt_parts.extend(["", self.get_sample_prompt()])
         
         return "\n".join(prompt_parts)
     
+    def get_sample_prompt(self) -> str:
+        """最新の執筆例を参考として示すプロンプト（執筆例がない場合は空文字）"""
+        with self._lock:
+            # 最新の3つのサンプルを使用
+            samples = self.writing_samples[-3:]
+        if not samples:
+            return ""
+        prompt_parts = ["過去の執筆例を参考にしてください："]
+        for sample in samples:
+            excerpt = sample['text'][:200] + "..." if len(sample['text']) > 200 else sample['text']
+            prompt_parts.append(f"- {excerpt}")
+        return "\n".join(prompt_parts)
+    
     def apply_persona_style(self, text: str) -> str:
         """テキストにアリサのペルソナスタイルを適用"""
         styled_text = text
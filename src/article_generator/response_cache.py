@@ -0,0 +1,176 @@
+"""
+LLM Response Cache
+AI Melody Kobo - プロンプトをキーにしたAIレスポンスのディスクキャッシュ
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    モデル・システムプロンプト・ユーザープロンプト・温度をキーにしたレスポンスキャッシュ
+
+    1エントリ1ファイル（キーのSHA-256がファイル名）でディスクに保存する。
+    有効期限（TTL）を過ぎたエントリは読み込み時に破棄し、合計サイズが上限を
+    超えた場合は最後に使われた時刻が古いものから削除する。
+    """
+
+    _shared: Optional['ResponseCache'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self,
+                 cache_dir: str = "data/cache/ai_responses",
+                 ttl_seconds: Optional[float] = None,
+                 max_bytes: Optional[int] = None):
+        """
+        Args:
+            cache_dir: キャッシュファイルの保存先
+            ttl_seconds: 有効期限（秒、0以下で無期限）
+            max_bytes: キャッシュ全体の最大サイズ（バイト）
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv('AI_RESPONSE_CACHE_TTL', str(7 * 24 * 3600)))
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            float(os.getenv('AI_RESPONSE_CACHE_MAX_MB', '100')) * 1024 * 1024)
+
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0, 'expired': 0, 'evictions': 0}
+
+        # ファイル名 → (サイズ, 最終使用時刻)
+        self._entries: Dict[str, list] = {}
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+                self._entries[path.stem] = [stat.st_size, stat.st_mtime]
+            except OSError:
+                continue
+        self._total_bytes = sum(size for size, _ in self._entries.values())
+
+    @classmethod
+    def shared(cls) -> Optional['ResponseCache']:
+        """プロセス共有のキャッシュを取得（AI_RESPONSE_CACHE=0で無効）"""
+        if os.getenv('AI_RESPONSE_CACHE', '1').lower() in ('0', 'false', 'off'):
+            return None
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def make_key(model: str, system: Optional[str], prompt: str,
+                 temperature: Optional[float], max_tokens: Optional[int] = None) -> str:
+        """リクエスト内容からキャッシュキーを生成"""
+        payload = json.dumps(
+            [model, system or '', prompt, temperature, max_tokens],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """キャッシュされたレスポンスを取得（なければNone）"""
+        path = self._path(key)
+        with self._lock:
+            if key not in self._entries:
+                self._stats['misses'] += 1
+                return None
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"レスポンスキャッシュ読み込みエラー: {e}")
+                self._remove(key)
+                self._stats['misses'] += 1
+                return None
+
+            if self.ttl_seconds > 0 and time.time() - entry.get('created_at', 0) > self.ttl_seconds:
+                self._remove(key)
+                self._stats['expired'] += 1
+                self._stats['misses'] += 1
+                return None
+
+            # 最終使用時刻を更新（サイズ超過時の削除順に使う）
+            now = time.time()
+            self._entries[key][1] = now
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+            self._stats['hits'] += 1
+            return entry.get('text')
+
+    def put(self, key: str, text: str, metadata: Optional[Dict[str, Any]] = None):
+        """レスポンスを保存"""
+        if not text:
+            return
+        data = json.dumps({
+            'created_at': time.time(),
+            'metadata': metadata or {},
+            'text': text
+        }, ensure_ascii=False).encode('utf-8')
+
+        path = self._path(key)
+        with self._lock:
+            try:
+                tmp_path = path.with_suffix('.tmp')
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"レスポンスキャッシュ保存エラー: {e}")
+                return
+
+            if key in self._entries:
+                self._total_bytes -= self._entries[key][0]
+            self._entries[key] = [len(data), time.time()]
+            self._total_bytes += len(data)
+            self._stats['stores'] += 1
+            self._evict()
+
+    def _remove(self, key: str):
+        """エントリを削除（呼び出し側でロックを保持すること）"""
+        size, _ = self._entries.pop(key, (0, 0))
+        self._total_bytes -= size
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def _evict(self):
+        """合計サイズが上限以下になるまで古いエントリを削除（ロック保持中に呼ぶ）"""
+        if self._total_bytes <= self.max_bytes:
+            return
+        for key, _ in sorted(self._entries.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._remove(key)
+            self._stats['evictions'] += 1
+
+    def clear(self):
+        """全エントリを削除"""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ヒット率などの統計を取得"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['size_bytes'] = self._total_bytes
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        return stats
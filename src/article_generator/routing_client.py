@@ -0,0 +1,287 @@
+"""
+Routing AI Client
+AI Melody Kobo - 複数のAIプロバイダーを遅延・エラー率に応じて切り替えるクライアント
+"""
+
+import os
+import math
+import time
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import logging
+
+from .ai_client import AIClientInterface
+from .streaming import ArticleStream
+from .usage_tracker import UsageBudgetExceeded, copy_usage_context
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderStats:
+    """
+    プロバイダーごとの直近のリクエスト結果（遅延・成否）
+
+    直近 window 件だけを保持し、p50/p95遅延とエラー率を計算する。
+    """
+
+    def __init__(self, window: int = 50):
+        """
+        Args:
+            window: 統計に使う直近のリクエスト数
+        """
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, ok: bool):
+        """リクエスト結果を記録"""
+        with self._lock:
+            self._samples.append((latency, ok))
+
+    @staticmethod
+    def _percentile(values: List[float], ratio: float) -> Optional[float]:
+        if not values:
+            return None
+        values = sorted(values)
+        # nearest-rank法
+        index = min(len(values) - 1, max(0, math.ceil(ratio * len(values)) - 1))
+        return values[index]
+
+    @property
+    def requests(self) -> int:
+        return len(self._samples)
+
+    @property
+    def error_rate(self) -> float:
+        with self._lock:
+            samples = list(self._samples)
+        if not samples:
+            return 0.0
+        return sum(1 for _, ok in samples if not ok) / len(samples)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """p50/p95遅延（成功したリクエストのみ）とエラー率"""
+        with self._lock:
+            samples = list(self._samples)
+        latencies = [latency for latency, ok in samples if ok]
+        p50 = self._percentile(latencies, 0.50)
+        p95 = self._percentile(latencies, 0.95)
+        return {
+            'requests': len(samples),
+            'errors': sum(1 for _, ok in samples if not ok),
+            'error_rate': round(sum(1 for _, ok in samples if not ok) / len(samples), 3) if samples else 0.0,
+            'p50_seconds': round(p50, 3) if p50 is not None else None,
+            'p95_seconds': round(p95, 3) if p95 is not None else None
+        }
+
+
+class RoutingClient(AIClientInterface):
+    """
+    複数のAIクライアントを束ね、1つのAIクライアントとして振る舞う
+
+    - 優先順に並んだプロバイダーのうち、APIを呼び出せるものを使う
+    - エラー率が max_error_rate 以上のプロバイダーは後回しにする
+    - 最初のプロバイダーが latency_budget 秒以内に応答しない場合、次のプロバイダーにも
+      同じリクエストを送り（ヘッジ）、先に成功した方の結果を使う
+    - エラーになった場合は次のプロバイダーで再実行する（フェイルオーバー）
+
+    レスポンスの 'provider' に実際に記事を生成したプロバイダー名を設定する。
+    """
+
+    PROVIDER = "routing"
+
+    def __init__(self,
+                 clients: List[AIClientInterface],
+                 latency_budget: Optional[float] = None,
+                 hedge: bool = True,
+                 max_error_rate: float = 0.5,
+                 min_samples: int = 5,
+                 window: int = 50):
+        """
+        Args:
+            clients: 優先順に並べたAIクライアント
+            latency_budget: ヘッジするまで待つ秒数（省略時は環境変数AI_ROUTING_LATENCY_BUDGET、既定90秒）
+            hedge: 遅いリクエストを次のプロバイダーにも送るか
+            max_error_rate: これ以上のエラー率のプロバイダーを後回しにする
+            min_samples: エラー率で判定を始めるまでのリクエスト数
+            window: 統計に使う直近のリクエスト数
+        """
+        if not clients:
+            raise ValueError("AIクライアントを1つ以上指定してください")
+        self.clients = clients
+        self.latency_budget = latency_budget if latency_budget is not None else float(
+            os.getenv('AI_ROUTING_LATENCY_BUDGET', '90'))
+        self.hedge = hedge
+        self.max_error_rate = max_error_rate
+        self.min_samples = min_samples
+        self.stats = {client.PROVIDER: ProviderStats(window) for client in clients}
+        # 使用量は各クライアントが記録する（同じ共有トラッカーを使う）
+        self.usage_tracker = clients[0].usage_tracker
+        # ヘッジしたリクエストを並行して実行するためのスレッドプール
+        self._executor = ThreadPoolExecutor(max_workers=max(4, len(clients) * 4),
+                                            thread_name_prefix='ai-route')
+
+    @property
+    def available(self) -> bool:
+        return any(client.available for client in self.clients)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        # 各クライアントは同じ共有キャッシュを使う
+        return self.clients[0].get_cache_stats()
+
+    def get_provider_stats(self) -> Dict[str, Dict[str, Any]]:
+        """プロバイダーごとのp50/p95遅延とエラー率"""
+        return {provider: stats.snapshot() for provider, stats in self.stats.items()}
+
+    def _candidates(self) -> List[AIClientInterface]:
+        """今回のリクエストで試す順に並べたクライアント"""
+        usable = [client for client in self.clients if client.available]
+        if not usable:
+            # APIキーがない場合は従来どおり先頭のクライアントのモックを使う
+            return self.clients[:1]
+
+        def unhealthy(client: AIClientInterface) -> bool:
+            stats = self.stats[client.PROVIDER]
+            return stats.requests >= self.min_samples and stats.error_rate >= self.max_error_rate
+
+        # sortedは安定なので、同じ状態のクライアント同士は優先順を保つ
+        return sorted(usable, key=unhealthy)
+
+    def _timed(self, client: AIClientInterface, operation: Callable[[AIClientInterface], Any]) -> Any:
+        """operationを実行し、遅延と成否を記録"""
+        started = time.monotonic()
+        try:
+            result = operation(client)
+        except UsageBudgetExceeded:
+            raise
+        except Exception:
+            self.stats[client.PROVIDER].record(time.monotonic() - started, False)
+            raise
+        self.stats[client.PROVIDER].record(time.monotonic() - started, True)
+        return result
+
+    def _route(self, operation: Callable[[AIClientInterface], Any],
+               hedge: bool = True) -> Tuple[AIClientInterface, Any]:
+        """
+        ヘッジとフェイルオーバーを行いながらoperationを実行
+
+        Returns:
+            (結果を返したクライアント, 結果)
+        """
+        queue = self._candidates()
+        pending: Dict[Future, AIClientInterface] = {}
+        last_error: Optional[Exception] = None
+        attempts = 0
+
+        def launch():
+            nonlocal attempts
+            client = queue.pop(0)
+            # 呼び出し元のラベル（記事タイプ等）と再試行回数を使用量レコードに引き継ぐ
+            context = copy_usage_context(retries=attempts)
+            attempts += 1
+            pending[self._executor.submit(context.run, self._timed, client, operation)] = client
+
+        launch()
+        while pending:
+            can_hedge = hedge and self.hedge and bool(queue)
+            done, _ = wait(list(pending), timeout=self.latency_budget if can_hedge else None,
+                           return_when=FIRST_COMPLETED)
+            if not done:
+                slow = ', '.join(client.PROVIDER for client in pending.values())
+                logger.warning(f"{slow} が{self.latency_budget:.0f}秒以内に応答しないため "
+                               f"{queue[0].PROVIDER} にも送信します")
+                launch()
+                continue
+
+            for future in done:
+                client = pending.pop(future)
+                try:
+                    result = future.result()
+                except UsageBudgetExceeded:
+                    # 予算超過は他のプロバイダーでも同じため切り替えない
+                    raise
+                except Exception as e:
+                    last_error = e
+                    logger.warning(f"{client.PROVIDER} でエラー: {str(e)}")
+                    if queue and not pending:
+                        logger.info(f"{queue[0].PROVIDER} にフェイルオーバーします")
+                        launch()
+                    continue
+                # 残りのリクエストは結果を使わない（統計には記録される）
+                return client, result
+
+        raise last_error
+
+    def generate_article(self,
+                         topic: str,
+                         keywords: List[str],
+                         article_type: str,
+                         additional_context: Optional[str] = None,
+                         static_context: Optional[str] = None,
+                         sample_context: Optional[str] = None) -> Dict[str, Any]:
+        client, response = self._route(lambda c: c.generate_article(
+            topic, keywords, article_type, additional_context, static_context, sample_context))
+        response['provider'] = client.PROVIDER
+        return response
+
+    def stream_article(self,
+                       topic: str,
+                       keywords: List[str],
+                       article_type: str,
+                       additional_context: Optional[str] = None,
+                       static_context: Optional[str] = None,
+                       sample_context: Optional[str] = None) -> ArticleStream:
+        """
+        ストリーミングで記事を生成
+
+        セクションを返し始めた後は切り替えられないため、ヘッジは行わず、
+        最初のセクションが届く前にエラーになった場合のみ次のプロバイダーに切り替える。
+        """
+        def sections() -> Iterator[str]:
+            last_error: Optional[Exception] = None
+            for client in self._candidates():
+                started = time.monotonic()
+                stream = None
+                yielded = False
+                try:
+                    stream = client.stream_article(topic, keywords, article_type,
+                                                   additional_context, static_context, sample_context)
+                    article_stream.model = stream.model
+                    article_stream.provider = client.PROVIDER
+                    for section in stream:
+                        yielded = True
+                        yield section
+                except GeneratorExit:
+                    if stream is not None:
+                        stream.close()
+                    raise
+                except UsageBudgetExceeded:
+                    raise
+                except Exception as e:
+                    self.stats[client.PROVIDER].record(time.monotonic() - started, False)
+                    if yielded:
+                        raise
+                    last_error = e
+                    logger.warning(f"{client.PROVIDER} でエラー: {str(e)}")
+                    continue
+                self.stats[client.PROVIDER].record(time.monotonic() - started, True)
+                article_stream.status = stream.status
+                article_stream.usage = stream.usage
+                return
+            raise last_error
+
+        article_stream = ArticleStream(sections(), model='unknown')
+        return article_stream
+
+    def generate_articles_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """一括生成（バッチ全体が失敗した場合のみ次のプロバイダーで再実行）"""
+        client, responses = self._route(lambda c: c.generate_articles_batch(requests), hedge=False)
+        for response in responses:
+            if response is not None:
+                response['provider'] = client.PROVIDER
+        return responses
+
+    def refine_content(self, content: str, instructions: str) -> str:
+        _, refined = self._route(lambda c: c.refine_content(content, instructions), hedge=False)
+        return refined
@@ -0,0 +1,183 @@
+"""
+Streaming Generation
+AI Melody Kobo - ストリーミング生成されたMarkdownを見出し単位のセクションに分割
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class StreamFormatError(Exception):
+    """ストリーミング中のレスポンスが想定した記事形式から外れた"""
+    pass
+
+
+class SectionSplitter:
+    """
+    逐次届くテキストをH1/H2見出しの直前で区切ってセクションにする
+
+    セクションは元のテキストをそのまま切り出したもので、全セクションを連結すると
+    元のレスポンスと一致する。コードブロック内の「#」は見出しとみなさない。
+    """
+
+    HEADING_PATTERN = re.compile(r'#{1,2}\s')
+
+    def __init__(self):
+        self._buffer = ''
+        self._section_start = 0
+        self._scan_pos = 0
+        self._in_fence = False
+
+    def feed(self, text: str) -> List[str]:
+        """
+        テキストを追加し、確定したセクションを返す
+
+        Args:
+            text: 新しく届いたテキスト片
+
+        Returns:
+            次の見出しが現れて完結したセクションのリスト
+        """
+        self._buffer += text
+        sections = []
+
+        # 改行まで届いた行だけを判定する
+        while True:
+            line_end = self._buffer.find('\n', self._scan_pos)
+            if line_end < 0:
+                break
+            line = self._buffer[self._scan_pos:line_end]
+            if line.lstrip().startswith('```'):
+                self._in_fence = not self._in_fence
+            elif (not self._in_fence and self._scan_pos > self._section_start
+                    and self.HEADING_PATTERN.match(line)):
+                sections.append(self._buffer[self._section_start:self._scan_pos])
+                self._section_start = self._scan_pos
+            self._scan_pos = line_end + 1
+
+        # 確定済みの部分はバッファから捨てる
+        if self._section_start:
+            self._buffer = self._buffer[self._section_start:]
+            self._scan_pos -= self._section_start
+            self._section_start = 0
+        return sections
+
+    def flush(self) -> List[str]:
+        """残りのテキストをセクションとして返す（ストリーム終了時に呼ぶ）"""
+        sections = []
+        # 改行で終わらない最終行が見出しの場合も区切る
+        tail = self._buffer[self._scan_pos:]
+        if (tail and not self._in_fence and self._scan_pos > self._section_start
+                and self.HEADING_PATTERN.match(tail)):
+            sections.append(self._buffer[self._section_start:self._scan_pos])
+            self._section_start = self._scan_pos
+        rest = self._buffer[self._section_start:]
+        if rest:
+            sections.append(rest)
+        self._buffer = ''
+        self._section_start = self._scan_pos = 0
+        self._in_fence = False
+        return sections
+
+    @classmethod
+    def split(cls, text: str) -> List[str]:
+        """テキスト全体をセクションに分割"""
+        splitter = cls()
+        return splitter.feed(text) + splitter.flush()
+
+
+class SectionFormatGuard:
+    """
+    届いたセクションが記事の形式になっているかを確認する
+
+    冒頭の一定文字数以内にH1タイトルが現れない場合や、見出しのないまま
+    長文が続く場合はStreamFormatErrorを送出し、生成を早期に打ち切らせる。
+    """
+
+    def __init__(self, max_preamble_chars: int = 2000, max_section_chars: int = 8000):
+        """
+        Args:
+            max_preamble_chars: H1タイトルが現れるまでに許容する文字数
+            max_section_chars: 1セクションの最大文字数
+        """
+        self.max_preamble_chars = max_preamble_chars
+        self.max_section_chars = max_section_chars
+        self._seen_chars = 0
+        self._has_title = False
+        self.sections = 0
+        self.h2_count = 0
+
+    def check(self, section: str):
+        """セクションを検査（形式外の場合はStreamFormatErrorを送出）"""
+        self.sections += 1
+        first_line = section.lstrip('\n').split('\n', 1)[0]
+        if first_line.startswith('# '):
+            self._has_title = True
+        elif first_line.startswith('## '):
+            self.h2_count += 1
+
+        self._seen_chars += len(section)
+        if not self._has_title and self._seen_chars > self.max_preamble_chars:
+            raise StreamFormatError(
+                f"冒頭{self.max_preamble_chars}文字以内にタイトル（H1）がありません")
+        if len(section) > self.max_section_chars:
+            raise StreamFormatError(
+                f"見出しのないセクションが長すぎます（{len(section)}文字）")
+
+
+class ArticleStream:
+    """
+    ストリーミング生成中の記事
+
+    イテレートすると届いたセクションを順に返し、読み終えた後は
+    markdown_contentやto_response()で generate_article と同じ形式の結果を得られる。
+    途中でclose()すると生成を中断する。
+    """
+
+    def __init__(self, sections: Iterable[str], model: str, status: str = 'generated'):
+        """
+        Args:
+            sections: セクションを返すイテレータ（ジェネレータの場合はclose()で中断できる）
+            model: モデル名
+            status: 生成ステータス
+        """
+        self._sections = iter(sections)
+        self.model = model
+        # 記事を生成したプロバイダー（複数プロバイダーを切り替える場合に設定される）
+        self.provider: Optional[str] = None
+        self.status = status
+        self.sections: List[str] = []
+        self.completed = False
+        # トークン使用量（ストリームを最後まで読むと設定される）
+        self.usage: Dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[str]:
+        for section in self._sections:
+            self.sections.append(section)
+            yield section
+        self.completed = True
+
+    def close(self):
+        """生成を中断（API接続も閉じる）"""
+        close = getattr(self._sections, 'close', None)
+        if close:
+            close()
+
+    @property
+    def markdown_content(self) -> str:
+        return ''.join(self.sections)
+
+    def to_response(self) -> Dict[str, Any]:
+        """generate_articleと同じ形式のレスポンス"""
+        response = {
+            'markdown_content': self.markdown_content,
+            'status': self.status,
+            'model': self.model,
+            'usage': self.usage
+        }
+        if self.provider:
+            response['provider'] = self.provider
+        return response
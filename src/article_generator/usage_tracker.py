@@ -0,0 +1,321 @@
+"""
+AI Usage Tracker
+AI Melody Kobo - AI呼び出しごとのトークン使用量・遅延・コストの記録と予算管理
+
+使用例:
+    python -m src.article_generator.usage_tracker --by day
+    python -m src.article_generator.usage_tracker --by article_type --since 2024-06-01
+"""
+
+import os
+import uuid
+import sqlite3
+import threading
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 呼び出し元（記事生成パイプライン）が付けるラベル（記事タイプ・ツール名など）
+_usage_labels: ContextVar[Dict[str, Any]] = ContextVar('ai_usage_labels', default={})
+
+
+@contextmanager
+def usage_context(**labels) -> Iterator[None]:
+    """
+    このブロック内のAI呼び出しの使用量レコードにラベルを付ける
+
+    例: with usage_context(article_type='tutorial', tool_name='Suno'): ...
+    """
+    token = _usage_labels.set({**_usage_labels.get(), **labels})
+    try:
+        yield
+    finally:
+        _usage_labels.reset(token)
+
+
+def copy_usage_context(**labels) -> Context:
+    """現在のラベルにlabelsを加えたコンテキスト（別スレッドで呼び出しを実行する場合に使う）"""
+    context = copy_context()
+    context.run(_usage_labels.set, {**context.get(_usage_labels, {}), **labels})
+    return context
+
+
+class UsageBudgetExceeded(Exception):
+    """実行ごとのトークン・コスト予算を使い切った"""
+    pass
+
+
+class UsageStore:
+    """
+    使用量レコードを保存するSQLiteストア
+
+    1回のAI呼び出しを1行として保存し、日付・記事タイプ・ツール名などで集計する。
+    """
+
+    # 集計に使える列
+    GROUP_COLUMNS = ('day', 'article_type', 'tool_name', 'model', 'provider', 'operation', 'run_id')
+
+    def __init__(self, db_path: str = "data/ai_usage.sqlite3"):
+        """
+        Args:
+            db_path: SQLiteファイルのパス
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS usage_records (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TEXT NOT NULL,
+                day TEXT NOT NULL,
+                run_id TEXT NOT NULL,
+                operation TEXT NOT NULL,
+                provider TEXT,
+                model TEXT,
+                article_type TEXT,
+                tool_name TEXT,
+                input_tokens INTEGER NOT NULL DEFAULT 0,
+                output_tokens INTEGER NOT NULL DEFAULT 0,
+                cache_creation_input_tokens INTEGER NOT NULL DEFAULT 0,
+                cache_read_input_tokens INTEGER NOT NULL DEFAULT 0,
+                latency_seconds REAL NOT NULL DEFAULT 0,
+                retries INTEGER NOT NULL DEFAULT 0,
+                cost_usd REAL NOT NULL DEFAULT 0,
+                response_cache_hit INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL,
+                error TEXT
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_usage_day ON usage_records (day)")
+
+    def add(self, record: Dict[str, Any]):
+        """レコードを1件保存"""
+        columns = [key for key in record if key != 'id']
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO usage_records ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})",
+                [record[key] for key in columns]
+            )
+
+    def rollup(self, group_by: str = 'day', since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        使用量を集計
+
+        Args:
+            group_by: 集計キー（GROUP_COLUMNSのいずれか）
+            since: この日付（YYYY-MM-DD）以降のレコードのみ集計
+
+        Returns:
+            集計キーごとの呼び出し数・トークン数・コスト・平均遅延
+        """
+        if group_by not in self.GROUP_COLUMNS:
+            raise ValueError(f"集計できない列: {group_by}")
+        where, params = ("WHERE day >= ?", [since]) if since else ("", [])
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT {group_by} AS key,
+                       COUNT(*) AS calls,
+                       SUM(status != 'ok') AS errors,
+                       SUM(response_cache_hit) AS response_cache_hits,
+                       SUM(input_tokens) AS input_tokens,
+                       SUM(output_tokens) AS output_tokens,
+                       SUM(cache_creation_input_tokens) AS cache_creation_input_tokens,
+                       SUM(cache_read_input_tokens) AS cache_read_input_tokens,
+                       ROUND(SUM(cost_usd), 4) AS cost_usd,
+                       ROUND(AVG(latency_seconds), 3) AS avg_latency_seconds
+                FROM usage_records {where}
+                GROUP BY {group_by} ORDER BY {group_by}
+            """, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class UsageTracker:
+    """
+    AI呼び出しの使用量を記録し、実行（プロセス）ごとの予算を管理する
+
+    AIクライアントはAPIを呼び出す前に check_budget() を、呼び出した後に record() を呼ぶ。
+    予算（トークン数・コスト）を超えると check_budget() が UsageBudgetExceeded を送出し、
+    以降の生成は行われない。並列実行中の呼び出しの分だけ予算を超えることがある。
+    """
+
+    # 100万トークンあたりの料金（USD）: (入力, 出力, キャッシュ書き込み, キャッシュ読み込み)
+    PRICING = {
+        'claude-3-opus-20240229': (15.0, 75.0, 18.75, 1.50),
+        'gemini-pro': (0.50, 1.50, 0.50, 0.50)
+    }
+
+    # Message Batches APIは通常料金の半額
+    BATCH_DISCOUNT = 0.5
+
+    _shared: Optional['UsageTracker'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self,
+                 store: Optional[UsageStore] = None,
+                 max_tokens: Optional[int] = None,
+                 max_cost_usd: Optional[float] = None):
+        """
+        Args:
+            store: 記録先（省略時は data/ai_usage.sqlite3）
+            max_tokens: 実行ごとのトークン数の上限（省略時は環境変数AI_RUN_TOKEN_BUDGET、0で無制限）
+            max_cost_usd: 実行ごとのコストの上限（省略時は環境変数AI_RUN_COST_BUDGET、0で無制限）
+        """
+        self.store = store or UsageStore()
+        self.max_tokens = max_tokens if max_tokens is not None else int(
+            os.getenv('AI_RUN_TOKEN_BUDGET', '0'))
+        self.max_cost_usd = max_cost_usd if max_cost_usd is not None else float(
+            os.getenv('AI_RUN_COST_BUDGET', '0'))
+        self.run_id = uuid.uuid4().hex[:12]
+        self._lock = threading.Lock()
+        self._totals = {'calls': 0, 'tokens': 0, 'cost_usd': 0.0}
+
+    @classmethod
+    def shared(cls) -> Optional['UsageTracker']:
+        """プロセス共有のトラッカーを取得（AI_USAGE_TRACKING=0で無効）"""
+        if os.getenv('AI_USAGE_TRACKING', '1').lower() in ('0', 'false', 'off'):
+            return None
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def estimate_cost(cls, model: str, usage: Dict[str, Any], batch: bool = False) -> float:
+        """トークン使用量からコスト（USD）を見積もる（料金表にないモデルは0）"""
+        prices = cls.PRICING.get(model)
+        if not prices:
+            return 0.0
+        tokens = (usage.get('input_tokens', 0), usage.get('output_tokens', 0),
+                  usage.get('cache_creation_input_tokens', 0), usage.get('cache_read_input_tokens', 0))
+        cost = sum((count or 0) * price for count, price in zip(tokens, prices)) / 1_000_000
+        return cost * cls.BATCH_DISCOUNT if batch else cost
+
+    def check_budget(self):
+        """予算を使い切っている場合はUsageBudgetExceededを送出"""
+        with self._lock:
+            tokens, cost = self._totals['tokens'], self._totals['cost_usd']
+        if self.max_tokens and tokens >= self.max_tokens:
+            raise UsageBudgetExceeded(
+                f"トークン予算を超えました: {tokens:,} / {self.max_tokens:,}トークン")
+        if self.max_cost_usd and cost >= self.max_cost_usd:
+            raise UsageBudgetExceeded(
+                f"コスト予算を超えました: ${cost:.2f} / ${self.max_cost_usd:.2f}")
+
+    def record(self,
+               operation: str,
+               provider: str,
+               model: str,
+               usage: Optional[Dict[str, Any]],
+               latency_seconds: float,
+               article_type: Optional[str] = None,
+               error: Optional[str] = None,
+               batch: bool = False,
+               tool_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        1回のAI呼び出しを記録
+
+        Args:
+            operation: 呼び出した処理（generate_article, refine_content など）
+            provider: プロバイダー名
+            model: モデル名
+            usage: トークン使用量（{'response_cache_hit': True} はレスポンスキャッシュから返した場合）
+            latency_seconds: 呼び出しにかかった秒数
+            article_type: 記事タイプ（省略時は usage_context のラベル）
+            error: 失敗した場合のエラー
+            batch: Message Batches APIで生成したか
+            tool_name: ツール名（省略時は usage_context のラベル）
+
+        Returns:
+            保存したレコード
+        """
+        usage = usage or {}
+        labels = _usage_labels.get()
+        now = datetime.now()
+        record = {
+            'created_at': now.isoformat(),
+            'day': now.strftime('%Y-%m-%d'),
+            'run_id': self.run_id,
+            'operation': operation,
+            'provider': provider,
+            'model': model,
+            'article_type': article_type or labels.get('article_type'),
+            'tool_name': tool_name or labels.get('tool_name'),
+            'input_tokens': usage.get('input_tokens', 0) or 0,
+            'output_tokens': usage.get('output_tokens', 0) or 0,
+            'cache_creation_input_tokens': usage.get('cache_creation_input_tokens', 0) or 0,
+            'cache_read_input_tokens': usage.get('cache_read_input_tokens', 0) or 0,
+            'latency_seconds': round(latency_seconds, 3),
+            'retries': labels.get('retries', 0),
+            'cost_usd': self.estimate_cost(model, usage, batch),
+            'response_cache_hit': int(bool(usage.get('response_cache_hit'))),
+            'status': 'error' if error else 'ok',
+            'error': error
+        }
+        tokens = (record['input_tokens'] + record['output_tokens']
+                  + record['cache_creation_input_tokens'] + record['cache_read_input_tokens'])
+
+        with self._lock:
+            self._totals['calls'] += 1
+            self._totals['tokens'] += tokens
+            self._totals['cost_usd'] += record['cost_usd']
+        try:
+            self.store.add(record)
+        except sqlite3.Error as e:
+            logger.warning(f"使用量の保存エラー: {e}")
+        return record
+
+    def get_run_totals(self) -> Dict[str, Any]:
+        """この実行での呼び出し数・トークン数・コストの合計"""
+        with self._lock:
+            totals = dict(self._totals)
+        totals['cost_usd'] = round(totals['cost_usd'], 4)
+        totals['run_id'] = self.run_id
+        return totals
+
+
+def main():
+    """メイン関数"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='AI呼び出しのトークン使用量・コストを集計')
+    parser.add_argument('--by', default='day', choices=UsageStore.GROUP_COLUMNS,
+                        help='集計キー デフォルト: day')
+    parser.add_argument('--since', help='この日付（YYYY-MM-DD）以降を集計')
+    parser.add_argument('--db', default='data/ai_usage.sqlite3', help='使用量データベースのパス')
+    args = parser.parse_args()
+
+    store = UsageStore(args.db)
+    rows = store.rollup(args.by, args.since)
+    store.close()
+    if not rows:
+        print("使用量の記録がありません")
+        return
+
+    print(f"{args.by:<24} {'呼出':>6} {'失敗':>5} {'入力':>10} {'出力':>10} "
+          f"{'Cache書込':>10} {'Cache読込':>10} {'コスト($)':>10} {'平均遅延':>8}")
+    for row in rows:
+        print(f"{str(row['key']):<24} {row['calls']:>6} {row['errors']:>5} "
+              f"{row['input_tokens']:>10,} {row['output_tokens']:>10,} "
+              f"{row['cache_creation_input_tokens']:>10,} {row['cache_read_input_tokens']:>10,} "
+              f"{row['cost_usd']:>10.4f} {row['avg_latency_seconds']:>7.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,14 @@ Article Enhancer for AI Melody Kobo
 """
 
 import re
+import asyncio
+import hashlib
 import logging
+import threading
 from typing import Dict, List, Optional
 from src.media.stock_images import StockImageManager
 from src.wordpress.api_client import WordPressClient
+from src.wordpress.async_client import AsyncWordPressClient
 
 logger = logging.getLogger(__name__)
 
@@ -15,10 +19,18 @@ logger = logging.getLogger(__name__)
 class ArticleEnhancer:
     """記事を強化するクラス"""
     
-    def __init__(self):
-        """エンハンサーの初期化"""
+    def __init__(self, wp_client: Optional[WordPressClient] = None):
+        """
+        エンハンサーの初期化
+        
+        Args:
+            wp_client: 画像のアップロードに使うクライアント（省略時は新規作成）
+        """
         self.image_manager = StockImageManager()
-        self.wp_client = WordPressClient()
+        self.wp_client = wp_client or WordPressClient()
+        # 同じURLの画像を複数のスレッドから同時にダウンロード・アップロードしないためのロック
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._url_locks_lock = threading.Lock()
     
     def enhance_article_with_images(self, 
                                   markdown_content: str,
@@ -43,42 +55,10 @@ class ArticleEnhancer:
         images = self.image_manager.get_multiple_images(topics, count=len(placeholders))
         
         # 画像をWordPressにアップロード
-        uploaded_images = []
-        for i, image_data in enumerate(images):
-            try:
-                # 画像をダウンロード
-                local_path = self.image_manager.download_image(
-                    image_data['url'],
-                    filename=f"article_image_{i+1}.jpg"
-                )
-                
-                # WordPressにアップロード
-                with open(local_path, 'rb') as f:
-                    media_result = self.wp_client.upload_media(
-                        file_data=f.read(),
-                        filename=f"ai_music_{i+1}.jpg",
-                        title=image_data['alt'],
-                        alt_text=image_data['alt'],
-                        mime_type='image/jpeg'
-                    )
-                
-                uploaded_images.append({
-                    'url': media_result['source_url'],
-                    'id': media_result['id'],
-                    'alt': image_data['alt'],
-                    'description': image_data['description']
-                })
-                
-                logger.info(f"Uploaded image {i+1}: ID {media_result['id']}")
-                
-            except Exception as e:
-                logger.error(f"Failed to upload image {i+1}: {str(e)}")
-                # フォールバック: 元のURLを使用
-                uploaded_images.append({
-                    'url': image_data['url'],
-                    'alt': image_data['alt'],
-                    'description': image_data['description']
-                })
+        uploaded_images = [
+            self._upload_stock_image(i, image_data)
+            for i, image_data in enumerate(images)
+        ]
         
         # Markdownの画像プレースホルダーを実際の画像に置換
         enhanced_content = self._replace_placeholders(markdown_content, uploaded_images)
@@ -89,6 +69,134 @@ class ArticleEnhancer:
             'image_count': len(uploaded_images)
         }
     
+    async def enhance_article_with_images_async(self,
+                                                markdown_content: str,
+                                                title: str,
+                                                keywords: List[str] = None,
+                                                wp_client: Optional[AsyncWordPressClient] = None) -> Dict[str, any]:
+        """
+        記事に画像を追加して強化（画像のダウンロード・アップロードを並行実行）
+        
+        Args:
+            markdown_content: 元のMarkdown記事
+            title: 記事タイトル
+            keywords: キーワードリスト
+            wp_client: 同時実行数の上限を共有する非同期クライアント（self.wp_clientをラップしたもの。
+                       省略時は作成して閉じる）
+            
+        Returns:
+            強化された記事データ（画像の順序は同期版と同じ）
+        """
+        placeholders = self._find_image_placeholders(markdown_content)
+        if not placeholders:
+            return {'content': markdown_content, 'images': [], 'image_count': 0}
+        
+        topics = self._extract_topics_from_content(markdown_content, title)
+        images = self.image_manager.get_multiple_images(topics, count=len(placeholders))
+        
+        # 同じURLの画像は1回だけアップロードする
+        first_index: Dict[str, int] = {}
+        for i, image_data in enumerate(images):
+            first_index.setdefault(image_data['url'], i)
+        
+        async_client = wp_client or AsyncWordPressClient(client=self.wp_client)
+        try:
+            uploaded = await asyncio.gather(*(
+                async_client.run(self._upload_stock_image, i, images[i])
+                for i in first_index.values()
+            ))
+        finally:
+            if wp_client is None:
+                await async_client.close()
+        
+        uploaded_by_url = dict(zip(first_index, uploaded))
+        uploaded_images = [
+            {**uploaded_by_url[image_data['url']],
+             'alt': image_data['alt'], 'description': image_data['description']}
+            for image_data in images
+        ]
+        # _replace_placeholdersはリストから取り出して使うためコピーを渡す
+        enhanced_content = self._replace_placeholders(markdown_content, list(uploaded_images))
+        
+        return {
+            'content': enhanced_content,
+            'images': uploaded_images,
+            'image_count': len(uploaded_images)
+        }
+    
+    def _upload_stock_image(self, index: int, image_data: Dict) -> Dict:
+        """ストック画像をダウンロードしてWordPressにアップロード"""
+        try:
+            # 画像をWordPressにアップロード（アップロード済みなら再利用）
+            media_result = self._upload_image_from_url(
+                image_data['url'],
+                filename=f"ai_music_{index+1}.jpg",
+                alt_text=image_data['alt']
+            )
+            
+            logger.info(f"Uploaded image {index+1}: ID {media_result['id']}")
+            return self._uploaded_image_entry(image_data, media_result)
+            
+        except Exception as e:
+            logger.error(f"Failed to upload image {index+1}: {str(e)}")
+            return self._uploaded_image_entry(image_data)
+    
+    def _upload_image_from_url(self, url: str, filename: str, alt_text: str) -> Dict:
+        """
+        画像URLをWordPressのメディアに変換
+        
+        同じURL・同じ内容の画像をアップロード済みの場合は、ダウンロードも
+        アップロードも行わず既存の添付ファイルを返す。
+        """
+        registry = self.wp_client.media_registry
+        # 並行実行時も同じURLのダウンロード（同じキャッシュファイル）とアップロードは1回にする
+        with self._url_lock(url):
+            existing = registry.get_by_url(url)
+            if existing and not self.wp_client.media_exists(existing['id']):
+                logger.info(f"アップロード済みの画像が削除されているため再アップロード: ID {existing['id']}")
+                registry.forget_media_id(existing['id'])
+                existing = None
+            if existing:
+                logger.info(f"アップロード済みの画像を再利用: ID {existing['id']}")
+                return existing
+            
+            local_path = self.image_manager.download_image(url, filename=self._cache_filename(url))
+            media_result = self.wp_client.upload_media(
+                file_path=local_path,
+                filename=filename,
+                title=alt_text,
+                alt_text=alt_text,
+                mime_type='image/jpeg'
+            )
+            registry.link_url(url, media_result['sha256'])
+            return media_result
+    
+    def _url_lock(self, url: str) -> threading.Lock:
+        """URLごとのロックを取得"""
+        with self._url_locks_lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+    
+    @staticmethod
+    def _cache_filename(url: str) -> str:
+        """URLごとに一意なローカルキャッシュのファイル名"""
+        return f"stock_{hashlib.md5(url.encode()).hexdigest()[:16]}.jpg"
+    
+    def _uploaded_image_entry(self, image_data: Dict,
+                              media_result: Optional[Dict] = None) -> Dict:
+        """アップロード結果を画像エントリに変換（失敗時は元のURLを使用）"""
+        if media_result is None:
+            return {
+                'url': image_data['url'],
+                'alt': image_data['alt'],
+                'description': image_data['description']
+            }
+        return {
+            'url': media_result['source_url'],
+            'id': media_result['id'],
+            'alt': image_data['alt'],
+            'description': image_data['description']
+        }
+    
     def _find_image_placeholders(self, content: str) -> List[str]:
         """画像プレースホルダーを検索"""
         # Markdownの画像記法を探す
@@ -168,22 +276,13 @@ class ArticleEnhancer:
         offset = 0
         for i, section_data in enumerate(reversed(section_images)):  # 後ろから処理
             try:
-                # 画像をダウンロード
-                local_path = self.image_manager.download_image(
+                # 画像をWordPressにアップロード（アップロード済みなら再利用）
+                media_result = self._upload_image_from_url(
                     section_data['image']['url'],
-                    filename=f"section_image_{i+1}.jpg"
+                    filename=f"section_{i+1}.jpg",
+                    alt_text=section_data['image']['alt']
                 )
                 
-                # WordPressにアップロード
-                with open(local_path, 'rb') as f:
-                    media_result = self.wp_client.upload_media(
-                        file_data=f.read(),
-                        filename=f"section_{i+1}.jpg",
-                        title=section_data['image']['alt'],
-                        alt_text=section_data['image']['alt'],
-                        mime_type='image/jpeg'
-                    )
-                
                 # 記事に画像を挿入（説明文なし、画像サイズ指定）
                 image_markdown = f"\n\n<img src=\"{media_result['source_url']}\" alt=\"{section_data['image']['alt']}\" style=\"max-width: 100%; height: auto; display: block; margin: 20px auto;\">\n\n"
                 
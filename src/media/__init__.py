@@ -2,12 +2,28 @@
 メディア生成モジュール
 """
 
-from .image_generator import ThumbnailGenerator
-from .modern_thumbnail_generator import ModernThumbnailGenerator
-from .stock_images import StockImageManager
-
-__all__ = [
-    'ThumbnailGenerator',
-    'ModernThumbnailGenerator',
-    'StockImageManager'
-]
\ No newline at end of file
+import importlib
+
+# 公開クラス → 定義しているサブモジュール
+# サブモジュールは最初に使われたときに読み込む（PIL・requestsの読み込みを遅らせるため）
+_EXPORTS = {
+    'ThumbnailGenerator': '.image_generator',
+    'ModernThumbnailGenerator': '.modern_thumbnail_generator',
+    'StockImageManager': '.stock_images',
+    'FontRegistry': '.fonts',
+    'render_many': '.batch_render'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
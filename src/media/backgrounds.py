@@ -0,0 +1,87 @@
+"""
+Background Fields
+AI Melody Kobo - サムネイル・記事内画像の背景（グラデーション・ノイズ）を生成
+
+グラデーションは1ピクセルずつ・1行ずつ描画せず、Pillowが持つ0〜255の
+グラデーション画像（C実装）から必要な範囲だけを拡大し、ImageOps.colorize で
+2色の間の色に割り当てて一度に作成する。円形は1/4だけ作成して反転コピーし、
+縦方向は1列だけ作成して横に引き伸ばす。
+"""
+
+import math
+import random
+from typing import Tuple
+from PIL import Image, ImageOps
+
+RGB = Tuple[int, int, int]
+
+
+def linear_gradient(size: Tuple[int, int], top: RGB, bottom: RGB) -> Image.Image:
+    """
+    上端の色から下端の色へ変化する縦方向のグラデーション
+
+    Args:
+        size: 画像サイズ (幅, 高さ)
+        top: 上端の色
+        bottom: 下端の色
+    """
+    width, height = size
+    column = Image.linear_gradient('L').resize((1, height), Image.BILINEAR)
+    return ImageOps.colorize(column, top, bottom).resize(size, Image.NEAREST)
+
+
+def radial_gradient(size: Tuple[int, int], inner: RGB, outer: RGB) -> Image.Image:
+    """
+    中心の色から四隅の色へ変化する円形のグラデーション
+
+    中心から四隅までの距離を半径とする。
+
+    Args:
+        size: 画像サイズ (幅, 高さ)
+        inner: 中心の色
+        outer: 四隅の色
+    """
+    width, height = size
+    quarter_width, quarter_height = math.ceil(width / 2), math.ceil(height / 2)
+    # radial_gradientは256x256で、中心(128, 128)から半径128に向かって0〜255になる
+    scale = 128 / math.hypot(width / 2, height / 2)
+    field = Image.radial_gradient('L').resize(
+        (quarter_width, quarter_height), Image.BILINEAR,
+        box=(128, 128, 128 + quarter_width * scale, 128 + quarter_height * scale))
+    quarter = ImageOps.colorize(field, inner, outer)
+
+    # 右下の1/4を反転して残りの3つを埋める
+    image = Image.new('RGB', size)
+    lower = quarter.transpose(Image.FLIP_LEFT_RIGHT)
+    image.paste(quarter, (width - quarter_width, height - quarter_height))
+    image.paste(lower, (0, height - quarter_height))
+    image.paste(quarter.transpose(Image.FLIP_TOP_BOTTOM), (width - quarter_width, 0))
+    image.paste(lower.transpose(Image.FLIP_TOP_BOTTOM), (0, 0))
+    return image
+
+
+def add_speckle_noise(image: Image.Image, rng: random.Random, alpha: float = 0.1,
+                      count: int = 1000, max_brightness: int = 30) -> Image.Image:
+    """
+    黒地にランダムな明るさの点を散らしたノイズを重ねる
+
+    Image.blend(image, noise, alpha) と同じ結果を、全面の合成をせずに
+    全体を (1 - alpha) 倍してから点の位置だけ明るくして作る。
+
+    Args:
+        image: RGBの背景
+        rng: 点の位置と明るさを決める乱数生成器
+        alpha: ノイズの割合
+        count: 点の数
+        max_brightness: 点の明るさの上限
+    """
+    width, height = image.size
+    result = image.point([int(value * (1 - alpha)) for value in range(256)] * 3)
+    pixels = result.load()
+    original = image.load()
+    for _ in range(count):
+        x = rng.randint(0, width - 1)
+        y = rng.randint(0, height - 1)
+        brightness = rng.randint(0, max_brightness) * alpha
+        pixels[x, y] = tuple(int(value * (1 - alpha) + brightness) for value in original[x, y])
+    return result
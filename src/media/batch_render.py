@@ -0,0 +1,139 @@
+"""
+Batch Image Rendering
+AI Melody Kobo - サムネイル・記事内画像をプロセスプールで並列に生成
+
+Pillowの描画はCPUを使い、ほとんどの間GILを保持するため、スレッドでは並列にならない。
+描画指定（辞書）をワーカープロセスに渡して生成し、画像データを指定と同じ順に返す。
+
+描画指定:
+    サムネイル:
+        {'kind': 'thumbnail', 'title': ..., 'article_type': 'general',
+         'tool_name': None, 'keywords': [...], 'theme_override': None}
+    記事内画像:
+        {'kind': 'content', 'description': ..., 'style': 'modern', 'article_context': None}
+"""
+
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# ワーカーで最初に読み込んでおくフォント（役割, サイズ）
+WARMUP_FONTS = [
+    ('bold', 52), ('latin', 20), ('latin', 12),   # ModernThumbnailGenerator
+    ('regular', 16),                              # ContentImageGenerator
+]
+
+# ワーカープロセス内の生成器（_init_worker で作成）
+_generators: Dict[str, Any] = {}
+
+
+def thumbnail_spec(title: str, article_type: str = 'general', tool_name: Optional[str] = None,
+                   keywords: Optional[List[str]] = None,
+                   theme_override: Optional[str] = None) -> Dict[str, Any]:
+    """サムネイルの描画指定（ModernThumbnailGenerator.generate_thumbnail の引数）"""
+    return {
+        'kind': 'thumbnail',
+        'title': title,
+        'article_type': article_type,
+        'tool_name': tool_name,
+        'keywords': list(keywords or []),
+        'theme_override': theme_override
+    }
+
+
+def content_image_spec(description: str, style: str = 'modern',
+                       article_context: Optional[str] = None) -> Dict[str, Any]:
+    """記事内画像の描画指定（ContentImageGenerator.generate_content_image の引数）"""
+    return {
+        'kind': 'content',
+        'description': description,
+        'style': style,
+        'article_context': article_context
+    }
+
+
+def _init_worker(seed: Optional[int], assets_dir: Optional[str]):
+    """ワーカープロセスの初期化（生成器の作成とフォントの読み込み）"""
+    from .fonts import FontRegistry
+    from .modern_thumbnail_generator import ModernThumbnailGenerator
+    from .content_image_generator import ContentImageGenerator
+
+    _generators['thumbnail'] = ModernThumbnailGenerator(assets_dir=assets_dir, seed=seed)
+    _generators['content'] = ContentImageGenerator()
+
+    fonts = FontRegistry.shared()
+    for face, size in WARMUP_FONTS:
+        fonts.get(face, size)
+
+
+def _render(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """描画指定から画像を生成（エラーは結果に含めて返す）"""
+    started = time.perf_counter()
+    try:
+        params = {key: value for key, value in spec.items() if key != 'kind'}
+        if spec['kind'] == 'thumbnail':
+            data = _generators['thumbnail'].generate_thumbnail(**params)
+        elif spec['kind'] == 'content':
+            data = _generators['content'].generate_content_image(**params)
+        else:
+            raise ValueError(f"不明な描画指定です: {spec['kind']}")
+        error = None
+    except Exception as e:
+        data, error = None, str(e)
+    return {
+        'data': data,
+        'seconds': time.perf_counter() - started,
+        'error': error
+    }
+
+
+def render_many(specs: List[Dict[str, Any]],
+                max_workers: Optional[int] = None,
+                seed: Optional[int] = None,
+                assets_dir: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    複数の画像をプロセスプールで並列に生成
+
+    Args:
+        specs: 描画指定（thumbnail_spec() / content_image_spec() で作成）
+        max_workers: ワーカープロセス数（省略時は環境変数RENDER_WORKERS、既定はCPU数）
+        seed: サムネイルの乱数シード（ModernThumbnailGenerator と同じ。省略時はGENERATION_SEED）
+        assets_dir: サムネイル生成器のアセットディレクトリ
+
+    Returns:
+        specsと同じ順の結果 {'data': 画像データ（失敗時None）, 'seconds': 生成時間, 'error': エラー内容}
+    """
+    if not specs:
+        return []
+
+    if max_workers is None:
+        max_workers = int(os.getenv('RENDER_WORKERS', '0')) or os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(specs)))
+
+    started = time.perf_counter()
+    if max_workers == 1:
+        # 1枚・1ワーカーの場合はプロセスを起動せずにこのプロセスで生成する
+        _init_worker(seed, assets_dir)
+        results = [_render(spec) for spec in specs]
+    else:
+        # AIクライアント等のスレッドを持つプロセスからforkしないようspawnで起動する
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(seed, assets_dir)) as executor:
+            results = list(executor.map(_render, specs))
+
+    elapsed = time.perf_counter() - started
+    failed = sum(1 for result in results if result['error'])
+    logger.info(f"画像生成: {len(specs)}枚 / {elapsed:.1f}秒 "
+                f"(ワーカー{max_workers}, 1枚あたり平均"
+                f"{sum(result['seconds'] for result in results) / len(results):.2f}秒"
+                f"{f', 失敗{failed}枚' if failed else ''})")
+    for spec, result in zip(specs, results):
+        if result['error']:
+            logger.warning(f"画像生成エラー ({spec['kind']}): {result['error']}")
+    return results
@@ -6,11 +6,14 @@ Content Image Generator for AI Melody Kobo
 import os
 import logging
 from typing import Dict, Optional, Tuple
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+from PIL import Image, ImageDraw, ImageFilter
 import io
 from pathlib import Path
 import random
 
+from .backgrounds import linear_gradient
+from .fonts import FontRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +22,8 @@ class ContentImageGenerator:
     
     def __init__(self):
         """画像生成器の初期化"""
+        self.fonts = FontRegistry.shared()
+        
         # デフォルトの画像サイズ
         self.default_size = (800, 450)  # 16:9比率
         
@@ -97,21 +102,10 @@ class ContentImageGenerator:
     
     def _add_gradient_background(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict):
         """グラデーション背景を追加"""
-        width, height = img.size
-        
-        # 縦方向のグラデーション
-        for y in range(height):
-            ratio = y / height
-            # 背景色を少し明るくする
-            r = int(int(colors['background'][1:3], 16) * (1 + ratio * 0.3))
-            g = int(int(colors['background'][3:5], 16) * (1 + ratio * 0.3))
-            b = int(int(colors['background'][5:7], 16) * (1 + ratio * 0.3))
-            
-            r = min(255, r)
-            g = min(255, g)
-            b = min(255, b)
-            
-            draw.line([(0, y), (width, y)], fill=(r, g, b))
+        # 縦方向のグラデーション（背景色から少し明るくする）
+        top = tuple(int(colors['background'][i:i + 2], 16) for i in (1, 3, 5))
+        bottom = tuple(min(255, int(c * 1.3)) for c in top)
+        img.paste(linear_gradient(img.size, top, bottom), (0, 0))
     
     def _draw_interface_mockup(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict):
         """インターフェースモックアップを描画"""
@@ -263,11 +257,8 @@ class ContentImageGenerator:
         """説明テキストを追加"""
         width, height = img.size
         
-        # フォント設定
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 16)
-        except:
-            font = ImageFont.load_default()
+        # フォント設定（説明文は日本語）
+        font = self.fonts.get(FontRegistry.REGULAR, 16)
         
         # テキストボックスの背景
         text_height = 40
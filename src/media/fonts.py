@@ -0,0 +1,218 @@
+"""
+Font Registry
+AI Melody Kobo - 画像生成で使うフォントの検索と読み込み済みフォントのキャッシュ
+
+フォントは役割（日本語本文・日本語太字・欧文）ごとに候補のファイル名を優先順に持ち、
+macOSのシステムフォント、Linuxのフォントディレクトリ（Noto CJK・IPA・Takao等）、
+assets/fonts、環境変数FONT_DIRSのディレクトリから最初に見つかったものを使う。
+検索はプロセスで1回だけ行い、(役割, サイズ) ごとに読み込んだフォントを再利用する。
+"""
+
+import os
+import shutil
+import subprocess
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from PIL import ImageFont
+
+logger = logging.getLogger(__name__)
+
+# フォントを探すディレクトリ（FONT_DIRS・assets/fonts の後に探す）
+SYSTEM_FONT_DIRS = [
+    '/System/Library/Fonts',
+    '/Library/Fonts',
+    '/usr/share/fonts',
+    '/usr/local/share/fonts',
+    '~/.local/share/fonts',
+    '~/.fonts',
+    'C:/Windows/Fonts',
+]
+
+
+class FontRegistry:
+    """
+    役割ごとのフォントの検索と、(役割, サイズ) ごとのフォントのキャッシュ
+
+    使用例:
+        fonts = FontRegistry.shared()
+        title_font = fonts.get(FontRegistry.BOLD, 52)
+    """
+
+    # 役割
+    REGULAR = 'regular'  # 日本語を含むテキスト
+    BOLD = 'bold'        # 日本語を含む見出し・タイトル
+    LATIN = 'latin'      # 英数字のみのラベル・タグ
+
+    # 役割ごとの候補（優先順のファイル名。ディレクトリ内を大文字小文字を区別せずに探す）
+    CANDIDATES: Dict[str, List[str]] = {
+        BOLD: [
+            'ヒラギノ角ゴシック W6.ttc',
+            'NotoSansCJK-Bold.ttc',
+            'NotoSansCJKjp-Bold.otf',
+            'NotoSansJP-Bold.otf',
+            'NotoSansJP-Bold.ttf',
+            'SourceHanSans-Bold.ttc',
+            'SourceHanSansJP-Bold.otf',
+            'YuGothB.ttc',
+        ],
+        REGULAR: [
+            'ヒラギノ角ゴシック W3.ttc',
+            'NotoSansCJK-Regular.ttc',
+            'NotoSansCJKjp-Regular.otf',
+            'NotoSansJP-Regular.otf',
+            'NotoSansJP-Regular.ttf',
+            'SourceHanSans-Regular.ttc',
+            'SourceHanSansJP-Regular.otf',
+            'ipaexg.ttf',
+            'ipag.ttf',
+            'TakaoPGothic.ttf',
+            'VL-PGothic-Regular.ttf',
+            'fonts-japanese-gothic.ttf',
+            'YuGothR.ttc',
+            'meiryo.ttc',
+            'DroidSansFallbackFull.ttf',
+        ],
+        LATIN: [
+            'Helvetica.ttc',
+            'Arial.ttc',
+            'DejaVuSans.ttf',
+            'LiberationSans-Regular.ttf',
+            'arial.ttf',
+        ],
+    }
+
+    # 候補が見つからない場合に代わりに使う役割（優先順。日本語フォントは欧文も描画できる）
+    FALLBACKS: Dict[str, List[str]] = {
+        BOLD: [REGULAR, LATIN],
+        REGULAR: [LATIN],
+        LATIN: [REGULAR],
+    }
+
+    _shared: Optional['FontRegistry'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, font_dirs: Optional[List[str]] = None, max_cached: int = 64):
+        """
+        Args:
+            font_dirs: 先に探すディレクトリ（省略時は環境変数FONT_DIRS（os.pathsep区切り）と assets/fonts）
+            max_cached: キャッシュする (役割, サイズ) の数
+        """
+        if font_dirs is None:
+            font_dirs = [d for d in os.getenv('FONT_DIRS', '').split(os.pathsep) if d]
+            font_dirs.append('assets/fonts')
+        self.font_dirs = list(font_dirs) + SYSTEM_FONT_DIRS
+        self.max_cached = max_cached
+        self._paths: Optional[Dict[str, Optional[str]]] = None
+        self._fonts: 'OrderedDict[Tuple[str, int], ImageFont.ImageFont]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> 'FontRegistry':
+        """プロセス共有のレジストリを取得"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _scan(self) -> Dict[str, str]:
+        """フォントディレクトリ内のフォントファイル（正規化したファイル名 → パス、先に見つかったもの優先）"""
+        files: Dict[str, str] = {}
+        for font_dir in self.font_dirs:
+            root = Path(font_dir).expanduser()
+            if not root.is_dir():
+                continue
+            for dirpath, _, filenames in os.walk(root):
+                for filename in filenames:
+                    if filename.lower().endswith(('.ttf', '.ttc', '.otf')):
+                        files.setdefault(self._normalize(filename), os.path.join(dirpath, filename))
+        return files
+
+    @staticmethod
+    def _normalize(filename: str) -> str:
+        # macOSのファイル名は濁点が分解された形（NFD）で返ることがある
+        return unicodedata.normalize('NFC', filename).lower()
+
+    def resolve(self) -> Dict[str, Optional[str]]:
+        """役割 → フォントファイルのパス（見つからない役割はNone）。検索は初回のみ行う"""
+        with self._lock:
+            if self._paths is not None:
+                return self._paths
+
+            files = self._scan()
+            found = {
+                face: next((files[self._normalize(name)] for name in names
+                            if self._normalize(name) in files), None)
+                for face, names in self.CANDIDATES.items()
+            }
+            if found[self.REGULAR] is None:
+                # 候補にないフォントでも、fontconfigが日本語対応と判断したものを使う
+                found[self.REGULAR] = self._fontconfig_lookup(':lang=ja')
+
+            paths: Dict[str, Optional[str]] = {}
+            for face, path in found.items():
+                if path:
+                    logger.info(f"フォント({face}): {path}")
+                else:
+                    path = next((found[other] for other in self.FALLBACKS[face] if found[other]), None)
+                    logger.warning(f"フォント({face})が見つかりません。"
+                                   f"{path or 'デフォルトフォント'}を使用します")
+                paths[face] = path
+            self._paths = paths
+            return paths
+
+    @staticmethod
+    def _fontconfig_lookup(pattern: str) -> Optional[str]:
+        """fc-listでパターンに合うフォントファイルを1つ探す（fontconfigがない環境ではNone）"""
+        if not shutil.which('fc-list'):
+            return None
+        try:
+            result = subprocess.run(['fc-list', pattern, 'file'], capture_output=True,
+                                    text=True, timeout=10)
+        except (OSError, subprocess.SubprocessError):
+            return None
+        files = sorted(line.strip().rstrip(':') for line in result.stdout.splitlines() if line.strip())
+        return files[0] if files else None
+
+    def get(self, face: str, size: int) -> ImageFont.ImageFont:
+        """
+        役割とサイズに合うフォントを取得
+
+        Args:
+            face: 役割（REGULAR / BOLD / LATIN）
+            size: フォントサイズ（px）
+        """
+        key = (face, size)
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self._fonts.move_to_end(key)
+                return font
+
+        path = self.resolve()[face]
+        font = None
+        if path:
+            try:
+                font = ImageFont.truetype(path, size)
+            except OSError as e:
+                logger.warning(f"フォント読み込み失敗: {path}: {e}")
+        if font is None:
+            font = self._default_font(size)
+
+        with self._lock:
+            self._fonts[key] = font
+            while len(self._fonts) > self.max_cached:
+                self._fonts.popitem(last=False)
+        return font
+
+    @staticmethod
+    def _default_font(size: int) -> ImageFont.ImageFont:
+        """Pillow内蔵のフォント（サイズ指定に対応していない版では固定サイズ）"""
+        try:
+            return ImageFont.load_default(size=size)
+        except TypeError:
+            return ImageFont.load_default()
@@ -13,6 +13,10 @@ from pathlib import Path
 import hashlib
 from datetime import datetime
 
+from .backgrounds import linear_gradient
+from .fonts import FontRegistry
+from .line_breaking import JapaneseLineBreaker
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +32,8 @@ class ThumbnailGenerator:
         """
         self.assets_dir = Path(assets_dir or "assets")
         self.assets_dir.mkdir(parents=True, exist_ok=True)
+        self.fonts = FontRegistry.shared()
+        self.line_breaker = JapaneseLineBreaker.shared()
         
         # デフォルトの画像サイズ（WordPress推奨）
         # 16:9の比率が一般的
@@ -143,24 +149,11 @@ class ThumbnailGenerator:
     
     def _add_gradient_background(self, img: Image.Image, colors: Dict[str, str]):
         """グラデーション背景を追加"""
-        width, height = img.size
-        
-        # グラデーションを作成
-        gradient = Image.new('RGB', (width, height))
-        draw = ImageDraw.Draw(gradient)
-        
-        # 縦方向のグラデーション
-        for y in range(height):
-            # 背景色から primary color への遷移
-            ratio = y / height
-            r1, g1, b1 = self._hex_to_rgb(colors['background'])
-            r2, g2, b2 = self._hex_to_rgb(colors['primary'])
-            
-            r = int(r1 + (r2 - r1) * ratio * 0.3)  # 30%の強度
-            g = int(g1 + (g2 - g1) * ratio * 0.3)
-            b = int(b1 + (b2 - b1) * ratio * 0.3)
-            
-            draw.line([(0, y), (width, y)], fill=(r, g, b))
+        # 縦方向のグラデーション（背景色から primary color へ30%の強度で遷移）
+        r1, g1, b1 = self._hex_to_rgb(colors['background'])
+        r2, g2, b2 = self._hex_to_rgb(colors['primary'])
+        bottom = (int(r1 + (r2 - r1) * 0.3), int(g1 + (g2 - g1) * 0.3), int(b1 + (b2 - b1) * 0.3))
+        gradient = linear_gradient(img.size, (r1, g1, b1), bottom)
         
         # 元の画像に合成
         img.paste(gradient, (0, 0))
@@ -217,18 +210,10 @@ class ThumbnailGenerator:
         """テキストを追加"""
         width, height = img.size
         
-        # フォントの設定（システムフォントを使用）
-        try:
-            # 日本語フォントを優先
-            # フォントサイズを調整
-            date_font = ImageFont.truetype("/System/Library/Fonts/ヒラギノ角ゴシック W3.ttc", 32)
-            title_font = ImageFont.truetype("/System/Library/Fonts/ヒラギノ角ゴシック W6.ttc", 48)
-            blog_font = ImageFont.truetype("/System/Library/Fonts/ヒラギノ角ゴシック W3.ttc", 24)
-        except:
-            # フォールバック
-            date_font = ImageFont.load_default()
-            title_font = ImageFont.load_default()
-            blog_font = ImageFont.load_default()
+        # フォントの設定（日本語フォントを優先）
+        date_font = self.fonts.get(FontRegistry.REGULAR, 32)
+        title_font = self.fonts.get(FontRegistry.BOLD, 48)
+        blog_font = self.fonts.get(FontRegistry.REGULAR, 24)
         
         # 日時を抽出（タイトルから【】内の日時を取得）
         import re
@@ -305,107 +290,14 @@ class ThumbnailGenerator:
         width, height = img.size
         
         # AI Melody Kobo のロゴテキスト
-        try:
-            brand_font = ImageFont.truetype("/System/Library/Fonts/ヒラギノ角ゴシック W3.ttc", 20)
-        except:
-            brand_font = ImageFont.load_default()
+        brand_font = self.fonts.get(FontRegistry.REGULAR, 20)
         
         brand_text = "AI Melody Kobo"
         draw.text((width - 200, height - 40), brand_text, font=brand_font, fill=colors['text'])
     
     def _wrap_text(self, text: str, font: ImageFont, max_width: int) -> list:
-        """テキストを折り返し（日本語対応・自然な改行）"""
-        lines = []
-        
-        # まず句読点、助詞、記号で区切れる位置を探す
-        import re
-        
-        # 改行候補となる区切り文字
-        delimiters = ['：', '、', '。', '！', '？', 'ー', '・', '／', '（', '）', '「', '」', ' ']
-        
-        # 助詞での区切り（後に続く文字がある場合のみ）
-        particles = ['の', 'を', 'に', 'で', 'と', 'は', 'が', 'から', 'まで', 'より']
-        
-        # タイトルが短い場合はそのまま返す
-        bbox = font.getbbox(text)
-        if bbox[2] - bbox[0] <= max_width:
-            return [text]
-        
-        # 単語や句で分割を試みる
-        current_line = ""
-        i = 0
-        
-        while i < len(text):
-            char = text[i]
-            test_line = current_line + char
-            bbox = font.getbbox(test_line)
-            text_width = bbox[2] - bbox[0]
-            
-            if text_width <= max_width:
-                current_line = test_line
-                i += 1
-            else:
-                # 改行位置を探す
-                best_break = len(current_line)
-                found_break = False
-                
-                # 句読点や記号での改行を優先
-                for delimiter in delimiters:
-                    pos = current_line.rfind(delimiter)
-                    if pos > 0:
-                        best_break = pos + len(delimiter)
-                        found_break = True
-                        break
-                
-                # 句読点がない場合は助詞での改行を試みる
-                if not found_break:
-                    for particle in particles:
-                        pos = current_line.rfind(particle)
-                        # 助詞の後に文字が続く場合のみ改行
-                        if pos > 0 and pos + len(particle) < len(current_line):
-                            best_break = pos + len(particle)
-                            found_break = True
-                            break
-                
-                # それでも見つからない場合は、なるべく長い位置で改行
-                if not found_break and len(current_line) > 10:
-                    # カタカナ・ひらがなの境界を探す
-                    for j in range(len(current_line) - 1, max(0, len(current_line) - 10), -1):
-                        if (self._is_katakana(current_line[j-1]) and not self._is_katakana(current_line[j])) or \
-                           (not self._is_katakana(current_line[j-1]) and self._is_katakana(current_line[j])):
-                            best_break = j
-                            break
-                
-                # 改行を実行
-                if best_break > 0:
-                    lines.append(current_line[:best_break])
-                    current_line = current_line[best_break:]
-                else:
-                    # どうしても改行位置が見つからない場合は現在の位置で改行
-                    lines.append(current_line)
-                    current_line = char
-                    i += 1
-        
-        if current_line:
-            lines.append(current_line)
-        
-        # 最大3行に制限
-        if len(lines) > 3:
-            # 3行目を短くして「...」を追加
-            third_line = lines[2]
-            while len(third_line) > 1:
-                test_line = third_line + "..."
-                bbox = font.getbbox(test_line)
-                if bbox[2] - bbox[0] <= max_width:
-                    lines = lines[:2] + [test_line]
-                    break
-                third_line = third_line[:-1]
-        
-        return lines
-    
-    def _is_katakana(self, char: str) -> bool:
-        """カタカナかどうかを判定"""
-        return '\u30A0' <= char <= '\u30FF'
+        """テキストを折り返し（日本語対応・自然な改行、最大3行）"""
+        return list(self.line_breaker.wrap(text, font, max_width, max_lines=3))
     
     def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
         """16進数カラーをRGBに変換"""
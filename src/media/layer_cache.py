@@ -0,0 +1,204 @@
+"""
+Thumbnail Layer Cache
+AI Melody Kobo - サムネイルの背景・装飾レイヤーのキャッシュ
+
+サムネイルの背景（グラデーション・ビジュアル要素・幾何学模様・グロウ・装飾）は
+(テーマ, ビジュアルスタイル, バリエーション, シード) だけで決まるため、一度描いた
+レイヤーをメモリ（件数上限のLRU）とディスク（合計サイズ上限、最後に使われた時刻が
+古いものから削除）に保存し、以降はタイトル・タグだけを描き足す。
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+import logging
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+class LayerCache:
+    """
+    描画済みレイヤー（PIL画像）のキャッシュ
+
+    使用例:
+        cache = LayerCache.shared()
+        layer = cache.get_or_render(('neon_purple', 'sound_waves', 3), render_background)
+        img = layer.copy()  # キャッシュの画像には直接描かない
+    """
+
+    _shared: Optional['LayerCache'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self,
+                 cache_dir: Optional[str] = "data/cache/thumbnail_layers",
+                 max_cached: Optional[int] = None,
+                 max_bytes: Optional[int] = None):
+        """
+        Args:
+            cache_dir: レイヤーのPNGの保存先（Noneでディスクに保存しない）
+            max_cached: メモリに保持するレイヤーの数
+            max_bytes: ディスク上のレイヤー全体の最大サイズ（バイト）
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_cached = max_cached if max_cached is not None else int(
+            os.getenv('THUMBNAIL_LAYER_CACHE_SIZE', '24'))
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            float(os.getenv('THUMBNAIL_LAYER_CACHE_MAX_MB', '200')) * 1024 * 1024)
+
+        self._layers: 'OrderedDict[str, Image.Image]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'renders': 0, 'evictions': 0}
+
+        # ファイル名 → [サイズ, 最終使用時刻]
+        self._entries: Dict[str, list] = {}
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for path in self.cache_dir.glob('*.png'):
+                try:
+                    stat = path.stat()
+                    self._entries[path.stem] = [stat.st_size, stat.st_mtime]
+                except OSError:
+                    continue
+        self._total_bytes = sum(size for size, _ in self._entries.values())
+
+    @classmethod
+    def shared(cls) -> Optional['LayerCache']:
+        """プロセス共有のキャッシュを取得（THUMBNAIL_LAYER_CACHE=0で無効）"""
+        if os.getenv('THUMBNAIL_LAYER_CACHE', '1').lower() in ('0', 'false', 'off'):
+            return None
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def make_key(parts: Any) -> str:
+        """レイヤーを決める値（JSONに変換できる値）からキャッシュキーを生成"""
+        payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.png"
+
+    def get_or_render(self, parts: Any, render: Callable[[], Image.Image]) -> Image.Image:
+        """
+        キャッシュされたレイヤーを取得（なければ render() で描いて保存）
+
+        返す画像はキャッシュと共有しているため、描き足す場合は copy() すること。
+
+        Args:
+            parts: レイヤーを決める値（テーマ・スタイル・バリエーション・シード等）
+            render: レイヤーを描く関数
+        """
+        key = self.make_key(parts)
+        with self._lock:
+            layer = self._layers.get(key)
+            if layer is not None:
+                self._layers.move_to_end(key)
+                self._stats['memory_hits'] += 1
+                return layer
+
+        layer = self._load(key)
+        rendered = layer is None
+        if rendered:
+            layer = render()
+            self._store(key, layer)
+
+        with self._lock:
+            self._stats['renders' if rendered else 'disk_hits'] += 1
+            self._layers[key] = layer
+            while len(self._layers) > self.max_cached:
+                self._layers.popitem(last=False)
+        return layer
+
+    def _load(self, key: str) -> Optional[Image.Image]:
+        """ディスク上のレイヤーを読み込み（なければNone）"""
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        with self._lock:
+            if key not in self._entries:
+                return None
+            try:
+                with Image.open(path) as image:
+                    layer = image.copy()
+            except OSError as e:
+                logger.warning(f"レイヤーキャッシュ読み込みエラー: {e}")
+                self._remove(key)
+                return None
+
+            # 最終使用時刻を更新（サイズ超過時の削除順に使う）
+            now = time.time()
+            self._entries[key][1] = now
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+            return layer
+
+    def _store(self, key: str, layer: Image.Image):
+        """レイヤーをディスクに保存"""
+        if not self.cache_dir:
+            return
+        path = self._path(key)
+        with self._lock:
+            try:
+                # 他のプロセス（並列生成のワーカー）と同じキーを書いても壊れないよう一時ファイルから置き換える
+                tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+                # 読み込み速度を優先して圧縮は弱くする
+                layer.save(tmp_path, format='PNG', compress_level=1)
+                os.replace(tmp_path, path)
+                size = path.stat().st_size
+            except OSError as e:
+                logger.warning(f"レイヤーキャッシュ保存エラー: {e}")
+                return
+
+            if key in self._entries:
+                self._total_bytes -= self._entries[key][0]
+            self._entries[key] = [size, time.time()]
+            self._total_bytes += size
+            self._evict()
+
+    def _remove(self, key: str):
+        """ディスク上のエントリを削除（呼び出し側でロックを保持すること）"""
+        size, _ = self._entries.pop(key, (0, 0))
+        self._total_bytes -= size
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def _evict(self):
+        """合計サイズが上限以下になるまで古いエントリを削除（ロック保持中に呼ぶ）"""
+        if self._total_bytes <= self.max_bytes:
+            return
+        for key, _ in sorted(self._entries.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._remove(key)
+            self._stats['evictions'] += 1
+
+    def clear(self):
+        """メモリとディスクの全エントリを削除"""
+        with self._lock:
+            self._layers.clear()
+            for key in list(self._entries):
+                self._remove(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ヒット率などの統計を取得"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._layers)
+            stats['disk_entries'] = len(self._entries)
+            stats['size_bytes'] = self._total_bytes
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['renders']
+        stats['hit_rate'] = round((lookups - stats['renders']) / lookups, 3) if lookups else 0.0
+        return stats
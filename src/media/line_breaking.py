@@ -0,0 +1,215 @@
+"""
+Japanese Line Breaking
+AI Melody Kobo - 画像に描くタイトルの日本語折り返し
+
+1文字ずつ足して幅を測り直すのではなく、フォントごとに1文字の送り幅をキャッシュして
+累積幅から二分探索で1行に入る位置を求め、getbboxで1〜数回だけ確認する。
+改行位置は句読点・記号の後、助詞の後、カタカナ・英数字の連続の境目の順に優先し、
+タイトルごとに一度だけ表を作る。折り返し結果は (タイトル, フォント, 幅, 行数) ごとに
+キャッシュする。
+"""
+
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from PIL import ImageFont
+
+# 改行位置の優先度（大きいほど優先）
+BREAK_NONE = 0
+BREAK_RUN = 1          # カタカナ・英数字の連続とそれ以外の境目
+BREAK_PARTICLE = 2     # 助詞の後（後に文字が続く場合のみ）
+BREAK_PUNCTUATION = 3  # 句読点・記号・空白の後
+
+# この文字の後で改行できる（長音「ー」はカタカナ語の途中なので含めない）
+PUNCTUATION = set('：、。！？・／（）「」 ')
+
+# 助詞（長いものから照合する）
+PARTICLES = ('から', 'まで', 'より', 'の', 'を', 'に', 'で', 'と', 'は', 'が')
+
+# 連続の境目で改行するのは、行末からこの文字数以内で行がこの文字数より長い場合のみ
+RUN_BREAK_WINDOW = 10
+
+# 改行位置を選ぶ範囲（1行に入る文字数に対して、行をこの割合以上埋める位置から選ぶ）
+MIN_LINE_FILL = 0.5
+
+ELLIPSIS = '...'
+
+
+def _script(char: str) -> str:
+    """文字の種類（カタカナ・英数字・その他）"""
+    if '\u30A0' <= char <= '\u30FF':
+        return 'katakana'
+    if char.isascii() and char.isalnum():
+        return 'latin'
+    return 'other'
+
+
+def break_opportunities(text: str) -> List[int]:
+    """
+    各位置 i（text[i] の前）で改行する場合の優先度の表
+
+    Returns:
+        長さ len(text) + 1 のリスト（BREAK_* の値）
+    """
+    table = [BREAK_NONE] * (len(text) + 1)
+    scripts = [_script(char) for char in text]
+    for i in range(1, len(text)):
+        if scripts[i - 1] != scripts[i]:
+            table[i] = BREAK_RUN
+
+    for i in range(len(text)):
+        for particle in PARTICLES:
+            end = i + len(particle)
+            if text.startswith(particle, i) and end < len(text):
+                table[end] = max(table[end], BREAK_PARTICLE)
+                break
+
+    for i, char in enumerate(text):
+        if char in PUNCTUATION:
+            table[i + 1] = BREAK_PUNCTUATION
+    table[0] = BREAK_NONE
+    return table
+
+
+class JapaneseLineBreaker:
+    """
+    日本語タイトルの折り返しエンジン
+
+    使用例:
+        breaker = JapaneseLineBreaker.shared()
+        lines = breaker.wrap(title, font, max_width=1080, max_lines=2)
+    """
+
+    _shared: Optional['JapaneseLineBreaker'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_cached: int = 1024):
+        """
+        Args:
+            max_cached: キャッシュする折り返し結果の件数
+        """
+        self.max_cached = max_cached
+        # フォント → 文字 → 送り幅
+        self._advances: Dict[Hashable, Dict[str, float]] = {}
+        self._wrapped: 'OrderedDict[tuple, Tuple[str, ...]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> 'JapaneseLineBreaker':
+        """プロセス共有のエンジンを取得"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def _font_key(font: ImageFont.ImageFont) -> Hashable:
+        # 同じファイル・サイズのフォントは別インスタンスでも同じ幅になる
+        if getattr(font, 'path', None):
+            return (font.path, font.size, getattr(font, 'index', 0))
+        return id(font)
+
+    @staticmethod
+    def measure(text: str, font: ImageFont.ImageFont) -> int:
+        """テキストを描いたときの幅（getbboxの左端から右端まで）"""
+        bbox = font.getbbox(text)
+        return bbox[2] - bbox[0]
+
+    def _prefix_widths(self, text: str, font: ImageFont.ImageFont) -> List[float]:
+        """先頭から各位置までの送り幅の合計（長さ len(text) + 1）"""
+        advances = self._advances.setdefault(self._font_key(font), {})
+        for char in set(text) - advances.keys():
+            advances[char] = font.getlength(char)
+        return [0.0] + list(accumulate(advances[char] for char in text))
+
+    def _fit(self, text: str, start: int, limit: int, prefix: List[float],
+             font: ImageFont.ImageFont, max_width: float) -> int:
+        """text[start:end] が max_width に収まる最大の end（start < end <= limit、最低1文字）"""
+        end = bisect_right(prefix, prefix[start] + max_width, start + 1, limit + 1) - 1
+        end = max(end, start + 1)
+        # カーニング・グリフのはみ出しで送り幅の合計と描画幅は少しずれるため実測で調整する
+        while end > start + 1 and self.measure(text[start:end], font) > max_width:
+            end -= 1
+        while end < limit and self.measure(text[start:end + 1], font) <= max_width:
+            end += 1
+        return end
+
+    def wrap(self, text: str, font: ImageFont.ImageFont, max_width: int,
+             max_lines: Optional[int] = None) -> Tuple[str, ...]:
+        """
+        テキストを max_width に収まる行に分割
+
+        Args:
+            text: タイトル等のテキスト
+            font: 描画に使うフォント
+            max_width: 1行の最大幅（px）
+            max_lines: 最大行数（超える場合は最終行を「...」で切り詰める）
+        """
+        key = (text, self._font_key(font), max_width, max_lines)
+        with self._lock:
+            lines = self._wrapped.get(key)
+            if lines is not None:
+                self._wrapped.move_to_end(key)
+                return lines
+
+        lines = tuple(self._wrap(text, font, max_width, max_lines))
+
+        with self._lock:
+            self._wrapped[key] = lines
+            while len(self._wrapped) > self.max_cached:
+                self._wrapped.popitem(last=False)
+        return lines
+
+    def _wrap(self, text: str, font: ImageFont.ImageFont, max_width: int,
+              max_lines: Optional[int]) -> List[str]:
+        if not text or self.measure(text, font) <= max_width:
+            return [text] if text else []
+
+        prefix = self._prefix_widths(text, font)
+        table = break_opportunities(text)
+        lines = []
+        start = 0
+        while start < len(text):
+            end = self._fit(text, start, len(text), prefix, font, max_width)
+            if end < len(text):
+                end = self._best_break(table, start, end)
+            lines.append(text[start:end])
+            start = end
+
+        if max_lines and len(lines) > max_lines:
+            lines = lines[:max_lines - 1] + [self._truncate(lines[max_lines - 1], font, max_width)]
+        return lines
+
+    @staticmethod
+    def _best_break(table: List[int], start: int, end: int) -> int:
+        """
+        start より後、end 以前で最も優先度の高い（同じなら最も後ろの）改行位置
+
+        行が極端に短くならないよう、行を MIN_LINE_FILL 以上埋める位置から選ぶ。
+        候補がなければ end（1行に入る最大の位置）で改行する。
+        """
+        best, best_priority = end, BREAK_NONE
+        first = start + max(1, int((end - start) * MIN_LINE_FILL))
+        for i in range(first, end + 1):
+            priority = table[i]
+            if priority == BREAK_RUN and (end - start <= RUN_BREAK_WINDOW or end - i >= RUN_BREAK_WINDOW):
+                continue
+            if priority and priority >= best_priority:
+                best, best_priority = i, priority
+        return best
+
+    def _truncate(self, line: str, font: ImageFont.ImageFont, max_width: int) -> str:
+        """行の末尾を削って「...」を付け、max_width に収める"""
+        room = max_width - self.measure(ELLIPSIS, font)
+        if room <= 0 or not line:
+            return ELLIPSIS
+        prefix = self._prefix_widths(line, font)
+        end = bisect_right(prefix, room) - 1
+        while end > 0 and self.measure(line[:end] + ELLIPSIS, font) > max_width:
+            end -= 1
+        while end < len(line) and self.measure(line[:end + 1] + ELLIPSIS, font) <= max_width:
+            end += 1
+        return line[:end] + ELLIPSIS
@@ -8,27 +8,73 @@ import random
 import math
 import logging
 from typing import Dict, Optional, Tuple, List
-from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance, ImageOps
+from PIL import Image, ImageChops, ImageDraw, ImageFont, ImageFilter, ImageEnhance, ImageOps
 import io
 from pathlib import Path
 from datetime import datetime
 import colorsys
+from collections import Counter
+from functools import lru_cache
+
+from ..utils.seeding import default_seed, seeded_random
+from .backgrounds import radial_gradient, add_speckle_noise
+from .fonts import FontRegistry
+from .layer_cache import LayerCache
+from .line_breaking import JapaneseLineBreaker
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _glow_rows(radii: Tuple[int, ...]) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    グロウの円を横一列ずつに分けた (dy, 半幅w, 重ねる回数)
+
+    半径rの円に含まれるオフセットは、各 dy について dx = -w〜w（w = isqrt(r² - dy²)）。
+    同じ (dy, w) の列が複数の円に含まれる場合はその数だけ重ねる。
+    """
+    counts = Counter(
+        (dy, math.isqrt(radius * radius - dy * dy))
+        for radius in radii
+        for dy in range(-radius, radius + 1)
+    )
+    return tuple((dy, w, count) for (dy, w), count in sorted(counts.items()))
+
+
+def _shifted(image: Image.Image, dx: int, dy: int) -> Image.Image:
+    """画像を (dx, dy) だけずらす（はみ出した部分は捨て、空いた部分は0）"""
+    width, height = image.size
+    return image.crop((-dx, -dy, width - dx, height - dy))
+
+
 class ModernThumbnailGenerator:
     """モダンで近未来的なサムネイル画像を生成するクラス"""
     
-    def __init__(self, assets_dir: Optional[str] = None):
+    # タイトルのネオングロウ（同じ色を重ねる円の半径と不透明度）
+    GLOW_RADII = (8, 6, 4, 2)
+    GLOW_ALPHA = 50
+    
+    # テーマ・ビジュアルスタイルごとの背景のバリエーション数
+    BACKGROUND_VARIANTS = 8
+    # 背景の描画内容を変えたら上げる（ディスク上の古いレイヤーを使わないため）
+    BACKGROUND_LAYER_VERSION = 1
+    
+    def __init__(self, assets_dir: Optional[str] = None, seed: Optional[int] = None):
         """
         画像生成器の初期化
         
         Args:
             assets_dir: アセット（フォント、背景画像等）のディレクトリ
+            seed: テーマ・模様の乱数シード（同じシード・同じ入力で同じ画像を生成する。
+                  省略時は環境変数GENERATION_SEED、未設定なら毎回ランダム）
         """
+        self.seed = seed if seed is not None else default_seed()
         self.assets_dir = Path(assets_dir or "assets")
         self.assets_dir.mkdir(parents=True, exist_ok=True)
+        self.fonts = FontRegistry.shared()
+        self.line_breaker = JapaneseLineBreaker.shared()
+        self.layer_cache = LayerCache.shared()
+        self.png_optimize = os.getenv('THUMBNAIL_PNG_OPTIMIZE', '1').lower() not in ('0', 'false', 'off')
         
         # デフォルトの画像サイズ（WordPress推奨）
         self.default_size = (1200, 675)  # 16:9比率
@@ -126,47 +172,36 @@ class ModernThumbnailGenerator:
         Returns:
             画像データ（bytes）
         """
-        # カラーテーマを選択
-        theme = self._select_theme(article_type, tool_name, keywords, theme_override)
-        colors = self.color_themes[theme]
-        
-        # 画像を作成
-        img = Image.new('RGBA', self.default_size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        # 1. グラデーション背景
-        self._create_gradient_background(img, colors)
+        # テーマ・模様の乱数（シード指定時は同じ入力から同じ画像になる）
+        rng = seeded_random(self.seed, 'thumbnail', title, article_type, tool_name, keywords, theme_override)
         
-        # 2. 記事タイプに応じたビジュアル要素を追加
-        visual_style = self._select_visual_style(article_type)
-        self._add_visual_element(img, draw, visual_style, colors)
-        
-        # 3. ネオン効果のある幾何学模様
-        self._add_geometric_patterns(img, draw, colors)
-        
-        # 4. グロウ効果
-        img = self._add_glow_effect(img, colors)
+        # カラーテーマ・ビジュアルスタイル・背景のバリエーションを選択
+        theme = self._select_theme(article_type, tool_name, keywords, theme_override, rng)
+        colors = self.color_themes[theme]
+        visual_style = self._select_visual_style(article_type, rng)
+        variant = rng.randrange(self.BACKGROUND_VARIANTS)
         
-        # 5. 装飾的なアクセント（背景）
-        self._add_decorative_accents(img, draw, colors)
+        # 1〜5. 背景・装飾レイヤー（キャッシュと共有しているためコピーに描き足す）
+        img = self._background_layer(theme, visual_style, variant).copy()
         
         # 6. タイトルとテキスト要素（最前面に描画）
-        draw = ImageDraw.Draw(img)  # drawオブジェクトを再取得
+        draw = ImageDraw.Draw(img)
         self._add_modern_text(img, draw, title, colors, tool_name)
         
         # RGBに変換（透過を除去）
         final_img = Image.new('RGB', self.default_size, colors['background'])
         final_img.paste(img, (0, 0), img)
         
-        # バイトデータに変換
+        # バイトデータに変換（optimizeはファイルサイズが1割ほど小さくなるが、生成時間の大半を占める）
         img_bytes = io.BytesIO()
-        final_img.save(img_bytes, format='PNG', optimize=True, quality=95)
+        final_img.save(img_bytes, format='PNG', optimize=self.png_optimize, quality=95)
         img_bytes.seek(0)
         
         return img_bytes.getvalue()
     
     def _select_theme(self, article_type: str, tool_name: Optional[str], 
-                     keywords: Optional[List[str]], theme_override: Optional[str]) -> str:
+                     keywords: Optional[List[str]], theme_override: Optional[str],
+                     rng: random.Random) -> str:
         """記事内容に基づいてカラーテーマを選択"""
         if theme_override and theme_override in self.color_themes:
             return theme_override
@@ -197,9 +232,9 @@ class ModernThumbnailGenerator:
         
         # ランダムに選択（matrix以外）
         themes = [t for t in self.color_themes.keys() if t != 'matrix']
-        return random.choice(themes)
+        return rng.choice(themes)
     
-    def _select_visual_style(self, article_type: str) -> str:
+    def _select_visual_style(self, article_type: str, rng: random.Random) -> str:
         """記事タイプに応じたビジュアルスタイルを選択"""
         # 記事タイプのマッピング
         type_mapping = {
@@ -219,70 +254,84 @@ class ModernThumbnailGenerator:
         
         style_category = type_mapping.get(article_type, 'music_generation')
         styles = self.visual_styles.get(style_category, self.visual_styles['music_generation'])
-        return random.choice(styles)
+        return rng.choice(styles)
     
-    def _create_gradient_background(self, img: Image.Image, colors: Dict[str, str]):
-        """高度なグラデーション背景を作成"""
-        width, height = img.size
+    def _background_layer(self, theme: str, visual_style: str, variant: int) -> Image.Image:
+        """
+        テーマ・ビジュアルスタイル・バリエーションごとの背景レイヤーを取得
+        
+        背景はタイトルに依存しないため、LayerCache があれば描画済みのものを再利用する。
+        """
+        colors = self.color_themes[theme]
+        
+        def render() -> Image.Image:
+            return self._render_background(theme, visual_style, variant)
+        
+        if self.layer_cache is None:
+            return render()
+        return self.layer_cache.get_or_render(
+            ['thumbnail_background', self.BACKGROUND_LAYER_VERSION, self.default_size,
+             colors, visual_style, variant, self.seed], render)
+    
+    def _render_background(self, theme: str, visual_style: str, variant: int) -> Image.Image:
+        """背景レイヤー（グラデーション・ビジュアル要素・幾何学模様・グロウ・装飾）を描画"""
+        colors = self.color_themes[theme]
+        # 模様の乱数はタイトルではなくバリエーションで決める（シード未指定時も同じバリエーションは同じ模様）
+        rng = seeded_random(self.seed if self.seed is not None else 0,
+                            'thumbnail_background', theme, visual_style, variant)
+        
+        # 画像を作成
+        img = Image.new('RGBA', self.default_size, (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
         
-        # 放射状グラデーション
-        center_x, center_y = width // 2, height // 2
-        max_radius = math.sqrt(center_x**2 + center_y**2)
+        # 1. グラデーション背景
+        self._create_gradient_background(img, colors, rng)
         
-        # グラデーション用の一時画像
-        gradient = Image.new('RGB', (width, height))
-        grad_draw = ImageDraw.Draw(gradient)
+        # 2. 記事タイプに応じたビジュアル要素を追加
+        self._add_visual_element(img, draw, visual_style, colors, rng)
         
-        start_color = self._hex_to_rgb(colors['gradient_start'])
-        end_color = self._hex_to_rgb(colors['gradient_end'])
+        # 3. ネオン効果のある幾何学模様
+        self._add_geometric_patterns(img, draw, colors, rng)
+        
+        # 4. グロウ効果
+        img = self._add_glow_effect(img, colors)
         
+        # 5. 装飾的なアクセント（背景）
+        self._add_decorative_accents(img, ImageDraw.Draw(img), colors, rng)
+        
+        return img
+    
+    def _create_gradient_background(self, img: Image.Image, colors: Dict[str, str], rng: random.Random):
+        """高度なグラデーション背景を作成"""
         # 円形グラデーション
-        for i in range(int(max_radius)):
-            ratio = i / max_radius
-            r = int(start_color[0] + (end_color[0] - start_color[0]) * ratio)
-            g = int(start_color[1] + (end_color[1] - start_color[1]) * ratio)
-            b = int(start_color[2] + (end_color[2] - start_color[2]) * ratio)
-            
-            grad_draw.ellipse(
-                [(center_x - i, center_y - i), (center_x + i, center_y + i)],
-                outline=(r, g, b)
-            )
+        gradient = radial_gradient(img.size,
+                                   self._hex_to_rgb(colors['gradient_start']),
+                                   self._hex_to_rgb(colors['gradient_end']))
         
         # ノイズテクスチャを追加
-        noise = Image.new('RGB', (width, height))
-        noise_draw = ImageDraw.Draw(noise)
-        for _ in range(1000):
-            x = random.randint(0, width-1)
-            y = random.randint(0, height-1)
-            brightness = random.randint(0, 30)
-            noise_draw.point((x, y), fill=(brightness, brightness, brightness))
-        
-        # ブレンド
-        gradient = Image.blend(gradient, noise, 0.1)
-        img.paste(gradient, (0, 0))
+        img.paste(add_speckle_noise(gradient, rng, alpha=0.1, count=1000, max_brightness=30), (0, 0))
     
     def _add_visual_element(self, img: Image.Image, draw: ImageDraw.Draw, 
-                           style: str, colors: Dict[str, str]):
+                           style: str, colors: Dict[str, str], rng: random.Random):
         """記事タイプに応じたメインビジュアル要素を追加"""
         width, height = img.size
         
         if style == 'sound_waves':
             self._draw_sound_waves(img, draw, colors)
         elif style == 'frequency_bars':
-            self._draw_frequency_bars(img, draw, colors)
+            self._draw_frequency_bars(img, draw, colors, rng)
         elif style == 'circular_visualizer':
             self._draw_circular_visualizer(img, draw, colors)
         elif style == 'voice_pattern':
             self._draw_voice_pattern(img, draw, colors)
         elif style == 'code_blocks':
-            self._draw_code_blocks(img, draw, colors)
+            self._draw_code_blocks(img, draw, colors, rng)
         elif style == 'data_stream':
-            self._draw_data_stream(img, draw, colors)
+            self._draw_data_stream(img, draw, colors, rng)
         elif style == 'split_design':
             self._draw_split_design(img, draw, colors)
         elif style == 'circuit_board':
-            self._draw_circuit_pattern(img, draw, colors)
+            self._draw_circuit_pattern(img, draw, colors, rng)
     
     def _draw_sound_waves(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict[str, str]):
         """音波パターンを描画"""
@@ -304,7 +353,8 @@ class ModernThumbnailGenerator:
                 alpha = 50 + offset * 30
                 draw.line(points, fill=self._hex_to_rgb(colors['primary']) + (alpha,), width=offset*2)
     
-    def _draw_frequency_bars(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict[str, str]):
+    def _draw_frequency_bars(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict[str, str],
+                             rng: random.Random):
         """周波数バーを描画"""
         width, height = img.size
         bar_count = 60
@@ -312,7 +362,7 @@ class ModernThumbnailGenerator:
         
         for i in range(bar_count):
             # ランダムな高さ（音楽のビジュアライザー風）
-            bar_height = random.randint(50, 300)
+            bar_height = rng.randint(50, 300)
             x = i * bar_width
             y = height // 2
             
@@ -381,7 +431,8 @@ class ModernThumbnailGenerator:
                 width=2
             )
     
-    def _draw_code_blocks(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict[str, str]):
+    def _draw_code_blocks(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict[str, str],
+                          rng: random.Random):
         """コードブロック風のデザイン"""
         width, height = img.size
         
@@ -391,8 +442,8 @@ class ModernThumbnailGenerator:
         
         for i in range(height // line_height):
             y = i * line_height + 20
-            indent = random.choice(indent_levels)
-            line_length = random.randint(100, 400)
+            indent = rng.choice(indent_levels)
+            line_length = rng.randint(100, 400)
             
             # コードライン
             draw.rectangle(
@@ -401,34 +452,32 @@ class ModernThumbnailGenerator:
             )
             
             # シンタックスハイライト風
-            if random.random() > 0.7:
-                highlight_start = 50 + indent + random.randint(0, line_length // 2)
-                highlight_length = random.randint(30, 100)
+            if rng.random() > 0.7:
+                highlight_start = 50 + indent + rng.randint(0, line_length // 2)
+                highlight_length = rng.randint(30, 100)
                 draw.rectangle(
                     [(highlight_start, y), (highlight_start + highlight_length, y + 15)],
                     fill=self._hex_to_rgb(colors['accent']) + (150,)
                 )
     
-    def _draw_data_stream(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict[str, str]):
+    def _draw_data_stream(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict[str, str],
+                          rng: random.Random):
         """データストリーム効果"""
         width, height = img.size
         
+        font = self.fonts.get(FontRegistry.LATIN, 12)
+        
         # 垂直に流れるデータ
         for x in range(0, width, 40):
-            stream_length = random.randint(100, 400)
-            start_y = random.randint(-200, height)
+            stream_length = rng.randint(100, 400)
+            start_y = rng.randint(-200, height)
             
             for y in range(start_y, start_y + stream_length, 20):
                 if 0 <= y < height:
                     # バイナリ風テキスト
-                    text = random.choice(['01', '10', '11', '00'])
+                    text = rng.choice(['01', '10', '11', '00'])
                     alpha = 255 - abs(y - start_y - stream_length//2) * 2
                     
-                    try:
-                        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 12)
-                    except:
-                        font = ImageFont.load_default()
-                    
                     draw.text(
                         (x, y), text, 
                         font=font,
@@ -458,7 +507,8 @@ class ModernThumbnailGenerator:
                 width=3
             )
     
-    def _draw_circuit_pattern(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict[str, str]):
+    def _draw_circuit_pattern(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict[str, str],
+                              rng: random.Random):
         """回路基板パターン"""
         width, height = img.size
         
@@ -468,7 +518,7 @@ class ModernThumbnailGenerator:
         
         for x in range(grid_size, width - grid_size, grid_size):
             for y in range(grid_size, height - grid_size, grid_size):
-                if random.random() > 0.3:
+                if rng.random() > 0.3:
                     nodes.append((x, y))
         
         # ノード間を接続
@@ -476,7 +526,7 @@ class ModernThumbnailGenerator:
             # 近くのノードと接続
             for node2 in nodes[i+1:]:
                 distance = math.sqrt((node1[0] - node2[0])**2 + (node1[1] - node2[1])**2)
-                if distance < grid_size * 1.5 and random.random() > 0.5:
+                if distance < grid_size * 1.5 and rng.random() > 0.5:
                     # 直角の経路
                     mid_x = node1[0]
                     mid_y = node2[1]
@@ -494,7 +544,8 @@ class ModernThumbnailGenerator:
                 outline=self._hex_to_rgb(colors['glow'])
             )
     
-    def _add_geometric_patterns(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict[str, str]):
+    def _add_geometric_patterns(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict[str, str],
+                                rng: random.Random):
         """幾何学的なパターンを追加"""
         width, height = img.size
         
@@ -502,7 +553,7 @@ class ModernThumbnailGenerator:
         hex_size = 30
         for x in range(0, width, hex_size * 3):
             for y in range(0, height, hex_size * 2):
-                if random.random() > 0.7:
+                if rng.random() > 0.7:
                     self._draw_hexagon(
                         draw, x + (hex_size * 1.5 if y % (hex_size * 4) else 0), 
                         y, hex_size,
@@ -511,9 +562,9 @@ class ModernThumbnailGenerator:
         
         # 三角形の装飾
         for _ in range(5):
-            x = random.randint(0, width)
-            y = random.randint(0, height)
-            size = random.randint(20, 60)
+            x = rng.randint(0, width)
+            y = rng.randint(0, height)
+            size = rng.randint(20, 60)
             
             points = [
                 (x, y - size),
@@ -554,22 +605,9 @@ class ModernThumbnailGenerator:
         """確実に見えるテキストレイアウト"""
         width, height = img.size
         
-        # フォント設定
-        try:
-            # タイトル用フォント（太め）
-            title_font = ImageFont.truetype("/System/Library/Fonts/ヒラギノ角ゴシック W6.ttc", 52)
-            tag_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 20)
-            logger.info("日本語フォントを読み込みました")
-        except Exception as e:
-            logger.warning(f"日本語フォント読み込み失敗: {e}")
-            try:
-                title_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttc", 52)
-                tag_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttc", 20)
-                logger.info("代替フォント(Arial)を読み込みました")
-            except:
-                title_font = ImageFont.load_default()
-                tag_font = ImageFont.load_default()
-                logger.warning("デフォルトフォントを使用します")
+        # フォント設定（タイトル用は太め）
+        title_font = self.fonts.get(FontRegistry.BOLD, 52)
+        tag_font = self.fonts.get(FontRegistry.LATIN, 20)
         
         # タイトルの処理（日付除去）
         import re
@@ -620,13 +658,8 @@ class ModernThumbnailGenerator:
                 logger.info(f"行{i+1}: '{line}', x={x_position}, y={y_offset}")
                 
                 # ネオングロウ効果
-                for glow_size in [8, 6, 4, 2]:
-                    glow_color = self._hex_to_rgb(colors['glow']) + (50,)
-                    for dx in range(-glow_size, glow_size+1):
-                        for dy in range(-glow_size, glow_size+1):
-                            if dx*dx + dy*dy <= glow_size*glow_size:
-                                draw.text((x_position + dx, y_offset + dy), line, 
-                                        font=title_font, fill=glow_color)
+                self._draw_neon_glow(img, (x_position, y_offset), line, title_font,
+                                     self._hex_to_rgb(colors['glow']) + (self.GLOW_ALPHA,))
                 
                 # メインテキスト（明るい白）
                 draw.text((x_position, y_offset), line, font=title_font, fill=(255, 255, 255, 255))
@@ -675,7 +708,46 @@ class ModernThumbnailGenerator:
         
         draw.text((brand_x, brand_y), brand_text, font=tag_font, fill=colors['text'])
     
-    def _add_decorative_accents(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict[str, str]):
+    def _draw_neon_glow(self, img: Image.Image, position: Tuple[int, int], text: str,
+                        font: ImageFont, color: Tuple[int, int, int, int]):
+        """
+        テキストの周りにネオングロウ（GLOW_RADII の円の範囲の縁取り）を描画
+        
+        テキストを1回だけマスクに描き、円内の各オフセットにずらしたマスクを
+        ImageChops.screen で重ねてから、1回の paste で色を塗る。
+        screen(a, b) = 1 - (1 - a)(1 - b) は同じ色をマスク付きで重ね塗りしたときの
+        被覆率と同じなので、オフセットごとに draw.text で重ね塗りした場合と同じ
+        見た目になる。screen は順序によらないため、先に横方向（dx = -w〜w）を
+        重ねたマスクを作り、円の各列（dy）にずらして重ねる。
+        """
+        reach = max(self.GLOW_RADII)
+        left, top, right, bottom = font.getbbox(text)
+        size = (right - left + reach * 2, bottom - top + reach * 2)
+        origin = (reach - left, reach - top)
+        
+        mask = Image.new('L', size, 0)
+        ImageDraw.Draw(mask).text(origin, text, font=font, fill=255)
+        
+        # runs[w]: dx = -w〜w にずらしたマスクを重ねたもの
+        runs = [mask]
+        for w in range(1, reach + 1):
+            run = ImageChops.screen(runs[-1], _shifted(mask, -w, 0))
+            runs.append(ImageChops.screen(run, _shifted(mask, w, 0)))
+        
+        # 同じ列をn回重ねた被覆率 1 - (1 - m)^n
+        glow = Image.new('L', size, 0)
+        for dy, w, count in _glow_rows(self.GLOW_RADII):
+            row = runs[w]
+            if count > 1:
+                row = row.point([round(255 * (1 - (1 - value / 255) ** count)) for value in range(256)])
+            # 余白（reach）があるため、ずらしてもテキストがはみ出すことはない
+            glow = ImageChops.screen(glow, _shifted(row, 0, dy))
+        
+        x, y = position[0] - origin[0], position[1] - origin[1]
+        img.paste(color, (x, y, x + size[0], y + size[1]), glow)
+    
+    def _add_decorative_accents(self, img: Image.Image, draw: ImageDraw.Draw, colors: Dict[str, str],
+                                rng: random.Random):
         """装飾的なアクセントを追加"""
         width, height = img.size
         
@@ -701,10 +773,10 @@ class ModernThumbnailGenerator:
         
         # ランダムな光の粒子
         for _ in range(20):
-            x = random.randint(0, width)
-            y = random.randint(0, height)
-            size = random.randint(1, 3)
-            alpha = random.randint(100, 255)
+            x = rng.randint(0, width)
+            y = rng.randint(0, height)
+            size = rng.randint(1, 3)
+            alpha = rng.randint(100, 255)
             
             draw.ellipse(
                 [(x - size, y - size), (x + size, y + size)],
@@ -713,8 +785,6 @@ class ModernThumbnailGenerator:
     
     def _wrap_text(self, text: str, font: ImageFont, max_width: int) -> List[str]:
         """テキストを折り返し"""
-        lines = []
-        
         # 特定の区切り文字で優先的に改行
         preferred_breaks = ['ガイド - ', 'ガイド-', 'ガイド ']
         
@@ -727,34 +797,12 @@ class ModernThumbnailGenerator:
                     second_part = parts[1]
                     
                     # 両方が適切な長さかチェック
-                    bbox1 = font.getbbox(first_part)
-                    bbox2 = font.getbbox(second_part)
-                    
-                    if (bbox1[2] - bbox1[0] <= max_width and 
-                        bbox2[2] - bbox2[0] <= max_width):
+                    if (self.line_breaker.measure(first_part, font) <= max_width and
+                        self.line_breaker.measure(second_part, font) <= max_width):
                         return [first_part, second_part]
         
-        # 通常の文字単位折り返し
-        current_line = ""
-        for char in text:
-            test_line = current_line + char
-            bbox = font.getbbox(test_line)
-            if bbox[2] - bbox[0] <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = char
-        
-        if current_line:
-            lines.append(current_line)
-        
-        # 最大2行に制限
-        if len(lines) > 2:
-            lines = lines[:2]
-            lines[1] = lines[1][:-3] + "..."
-        
-        return lines
+        # 句読点・助詞等で折り返し（最大2行）
+        return list(self.line_breaker.wrap(text, font, max_width, max_lines=2))
     
     def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
         """16進数カラーをRGBに変換"""
@@ -2,10 +2,25 @@
 SEO最適化モジュール
 """
 
-from .keyword_strategy import SEOKeywordStrategy
-from .content_optimizer import SEOContentOptimizer
+import importlib
 
-__all__ = [
-    'SEOKeywordStrategy',
-    'SEOContentOptimizer'
-]
\ No newline at end of file
+# 公開クラス → 定義しているサブモジュール
+# サブモジュールは最初に使われたときに読み込む（使わないコマンドで読み込まないため）
+_EXPORTS = {
+    'SEOKeywordStrategy': '.keyword_strategy',
+    'SEOContentOptimizer': '.content_optimizer'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -8,7 +8,8 @@ import json
 import logging
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-import random
+
+from ..utils.seeding import default_seed, seeded_random
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +17,15 @@ logger = logging.getLogger(__name__)
 class SEOContentOptimizer:
     """SEO最適化コンテンツ生成システム"""
     
-    def __init__(self):
-        """初期化"""
+    def __init__(self, seed: Optional[int] = None):
+        """
+        初期化
+        
+        Args:
+            seed: 乱数のシード（同じシード・同じ入力で同じ見出しを返す。
+                  省略時は環境変数GENERATION_SEED、未設定なら毎回ランダム）
+        """
+        self.seed = seed if seed is not None else default_seed()
         # SEO要件定義
         self.seo_requirements = {
             "title_length": {"min": 30, "max": 60},
@@ -198,11 +206,12 @@ class SEOContentOptimizer:
             ]
         }
         
+        rng = seeded_random(self.seed, 'heading', section, primary_keyword, keywords, level)
         if section in heading_templates:
-            return f"{level} {random.choice(heading_templates[section])}"
+            return f"{level} {rng.choice(heading_templates[section])}"
         else:
             # デフォルトの見出し生成
-            semantic_keyword = random.choice(keywords.get("semantic", ["音楽制作"]))
+            semantic_keyword = rng.choice(keywords.get("semantic", ["音楽制作"]))
             return f"{level} {primary_keyword}で{semantic_keyword}をレベルアップする方法"
     
     def _calculate_section_length(self, total_sections: int, section_index: int) -> int:
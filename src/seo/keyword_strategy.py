@@ -8,22 +8,26 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
-import random
 import re
 
+from ..utils.seeding import default_seed, seeded_random
+
 logger = logging.getLogger(__name__)
 
 
 class SEOKeywordStrategy:
     """SEO戦略に基づくキーワード管理システム"""
     
-    def __init__(self, strategy_file: str = None):
+    def __init__(self, strategy_file: str = None, seed: Optional[int] = None):
         """
         初期化
         
         Args:
             strategy_file: SEO戦略データファイルのパス
+            seed: 乱数のシード（同じシード・同じ入力で同じキーワード・タイトルを返す。
+                  省略時は環境変数GENERATION_SEED、未設定なら毎回ランダム）
         """
+        self.seed = seed if seed is not None else default_seed()
         self.strategy_file = Path(strategy_file or "data/seo_strategy.json")
         self.strategy_file.parent.mkdir(parents=True, exist_ok=True)
         
@@ -168,6 +172,7 @@ class SEOKeywordStrategy:
         """
         current_month = str(datetime.now().month)
         seasonal_boost = self.seasonal_trends.get(current_month, {"boost": [], "factor": 1.0})
+        rng = seeded_random(self.seed, 'keywords', article_type, tool_name, target_difficulty, current_month)
         
         # プライマリキーワード選択
         primary_keywords = []
@@ -175,31 +180,31 @@ class SEOKeywordStrategy:
             tool_data = self.seo_data["primary_keywords"][tool_name.lower()]
             primary_keywords.extend(tool_data["main"])
             # 検索ボリュームが高い関連キーワードを追加
-            primary_keywords.extend(random.sample(tool_data["variations"], 3))
+            primary_keywords.extend(rng.sample(tool_data["variations"], 3))
         
         # 記事タイプ別キーワード
         type_keywords = []
         if article_type in ["tutorial", "beginner_guide"]:
-            type_keywords.extend(random.sample(self.seo_data["long_tail_keywords"]["tutorial"], 2))
+            type_keywords.extend(rng.sample(self.seo_data["long_tail_keywords"]["tutorial"], 2))
         elif article_type in ["tool_comparison", "tool_review"]:
-            type_keywords.extend(random.sample(self.seo_data["long_tail_keywords"]["comparison"], 2))
+            type_keywords.extend(rng.sample(self.seo_data["long_tail_keywords"]["comparison"], 2))
         elif article_type in ["programming", "app_development"]:
-            type_keywords.extend(random.sample(self.seo_data["long_tail_keywords"]["technical"], 2))
+            type_keywords.extend(rng.sample(self.seo_data["long_tail_keywords"]["technical"], 2))
         
         # セマンティックキーワード
         semantic_keywords = []
-        semantic_keywords.extend(random.sample(self.seo_data["semantic_keywords"]["music_production"], 2))
-        semantic_keywords.extend(random.sample(self.seo_data["semantic_keywords"]["ai_technology"], 2))
+        semantic_keywords.extend(rng.sample(self.seo_data["semantic_keywords"]["music_production"], 2))
+        semantic_keywords.extend(rng.sample(self.seo_data["semantic_keywords"]["ai_technology"], 2))
         
         # 検索意図キーワード
         intent_keywords = []
         if article_type in ["beginner_guide", "tutorial"]:
-            intent_keywords.extend(random.sample(self.seo_data["intent_based_keywords"]["informational"], 2))
+            intent_keywords.extend(rng.sample(self.seo_data["intent_based_keywords"]["informational"], 2))
         elif article_type == "tool_comparison":
-            intent_keywords.extend(random.sample(self.seo_data["intent_based_keywords"]["commercial"], 2))
+            intent_keywords.extend(rng.sample(self.seo_data["intent_based_keywords"]["commercial"], 2))
         
         # 季節的キーワード
-        seasonal_keywords = random.sample(seasonal_boost["boost"], min(2, len(seasonal_boost["boost"])))
+        seasonal_keywords = rng.sample(seasonal_boost["boost"], min(2, len(seasonal_boost["boost"])))
         
         return {
             "primary": primary_keywords,
@@ -241,6 +246,7 @@ class SEOKeywordStrategy:
         """
         current_year = datetime.now().year
         current_month = datetime.now().month
+        rng = seeded_random(self.seed, 'titles', base_topic, keywords, max_length, current_year, current_month)
         
         # タイトルテンプレート
         templates = [
@@ -261,10 +267,10 @@ class SEOKeywordStrategy:
                 title = template.format(
                     year=current_year,
                     month=current_month,
-                    primary=random.choice(keywords.get("primary", ["AI音楽"])),
+                    primary=rng.choice(keywords.get("primary", ["AI音楽"])),
                     topic=base_topic,
-                    benefit=random.choice(["初心者でも簡単", "プロ級のクオリティ", "無料で始められる"]),
-                    comparison=random.choice(["どっちがいい", "何が違う", "比較検証"])
+                    benefit=rng.choice(["初心者でも簡単", "プロ級のクオリティ", "無料で始められる"]),
+                    comparison=rng.choice(["どっちがいい", "何が違う", "比較検証"])
                 )
                 
                 if len(title) <= max_length:
@@ -384,7 +390,7 @@ class SEOKeywordStrategy:
             f"{primary_keyword}について知りたい方必見！基本から応用まで分かりやすく解説した完全ガイドです。"
         ]
         
-        meta_desc = random.choice(templates)
+        meta_desc = seeded_random(self.seed, 'meta_description', title, keywords).choice(templates)
         
         # 120文字以内に調整
         if len(meta_desc) > 120:
@@ -395,6 +401,7 @@ class SEOKeywordStrategy:
     def get_keyword_suggestions(self, base_keyword: str) -> List[str]:
         """関連キーワードの提案"""
         suggestions = []
+        rng = seeded_random(self.seed, 'suggestions', base_keyword)
         
         # 既存のキーワードデータから関連語を抽出
         for category, keywords in self.seo_data["long_tail_keywords"].items():
@@ -404,7 +411,7 @@ class SEOKeywordStrategy:
         
         # セマンティックキーワードからも提案
         for category, keywords in self.seo_data["semantic_keywords"].items():
-            suggestions.extend(random.sample(keywords, min(2, len(keywords))))
+            suggestions.extend(rng.sample(keywords, min(2, len(keywords))))
         
         return suggestions[:10]
 
@@ -0,0 +1,220 @@
+"""
+Durable Job Store
+AI Melody Kobo - 記事投稿ジョブのチェックポイントを保存するSQLiteストア
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class JobStore:
+    """
+    投稿ジョブの各ステージの出力を保存する永続ストア（SQLite WALモード）
+
+    ステージが完了するたびに出力（Markdown・HTML・サムネイル・メディアID・投稿ID）を
+    書き込み、プロセスが異常終了しても再起動時に最後に完了したステージから再開できる。
+    """
+
+    # 完了済みステージ（この順に進む）
+    STAGES = ('created', 'generated', 'rendered', 'archived', 'uploaded', 'posted', 'done')
+
+    # payload列にJSONで保存するジョブのキー
+    PAYLOAD_KEYS = ('article_type', 'tool_name', 'topic', 'generated_at',
+                    'markdown', 'article_data', 'post_result')
+
+    def __init__(self, db_path: str = "data/jobs.sqlite3", max_attempts: int = 3):
+        """
+        Args:
+            db_path: SQLiteファイルのパス
+            max_attempts: 再開・再試行する最大回数（超えたジョブは失敗扱い）
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+
+        # ステージのワーカースレッドから共有するため、アクセスはロックで直列化する
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                stage TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'active',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                payload TEXT NOT NULL,
+                thumbnail BLOB,
+                media_id INTEGER,
+                post_id INTEGER,
+                error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)")
+
+    @classmethod
+    def reached(cls, job: Dict[str, Any], stage: str) -> bool:
+        """ジョブが指定ステージを完了済みかどうか"""
+        return cls.STAGES.index(job.get('stage', 'created')) >= cls.STAGES.index(stage)
+
+    def _payload(self, job: Dict[str, Any]) -> str:
+        return json.dumps({key: job[key] for key in self.PAYLOAD_KEYS if key in job},
+                          ensure_ascii=False)
+
+    def create(self, job: Dict[str, Any]):
+        """新しいジョブを登録（job['id']が必要）"""
+        now = datetime.now().isoformat()
+        job['stage'] = 'created'
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, stage, payload, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job['id'], job['stage'], self._payload(job), now, now)
+            )
+
+    def checkpoint(self, job: Dict[str, Any], stage: str):
+        """ステージの完了とその時点の出力を保存"""
+        if stage not in self.STAGES:
+            raise ValueError(f"不明なステージ: {stage}")
+        job['stage'] = stage
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET stage = ?, payload = ?, thumbnail = ?, media_id = ?, "
+                "post_id = ?, error = NULL, updated_at = ? WHERE id = ?",
+                (stage, self._payload(job), job.get('thumbnail_data'),
+                 job.get('media_id'), job.get('post_id'),
+                 datetime.now().isoformat(), job['id'])
+            )
+
+    def complete(self, job: Dict[str, Any]):
+        """ジョブを完了にする（容量削減のためサムネイルは削除）"""
+        job['stage'] = 'done'
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET stage = 'done', status = 'done', thumbnail = NULL, "
+                "payload = ?, updated_at = ? WHERE id = ?",
+                (self._payload({key: job.get(key) for key in ('article_type', 'tool_name', 'topic')}),
+                 datetime.now().isoformat(), job['id'])
+            )
+
+    def record_error(self, job_id: str, error: str):
+        """ステージの失敗を記録（再試行は retry() で行う）"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET error = ?, updated_at = ? WHERE id = ?",
+                (error, datetime.now().isoformat(), job_id)
+            )
+
+    def retry(self, job_id: str) -> Optional[int]:
+        """
+        失敗したジョブを実行中のプロセス内で再試行する
+
+        claim_pending() と同じく試行回数を加算し、max_attemptsを超えたジョブは失敗にする。
+
+        Returns:
+            加算後の試行回数（上限を超えて失敗にした場合はNone）
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT attempts, stage, error FROM jobs WHERE id = ? AND status = 'active'", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            attempts = row['attempts'] + 1
+            if attempts > self.max_attempts:
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'failed', updated_at = ? WHERE id = ?", (now, job_id))
+                logger.warning(f"再試行回数の上限に達したジョブを失敗扱いにします: "
+                               f"{job_id} ({row['error'] or row['stage']})")
+                return None
+            self._conn.execute(
+                "UPDATE jobs SET attempts = ?, updated_at = ? WHERE id = ?", (attempts, now, job_id))
+            return attempts
+
+    def claim_pending(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        未完了のジョブを再開用に取得
+
+        取得したジョブだけ試行回数を加算し、max_attemptsを超えたジョブは失敗として除外する。
+
+        Args:
+            limit: 取得する最大件数（省略時は全件。1件だけ実行する場合は1を指定し、
+                   実行しないジョブの試行回数を加算しない）
+
+        Returns:
+            作成順に並べた再開対象のジョブ
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE status = 'active' ORDER BY created_at"
+            ).fetchall()
+
+            jobs = []
+            now = datetime.now().isoformat()
+            for row in rows:
+                if limit is not None and len(jobs) >= limit:
+                    break
+                attempts = row['attempts'] + 1
+                if attempts > self.max_attempts:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = 'failed', updated_at = ? WHERE id = ?",
+                        (now, row['id'])
+                    )
+                    logger.warning(f"再開回数の上限に達したジョブを失敗扱いにします: "
+                                   f"{row['id']} ({row['error'] or row['stage']})")
+                    continue
+                self._conn.execute(
+                    "UPDATE jobs SET attempts = ?, updated_at = ? WHERE id = ?",
+                    (attempts, now, row['id'])
+                )
+                jobs.append(self._to_job(row))
+            return jobs
+
+    def _to_job(self, row: sqlite3.Row) -> Dict[str, Any]:
+        job = json.loads(row['payload'])
+        job['id'] = row['id']
+        job['stage'] = row['stage']
+        if row['thumbnail'] is not None:
+            job['thumbnail_data'] = bytes(row['thumbnail'])
+        if row['media_id'] is not None:
+            job['media_id'] = row['media_id']
+        if row['post_id'] is not None:
+            job['post_id'] = row['post_id']
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """ジョブを取得"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row else None
+
+    def get_counts(self) -> Dict[str, Any]:
+        """状態別・ステージ別のジョブ数を取得"""
+        with self._lock:
+            status_rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+            stage_rows = self._conn.execute(
+                "SELECT stage, COUNT(*) FROM jobs WHERE status = 'active' GROUP BY stage"
+            ).fetchall()
+        return {
+            'status': {row[0]: row[1] for row in status_rows},
+            'active_stages': {row[0]: row[1] for row in stage_rows}
+        }
+
+    def close(self):
+        """接続を閉じる"""
+        with self._lock:
+            self._conn.close()
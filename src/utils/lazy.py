@@ -0,0 +1,52 @@
+"""
+Lazy Components
+AI Melody Kobo - 初回使用時に生成するコンポーネント
+"""
+
+import threading
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class lazy_component(Generic[T]):
+    """
+    初回アクセス時にメソッドを呼び出して生成し、以降は同じインスタンスを返すプロパティ
+
+    重いモジュールの読み込みやネットワークアクセスを伴うコンポーネントを、
+    実際に使われるまで生成しないために使う。複数スレッドから同時にアクセスされても
+    生成は1回だけ行う。属性に代入すれば生成済みの値を差し替えられる。
+
+    使用例:
+        class Publisher:
+            @lazy_component
+            def wp_client(self) -> 'WordPressClient':
+                from src.wordpress.api_client import WordPressClient
+                return WordPressClient()
+    """
+
+    def __init__(self, factory: Callable[[Any], T]):
+        self.factory = factory
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+        self._lock = threading.RLock()
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            pass
+        with self._lock:
+            if self.name not in instance.__dict__:
+                instance.__dict__[self.name] = self.factory(instance)
+            return instance.__dict__[self.name]
+
+    @staticmethod
+    def loaded(instance, name: str) -> Optional[Any]:
+        """生成済みの場合はその値、未生成の場合はNoneを返す"""
+        return instance.__dict__.get(name)
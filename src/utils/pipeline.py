@@ -0,0 +1,265 @@
+"""
+Stage Pipeline
+AI Melody Kobo - 有界キューで接続したステージ並列パイプライン
+"""
+
+import time
+import queue
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineStage:
+    """パイプラインの1ステージ（専用のワーカースレッドと入力キューを持つ）"""
+
+    def __init__(self, name: str, func: Callable[[Any], Any],
+                 workers: int = 1, queue_size: int = 2):
+        """
+        Args:
+            name: ステージ名（メトリクス・ログ用）
+            func: 1件を処理する関数。戻り値が次のステージに渡される
+                  （Noneを返した場合・例外を送出した場合はその件を破棄）
+            workers: ワーカースレッド数
+            queue_size: 入力キューの上限（満杯の場合は前段が待機する）
+        """
+        if workers < 1:
+            raise ValueError("workersは1以上を指定してください")
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=100)
+        self.processed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.consecutive_failures = 0
+
+    def record(self, seconds: float, success: bool) -> int:
+        """
+        処理結果を記録
+
+        Returns:
+            連続失敗回数（成功時は0）
+        """
+        with self._lock:
+            self._latencies.append(seconds)
+            if success:
+                self.processed += 1
+                self.consecutive_failures = 0
+            else:
+                self.failed += 1
+                self.consecutive_failures += 1
+            return self.consecutive_failures
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """キュー深さと処理時間のメトリクスを取得"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            in_flight = self.in_flight
+            processed = self.processed
+            failed = self.failed
+            consecutive_failures = self.consecutive_failures
+
+        if latencies:
+            avg = sum(latencies) / len(latencies)
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        else:
+            avg = p95 = 0.0
+
+        return {
+            'workers': self.workers,
+            'queue_depth': self.queue.qsize(),
+            'queue_size': self.queue.maxsize,
+            'in_flight': in_flight,
+            'processed': processed,
+            'failed': failed,
+            'consecutive_failures': consecutive_failures,
+            'latency_avg': round(avg, 3),
+            'latency_p95': round(p95, 3)
+        }
+
+
+class StagePipeline:
+    """
+    複数ステージを有界キューで接続したパイプライン
+
+    先頭ステージはsource()から作業項目を受け取り、各ステージの出力は次のステージの
+    入力キューに積まれる。キューが満杯になると前段が待機するため、先行して
+    処理される件数はキューサイズで制限される。max_in_flightを指定した場合は
+    パイプライン内の項目数がその数に達するとsource()を呼ばずに待機する。
+
+    ステージが失敗したワーカーは、連続失敗回数に応じて指数的に待機してから次の項目に進む
+    （外部APIの障害時に先頭ステージが失敗と再試行を繰り返さないようにする）。
+    """
+
+    # 停止確認のためにキューを待つ間隔（秒）
+    POLL_INTERVAL = 0.5
+
+    def __init__(self, stages: List[PipelineStage],
+                 source: Callable[[], Any],
+                 max_in_flight: Optional[int] = None,
+                 failure_backoff: float = 0.0,
+                 max_failure_backoff: float = 300.0):
+        """
+        Args:
+            stages: 実行順に並べたステージ
+            source: 先頭ステージに渡す作業項目を生成する関数
+            max_in_flight: source()から取り出してから最終ステージを終える（または破棄される）までの
+                           項目数の上限（Noneの場合は各キューの上限のみ）
+            failure_backoff: ステージ失敗後の待機秒数（連続失敗ごとに2倍、0で待機しない）
+            max_failure_backoff: 失敗後の待機秒数の上限
+        """
+        if not stages:
+            raise ValueError("ステージが1つ以上必要です")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flightは1以上を指定してください")
+        self.stages = stages
+        self.source = source
+        self.failure_backoff = failure_backoff
+        self.max_failure_backoff = max_failure_backoff
+        self._slots = threading.Semaphore(max_in_flight) if max_in_flight else None
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def wait(self, seconds: float) -> bool:
+        """
+        停止されるまで最大seconds秒待機（ステージ関数内のスケジュール待ちに使用）
+
+        Returns:
+            待機中に停止された場合True
+        """
+        return self._stop.wait(max(0.0, seconds))
+
+    def start(self):
+        """全ステージのワーカーを起動"""
+        for index, stage in enumerate(self.stages):
+            for worker in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._run_worker,
+                    args=(index,),
+                    name=f"{stage.name}-{worker + 1}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+        logger.info("パイプライン開始: " + " → ".join(
+            f"{stage.name}(x{stage.workers})" for stage in self.stages))
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        停止を指示し、処理中の項目が終わるまで待機
+
+        キューに残っている未処理の項目は破棄される。
+        """
+        self._stop.set()
+        deadline = time.time() + timeout if timeout is not None else None
+        for thread in self._threads:
+            remaining = None if deadline is None else max(0.0, deadline - time.time())
+            thread.join(remaining)
+        self._threads = []
+
+    def _acquire_slot(self) -> bool:
+        """パイプライン内の項目数に空きができるまで待機（停止された場合False）"""
+        if self._slots is None:
+            return True
+        while not self._stop.is_set():
+            if self._slots.acquire(timeout=self.POLL_INTERVAL):
+                return True
+        return False
+
+    def _release_slot(self):
+        """項目がパイプラインを出たことを記録"""
+        if self._slots is not None:
+            self._slots.release()
+
+    def _next_item(self, index: int) -> Any:
+        """ステージの次の入力を取得（停止時はNone）"""
+        if index == 0:
+            if not self._acquire_slot():
+                return None
+            try:
+                item = self.source()
+            except Exception:
+                self._release_slot()
+                raise
+            if item is None:
+                self._release_slot()
+            return item
+        stage = self.stages[index]
+        while not self._stop.is_set():
+            try:
+                return stage.queue.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return None
+
+    def _put_next(self, index: int, item: Any):
+        """次のステージのキューに項目を積む（満杯の場合は空くまで待機）"""
+        if index + 1 >= len(self.stages):
+            return
+        next_queue = self.stages[index + 1].queue
+        while not self._stop.is_set():
+            try:
+                next_queue.put(item, timeout=self.POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def _run_worker(self, index: int):
+        """ワーカースレッドのメインループ"""
+        stage = self.stages[index]
+        while not self._stop.is_set():
+            try:
+                item = self._next_item(index)
+            except Exception as e:
+                logger.error(f"ステージ '{stage.name}' の入力取得でエラー: {str(e)}")
+                self._backoff(stage, stage.record(0.0, False))
+                continue
+            if item is None or self._stop.is_set():
+                continue
+
+            with stage._lock:
+                stage.in_flight += 1
+            start = time.time()
+            try:
+                result = stage.func(item)
+                success = True
+            except Exception as e:
+                logger.error(f"ステージ '{stage.name}' でエラー: {str(e)}")
+                result = None
+                success = False
+            finally:
+                with stage._lock:
+                    stage.in_flight -= 1
+            failures = stage.record(time.time() - start, success)
+
+            if result is not None and index + 1 < len(self.stages):
+                self._put_next(index, result)
+            else:
+                # 最終ステージを終えた項目・途中で破棄された項目の分だけsource()を再開する
+                self._release_slot()
+
+            if failures:
+                self._backoff(stage, failures)
+
+    def _backoff(self, stage: PipelineStage, failures: int):
+        """連続失敗回数に応じて待機（停止されたら待機を打ち切る）"""
+        if self.failure_backoff <= 0:
+            return
+        delay = min(self.max_failure_backoff, self.failure_backoff * 2 ** (failures - 1))
+        logger.warning(f"ステージ '{stage.name}' が{failures}回連続で失敗しました。{delay:.0f}秒待機します")
+        self._stop.wait(delay)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """ステージ別のメトリクスを取得"""
+        return {stage.name: stage.get_metrics() for stage in self.stages}
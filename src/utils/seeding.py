@@ -0,0 +1,34 @@
+"""
+Seeded Random
+AI Melody Kobo - 同じシード・同じ入力から同じ結果を得るための乱数生成器
+"""
+
+import os
+import json
+import random
+import hashlib
+from typing import Any, Optional
+
+
+def default_seed() -> Optional[int]:
+    """環境変数GENERATION_SEEDのシード（未設定の場合はNone）"""
+    value = os.getenv('GENERATION_SEED', '').strip()
+    return int(value) if value else None
+
+
+def seeded_random(seed: Optional[int], *scope: Any) -> random.Random:
+    """
+    シードと入力（scope）から決まる乱数生成器を作成
+
+    同じシード・同じ入力であれば、呼び出し順や並列実行の有無に関係なく
+    同じ乱数列になる。seedがNoneの場合は呼び出しごとに異なる乱数列になる。
+
+    Args:
+        seed: シード（Noneで非決定的）
+        scope: 乱数列を決める入力（用途名・トピック・キーワード等、JSONに変換できる値）
+    """
+    if seed is None:
+        return random.Random()
+    material = json.dumps([seed, *scope], ensure_ascii=False, sort_keys=True, default=str)
+    digest = hashlib.sha256(material.encode('utf-8')).digest()
+    return random.Random(int.from_bytes(digest[:8], 'big'))
@@ -2,13 +2,34 @@
 WordPress連携モジュール
 """
 
-from .api_client import WordPressClient, WordPressAPIError
-from .converter import ArticleConverter
-from .category_manager import CategoryManager
-
-__all__ = [
-    'WordPressClient',
-    'WordPressAPIError',
-    'ArticleConverter',
-    'CategoryManager'
-]
\ No newline at end of file
+import importlib
+
+# 公開クラス → 定義しているサブモジュール
+# サブモジュールは最初に使われたときに読み込む（requests・markdown等の読み込みを遅らせるため）
+_EXPORTS = {
+    'WordPressClient': '.api_client',
+    'WordPressAPIError': '.api_client',
+    'InvalidMediaError': '.api_client',
+    'AsyncWordPressClient': '.async_client',
+    'TaxonomyCache': '.taxonomy_cache',
+    'WordPressBatch': '.batch',
+    'BatchItem': '.batch',
+    'MediaRegistry': '.media_registry',
+    'PooledSession': '.http_session',
+    'ArticleConverter': '.converter',
+    'CategoryManager': '.category_manager'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -6,12 +6,21 @@ AI Melody Kobo - WordPress記事自動投稿システム
 import os
 import base64
 import json
+import hashlib
 import requests
-from typing import Dict, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, Optional, List, Tuple, Union
+from urllib.parse import quote
 from datetime import datetime
 import logging
 from dotenv import load_dotenv
 
+from .http_session import PooledSession
+from .taxonomy_cache import TaxonomyCache
+from .batch import WordPressBatch
+from .upload_stream import BufferReader, MultipartStream
+from .media_registry import MediaRegistry
+
 # 環境変数の読み込み
 load_dotenv()
 
@@ -23,13 +32,28 @@ class WordPressAPIError(Exception):
     pass
 
 
+class InvalidMediaError(WordPressAPIError):
+    """指定したメディア（アイキャッチ画像）がWordPressに存在しない"""
+    
+    def __init__(self, message: str, media_id: Optional[int] = None):
+        super().__init__(message)
+        self.media_id = media_id
+
+
 class WordPressClient:
     """WordPress REST APIクライアント"""
     
+    # 記事本文に埋め込む冪等キーのマーカー（表示には影響しないHTMLコメント）
+    IDEMPOTENCY_MARKER = "<!-- ai-melody-kobo:idempotency-key={key} -->"
+    
     def __init__(self, 
                  api_url: Optional[str] = None,
                  username: Optional[str] = None,
-                 app_password: Optional[str] = None):
+                 app_password: Optional[str] = None,
+                 session: Optional[PooledSession] = None,
+                 pool_maxsize: Optional[int] = None,
+                 keep_alive: bool = True,
+                 taxonomy_cache_ttl: Optional[int] = None):
         """
         WordPress APIクライアントの初期化
         
@@ -37,6 +61,10 @@ class WordPressClient:
             api_url: WordPress REST APIのURL
             username: WordPressユーザー名
             app_password: アプリケーションパスワード
+            session: 共有する接続プール付きセッション（省略時は新規作成）
+            pool_maxsize: ホストごとの最大接続数
+            keep_alive: 接続を再利用するかどうか
+            taxonomy_cache_ttl: タグ・カテゴリーのスナップショット有効期間（秒）
         """
         self.api_url = api_url or os.getenv('WORDPRESS_API_URL')
         self.username = username or os.getenv('WORDPRESS_USERNAME')
@@ -48,6 +76,49 @@ class WordPressClient:
         # Basic認証ヘッダーの準備
         self.headers = self._prepare_auth_headers()
         
+        # 接続プール付きセッション（外部から渡された場合は所有しない）
+        self._owns_session = session is None
+        self.session = session or PooledSession(
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive
+        )
+        
+        # タグ・カテゴリーの全件スナップショット
+        self.taxonomy = TaxonomyCache(self, ttl_seconds=taxonomy_cache_ttl)
+        
+        # アップロード済みメディアの内容ハッシュ → メディアID
+        site_hash = hashlib.md5(self.api_url.encode()).hexdigest()[:12]
+        self.media_registry = MediaRegistry(f"data/cache/media_registry_{site_hash}.json")
+        
+        # 一括リクエスト（/batch/v1）のエンドポイント
+        self.route_prefix = '/wp/v2'
+        api_root = self.api_url.rstrip('/')
+        if api_root.endswith(self.route_prefix):
+            self.batch_url = api_root[:-len(self.route_prefix)] + '/batch/v1'
+            self.batch_supported = True
+        else:
+            self.batch_url = None
+            self.batch_supported = False
+    
+    def close(self):
+        """所有しているセッションの接続を閉じる"""
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def batch(self) -> WordPressBatch:
+        """ターム作成・記事更新をまとめて送信するバッチを作成"""
+        return WordPressBatch(self)
+    
+    def get_request_stats(self) -> Dict[str, float]:
+        """リクエスト数と接続再利用の統計を取得"""
+        return self.session.get_stats()
+        
     def _prepare_auth_headers(self) -> Dict[str, str]:
         """認証ヘッダーを準備"""
         credentials = f"{self.username}:{self.app_password}"
@@ -62,7 +133,7 @@ class WordPressClient:
     def test_connection(self) -> bool:
         """APIへの接続をテスト"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_url}/users/me",
                 headers=self.headers,
                 timeout=10
@@ -80,10 +151,14 @@ class WordPressClient:
                    tags: List[int] = None,
                    featured_media: Optional[int] = None,
                    excerpt: Optional[str] = None,
-                   meta_description: Optional[str] = None) -> Dict:
+                   meta_description: Optional[str] = None,
+                   idempotency_key: Optional[str] = None) -> Dict:
         """
         新規記事を作成
         
+        本文末尾に冪等キーのHTMLコメントを埋め込み、タイムアウト等で結果が
+        不明なまま再送する前に同じキーの記事を検索して二重投稿を防ぐ。
+        
         Args:
             title: 記事タイトル
             content: 記事本文（HTML）
@@ -93,13 +168,19 @@ class WordPressClient:
             featured_media: アイキャッチ画像のメディアID
             excerpt: 抜粋
             meta_description: メタディスクリプション
+            idempotency_key: 冪等キー（省略時はタイトルと本文から生成）
             
         Returns:
             作成された記事の情報
         """
+        if not idempotency_key:
+            idempotency_key = hashlib.sha256(
+                f"{title}\n{content}".encode('utf-8')
+            ).hexdigest()[:32]
+        
         data = {
             'title': title,
-            'content': content,
+            'content': f"{content}\n{self.IDEMPOTENCY_MARKER.format(key=idempotency_key)}",
             'status': status,
             'author': 1,  # AIクリエイター アリサ
             'format': 'standard',
@@ -119,26 +200,61 @@ class WordPressClient:
             data['meta'] = {'description': meta_description}
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/posts",
-                headers=self.headers,
+                headers={**self.headers, 'Idempotency-Key': idempotency_key},
                 data=json.dumps(data),
-                timeout=30
+                timeout=30,
+                recover=lambda: self.find_post_by_idempotency_key(idempotency_key)
             )
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"記事作成エラー: {str(e)}")
+            if featured_media and self._error_code(e) == 'rest_post_invalid_featured_media':
+                # WordPress側で削除されたメディアを次のアップロードで再利用しない
+                self.media_registry.forget_media_id(featured_media)
+                raise InvalidMediaError(f"アイキャッチ画像が存在しません: ID={featured_media}",
+                                        media_id=featured_media)
             raise WordPressAPIError(f"記事の作成に失敗しました: {str(e)}")
     
+    def find_post_by_idempotency_key(self, idempotency_key: str) -> Optional[Dict]:
+        """冪等キーを本文に含む記事を検索（見つからなければNone）"""
+        marker = self.IDEMPOTENCY_MARKER.format(key=idempotency_key)
+        try:
+            response = self.session.get(
+                f"{self.api_url}/posts",
+                headers=self.headers,
+                params={
+                    'search': idempotency_key,
+                    'status': 'draft,publish,pending,private,future',
+                    'context': 'edit',
+                    'per_page': 5
+                },
+                timeout=10
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"冪等キーによる記事検索に失敗: {str(e)}")
+            return None
+        
+        for post in response.json():
+            content = post.get('content', {})
+            raw = content.get('raw') or content.get('rendered', '')
+            if marker in raw:
+                logger.info(f"冪等キーに一致する既存記事を使用: ID={post['id']}")
+                return post
+        return None
+    
     def update_post(self, post_id: int, **kwargs) -> Dict:
         """既存の記事を更新"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/posts/{post_id}",
                 headers=self.headers,
                 data=json.dumps(kwargs),
-                timeout=30
+                timeout=30,
+                retry_safe=True  # 同じ値での上書きのため再送可能
             )
             response.raise_for_status()
             return response.json()
@@ -149,7 +265,7 @@ class WordPressClient:
     def get_post(self, post_id: int) -> Dict:
         """投稿を取得"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_url}/posts/{post_id}",
                 headers=self.headers,
                 timeout=10
@@ -160,10 +276,33 @@ class WordPressClient:
             logger.error(f"投稿取得エラー: {str(e)}")
             raise WordPressAPIError(f"投稿の取得に失敗しました: {str(e)}")
     
+    def get_posts(self, **params) -> List[Dict]:
+        """
+        投稿一覧を取得
+        
+        Args:
+            **params: REST APIのクエリパラメータ（status, per_page, orderby等）
+            
+        Returns:
+            投稿情報のリスト
+        """
+        try:
+            response = self.session.get(
+                f"{self.api_url}/posts",
+                headers=self.headers,
+                params=params,
+                timeout=10
+            )
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"投稿一覧取得エラー: {str(e)}")
+            raise WordPressAPIError(f"投稿一覧の取得に失敗しました: {str(e)}")
+    
     def get_categories(self) -> List[Dict]:
         """カテゴリー一覧を取得"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_url}/categories",
                 headers=self.headers,
                 params={'per_page': 100},
@@ -187,22 +326,75 @@ class WordPressClient:
             data['slug'] = slug
             
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/categories",
                 headers=self.headers,
                 data=json.dumps(data),
-                timeout=10
+                timeout=10,
+                retry_safe=True  # 重複作成はterm_existsとして既存IDが返る
             )
             response.raise_for_status()
-            return response.json()
+            category = response.json()
+            self.taxonomy.add_term('categories', category)
+            return category
         except requests.exceptions.RequestException as e:
+            existing_id = self._existing_term_id(e)
+            if existing_id:
+                logger.info(f"既存のカテゴリーを使用: {name}")
+                category = {'id': existing_id, 'name': name, 'slug': slug or '', 'parent': parent}
+                self.taxonomy.add_term('categories', category)
+                return category
             logger.error(f"カテゴリー作成エラー: {str(e)}")
             raise WordPressAPIError(f"カテゴリーの作成に失敗しました: {str(e)}")
     
+    def _get_terms_page(self, taxonomy: str, page: int) -> requests.Response:
+        """タクソノミーの1ページ分を取得"""
+        response = self.session.get(
+            f"{self.api_url}/{taxonomy}",
+            headers=self.headers,
+            params={'per_page': 100, 'page': page, 'orderby': 'id'},
+            timeout=10
+        )
+        response.raise_for_status()
+        return response
+    
+    def fetch_all_terms(self, taxonomy: str, max_workers: int = 4) -> List[Dict]:
+        """
+        タグ・カテゴリーを全ページ取得
+        
+        1ページ目のX-WP-TotalPagesヘッダーから総ページ数を求め、
+        残りのページを並列に取得する。
+        
+        Args:
+            taxonomy: 'tags' または 'categories'
+            max_workers: 並列取得するワーカー数
+            
+        Returns:
+            全タームのリスト
+        """
+        try:
+            first = self._get_terms_page(taxonomy, 1)
+            terms = first.json()
+            total_pages = int(first.headers.get('X-WP-TotalPages', 1) or 1)
+            
+            if total_pages > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    pages = executor.map(
+                        lambda page: self._get_terms_page(taxonomy, page).json(),
+                        range(2, total_pages + 1)
+                    )
+                    for page_terms in pages:
+                        terms.extend(page_terms)
+            
+            return terms
+        except requests.exceptions.RequestException as e:
+            logger.error(f"{taxonomy}全件取得エラー: {str(e)}")
+            raise WordPressAPIError(f"{taxonomy}の全件取得に失敗しました: {str(e)}")
+    
     def get_tags(self) -> List[Dict]:
         """タグ一覧を取得"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_url}/tags",
                 headers=self.headers,
                 params={'per_page': 100},
@@ -247,95 +439,200 @@ class WordPressClient:
             
         try:
             logger.debug(f"タグ作成リクエスト: {data}")
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/tags",
                 headers=self.headers,
                 data=json.dumps(data),
-                timeout=10
+                timeout=10,
+                retry_safe=True  # 重複作成はterm_existsとして既存IDが返る
             )
             response.raise_for_status()
-            return response.json()
+            tag = response.json()
+            self.taxonomy.add_term('tags', tag)
+            return tag
         except requests.exceptions.RequestException as e:
+            # 既に存在する場合、WordPressはterm_existsとともに既存IDを返す
+            existing_id = self._existing_term_id(e)
+            if existing_id:
+                logger.info(f"既存のタグを使用: {name}")
+                tag = {'id': existing_id, 'name': name}
+                self.taxonomy.add_term('tags', tag)
+                return tag
+            
             logger.error(f"タグ作成エラー - タグ名: '{name}', エラー: {str(e)}")
             if hasattr(e, 'response') and e.response is not None:
                 logger.error(f"レスポンス内容: {e.response.text}")
-            # タグ作成に失敗した場合は、既存のタグを探す
+            # タグ作成に失敗した場合は、スナップショットを更新して既存のタグを探す
             try:
-                existing_tags = self.get_tags()
-                for tag in existing_tags:
-                    if tag['name'] == name:
-                        logger.info(f"既存のタグを使用: {name}")
-                        return tag
-            except:
+                self.taxonomy.refresh('tags')
+                tag_id = self.taxonomy.get_id('tags', name)
+                if tag_id:
+                    logger.info(f"既存のタグを使用: {name}")
+                    return {'id': tag_id, 'name': name}
+            except WordPressAPIError:
                 pass
             # それでも見つからない場合はエラー
             raise WordPressAPIError(f"タグの作成に失敗しました: {str(e)}")
     
-    def upload_media(self, file_path: str = None, file_data: bytes = None,
+    def upload_media(self, file_path: str = None,
+                    file_data: Union[bytes, bytearray, memoryview] = None,
                     filename: str = None, title: str = None, 
-                    alt_text: str = None, mime_type: str = 'image/png') -> Dict:
+                    alt_text: str = None, mime_type: str = 'image/png',
+                    file_obj: Optional[BinaryIO] = None,
+                    raw: bool = False,
+                    dedupe: bool = True) -> Dict:
         """メディア（画像等）をアップロード
         
+        ファイル本体はメモリ上に複製せず、送信時にストリームから読み出す。
+        同じ内容（SHA-256）のメディアをアップロード済みの場合は再アップロードせず、
+        既存の添付ファイル（id, source_url）を返す。
+        
         Args:
             file_path: アップロードするファイルのパス
-            file_data: ファイルのバイトデータ（file_pathの代替）
-            filename: ファイル名（file_data使用時は必須）
+            file_data: ファイルのバイトデータ（bytes/memoryview、file_pathの代替）
+            filename: ファイル名（file_data・file_obj使用時は必須）
             title: メディアのタイトル
             alt_text: 代替テキスト
             mime_type: MIMEタイプ
+            file_obj: シーク可能なバイナリファイルオブジェクト（file_pathの代替）
+            raw: Trueの場合multipartを使わずContent-Disposition付きの生データで送信
+            dedupe: Falseの場合はレジストリを参照せず必ずアップロード
             
         Returns:
-            アップロードされたメディアの情報
+            アップロードされたメディアの情報（'sha256'キーに内容ハッシュを含む）
         """
         if file_path:
+            filename = filename or os.path.basename(file_path)
             with open(file_path, 'rb') as file:
-                file_data = file.read()
-                filename = os.path.basename(file_path)
-        elif not file_data or not filename:
-            raise ValueError("file_pathまたは(file_dataとfilename)が必要です")
-        
-        files = {
-            'file': (filename, file_data, mime_type)
-        }
+                return self._upload_media_stream(file, filename, title, alt_text, mime_type, raw, dedupe)
         
-        headers = self.headers.copy()
-        headers.pop('Content-Type')  # multipart/form-dataの場合は削除
+        if file_obj is not None and filename:
+            return self._upload_media_stream(file_obj, filename, title, alt_text, mime_type, raw, dedupe)
+        if file_data is not None and len(file_data) and filename:
+            return self._upload_media_stream(
+                BufferReader(file_data), filename, title, alt_text, mime_type, raw, dedupe
+            )
+        raise ValueError("file_path、(file_dataとfilename)または(file_objとfilename)が必要です")
+    
+    def _upload_media_stream(self, stream: BinaryIO, filename: str,
+                             title: Optional[str], alt_text: Optional[str],
+                             mime_type: str, raw: bool, dedupe: bool) -> Dict:
+        """ストリームからメディアを送信"""
+        sha256 = MediaRegistry.hash_stream(stream)
+        if dedupe:
+            existing = self.media_registry.get(sha256)
+            if existing and not self.media_exists(existing['id']):
+                logger.info(f"登録済みのメディアが削除されているため再アップロードします: "
+                            f"ID={existing['id']} ({filename})")
+                self.media_registry.forget(sha256)
+                existing = None
+            if existing:
+                logger.info(f"同じ内容のメディアを再利用: ID={existing['id']} ({filename})")
+                return {**existing, 'sha256': sha256, 'deduplicated': True}
         
-        data = {}
+        fields = {}
         if title:
-            data['title'] = title
+            fields['title'] = title
         if alt_text:
-            data['alt_text'] = alt_text
+            fields['alt_text'] = alt_text
+        
+        headers = self.headers.copy()
+        if raw:
+            # 本文はファイルそのもの。タイトル等はクエリパラメータで渡す
+            body = stream
+            params = fields
+            headers['Content-Type'] = mime_type
+            headers['Content-Disposition'] = self._content_disposition(filename)
+        else:
+            body = MultipartStream(fields, filename, mime_type, stream)
+            params = None
+            headers['Content-Type'] = body.content_type
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/media",
                 headers=headers,
-                files=files,
-                data=data,
+                params=params,
+                data=body,
                 timeout=60
             )
             response.raise_for_status()
-            return response.json()
+            media = response.json()
+            self.media_registry.put(sha256, media)
+            media['sha256'] = sha256
+            return media
         except requests.exceptions.RequestException as e:
             logger.error(f"メディアアップロードエラー: {str(e)}")
             raise WordPressAPIError(f"メディアのアップロードに失敗しました: {str(e)}")
     
+    def media_exists(self, media_id: int) -> bool:
+        """
+        メディアがWordPressに残っているか
+        
+        404・410の場合のみFalseを返す（通信エラー等で確認できない場合は残っているとみなす）。
+        """
+        try:
+            response = self.session.get(
+                f"{self.api_url}/media/{media_id}",
+                headers=self.headers,
+                params={'_fields': 'id'},
+                timeout=10
+            )
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"メディアの確認に失敗: ID={media_id} - {str(e)}")
+            return True
+        return response.status_code not in (404, 410)
+    
+    @staticmethod
+    def _content_disposition(filename: str) -> str:
+        """生データ送信用のContent-Dispositionヘッダー（非ASCIIはRFC 5987形式）"""
+        try:
+            filename.encode('ascii')
+        except UnicodeEncodeError:
+            return f"attachment; filename*=UTF-8''{quote(filename)}"
+        return f'attachment; filename="{filename}"'
+    
+    @staticmethod
+    def _error_code(error: requests.exceptions.RequestException) -> Optional[str]:
+        """エラーレスポンスのWordPressエラーコード（rest_post_invalid_featured_media等）"""
+        response = getattr(error, 'response', None)
+        if response is None:
+            return None
+        try:
+            body = response.json()
+        except ValueError:
+            return None
+        return body.get('code') if isinstance(body, dict) else None
+    
+    @staticmethod
+    def _existing_term_id(error: requests.exceptions.RequestException) -> Optional[int]:
+        """term_existsエラーのレスポンスから既存タームのIDを取り出す"""
+        response = getattr(error, 'response', None)
+        if response is None:
+            return None
+        try:
+            body = response.json()
+        except ValueError:
+            return None
+        if isinstance(body, dict) and body.get('code') == 'term_exists':
+            data = body.get('data') or {}
+            return data.get('term_id')
+        return None
+    
     def find_or_create_category(self, name: str) -> int:
         """カテゴリーを検索し、なければ作成"""
-        categories = self.get_categories()
-        for cat in categories:
-            if cat['name'] == name:
-                return cat['id']
+        category_id = self.taxonomy.get_id('categories', name)
+        if category_id:
+            return category_id
         
         # カテゴリーが存在しない場合は作成
         new_cat = self.create_category(name)
         return new_cat['id']
     
     def find_or_create_tags(self, tag_names: List[str]) -> List[int]:
-        """タグを検索し、なければ作成"""
-        existing_tags = self.get_tags()
-        tag_ids = []
+        """タグを検索し、なければ一括リクエストでまとめて作成"""
+        resolved = {}
+        names = []
         
         for tag_name in tag_names:
             # 空のタグ名はスキップ
@@ -343,27 +640,29 @@ class WordPressClient:
                 continue
                 
             tag_name = tag_name.strip()
-            tag_id = None
-            
-            # 既存のタグを検索
-            for tag in existing_tags:
-                if tag['name'].lower() == tag_name.lower():
-                    tag_id = tag['id']
-                    break
-            
-            if not tag_id:
-                # タグが存在しない場合は作成
-                try:
-                    new_tag = self.create_tag(tag_name)
-                    if new_tag:
-                        tag_id = new_tag['id']
-                        # 新しく作成したタグを既存タグリストに追加
-                        existing_tags.append(new_tag)
-                except Exception as e:
-                    logger.warning(f"タグ '{tag_name}' の作成をスキップ: {str(e)}")
-                    continue
+            names.append(tag_name)
+            if tag_name.lower() in resolved:
+                continue
             
-            if tag_id:
-                tag_ids.append(tag_id)
+            # 既存のタグを検索（全件スナップショットから）
+            try:
+                resolved[tag_name.lower()] = self.taxonomy.get_id('tags', tag_name)
+            except WordPressAPIError as e:
+                logger.warning(f"タグ一覧を取得できないため作成を試みます: {str(e)}")
+                resolved[tag_name.lower()] = None
+        
+        # タグが存在しない場合はまとめて作成
+        missing = []
+        for name in names:
+            if not resolved[name.lower()] and name.lower() not in {m.lower() for m in missing}:
+                missing.append(name)
+        if missing:
+            with self.batch() as batch:
+                items = [(name, batch.create_tag(name)) for name in missing]
+            for name, item in items:
+                if item.ok and item.result.get('id'):
+                    resolved[name.lower()] = item.result['id']
+                else:
+                    logger.warning(f"タグ '{name}' の作成をスキップ: {item.error}")
         
-        return tag_ids
\ No newline at end of file
+        return [resolved[name.lower()] for name in names if resolved.get(name.lower())]
@@ -0,0 +1,151 @@
+"""
+Async WordPress REST API Client
+AI Melody Kobo - 同時実行数を制限した非同期WordPressクライアント
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+from .api_client import WordPressClient
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWordPressClient:
+    """
+    WordPressClientのasyncio版
+
+    同期クライアントの接続プールを共有し、各リクエストを専用スレッドプールで
+    実行する。セマフォでサーバーへの同時リクエスト数を制限する。
+    """
+
+    def __init__(self,
+                 api_url: Optional[str] = None,
+                 username: Optional[str] = None,
+                 app_password: Optional[str] = None,
+                 max_concurrency: int = 4,
+                 client: Optional[WordPressClient] = None):
+        """
+        非同期クライアントの初期化
+
+        Args:
+            api_url: WordPress REST APIのURL
+            username: WordPressユーザー名
+            app_password: アプリケーションパスワード
+            max_concurrency: 同時に実行するリクエストの上限
+            client: ラップする同期クライアント（省略時は新規作成）
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrencyは1以上を指定してください")
+
+        self.max_concurrency = max_concurrency
+        self._owns_client = client is None
+        # 同時実行数以上の接続をプールに保持し、接続待ちを防ぐ
+        self.client = client or WordPressClient(
+            api_url=api_url,
+            username=username,
+            app_password=app_password,
+            pool_maxsize=max_concurrency
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix='wp-async'
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """実行中のイベントループに紐づくセマフォを取得"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """同時実行数の制限内で同期メソッドを実行"""
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(func, *args, **kwargs)
+            )
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        同期クライアントを使う任意の処理を同時実行数の制限内で実行
+
+        画像のダウンロードとアップロードのように複数のリクエストをまとめた処理に使う。
+        """
+        return await self._run(func, *args, **kwargs)
+
+    async def test_connection(self) -> bool:
+        """APIへの接続をテスト"""
+        return await self._run(self.client.test_connection)
+
+    async def create_post(self, title: str, content: str, **kwargs) -> Dict:
+        """新規記事を作成（引数はWordPressClient.create_postと同じ）"""
+        return await self._run(self.client.create_post, title, content, **kwargs)
+
+    async def update_post(self, post_id: int, **kwargs) -> Dict:
+        """既存の記事を更新"""
+        return await self._run(self.client.update_post, post_id, **kwargs)
+
+    async def get_post(self, post_id: int) -> Dict:
+        """投稿を取得"""
+        return await self._run(self.client.get_post, post_id)
+
+    async def get_posts(self, **params) -> List[Dict]:
+        """投稿一覧を取得"""
+        return await self._run(self.client.get_posts, **params)
+
+    async def upload_media(self, **kwargs) -> Dict:
+        """メディアをアップロード（引数はWordPressClient.upload_mediaと同じ）"""
+        return await self._run(self.client.upload_media, **kwargs)
+
+    async def get_categories(self) -> List[Dict]:
+        """カテゴリー一覧を取得"""
+        return await self._run(self.client.get_categories)
+
+    async def create_category(self, name: str, description: str = "",
+                              slug: Optional[str] = None, parent: int = 0) -> Dict:
+        """新規カテゴリーを作成"""
+        return await self._run(self.client.create_category, name, description, slug, parent)
+
+    async def get_tags(self) -> List[Dict]:
+        """タグ一覧を取得"""
+        return await self._run(self.client.get_tags)
+
+    async def create_tag(self, name: str, description: str = "",
+                         slug: Optional[str] = None) -> Dict:
+        """新規タグを作成"""
+        return await self._run(self.client.create_tag, name, description, slug)
+
+    async def find_or_create_tags(self, tag_names: List[str]) -> List[int]:
+        """
+        タグを検索し、なければ作成
+
+        不足しているタグは同期クライアントと同じく一括リクエスト（/batch/v1）で
+        まとめて作成する。戻り値のタグIDは入力順を保持する。
+        """
+        return await self._run(self.client.find_or_create_tags, tag_names)
+
+    def get_request_stats(self) -> Dict[str, int]:
+        """リクエスト数と接続再利用の統計を取得"""
+        return self.client.get_request_stats()
+
+    async def close(self):
+        """スレッドプールと所有しているセッションを閉じる"""
+        # 実行中のリクエストの完了待ちでイベントループを止めないよう別スレッドで待つ
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown, True)
+        if self._owns_client:
+            self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,209 @@
+"""
+WordPress Batch Requests
+AI Melody Kobo - /batch/v1 エンドポイントによる一括リクエスト
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class BatchItem:
+    """一括リクエスト内の1件分の結果"""
+
+    def __init__(self, method: str, path: str, body: Dict,
+                 fallback: Callable[[], Dict],
+                 taxonomy: Optional[str] = None):
+        """
+        Args:
+            method: HTTPメソッド
+            path: REST APIのルート（例: /wp/v2/tags）
+            body: リクエストボディ
+            fallback: 一括リクエスト非対応時に個別に実行する関数
+            taxonomy: ターム作成の場合のタクソノミー名
+        """
+        self.method = method
+        self.path = path
+        self.body = body
+        self.fallback = fallback
+        self.taxonomy = taxonomy
+        self.status: Optional[int] = None
+        self.result: Optional[Dict] = None
+        self.error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """成功したかどうか"""
+        return self.result is not None and self.error is None
+
+    def to_request(self) -> Dict[str, Any]:
+        """batch/v1のサブリクエスト形式に変換"""
+        return {'method': self.method, 'path': self.path, 'body': self.body}
+
+
+class WordPressBatch:
+    """
+    ターム作成・記事更新をまとめて送信するバッチ
+
+    WordPress 5.6以降の /batch/v1 に最大25件ずつ送信する。
+    サーバーが一括リクエストに対応していない場合は個別リクエストに切り替える。
+
+    使用例:
+        with client.batch() as batch:
+            item = batch.create_tag('Suno')
+        print(item.result['id'])
+    """
+
+    MAX_REQUESTS = 25
+
+    def __init__(self, client):
+        """
+        Args:
+            client: 送信に使用するWordPressClient
+        """
+        self.client = client
+        self._items: List[BatchItem] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
+
+    def create_tag(self, name: str, description: str = "",
+                   slug: Optional[str] = None) -> BatchItem:
+        """タグ作成を追加"""
+        body = {'name': name.strip(), 'description': description}
+        if slug:
+            body['slug'] = slug
+        return self._add(BatchItem(
+            'POST', f"{self.client.route_prefix}/tags", body,
+            fallback=lambda: self.client.create_tag(name, description, slug),
+            taxonomy='tags'
+        ))
+
+    def create_category(self, name: str, description: str = "",
+                        slug: Optional[str] = None, parent: int = 0) -> BatchItem:
+        """カテゴリー作成を追加"""
+        body = {'name': name, 'description': description, 'parent': parent}
+        if slug:
+            body['slug'] = slug
+        return self._add(BatchItem(
+            'POST', f"{self.client.route_prefix}/categories", body,
+            fallback=lambda: self.client.create_category(name, description, slug, parent),
+            taxonomy='categories'
+        ))
+
+    def update_post(self, post_id: int, **fields) -> BatchItem:
+        """記事更新を追加"""
+        return self._add(BatchItem(
+            'POST', f"{self.client.route_prefix}/posts/{post_id}", fields,
+            fallback=lambda: self.client.update_post(post_id, **fields)
+        ))
+
+    def _add(self, item: BatchItem) -> BatchItem:
+        self._items.append(item)
+        return item
+
+    def flush(self) -> List[BatchItem]:
+        """
+        溜まっているリクエストを送信
+
+        Returns:
+            送信した項目のリスト（各項目にresultまたはerrorが設定される）
+        """
+        items, self._items = self._items, []
+        if not items:
+            return items
+
+        for start in range(0, len(items), self.MAX_REQUESTS):
+            chunk = items[start:start + self.MAX_REQUESTS]
+            if not self.client.batch_supported or not self._send_chunk(chunk):
+                self._send_individually(chunk)
+
+        failed = sum(1 for item in items if not item.ok)
+        logger.info(f"一括リクエスト完了: {len(items) - failed}件成功, {failed}件失敗")
+        return items
+
+    def _send_chunk(self, chunk: List[BatchItem]) -> bool:
+        """
+        1チャンクを/batch/v1で送信
+
+        Returns:
+            一括送信できた場合True（非対応と判明した場合False）
+        """
+        try:
+            response = self.client.session.post(
+                self.client.batch_url,
+                headers=self.client.headers,
+                data=json.dumps({
+                    'validation': 'normal',
+                    'requests': [item.to_request() for item in chunk]
+                }),
+                timeout=60,
+                retry_safe=True  # ターム作成と記事更新は再送しても重複しない
+            )
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"一括リクエスト送信エラー、個別送信に切り替えます: {str(e)}")
+            return False
+
+        if response.status_code in (404, 405) or response.status_code >= 500:
+            if response.status_code in (404, 405):
+                logger.info("サーバーが一括リクエストに対応していないため個別送信に切り替えます")
+                self.client.batch_supported = False
+            return False
+
+        try:
+            payload = response.json()
+        except ValueError:
+            return False
+
+        responses = payload.get('responses') if isinstance(payload, dict) else None
+        if responses is None or len(responses) != len(chunk):
+            # validation失敗時などはサブレスポンスが返らない
+            logger.warning(f"一括リクエストが拒否されました: HTTP {response.status_code}")
+            return False
+
+        for item, sub in zip(chunk, responses):
+            self._apply_response(item, sub)
+        return True
+
+    def _apply_response(self, item: BatchItem, sub: Dict):
+        """サブレスポンスを項目に反映"""
+        item.status = sub.get('status')
+        body = sub.get('body')
+
+        if item.status and 200 <= item.status < 300:
+            item.result = body
+        elif item.taxonomy and isinstance(body, dict) and body.get('code') == 'term_exists':
+            # 既存タームのIDが返るため成功として扱う
+            item.result = {'id': (body.get('data') or {}).get('term_id'),
+                           'name': item.body['name']}
+        else:
+            message = body.get('message') if isinstance(body, dict) else body
+            item.error = f"HTTP {item.status}: {message}"
+            logger.warning(f"一括リクエストの項目が失敗: {item.path} {item.error}")
+            return
+
+        if item.taxonomy:
+            self.client.taxonomy.add_term(item.taxonomy, item.result)
+
+    def _send_individually(self, chunk: List[BatchItem]):
+        """個別リクエストで送信"""
+        for item in chunk:
+            try:
+                item.result = item.fallback()
+                item.status = 200
+                if item.result is None:
+                    item.error = "結果が返されませんでした"
+            except Exception as e:
+                item.error = str(e)
+                logger.warning(f"個別リクエストが失敗: {item.path} {item.error}")
@@ -171,35 +171,76 @@ class CategoryManager:
         logger.info("カテゴリー構造のセットアップを開始")
         category_ids = {}
         
-        # 既存のカテゴリーを取得
-        existing_categories = self.wp_client.get_categories()
+        # 既存のカテゴリーを取得（全件スナップショットから）
+        try:
+            existing_categories = self.wp_client.taxonomy.get_terms('categories')
+        except Exception as e:
+            logger.error(f"カテゴリー一覧取得エラー: {str(e)}")
+            existing_categories = []
         for cat in existing_categories:
             self.category_cache[cat['name']] = cat['id']
         
-        # カテゴリー構造を作成
-        for parent_name, parent_info in self.CATEGORY_STRUCTURE.items():
-            # 親カテゴリーを作成
-            parent_id = self._ensure_category_exists(
-                parent_name, 
-                parent_info['description'],
-                parent_info['slug']
-            )
-            category_ids[parent_name] = parent_id
-            
-            # 子カテゴリーを作成
-            if 'children' in parent_info:
-                for child_name, child_info in parent_info['children'].items():
-                    child_id = self._ensure_category_exists(
-                        child_name,
-                        child_info['description'],
-                        child_info['slug'],
-                        parent_id
-                    )
-                    category_ids[child_name] = child_id
+        # 親カテゴリーを作成（不足分は一括リクエストでまとめて作成）
+        category_ids.update(self._ensure_categories_exist([
+            (parent_name, parent_info['description'], parent_info['slug'], 0)
+            for parent_name, parent_info in self.CATEGORY_STRUCTURE.items()
+        ]))
+        
+        # 子カテゴリーを作成
+        category_ids.update(self._ensure_categories_exist([
+            (child_name, child_info['description'], child_info['slug'], category_ids[parent_name])
+            for parent_name, parent_info in self.CATEGORY_STRUCTURE.items()
+            for child_name, child_info in parent_info.get('children', {}).items()
+        ]))
         
         logger.info(f"カテゴリー構造のセットアップ完了: {len(category_ids)}個のカテゴリー")
         return category_ids
     
+    def _ensure_categories_exist(self, specs: List[Tuple[str, str, str, int]]) -> Dict[str, int]:
+        """
+        複数のカテゴリーが存在することを確認し、不足分をまとめて作成
+        
+        Args:
+            specs: (カテゴリー名, 説明, スラッグ, 親カテゴリーID) のリスト
+            
+        Returns:
+            カテゴリー名とIDのマッピング
+        """
+        category_ids = {}
+        missing = []
+        
+        for name, description, slug, parent in specs:
+            if name in self.category_cache:
+                category_ids[name] = self.category_cache[name]
+                continue
+            try:
+                category_id = self.wp_client.taxonomy.get_id('categories', name)
+            except Exception as e:
+                logger.error(f"カテゴリー検索エラー ({name}): {str(e)}")
+                category_id = None
+            if category_id:
+                self.category_cache[name] = category_id
+                category_ids[name] = category_id
+            else:
+                missing.append((name, description, slug, parent))
+        
+        if not missing:
+            return category_ids
+        
+        logger.info(f"新規カテゴリーを作成: {', '.join(spec[0] for spec in missing)}")
+        with self.wp_client.batch() as batch:
+            items = [(spec[0], batch.create_category(*spec)) for spec in missing]
+        
+        for name, item in items:
+            if item.ok and item.result.get('id'):
+                self.category_cache[name] = item.result['id']
+                category_ids[name] = item.result['id']
+            else:
+                logger.error(f"カテゴリー作成エラー ({name}): {item.error}")
+                category_ids[name] = 1  # デフォルトカテゴリー
+        
+        return category_ids
+    
     def _ensure_category_exists(self, name: str, description: str = "", 
                                slug: str = None, parent: int = 0) -> int:
         """
@@ -218,13 +259,12 @@ class CategoryManager:
         if name in self.category_cache:
             return self.category_cache[name]
         
-        # WordPressから取得
+        # 全件スナップショットから取得
         try:
-            categories = self.wp_client.get_categories()
-            for cat in categories:
-                if cat['name'] == name:
-                    self.category_cache[name] = cat['id']
-                    return cat['id']
+            category_id = self.wp_client.taxonomy.get_id('categories', name)
+            if category_id:
+                self.category_cache[name] = category_id
+                return category_id
             
             # カテゴリーが存在しない場合は作成
             logger.info(f"新規カテゴリーを作成: {name}")
@@ -3,35 +3,159 @@ Markdown to HTML Converter
 AI Melody Kobo - Markdown記事をWordPress用HTMLに変換
 """
 
+import os
 import re
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 import markdown
 from bs4 import BeautifulSoup
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, Iterator, List, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class MarkdownEngine:
+    """
+    markdown.Markdownインスタンスのプールと変換結果のキャッシュ
+
+    markdown.Markdownは変換のたびに内部状態（目次・メタ情報・脚注等）を持つため
+    スレッド間で共有できない。インスタンスをプールし、貸し出すたびに reset() して
+    1スレッド1インスタンスで使う。変換結果は本文のハッシュでキャッシュし、
+    同じ本文（本文と抜粋、再投稿等）を再変換しない。
+    """
+
+    EXTENSIONS = [
+        'markdown.extensions.extra',
+        'markdown.extensions.codehilite',
+        'markdown.extensions.tables',
+        'markdown.extensions.toc',
+        'markdown.extensions.meta',
+        'markdown.extensions.md_in_html'
+    ]
+    EXTENSION_CONFIGS = {
+        'markdown.extensions.codehilite': {'css_class': 'highlight'},
+        'markdown.extensions.extra': {'markdown_in_html_blocks': True}
+    }
+
+    _shared: Optional['MarkdownEngine'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_cached: Optional[int] = None):
+        """
+        Args:
+            max_cached: キャッシュする変換結果の件数（省略時は環境変数MARKDOWN_CACHE_SIZE、既定256。0で無効）
+        """
+        self.max_cached = max_cached if max_cached is not None else int(
+            os.getenv('MARKDOWN_CACHE_SIZE', '256'))
+        self._pool: List[markdown.Markdown] = []
+        self._pool_lock = threading.Lock()
+        self._cache: 'OrderedDict[str, str]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.created = 0
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls) -> 'MarkdownEngine':
+        """プロセス共有のエンジンを取得"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @contextmanager
+    def checkout(self) -> Iterator[markdown.Markdown]:
+        """リセット済みのmarkdown.Markdownを借りる（ブロックを抜けるとプールに戻る）"""
+        with self._pool_lock:
+            md = self._pool.pop() if self._pool else None
+            if md is None:
+                self.created += 1
+        if md is None:
+            md = markdown.Markdown(extensions=self.EXTENSIONS,
+                                   extension_configs=self.EXTENSION_CONFIGS)
+        md.reset()
+        try:
+            yield md
+        finally:
+            with self._pool_lock:
+                self._pool.append(md)
+
+    def convert(self, text: str) -> str:
+        """MarkdownをHTMLに変換（同じ本文はキャッシュから返す）"""
+        key = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        with self._cache_lock:
+            html = self._cache.get(key)
+            if html is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return html
+            self.misses += 1
+
+        with self.checkout() as md:
+            html = md.convert(text)
+
+        if self.max_cached > 0:
+            with self._cache_lock:
+                self._cache[key] = html
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.max_cached:
+                    self._cache.popitem(last=False)
+        return html
+
+    def get_stats(self) -> Dict[str, Any]:
+        """プール・キャッシュの統計"""
+        with self._cache_lock:
+            cached = len(self._cache)
+        with self._pool_lock:
+            pooled = len(self._pool)
+        return {
+            'instances': self.created,
+            'idle_instances': pooled,
+            'cached': cached,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
 class ArticleConverter:
     """Markdown記事をWordPress用に変換するクラス"""
     
-    def __init__(self):
-        """コンバーターの初期化"""
-        # Markdown拡張機能の設定
-        self.md = markdown.Markdown(
-            extensions=[
-                'markdown.extensions.extra',
-                'markdown.extensions.codehilite',
-                'markdown.extensions.tables',
-                'markdown.extensions.toc',
-                'markdown.extensions.meta',
-                'markdown.extensions.md_in_html'
-            ],
-            extension_configs={
-                'markdown.extensions.codehilite': {'css_class': 'highlight'},
-                'markdown.extensions.extra': {'markdown_in_html_blocks': True}
-            }
-        )
+    # CTAボタン指示（[CTAボタン: ラベル]）を置き換えるWordPressのボタンブロック
+    CTA_BUTTON_HTML = (
+        '<div class="wp-block-buttons is-content-justification-center is-layout-flex '
+        'wp-container-core-buttons-layout-1 wp-block-buttons-is-layout-flex">\n'
+        '<div class="wp-block-button"><a class="wp-block-button__link wp-element-button" '
+        'href="/newsletter" style="background-color:#ff6b35;color:#ffffff;padding:15px 30px;'
+        'font-size:18px;font-weight:bold;border-radius:5px;text-decoration:none;">{label}</a></div>\n'
+        '</div>'
+    )
+    
+    # HR要素で囲まれたCTAセクションの装飾（ブランドCTA・メルマガCTA）
+    CTA_BLOCK_STYLES = {
+        'brand': {
+            'div': 'background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; margin: 40px 0; border-radius: 10px; text-align: center;',
+            'h3': 'color: white; margin-bottom: 15px;',
+            'p': 'color: white; margin-bottom: 20px;',
+            'a': 'background: white; color: #667eea; padding: 15px 30px; text-decoration: none; border-radius: 5px; display: inline-block; font-weight: bold; margin-top: 10px;'
+        },
+        'newsletter': {
+            'div': 'background-color: #FFF8E1; border: 2px solid #ff6b35; border-radius: 10px; padding: 30px; margin: 40px 0; text-align: center;',
+            'h3': 'color: #ff6b35; margin-bottom: 20px;',
+            'p': 'margin-bottom: 25px;'
+        }
+    }
+    
+    def __init__(self, engine: Optional[MarkdownEngine] = None):
+        """
+        コンバーターの初期化
+        
+        Args:
+            engine: Markdown変換エンジン（省略時はプロセス共有のエンジン）
+        """
+        self.engine = engine or MarkdownEngine.shared()
         
     def parse_article(self, markdown_content: str) -> Dict:
         """
@@ -54,16 +178,7 @@ class ArticleConverter:
         content_without_meta = self._remove_meta_information(content_without_title)
         
         # HTMLに変換
-        html_content = self.md.convert(content_without_meta)
-        
-        # 画像・動画挿入指示を処理
-        html_content = self._process_media_instructions(html_content)
-        
-        # リンク指示を処理
-        html_content = self._process_link_instructions(html_content)
-        
-        # CTAブロックを装飾
-        html_content = self._enhance_cta_blocks(html_content)
+        html_content = self._render_body(content_without_meta)
         
         # メタ情報の抽出
         tags = self._extract_tags(markdown_content)
@@ -81,6 +196,43 @@ class ArticleConverter:
             'original_markdown': markdown_content
         }
     
+    def markdown_to_html(self, markdown_content: str, media_placeholders: bool = True) -> str:
+        """
+        Markdown記事の本文をWordPress投稿用のHTMLに変換
+        
+        タイトル（最初のH1）・WordPressタグ・メタディスクリプションを除いた本文を、
+        convert_to_wordpress_html() と同じ手順でHTMLにする。
+        
+        Args:
+            markdown_content: Markdown形式の記事
+            media_placeholders: 画像・動画挿入指示をプレースホルダーに変換するか
+                （Falseの場合は指示を残し、呼び出し側で実際の画像に置き換える）
+            
+        Returns:
+            本文のHTML
+        """
+        content_without_title = re.sub(r'^#\s+.+$', '', markdown_content, count=1, flags=re.MULTILINE).strip()
+        content_without_meta = self._remove_meta_information(content_without_title)
+        html_content = self._render_body(content_without_meta, media_placeholders)
+        return self._optimize_for_wordpress(html_content)
+    
+    def _render_body(self, content: str, media_placeholders: bool = True) -> str:
+        """本文のMarkdownをHTMLに変換し、挿入指示・CTAを処理"""
+        html_content = self.engine.convert(content)
+        
+        # 画像・動画挿入指示を処理
+        if media_placeholders:
+            html_content = self._process_media_instructions(html_content)
+        
+        # リンク指示を処理
+        html_content = self._process_link_instructions(html_content)
+        
+        # CTAボタン指示を処理
+        html_content = self._process_cta_buttons(html_content)
+        
+        # CTAブロックを装飾
+        return self._enhance_cta_blocks(html_content)
+    
     def _process_media_instructions(self, html_content: str) -> str:
         """画像・動画挿入指示を処理"""
         # [画像挿入指示: description] をプレースホルダーに変換
@@ -109,6 +261,22 @@ class ArticleConverter:
         
         return html_content
     
+    def _process_cta_buttons(self, html_content: str) -> str:
+        """CTAボタン指示とCTA見出しをHTMLに変換"""
+        # [CTAボタン: ラベル] をボタンブロックに変換（段落だけの場合は段落ごと置き換える）
+        html_content = re.sub(
+            r'(?:<p>\s*)?\[CTAボタン:\s*([^\]]+?)\s*\](?:\s*</p>)?',
+            lambda m: self.CTA_BUTTON_HTML.format(label=m.group(1)),
+            html_content
+        )
+        
+        # 段落だけの **💌 ...** をCTA見出しに変換
+        return re.sub(
+            r'<p><strong>(💌[^<]*)</strong></p>',
+            r'<h3 style="text-align: center; color: #ff6b35;">\1</h3>',
+            html_content
+        )
+    
     def _enhance_cta_blocks(self, html_content: str) -> str:
         """CTAブロックを装飾"""
         soup = BeautifulSoup(html_content, 'html.parser')
@@ -124,11 +292,18 @@ class ArticleConverter:
                     cta_content.append(str(current))
                 current = current.next_sibling
             
-            if cta_content and 'AI Melody Kobo' in ' '.join(cta_content):
+            joined = ' '.join(cta_content)
+            styles = None
+            if cta_content and 'AI Melody Kobo' in joined:
+                styles = self.CTA_BLOCK_STYLES['brand']
+            elif cta_content and '💌' in joined and 'wp-block-buttons' in joined:
+                styles = self.CTA_BLOCK_STYLES['newsletter']
+            
+            if styles:
                 # CTAブロックをdivで囲む
                 cta_div = soup.new_tag('div', attrs={
                     'class': 'cta-block',
-                    'style': 'background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; margin: 40px 0; border-radius: 10px; text-align: center;'
+                    'style': styles['div']
                 })
                 
                 # CTAコンテンツを新しいdivに移動
@@ -137,12 +312,8 @@ class ArticleConverter:
                     for elem in elem_soup:
                         if hasattr(elem, 'name'):
                             # スタイルを調整
-                            if elem.name == 'h3':
-                                elem['style'] = 'color: white; margin-bottom: 15px;'
-                            elif elem.name == 'p':
-                                elem['style'] = 'color: white; margin-bottom: 20px;'
-                            elif elem.name == 'a':
-                                elem['style'] = 'background: white; color: #667eea; padding: 15px 30px; text-decoration: none; border-radius: 5px; display: inline-block; font-weight: bold; margin-top: 10px;'
+                            if elem.name in ('h3', 'p', 'a') and elem.name in styles:
+                                elem['style'] = styles[elem.name]
                             cta_div.append(elem)
                 
                 # 元のコンテンツを削除してCTAブロックを挿入
@@ -179,7 +350,7 @@ class ArticleConverter:
     def _generate_excerpt(self, content: str) -> str:
         """記事の抜粋を生成"""
         # Markdownを一時的にHTMLに変換してテキストを抽出
-        html = self.md.convert(content)
+        html = self.engine.convert(content)
         soup = BeautifulSoup(html, 'html.parser')
         text = soup.get_text()
         
@@ -0,0 +1,245 @@
+"""
+WordPress HTTP Session Layer
+AI Melody Kobo - 接続プール付きHTTPセッション管理
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Callable, Dict, Optional
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .retry import RetryPolicy, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class PooledSession:
+    """keep-alive接続を再利用する接続プール付きHTTPセッション"""
+
+    def __init__(self,
+                 pool_connections: Optional[int] = None,
+                 pool_maxsize: Optional[int] = None,
+                 pool_block: bool = False,
+                 keep_alive: bool = True,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[TokenBucket] = None):
+        """
+        セッションの初期化
+
+        Args:
+            pool_connections: キャッシュするホスト別プールの数
+            pool_maxsize: ホストごとに保持する最大接続数
+            pool_block: Trueの場合、ホストごとの接続数がpool_maxsizeを超えないよう待機
+            keep_alive: Falseの場合、リクエストごとに接続を閉じる
+            retry_policy: リトライ方針（省略時は既定の指数バックオフ）
+            rate_limiter: レートリミッター（省略時はプロセス共有のもの）
+        """
+        self.pool_connections = pool_connections or int(
+            os.getenv('WORDPRESS_POOL_CONNECTIONS', '4'))
+        self.pool_maxsize = pool_maxsize or int(
+            os.getenv('WORDPRESS_POOL_MAXSIZE', '10'))
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter or TokenBucket.shared()
+
+        self.session = requests.Session()
+        self.adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
+        )
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+
+        if not self.keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+        self._lock = threading.Lock()
+        self._request_count = 0
+        self._error_count = 0
+        self._retry_count = 0
+        self._throttled_count = 0
+        self._rate_limited_count = 0
+        self._recovered_count = 0
+        self._wait_seconds = 0.0
+        self._closed = False
+        self._final_stats: Optional[Dict[str, float]] = None
+
+    def request(self, method: str, url: str,
+                retry_safe: Optional[bool] = None,
+                recover: Optional[Callable[[], Optional[Dict]]] = None,
+                **kwargs) -> requests.Response:
+        """
+        プール済み接続でリクエストを送信（レート制限・リトライ付き）
+
+        Args:
+            method: HTTPメソッド
+            url: リクエストURL
+            retry_safe: 再送しても安全か（省略時はメソッドと冪等キーから判定）
+            recover: 非冪等リクエストの再送前に呼ばれる関数。
+                     既に処理済みの結果(dict)を返した場合は再送せずそれを返す
+            **kwargs: requests.Session.requestに渡す引数
+
+        Returns:
+            レスポンス
+        """
+        if self._closed:
+            raise RuntimeError("クローズ済みのセッションは使用できません")
+
+        policy = self.retry_policy
+        if retry_safe is None:
+            retry_safe = policy.is_retry_safe(method, kwargs.get('headers'))
+        attempt = 0
+
+        # ストリーム本文は再送時に先頭へ巻き戻す
+        body = kwargs.get('data')
+        body_start = body.tell() if hasattr(body, 'seek') and hasattr(body, 'tell') else None
+
+        while True:
+            if attempt and body_start is not None:
+                body.seek(body_start)
+
+            self._wait(self.rate_limiter.acquire(), rate_limited=True)
+            with self._lock:
+                self._request_count += 1
+
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                with self._lock:
+                    self._error_count += 1
+                if attempt >= policy.max_retries or not policy.should_retry_exception(e, retry_safe):
+                    raise
+                delay = policy.backoff(attempt)
+                logger.warning(f"通信エラーのためリトライします ({attempt + 1}/{policy.max_retries}, "
+                               f"{delay:.1f}秒後): {method} {url}: {str(e)}")
+            else:
+                if attempt >= policy.max_retries or not policy.should_retry_response(response, retry_safe):
+                    return response
+                if response.status_code in policy.UNPROCESSED_STATUSES:
+                    with self._lock:
+                        self._throttled_count += 1
+                retry_after = policy.retry_after(response)
+                delay = retry_after if retry_after is not None else policy.backoff(attempt)
+                logger.warning(f"HTTP {response.status_code} のためリトライします "
+                               f"({attempt + 1}/{policy.max_retries}, {delay:.1f}秒後): {method} {url}")
+                response.close()
+
+            self._wait(delay)
+            attempt += 1
+            with self._lock:
+                self._retry_count += 1
+
+            # 前回の送信が処理済みかもしれない場合は、再送前に結果を確認する
+            if recover is not None:
+                recovered = recover()
+                if recovered is not None:
+                    with self._lock:
+                        self._recovered_count += 1
+                    logger.info(f"処理済みの結果を回収したため再送を省略: {method} {url}")
+                    return self._json_response(recovered, url)
+
+    def _wait(self, seconds: float, rate_limited: bool = False):
+        """待機して待ち時間を記録"""
+        if seconds <= 0:
+            return
+        if not rate_limited:
+            time.sleep(seconds)
+        with self._lock:
+            self._wait_seconds += seconds
+            if rate_limited:
+                self._rate_limited_count += 1
+
+    @staticmethod
+    def _json_response(data: Dict, url: str) -> requests.Response:
+        """回収した結果をレスポンスとして包む"""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers['Content-Type'] = 'application/json'
+        response._content = json.dumps(data).encode('utf-8')
+        response.encoding = 'utf-8'
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GETリクエストを送信"""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """POSTリクエストを送信"""
+        return self.request('POST', url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        """DELETEリクエストを送信"""
+        return self.request('DELETE', url, **kwargs)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        リクエスト数と接続の再利用状況を取得
+
+        Returns:
+            requests: 送信したリクエスト数
+            errors: 通信エラー数
+            connections_opened: 新規に確立した接続数
+            connections_reused: 既存接続を再利用したリクエスト数
+            host_pools: 現在保持しているホスト別プール数
+            retries: リトライした回数
+            throttled: 429/503で制限された回数
+            rate_limited: レートリミッターで待機した回数
+            recovered: 再送前に処理済みの結果を回収した回数
+            wait_seconds: バックオフとレート制限で待機した合計秒数
+        """
+        if self._final_stats is not None:
+            return dict(self._final_stats)
+
+        opened = 0
+        pooled_requests = 0
+        host_pools = 0
+
+        poolmanager = getattr(self.adapter, 'poolmanager', None)
+        if poolmanager is not None:
+            for key in list(poolmanager.pools.keys()):
+                pool = poolmanager.pools.get(key)
+                if pool is None:
+                    continue
+                host_pools += 1
+                opened += getattr(pool, 'num_connections', 0)
+                pooled_requests += getattr(pool, 'num_requests', 0)
+
+        return {
+            'requests': self._request_count,
+            'errors': self._error_count,
+            'connections_opened': opened,
+            'connections_reused': max(0, pooled_requests - opened),
+            'host_pools': host_pools,
+            'retries': self._retry_count,
+            'throttled': self._throttled_count,
+            'rate_limited': self._rate_limited_count,
+            'recovered': self._recovered_count,
+            'wait_seconds': round(self._wait_seconds, 3)
+        }
+
+    def close(self):
+        """プール内の全接続を閉じる"""
+        if self._closed:
+            return
+        stats = self.get_stats()
+        self._final_stats = stats
+        self._closed = True
+        self.session.close()
+        logger.debug(
+            f"HTTPセッションを終了: リクエスト {stats['requests']}件, "
+            f"新規接続 {stats['connections_opened']}件, 再利用 {stats['connections_reused']}件"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
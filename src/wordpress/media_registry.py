@@ -0,0 +1,130 @@
+"""
+Media Deduplication Registry
+AI Melody Kobo - メディア内容のハッシュとWordPressメディアIDの対応表
+"""
+
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional
+import logging
+
+from .upload_stream import CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class MediaRegistry:
+    """
+    SHA-256 → WordPressメディア（ID・source_url）の永続レジストリ
+
+    同じ内容の画像を再アップロードせず、既存の添付ファイルを再利用するために使う。
+    取得元URL → SHA-256 の対応も保持し、ダウンロード自体も省略できるようにする。
+    """
+
+    def __init__(self, registry_file: str):
+        """
+        Args:
+            registry_file: レジストリを保存するJSONファイルのパス
+        """
+        self.registry_file = Path(registry_file)
+        self._lock = threading.Lock()
+        self._media: Dict[str, Dict] = {}
+        self._urls: Dict[str, str] = {}
+        self._load()
+
+    @staticmethod
+    def hash_stream(stream: BinaryIO) -> str:
+        """ストリームの現在位置以降のSHA-256を計算（位置は元に戻す）"""
+        start = stream.tell()
+        digest = hashlib.sha256()
+        while True:
+            chunk = stream.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+        stream.seek(start)
+        return digest.hexdigest()
+
+    def _load(self):
+        """レジストリファイルを読み込み"""
+        if not self.registry_file.exists():
+            return
+        try:
+            with open(self.registry_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._media = data.get('media', {})
+            self._urls = data.get('urls', {})
+            logger.debug(f"メディアレジストリを読み込みました: {len(self._media)}件")
+        except Exception as e:
+            logger.warning(f"メディアレジストリ読み込みエラー: {e}")
+
+    def _save(self):
+        """レジストリファイルに保存（呼び出し側でロックを保持すること）"""
+        try:
+            self.registry_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.registry_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'media': self._media, 'urls': self._urls},
+                          f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.registry_file)
+        except Exception as e:
+            logger.warning(f"メディアレジストリ保存エラー: {e}")
+
+    def __len__(self) -> int:
+        return len(self._media)
+
+    def get(self, sha256: str) -> Optional[Dict]:
+        """ハッシュに対応する既存メディアを取得"""
+        with self._lock:
+            entry = self._media.get(sha256)
+            return dict(entry) if entry else None
+
+    def put(self, sha256: str, media: Dict):
+        """アップロード済みメディアを登録"""
+        if not media or 'id' not in media:
+            return
+        with self._lock:
+            self._media[sha256] = {
+                'id': media['id'],
+                'source_url': media.get('source_url'),
+                'mime_type': media.get('mime_type'),
+                'registered_at': datetime.now().isoformat()
+            }
+            self._save()
+
+    def get_by_url(self, url: str) -> Optional[Dict]:
+        """取得元URLからアップロード済みメディアを取得"""
+        with self._lock:
+            sha256 = self._urls.get(url)
+            entry = self._media.get(sha256) if sha256 else None
+            return dict(entry) if entry else None
+
+    def link_url(self, url: str, sha256: str):
+        """取得元URLとハッシュを関連付ける"""
+        with self._lock:
+            if self._urls.get(url) == sha256:
+                return
+            self._urls[url] = sha256
+            self._save()
+
+    def forget(self, sha256: str):
+        """メディアの登録を削除（WordPress側で削除された場合など）"""
+        with self._lock:
+            self._forget(sha256)
+
+    def forget_media_id(self, media_id: int):
+        """メディアIDで登録を削除（投稿時に無効なメディアIDと判明した場合など）"""
+        with self._lock:
+            for sha256 in [h for h, entry in self._media.items() if entry.get('id') == media_id]:
+                self._forget(sha256)
+
+    def _forget(self, sha256: str):
+        """登録とURLの関連付けを削除（呼び出し側でロックを保持すること）"""
+        if self._media.pop(sha256, None) is None:
+            return
+        self._urls = {url: h for url, h in self._urls.items() if h != sha256}
+        self._save()
@@ -0,0 +1,151 @@
+"""
+Retry Policy and Rate Limiter
+AI Melody Kobo - WordPress APIへのリトライ・バックオフ・流量制御
+"""
+
+import os
+import time
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+import logging
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    トークンバケット方式のレートリミッター
+
+    shared()で取得するインスタンスはプロセス内の全クライアントで共有される。
+    """
+
+    _shared: Optional['TokenBucket'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: 1秒あたりに補充されるトークン数（0以下で無制限）
+            burst: バケットの最大容量
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> 'TokenBucket':
+        """プロセス共有のリミッターを取得（環境変数で設定）"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(
+                    rate=float(os.getenv('WORDPRESS_RATE_LIMIT', '5')),
+                    burst=int(os.getenv('WORDPRESS_RATE_BURST', '10'))
+                )
+            return cls._shared
+
+    def acquire(self) -> float:
+        """
+        トークンを1つ取得（不足時は補充まで待機）
+
+        Returns:
+            待機した秒数
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class RetryPolicy:
+    """指数バックオフ（フルジッター）とRetry-Afterに従うリトライ方針"""
+
+    # 再送しても副作用が重複しないHTTPメソッド
+    IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+    # 一時的な障害とみなすステータス
+    RETRY_STATUSES = frozenset([429, 502, 503, 504])
+
+    # サーバーがリクエストを処理していないことが保証されるステータス
+    UNPROCESSED_STATUSES = frozenset([429, 503])
+
+    def __init__(self,
+                 max_retries: Optional[int] = None,
+                 backoff_base: float = 0.5,
+                 backoff_cap: float = 30.0,
+                 max_retry_after: float = 120.0):
+        """
+        Args:
+            max_retries: 最大リトライ回数
+            backoff_base: バックオフの基準秒数
+            backoff_cap: 1回あたりの最大待機秒数
+            max_retry_after: Retry-Afterとして受け入れる最大秒数
+        """
+        self.max_retries = max_retries if max_retries is not None else int(
+            os.getenv('WORDPRESS_MAX_RETRIES', '3'))
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.max_retry_after = max_retry_after
+        # ジッター用の乱数はグローバルなrandomの状態に影響させない
+        self._random = random.Random()
+
+    def is_retry_safe(self, method: str, headers: Optional[dict]) -> bool:
+        """再送しても安全なリクエストかどうか（冪等メソッドまたは冪等キー付き）"""
+        if method.upper() in self.IDEMPOTENT_METHODS:
+            return True
+        return bool(headers and headers.get('Idempotency-Key'))
+
+    def should_retry_response(self, response: requests.Response, retry_safe: bool) -> bool:
+        """レスポンスに対してリトライすべきか"""
+        if response.status_code not in self.RETRY_STATUSES:
+            return False
+        return retry_safe or response.status_code in self.UNPROCESSED_STATUSES
+
+    def should_retry_exception(self, error: Exception, retry_safe: bool) -> bool:
+        """通信例外に対してリトライすべきか"""
+        # 接続確立前の失敗はサーバーに届いていないため常に再送可能
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(error, (requests.exceptions.Timeout,
+                              requests.exceptions.ConnectionError)):
+            return retry_safe
+        return False
+
+    def backoff(self, attempt: int) -> float:
+        """attempt回目（0始まり）のリトライ前の待機秒数"""
+        ceiling = min(self.backoff_cap, self.backoff_base * (2 ** attempt))
+        return self._random.uniform(0, ceiling)
+
+    def retry_after(self, response: requests.Response) -> Optional[float]:
+        """Retry-Afterヘッダー（秒数またはHTTP日付）を秒数に変換"""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=timezone.utc)
+            seconds = (when - datetime.now(timezone.utc)).total_seconds()
+        return min(self.max_retry_after, max(0.0, seconds))
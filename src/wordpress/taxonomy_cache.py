@@ -0,0 +1,206 @@
+"""
+Taxonomy Snapshot Cache
+AI Melody Kobo - タグ・カテゴリーの全件スナップショットキャッシュ
+"""
+
+import os
+import json
+import html
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TaxonomyCache:
+    """
+    タグ・カテゴリーの名前/スラッグ → ID を保持するキャッシュ
+
+    初回アクセス時に全ページを並列取得し、以降はメモリ上のマップで解決する。
+    スナップショットはTTL付きでディスクに保存され、デーモン再起動時の再取得を省く。
+    """
+
+    TAXONOMIES = ('tags', 'categories')
+
+    def __init__(self,
+                 client,
+                 cache_dir: str = 'data/cache',
+                 ttl_seconds: Optional[int] = None,
+                 persist: bool = True,
+                 max_workers: int = 4):
+        """
+        キャッシュの初期化
+
+        Args:
+            client: 全件取得に使用するWordPressClient
+            cache_dir: スナップショットの保存ディレクトリ
+            ttl_seconds: スナップショットの有効期間（秒）
+            persist: ディスクに保存するかどうか
+            max_workers: ページを並列取得するワーカー数
+        """
+        self.client = client
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else int(
+            os.getenv('WORDPRESS_TAXONOMY_CACHE_TTL', '3600'))
+        self.persist = persist
+        self.max_workers = max_workers
+
+        site_hash = hashlib.md5(client.api_url.encode()).hexdigest()[:12]
+        self.cache_file = Path(cache_dir) / f"taxonomy_{site_hash}.json"
+
+        self._lock = threading.RLock()
+        # taxonomy -> {'fetched_at': float, 'by_name': {...}, 'by_slug': {...}, 'terms': {id: term}}
+        self._snapshots: Dict[str, Dict] = {}
+        self._disk_loaded = False
+
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        """名前を比較用に正規化（WordPressはHTMLエスケープした名前を返す）"""
+        return html.unescape(name).strip().lower()
+
+    def _new_snapshot(self, terms: List[Dict], fetched_at: float) -> Dict:
+        """取得したタームからスナップショットを構築"""
+        snapshot = {
+            'fetched_at': fetched_at,
+            'by_name': {},
+            'by_slug': {},
+            'terms': {}
+        }
+        for term in terms:
+            self._index_term(snapshot, term)
+        return snapshot
+
+    def _index_term(self, snapshot: Dict, term: Dict):
+        """タームをスナップショットのマップに登録"""
+        entry = {
+            'id': term['id'],
+            'name': html.unescape(term.get('name', '')),
+            'slug': term.get('slug', ''),
+            'parent': term.get('parent', 0)
+        }
+        snapshot['terms'][entry['id']] = entry
+        snapshot['by_name'][self._normalize_name(entry['name'])] = entry['id']
+        if entry['slug']:
+            snapshot['by_slug'][entry['slug']] = entry['id']
+
+    def _is_fresh(self, snapshot: Dict) -> bool:
+        """スナップショットがTTL内かどうか"""
+        return (time.time() - snapshot['fetched_at']) < self.ttl_seconds
+
+    def _load_from_disk(self):
+        """ディスク上のスナップショットを読み込み（期限切れは無視）"""
+        self._disk_loaded = True
+        if not self.persist or not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"タクソノミーキャッシュ読み込みエラー: {e}")
+            return
+
+        for taxonomy, stored in data.items():
+            snapshot = self._new_snapshot(stored.get('terms', []), stored.get('fetched_at', 0))
+            if self._is_fresh(snapshot):
+                self._snapshots[taxonomy] = snapshot
+                logger.info(f"タクソノミーキャッシュを復元: {taxonomy} ({len(snapshot['terms'])}件)")
+
+    def _save_to_disk(self):
+        """スナップショットをディスクに保存"""
+        if not self.persist:
+            return
+
+        data = {
+            taxonomy: {
+                'fetched_at': snapshot['fetched_at'],
+                'terms': list(snapshot['terms'].values())
+            }
+            for taxonomy, snapshot in self._snapshots.items()
+        }
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            logger.warning(f"タクソノミーキャッシュ保存エラー: {e}")
+
+    def _ensure_loaded(self, taxonomy: str) -> Dict:
+        """有効なスナップショットを返す（なければ全件取得）"""
+        if taxonomy not in self.TAXONOMIES:
+            raise ValueError(f"サポートされていないタクソノミー: {taxonomy}")
+
+        with self._lock:
+            if not self._disk_loaded:
+                self._load_from_disk()
+
+            snapshot = self._snapshots.get(taxonomy)
+            if snapshot is None or not self._is_fresh(snapshot):
+                snapshot = self._fetch(taxonomy)
+            return snapshot
+
+    def _fetch(self, taxonomy: str) -> Dict:
+        """WordPressから全件を取得してスナップショットを更新"""
+        start = time.time()
+        terms = self.client.fetch_all_terms(taxonomy, max_workers=self.max_workers)
+        snapshot = self._new_snapshot(terms, time.time())
+        self._snapshots[taxonomy] = snapshot
+        self._save_to_disk()
+        logger.info(f"タクソノミーを全件取得: {taxonomy} {len(terms)}件 "
+                    f"({time.time() - start:.2f}秒)")
+        return snapshot
+
+    def refresh(self, taxonomy: str) -> int:
+        """
+        スナップショットを強制的に再取得
+
+        Returns:
+            取得したターム数
+        """
+        with self._lock:
+            return len(self._fetch(taxonomy)['terms'])
+
+    def invalidate(self, taxonomy: Optional[str] = None):
+        """スナップショットを破棄（次回アクセス時に再取得）"""
+        with self._lock:
+            if taxonomy:
+                self._snapshots.pop(taxonomy, None)
+            else:
+                self._snapshots.clear()
+            self._save_to_disk()
+
+    def get_id(self, taxonomy: str, name: str) -> Optional[int]:
+        """名前（大文字小文字を区別しない）からIDを取得"""
+        snapshot = self._ensure_loaded(taxonomy)
+        return snapshot['by_name'].get(self._normalize_name(name))
+
+    def get_id_by_slug(self, taxonomy: str, slug: str) -> Optional[int]:
+        """スラッグからIDを取得"""
+        snapshot = self._ensure_loaded(taxonomy)
+        return snapshot['by_slug'].get(slug)
+
+    def get_terms(self, taxonomy: str) -> List[Dict]:
+        """キャッシュ済みのターム一覧を取得"""
+        snapshot = self._ensure_loaded(taxonomy)
+        return list(snapshot['terms'].values())
+
+    def add_term(self, taxonomy: str, term: Dict):
+        """
+        新規作成されたタームをキャッシュに反映
+
+        スナップショット未取得の場合は何もしない（次回の全件取得に含まれるため）。
+        """
+        if not term or 'id' not in term:
+            return
+        with self._lock:
+            snapshot = self._snapshots.get(taxonomy)
+            if snapshot is None:
+                return
+            self._index_term(snapshot, term)
+            self._save_to_disk()
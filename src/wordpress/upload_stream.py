@@ -0,0 +1,172 @@
+"""
+Streaming Upload Bodies
+AI Melody Kobo - メディアをメモリに展開せずに送信するためのストリーム
+"""
+
+import io
+import os
+import uuid
+from typing import BinaryIO, Dict, Iterator, List, Union
+
+# 送信時に一度に読み込むサイズ
+CHUNK_SIZE = 64 * 1024
+
+
+def _field_name(value: str) -> str:
+    """multipartヘッダー用に引用符・改行をエスケープ"""
+    return value.replace('\\', '\\\\').replace('"', '%22').replace('\r', '').replace('\n', '')
+
+
+class BufferReader(io.RawIOBase):
+    """bytes/memoryviewをコピーせずに読み出すファイルライクオブジェクト"""
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview]):
+        super().__init__()
+        self._view = memoryview(data).cast('B')
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        else:
+            self._pos = len(self._view) + offset
+        self._pos = max(0, min(self._pos, len(self._view)))
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), len(self._view) - self._pos)
+        buffer[:size] = self._view[self._pos:self._pos + size]
+        self._pos += size
+        return size
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(len(self._view), self._pos + size)
+        chunk = self._view[self._pos:end].tobytes()
+        self._pos = end
+        return chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def stream_length(stream: BinaryIO) -> int:
+    """ストリームの現在位置から末尾までのバイト数"""
+    if isinstance(stream, BufferReader):
+        return len(stream) - stream.tell()
+    try:
+        return os.fstat(stream.fileno()).st_size - stream.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        position = stream.tell()
+        end = stream.seek(0, io.SEEK_END)
+        stream.seek(position)
+        return end - position
+
+
+class MultipartStream:
+    """
+    multipart/form-dataの本文を逐次生成するストリーム
+
+    フォーム項目とファイル部分のヘッダーだけを事前に組み立て、
+    ファイル本体は送信時に元のストリームから少しずつ読み出す。
+    Content-Lengthを事前に計算できるため、chunked転送にはならない。
+    """
+
+    def __init__(self, fields: Dict[str, str], filename: str,
+                 mime_type: str, stream: BinaryIO):
+        """
+        Args:
+            fields: ファイル以外のフォーム項目
+            filename: アップロードするファイル名
+            mime_type: ファイルのMIMEタイプ
+            stream: ファイル本体を読み出すストリーム
+        """
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self._stream = stream
+        self._stream_start = stream.tell()
+        self._file_length = stream_length(stream)
+
+        head = []
+        for name, value in fields.items():
+            head.append(
+                f"--{self.boundary}\r\n"
+                f"Content-Disposition: form-data; name=\"{_field_name(name)}\"\r\n\r\n"
+                f"{value}\r\n"
+            )
+        head.append(
+            f"--{self.boundary}\r\n"
+            f"Content-Disposition: form-data; name=\"file\"; filename=\"{_field_name(filename)}\"\r\n"
+            f"Content-Type: {mime_type}\r\n\r\n"
+        )
+        self._head = ''.join(head).encode('utf-8')
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode('ascii')
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return len(self._head) + self._file_length + len(self._tail)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """再送のための巻き戻し（先頭以外への移動はサポートしない）"""
+        if whence != io.SEEK_SET or offset != 0:
+            raise io.UnsupportedOperation("MultipartStreamは先頭への巻き戻しのみ対応しています")
+        self._pos = 0
+        self._stream.seek(self._stream_start)
+        return 0
+
+    def _segments(self) -> List:
+        return [self._head, self._stream, self._tail]
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = len(self) - self._pos
+        out = []
+        remaining = size
+        offset = self._pos
+        for segment in self._segments():
+            segment_length = self._file_length if segment is self._stream else len(segment)
+            if remaining <= 0:
+                break
+            if offset >= segment_length:
+                offset -= segment_length
+                continue
+            take = min(remaining, segment_length - offset)
+            if segment is self._stream:
+                chunk = self._stream.read(take)
+            else:
+                chunk = segment[offset:offset + take]
+            out.append(chunk)
+            remaining -= len(chunk)
+            offset = 0
+            if len(chunk) < take:
+                break
+        data = b''.join(out)
+        self._pos += len(data)
+        return data
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
@@ -0,0 +1,102 @@
+"""
+ArticleEnhancer のテスト（非同期版で同じURLの画像を1回だけアップロード）
+"""
+
+import asyncio
+import threading
+import time
+
+from src.content.article_enhancer import ArticleEnhancer
+from src.wordpress.async_client import AsyncWordPressClient
+
+
+class _FakeRegistry:
+    def __init__(self):
+        self.media = {}
+        self.uploaded = {}
+
+    def get_by_url(self, url):
+        return self.media.get(url)
+
+    def link_url(self, url, sha256):
+        self.media[url] = self.uploaded[sha256]
+
+    def forget_media_id(self, media_id):
+        self.media = {url: media for url, media in self.media.items() if media['id'] != media_id}
+
+
+class _FakeWordPress:
+    """upload_media の呼び出しを数えるWordPressClientの代わり"""
+
+    def __init__(self):
+        self.media_registry = _FakeRegistry()
+        self.uploads = 0
+        self.live = set()
+        self._lock = threading.Lock()
+
+    def media_exists(self, media_id):
+        return media_id in self.live
+
+    def upload_media(self, file_path, **kwargs):
+        time.sleep(0.02)
+        with self._lock:
+            self.uploads += 1
+            media = {'id': self.uploads, 'source_url': f"https://example.com/{self.uploads}.jpg",
+                     'sha256': file_path}
+            self.live.add(self.uploads)
+        self.media_registry.uploaded[file_path] = media
+        return media
+
+
+def test_async_enhance_uploads_each_url_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    wp = _FakeWordPress()
+    enhancer = ArticleEnhancer(wp_client=wp)
+    downloads = []
+
+    def download_image(url, filename=None):
+        downloads.append(url)
+        time.sleep(0.01)
+        return f"{tmp_path}/{filename}"
+
+    # 3つのプレースホルダーに2種類のURLの画像を割り当てる
+    monkeypatch.setattr(enhancer.image_manager, 'get_multiple_images', lambda topics, count: [
+        {'url': f"https://images.example.com/{i % 2}", 'alt': f"画像{i}", 'description': ''}
+        for i in range(count)
+    ])
+    monkeypatch.setattr(enhancer.image_manager, 'download_image', download_image)
+    markdown = "# タイトル\n\n![a](a.jpg)\n\n![b](b.jpg)\n\n![c](c.jpg)\n"
+
+    async def enhance_articles():
+        async with AsyncWordPressClient(client=wp, max_concurrency=4) as client:
+            return await asyncio.gather(*(
+                enhancer.enhance_article_with_images_async(markdown, 'タイトル', wp_client=client)
+                for _ in range(3)
+            ))
+
+    results = asyncio.run(enhance_articles())
+
+    assert wp.uploads == 2
+    assert sorted(downloads) == ['https://images.example.com/0', 'https://images.example.com/1']
+    for result in results:
+        assert [image['alt'] for image in result['images']] == ['画像0', '画像1', '画像2']
+        assert result['images'][0]['id'] == result['images'][2]['id']
+        assert 'a.jpg' not in result['content']
+
+
+def test_deleted_stock_image_is_uploaded_again(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    wp = _FakeWordPress()
+    enhancer = ArticleEnhancer(wp_client=wp)
+    monkeypatch.setattr(enhancer.image_manager, 'download_image',
+                        lambda url, filename=None: f"{tmp_path}/{filename}")
+    url = 'https://images.example.com/0'
+
+    first = enhancer._upload_image_from_url(url, 'a.jpg', '画像')
+    assert enhancer._upload_image_from_url(url, 'a.jpg', '画像')['id'] == first['id']
+
+    # WordPress側で削除された画像は再利用せずにアップロードし直す
+    wp.live.clear()
+    second = enhancer._upload_image_from_url(url, 'a.jpg', '画像')
+    assert second['id'] != first['id']
+    assert wp.media_registry.get_by_url(url)['id'] == second['id']
@@ -0,0 +1,34 @@
+"""
+AsyncWordPressClient のテスト
+"""
+
+import asyncio
+import time
+
+from src.wordpress.async_client import AsyncWordPressClient
+
+
+class _FakeWordPress:
+    def close(self):
+        pass
+
+
+def test_async_client_close_does_not_block_event_loop():
+    async def close_while_request_runs():
+        client = AsyncWordPressClient(client=_FakeWordPress())
+        request = asyncio.ensure_future(client.run(time.sleep, 0.2))
+        await asyncio.sleep(0.01)
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while not request.done():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(client.close(), tick())
+        return ticks
+
+    # close() の間も他のタスクが進む
+    assert asyncio.run(close_while_request_runs()) > 5
@@ -0,0 +1,56 @@
+"""
+JobStore のテスト（実行中の再試行と失敗扱い）
+"""
+
+from src.utils.job_store import JobStore
+
+
+def _new_job(store: JobStore, job_id: str = 'job-1') -> dict:
+    job = {'id': job_id, 'article_type': 'tutorial', 'tool_name': 'Suno', 'topic': 'テスト'}
+    store.create(job)
+    return job
+
+
+def test_retry_counts_attempts_and_fails_after_max(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.sqlite3'), max_attempts=2)
+    job = _new_job(store)
+
+    store.record_error(job['id'], 'timeout')
+    assert store.retry(job['id']) == 1
+    assert store.retry(job['id']) == 2
+    assert store.retry(job['id']) is None
+
+    assert store.get_counts()['status'] == {'failed': 1}
+    # 失敗にしたジョブは再起動時にも再開しない
+    assert store.claim_pending() == []
+    store.close()
+
+
+def test_retry_keeps_checkpointed_stage(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.sqlite3'))
+    job = _new_job(store)
+    job['markdown'] = '# 記事'
+    store.checkpoint(job, 'generated')
+
+    store.record_error(job['id'], 'render failed')
+    assert store.retry(job['id']) == 1
+
+    resumed = store.claim_pending()
+    assert [(j['id'], j['stage'], j['markdown']) for j in resumed] == [('job-1', 'generated', '# 記事')]
+    store.close()
+
+
+def test_claim_pending_with_limit_only_counts_claimed_jobs(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.sqlite3'), max_attempts=2)
+    _new_job(store, 'job-1')
+    _new_job(store, 'job-2')
+
+    # --test の実行ごとに1件だけ取得する
+    assert [job['id'] for job in store.claim_pending(limit=1)] == ['job-1']
+    assert [job['id'] for job in store.claim_pending(limit=1)] == ['job-1']
+    # job-1 は上限に達して失敗になり、一度も実行していない job-2 が取得される
+    assert [job['id'] for job in store.claim_pending(limit=1)] == ['job-2']
+
+    assert store.get_counts()['status'] == {'failed': 1, 'active': 1}
+    assert [job['id'] for job in store.claim_pending()] == ['job-2']
+    store.close()
@@ -0,0 +1,81 @@
+"""
+メディアレジストリのテスト（WordPress側で削除されたメディアを再利用しない）
+"""
+
+import json
+
+import pytest
+import requests
+
+from src.wordpress.api_client import InvalidMediaError, WordPressClient
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code}", response=self)
+
+
+class _FakeSession:
+    """メディアと投稿のエンドポイントだけを持つWordPressの代わり"""
+
+    def __init__(self):
+        self.media = set()
+        self.uploads = 0
+
+    def get(self, url, **kwargs):
+        media_id = int(url.rsplit('/', 1)[1])
+        if media_id in self.media:
+            return _FakeResponse(200, {'id': media_id})
+        return _FakeResponse(404, {'code': 'rest_post_invalid_id'})
+
+    def post(self, url, data=None, **kwargs):
+        if url.endswith('/media'):
+            self.uploads += 1
+            media_id = 100 + self.uploads
+            self.media.add(media_id)
+            return _FakeResponse(201, {'id': media_id, 'source_url': f"https://example.com/{media_id}.png"})
+        post = json.loads(data)
+        if post.get('featured_media') not in self.media:
+            return _FakeResponse(400, {'code': 'rest_post_invalid_featured_media'})
+        return _FakeResponse(201, {'id': 1, **post})
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return WordPressClient(api_url='https://example.com/wp-json/wp/v2', username='user',
+                           app_password='pass', session=_FakeSession())
+
+
+def test_deleted_media_is_uploaded_again(client):
+    first = client.upload_media(file_data=b'png', filename='a.png')
+    assert client.upload_media(file_data=b'png', filename='a.png')['id'] == first['id']
+
+    # WordPress側でメディアを削除すると、同じ内容でも再アップロードする
+    client.session.media.clear()
+    second = client.upload_media(file_data=b'png', filename='a.png')
+
+    assert second['id'] != first['id']
+    assert client.session.uploads == 2
+    assert client.media_registry.get(second['sha256'])['id'] == second['id']
+
+
+def test_invalid_featured_media_forgets_registry_entry(client):
+    media = client.upload_media(file_data=b'png', filename='a.png')
+    client.session.media.clear()
+
+    with pytest.raises(InvalidMediaError):
+        client.create_post('タイトル', '<p>本文</p>', featured_media=media['id'])
+
+    # 登録が消えているため確認なしで再アップロードし、その画像で投稿できる
+    assert client.media_registry.get(media['sha256']) is None
+    reuploaded = client.upload_media(file_data=b'png', filename='a.png')
+    assert client.create_post('タイトル', '<p>本文</p>', featured_media=reuploaded['id'])['id'] == 1
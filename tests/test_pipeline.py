@@ -0,0 +1,75 @@
+"""
+StagePipeline のテスト（失敗時の待機・先行処理数の上限）
+"""
+
+import threading
+import time
+
+from src.utils.pipeline import PipelineStage, StagePipeline
+
+
+def _failing_generate(item):
+    raise RuntimeError("API unavailable")
+
+
+def test_failing_stage_backs_off_instead_of_hot_looping():
+    calls = []
+
+    def source():
+        calls.append(time.time())
+        return {'id': len(calls)}
+
+    pipeline = StagePipeline(
+        [PipelineStage('generate', _failing_generate), PipelineStage('publish', lambda job: job)],
+        source=source,
+        failure_backoff=0.05,
+        max_failure_backoff=1.0
+    )
+    pipeline.start()
+    time.sleep(0.5)
+    pipeline.stop(timeout=2)
+
+    # 0.05 + 0.1 + 0.2 + 0.4秒の待機を挟むため、0.5秒間の呼び出しは数回に収まる
+    assert 1 <= len(calls) <= 5
+    metrics = pipeline.get_metrics()['generate']
+    assert metrics['failed'] == len(calls)
+    assert metrics['consecutive_failures'] == len(calls)
+
+
+def test_success_resets_backoff():
+    stage = PipelineStage('generate', lambda item: item)
+    assert stage.record(0.1, False) == 1
+    assert stage.record(0.1, False) == 2
+    assert stage.record(0.1, True) == 0
+
+
+def test_max_in_flight_bounds_items_taken_from_source():
+    released = threading.Event()
+    taken = []
+
+    def source():
+        taken.append(len(taken))
+        return {'id': len(taken)}
+
+    def publish(job):
+        released.wait()
+        return job
+
+    pipeline = StagePipeline(
+        [
+            PipelineStage('generate', lambda job: job, workers=2),
+            PipelineStage('render', lambda job: job),
+            PipelineStage('publish', publish, queue_size=3)
+        ],
+        source=source,
+        max_in_flight=2
+    )
+    pipeline.start()
+    time.sleep(0.3)
+    # 投稿で止まっている間はキューに空きがあっても2件までしかsource()を呼ばない
+    assert len(taken) == 2
+
+    released.set()
+    time.sleep(0.3)
+    pipeline.stop(timeout=2)
+    assert len(taken) > 2
@@ -0,0 +1,65 @@
+"""
+レスポンスキャッシュのテスト（執筆例が変わっても再実行時にキャッシュを使う）
+"""
+
+from types import SimpleNamespace
+
+from src.article_generator.ai_client import ClaudeClient
+from src.article_generator.content_builder import ArticleGenerator
+from src.article_generator.response_cache import ResponseCache
+
+
+ARTICLE = "# テスト記事\n\n## はじめに\n\nSunoで作曲してみましょう。\n\n## まとめ\n\n楽しみましょう。\n"
+
+
+class _FakeMessages:
+    """messages.create の呼び出しを数えるAnthropic SDKの代わり"""
+
+    def __init__(self):
+        self.prompts = []
+
+    def create(self, **params):
+        self.prompts.append(params['messages'][0]['content'])
+        return SimpleNamespace(content=[SimpleNamespace(text=ARTICLE)], usage=None)
+
+
+def _generator(tmp_path) -> ArticleGenerator:
+    generator = ArticleGenerator(persona_data_path=str(tmp_path / 'persona.json'),
+                                 enable_seo_optimization=False)
+    client = ClaudeClient(api_key='test', response_cache=ResponseCache(str(tmp_path / 'cache')))
+    client.client = SimpleNamespace(messages=_FakeMessages())
+    generator.ai_client = client
+    return generator
+
+
+def _generate(generator: ArticleGenerator) -> dict:
+    return generator.generate_article('Sunoの使い方', article_type='howto',
+                                      keywords=['Suno'], use_latest_info=False)
+
+
+def test_rerun_after_downstream_failure_hits_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    generator = _generator(tmp_path)
+    api = generator.ai_client.client.messages
+
+    # 生成後の投稿が失敗した想定（生成時に執筆例が追加されている）
+    first = _generate(generator)
+    assert first['success']
+    assert len(generator.persona.writing_samples) == 1
+
+    # 同じ記事を再実行すると、執筆例が変わっていてもAPIを呼ばずにキャッシュを使う
+    second = _generate(generator)
+    assert second['success']
+    assert len(api.prompts) == 1
+    assert generator.ai_client.get_cache_stats()['hits'] == 1
+
+
+def test_samples_are_sent_but_not_part_of_key(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    generator = _generator(tmp_path)
+    api = generator.ai_client.client.messages
+
+    generator.persona.add_writing_sample('以前の記事の書き出し')
+    _generate(generator)
+
+    assert '以前の記事の書き出し' in api.prompts[0]